@@ -90,6 +90,8 @@ INSTALLED_APPS = [
     'users',
     'audit',
     'rfqs',
+    'dashboard',
+    'changes',
 ]
 
 REST_FRAMEWORK = {
@@ -143,6 +145,9 @@ CORS_ALLOWED_ORIGINS = [
 
 CORS_ALLOW_CREDENTIALS = True 
 
+# Dashboard summary cache (seconds) - also invalidated by signals on writes
+DASHBOARD_SUMMARY_CACHE_TTL = int(os.getenv('DASHBOARD_SUMMARY_CACHE_TTL', '60'))
+
 
 ROOT_URLCONF = 'backend_app.urls'
 
@@ -211,6 +216,27 @@ USE_TZ = True
 
 STATIC_URL = 'static/'
 
+# Uploaded files (background import jobs store their CSVs here)
+MEDIA_URL = 'media/'
+MEDIA_ROOT = BASE_DIR / 'media'
+
+# Rows per committed chunk for CSV imports
+IMPORT_CHUNK_SIZE = int(os.getenv('IMPORT_CHUNK_SIZE', '1000'))
+
+# Worker processes for ?dry_run=1 CSV validation (0 = one per CPU), shared by
+# every request in a web worker; smaller files are validated in-process
+IMPORT_VALIDATION_WORKERS = int(os.getenv('IMPORT_VALIDATION_WORKERS', '0'))
+IMPORT_VALIDATION_PARALLEL_ROWS = int(os.getenv('IMPORT_VALIDATION_PARALLEL_ROWS', '20000'))
+
+# Worker processes for zipped pick-ticket batches (0 = one per CPU)
+PICK_TICKET_WORKERS = int(os.getenv('PICK_TICKET_WORKERS', '0'))
+
+# Change feed hides entries younger than this so concurrent writers can't be skipped
+CHANGE_FEED_SETTLE_SECONDS = int(os.getenv('CHANGE_FEED_SETTLE_SECONDS', '2'))
+
+# Per-process manufacturer alias cache is reloaded after this many seconds
+MANUFACTURER_CACHE_SECONDS = int(os.getenv('MANUFACTURER_CACHE_SECONDS', '300'))
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
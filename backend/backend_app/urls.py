@@ -32,6 +32,9 @@ urlpatterns = [
     path('api/users/', include('users.urls')),
     path('api/audit/', include('audit.urls')),
     path('api/', include('rfqs.urls')),
+    path('api/dashboard/', include('dashboard.urls')),
+    path('api/changes/', include('changes.urls')),
+    path('api/manufacturers/', include('manufacturers.urls')),
 
     # API documentation
     path('api/schema/', SpectacularAPIView.as_view(), name='schema'),
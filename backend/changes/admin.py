@@ -0,0 +1,11 @@
+from django.contrib import admin
+
+from .models import ChangeLogEntry
+
+
+@admin.register(ChangeLogEntry)
+class ChangeLogEntryAdmin(admin.ModelAdmin):
+    list_display = ('seq', 'entity_type', 'entity_id', 'operation', 'changed_at')
+    list_filter = ('entity_type', 'operation')
+    search_fields = ('entity_id',)
+    readonly_fields = ('seq', 'entity_type', 'entity_id', 'operation', 'changed_at')
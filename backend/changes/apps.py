@@ -0,0 +1,11 @@
+from django.apps import AppConfig
+
+
+class ChangesConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'changes'
+    verbose_name = 'Change Feed'
+
+    def ready(self):
+        """Import signals when app is ready"""
+        import changes.signals  # noqa
@@ -0,0 +1,44 @@
+# backend/changes/management/commands/compact_change_log.py
+"""
+Change log compaction.
+
+Deletes change log entries superseded by a later change to the same row;
+run it daily (cron) so the log stays about one entry per tracked row:
+
+    python manage.py compact_change_log
+    python manage.py compact_change_log --tombstone-days 90
+
+With --tombstone-days, DELETE entries older than that are dropped too, and
+clients that have not synced within that window must resync from since=0.
+"""
+
+from django.core.management.base import BaseCommand
+
+from changes.services import COMPACT_BATCH_SIZE, compact_change_log
+
+
+class Command(BaseCommand):
+    help = "Delete superseded change log entries (and optionally old tombstones)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--tombstone-days',
+            type=int,
+            default=None,
+            help='Also delete tombstones older than this many days (default: keep them)'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=COMPACT_BATCH_SIZE,
+            help=f'Sequence numbers scanned per DELETE (default: {COMPACT_BATCH_SIZE})'
+        )
+
+    def handle(self, *args, **options):
+        result = compact_change_log(
+            tombstone_days=options['tombstone_days'],
+            batch_size=options['batch_size'],
+        )
+        self.stdout.write(
+            f"Deleted {result['superseded']} superseded entries and {result['tombstones']} tombstones"
+        )
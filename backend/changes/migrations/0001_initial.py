@@ -0,0 +1,30 @@
+# Generated by Django 5.2.7 on 2026-10-19 15:56
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ChangeLogEntry',
+            fields=[
+                ('seq', models.BigAutoField(primary_key=True, serialize=False)),
+                ('entity_type', models.CharField(max_length=40)),
+                ('entity_id', models.CharField(max_length=64)),
+                ('operation', models.CharField(choices=[('UPSERT', 'Created or Updated'), ('DELETE', 'Deleted')], default='UPSERT', max_length=10)),
+                ('changed_at', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+            options={
+                'db_table': 'change_log',
+                'ordering': ['seq'],
+                'indexes': [models.Index(fields=['entity_type', 'seq'], name='idx_change_log_entity'), models.Index(fields=['changed_at'], name='idx_change_log_changed_at')],
+            },
+        ),
+    ]
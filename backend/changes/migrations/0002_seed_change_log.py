@@ -0,0 +1,50 @@
+from django.db import migrations
+from django.utils import timezone
+
+
+SEED_MODELS = [
+    ('inventory', 'Item', 'item'),
+    ('vendoritems', 'VendorItem', 'vendor_item'),
+    ('inventory', 'ItemLocationPolicy', 'item_location_policy'),
+    ('locations', 'Location', 'location'),
+]
+
+BATCH_SIZE = 5000
+
+
+def seed_change_log(apps, schema_editor):
+    """
+    Log every existing row once, so a feed read from since=0 is a full
+    sync of rows created before change tracking existed.
+    """
+    ChangeLogEntry = apps.get_model('changes', 'ChangeLogEntry')
+    now = timezone.now()
+    for app_label, model_name, entity_type in SEED_MODELS:
+        model = apps.get_model(app_label, model_name)
+        batch = []
+        for pk in model.objects.values_list('pk', flat=True).iterator(chunk_size=BATCH_SIZE):
+            batch.append(ChangeLogEntry(
+                entity_type=entity_type,
+                entity_id=str(pk),
+                operation='UPSERT',
+                changed_at=now,
+            ))
+            if len(batch) >= BATCH_SIZE:
+                ChangeLogEntry.objects.bulk_create(batch)
+                batch = []
+        if batch:
+            ChangeLogEntry.objects.bulk_create(batch)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('changes', '0001_initial'),
+        ('inventory', '0005_remove_item_idx_item_cat_subcat_item_subcategory2_and_more'),
+        ('locations', '0001_initial'),
+        ('vendoritems', '0004_vendoritempricehistory'),
+    ]
+
+    operations = [
+        migrations.RunPython(seed_change_log, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.7 on 2026-10-19 16:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('changes', '0002_seed_change_log'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='changelogentry',
+            index=models.Index(fields=['entity_type', 'entity_id', 'seq'], name='idx_change_log_row'),
+        ),
+    ]
@@ -0,0 +1,40 @@
+from django.db import models
+from django.utils import timezone
+
+
+class ChangeOperation(models.TextChoices):
+    """What happened to the row"""
+    UPSERT = 'UPSERT', 'Created or Updated'
+    DELETE = 'DELETE', 'Deleted'
+
+
+class ChangeLogEntry(models.Model):
+    """
+    Append-only log of catalog and pricing changes.
+
+    seq is the change sequence: it only grows, so "everything after seq N"
+    is a stable continuation point for the change feed. Deletes are kept
+    as DELETE entries (tombstones) so downstream copies can drop the row.
+    Superseded entries are pruned by services.compact_change_log().
+    """
+    seq = models.BigAutoField(primary_key=True)
+    entity_type = models.CharField(max_length=40)
+    entity_id = models.CharField(max_length=64)
+    operation = models.CharField(
+        max_length=10,
+        choices=ChangeOperation.choices,
+        default=ChangeOperation.UPSERT
+    )
+    changed_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        db_table = 'change_log'
+        ordering = ['seq']
+        indexes = [
+            models.Index(fields=['entity_type', 'seq'], name='idx_change_log_entity'),
+            models.Index(fields=['changed_at'], name='idx_change_log_changed_at'),
+            models.Index(fields=['entity_type', 'entity_id', 'seq'], name='idx_change_log_row'),
+        ]
+
+    def __str__(self):
+        return f"#{self.seq} {self.operation} {self.entity_type} {self.entity_id}"
@@ -0,0 +1,233 @@
+# backend/changes/services.py
+"""
+Change Feed Services
+
+Catalog and pricing rows (items, vendor items, item location policies,
+locations) append a ChangeLogEntry whenever they are saved or deleted.
+Downstream systems read the log through GET /api/changes/?since=<token>
+and only download the rows that changed since their last sync.
+
+Entries are written with transaction.on_commit, so a sequence number is
+only allocated once the change is committed. The feed also holds back
+entries younger than CHANGE_FEED_SETTLE_SECONDS, so a client never skips
+past an entry that is being written concurrently.
+
+Writes that bypass model signals (bulk_create / bulk_update) must call
+record_changes() themselves; the CSV importers do.
+
+The log would otherwise grow on every save, so compact_change_log() (the
+compact_change_log management command, run daily) deletes entries that a
+later entry for the same row supersedes. Pages already collapse repeated
+changes to the latest one, so this changes nothing a client can observe,
+and the log stays about one entry per row. Tombstones are kept unless
+tombstone_days is given; a client that has not synced for longer than
+that must resync from since=0.
+"""
+
+from datetime import timedelta
+from decimal import Decimal
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Exists, F, OuterRef
+from django.utils import timezone
+
+from inventory.models import Item, ItemLocationPolicy
+from locations.models import Location
+from vendoritems.models import VendorItem
+
+from .models import ChangeLogEntry, ChangeOperation
+
+
+DEFAULT_PAGE_SIZE = 1000
+MAX_PAGE_SIZE = 10000
+COMPACT_BATCH_SIZE = 10000
+
+# entity name -> (model, payload fields, aliased payload fields)
+FEED_ENTITIES = {
+    'item': (
+        Item,
+        ['g_code', 'item_name', 'description', 'category', 'subcategory', 'subcategory2',
+         'subcategory3', 'manufacturer', 'manufacturer_part_no', 'default_uom_id'],
+        {},
+    ),
+    'vendor_item': (
+        VendorItem,
+        ['vendor_id', 'item_id', 'vendor_sku', 'vendor_uom_id', 'unit_price', 'conversion_factor',
+         'lead_time_days', 'last_updated'],
+        {'vendor_name': F('vendor__name'), 'g_code': F('item__g_code')},
+    ),
+    'item_location_policy': (
+        ItemLocationPolicy,
+        ['item_id', 'location_id', 'min_qty', 'max_qty', 'reorder_qty', 'lead_time_days',
+         'preferred_vendor_id'],
+        {'g_code': F('item__g_code')},
+    ),
+    'location': (
+        Location,
+        ['name', 'type', 'is_active'],
+        {},
+    ),
+}
+
+ENTITY_TYPES = {model: name for name, (model, _, _) in FEED_ENTITIES.items()}
+TRACKED_MODELS = list(ENTITY_TYPES)
+
+
+def record_changes(model, pks, operation=ChangeOperation.UPSERT):
+    """
+    Append change log entries for rows of a tracked model once the
+    current transaction commits. Untracked models are ignored.
+
+    Args:
+        model: Model class of the changed rows
+        pks: Primary keys of the changed rows
+        operation: ChangeOperation.UPSERT or ChangeOperation.DELETE
+    """
+    entity_type = ENTITY_TYPES.get(model)
+    if entity_type is None:
+        return
+    entity_ids = [str(pk) for pk in pks]
+    if not entity_ids:
+        return
+
+    def write():
+        now = timezone.now()
+        ChangeLogEntry.objects.bulk_create(
+            [
+                ChangeLogEntry(
+                    entity_type=entity_type,
+                    entity_id=entity_id,
+                    operation=operation,
+                    changed_at=now,
+                )
+                for entity_id in entity_ids
+            ],
+            batch_size=1000,
+        )
+
+    transaction.on_commit(write)
+
+
+def _payload(values):
+    """JSON-ready row payload; decimals are kept exact as strings"""
+    return {
+        key: str(value) if isinstance(value, Decimal) else value
+        for key, value in values.items()
+    }
+
+
+def get_changes(since=0, limit=DEFAULT_PAGE_SIZE, entity_types=None):
+    """
+    One page of the change feed.
+
+    Repeated changes to the same row within the page collapse to its
+    latest entry. Upserts carry the row's current values; deletes are
+    tombstones with only the id. An upsert whose row has since been
+    deleted is skipped, because its tombstone follows later in the feed.
+
+    Args:
+        since: Sequence number from the previous page's next_token (0 = start)
+        limit: Maximum log entries read for this page
+        entity_types: Optional list of FEED_ENTITIES keys to include
+
+    Returns:
+        dict: changes, next_token, has_more
+    """
+    settle_seconds = getattr(settings, 'CHANGE_FEED_SETTLE_SECONDS', 2)
+    entries = ChangeLogEntry.objects.filter(
+        seq__gt=since,
+        changed_at__lte=timezone.now() - timedelta(seconds=settle_seconds),
+    )
+    if entity_types:
+        entries = entries.filter(entity_type__in=entity_types)
+
+    page = list(
+        entries.order_by('seq')
+        .values_list('seq', 'entity_type', 'entity_id', 'operation')[:limit + 1]
+    )
+    has_more = len(page) > limit
+    page = page[:limit]
+
+    latest = {}
+    for seq, entity_type, entity_id, operation in page:
+        latest[(entity_type, entity_id)] = (seq, operation)
+
+    upserts = {}
+    for (entity_type, entity_id), (seq, operation) in latest.items():
+        if operation == ChangeOperation.UPSERT:
+            upserts.setdefault(entity_type, []).append(entity_id)
+
+    rows = {}
+    for entity_type, entity_ids in upserts.items():
+        model, fields, aliases = FEED_ENTITIES[entity_type]
+        for values in (
+            model.objects
+            .filter(pk__in=entity_ids)
+            .values('pk', *fields, **aliases)
+        ):
+            rows[(entity_type, str(values.pop('pk')))] = values
+
+    changes = []
+    for (entity_type, entity_id), (seq, operation) in sorted(latest.items(), key=lambda pair: pair[1][0]):
+        change = {
+            'seq': seq,
+            'entity': entity_type,
+            'id': entity_id,
+            'op': operation.lower(),
+        }
+        if operation == ChangeOperation.UPSERT:
+            values = rows.get((entity_type, entity_id))
+            if values is None:
+                continue
+            change['data'] = _payload(values)
+        changes.append(change)
+
+    return {
+        'changes': changes,
+        'next_token': str(page[-1][0] if page else since),
+        'has_more': has_more,
+    }
+
+
+def compact_change_log(tombstone_days=None, batch_size=COMPACT_BATCH_SIZE):
+    """
+    Delete change log entries no client needs any more.
+
+    Entries superseded by a later entry for the same row are deleted, one
+    seq range of batch_size at a time so each DELETE stays short.
+
+    Args:
+        tombstone_days: Also delete DELETE entries older than this many
+            days (None keeps every tombstone)
+        batch_size: Sequence numbers scanned per DELETE
+
+    Returns:
+        dict: superseded, tombstones (entries deleted)
+    """
+    result = {'superseded': 0, 'tombstones': 0}
+    last_seq = ChangeLogEntry.objects.order_by('-seq').values_list('seq', flat=True).first()
+    if last_seq is None:
+        return result
+
+    later = ChangeLogEntry.objects.filter(
+        entity_type=OuterRef('entity_type'),
+        entity_id=OuterRef('entity_id'),
+        seq__gt=OuterRef('seq'),
+    )
+    for low in range(0, last_seq, batch_size):
+        deleted, _ = (
+            ChangeLogEntry.objects
+            .filter(seq__gt=low, seq__lte=low + batch_size)
+            .filter(Exists(later))
+            .delete()
+        )
+        result['superseded'] += deleted
+
+    if tombstone_days is not None:
+        deleted, _ = ChangeLogEntry.objects.filter(
+            operation=ChangeOperation.DELETE,
+            changed_at__lt=timezone.now() - timedelta(days=tombstone_days),
+        ).delete()
+        result['tombstones'] = deleted
+    return result
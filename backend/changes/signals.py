@@ -0,0 +1,35 @@
+"""
+Signals for the change feed.
+Records an UPSERT entry when a tracked model is saved and a DELETE
+tombstone when it is deleted (including cascades).
+
+Queryset .update() and bulk_create()/bulk_update() don't send these
+signals; callers of those paths use services.record_changes().
+"""
+from django.db.models.signals import post_save, post_delete
+
+from .models import ChangeOperation
+from .services import TRACKED_MODELS, record_changes
+
+
+def record_save(sender, instance, **kwargs):
+    """Log an upsert after a tracked row is saved"""
+    record_changes(sender, [instance.pk])
+
+
+def record_delete(sender, instance, **kwargs):
+    """Log a tombstone after a tracked row is deleted"""
+    record_changes(sender, [instance.pk], operation=ChangeOperation.DELETE)
+
+
+for model in TRACKED_MODELS:
+    post_save.connect(
+        record_save,
+        sender=model,
+        dispatch_uid=f'change_feed_save_{model._meta.label_lower}'
+    )
+    post_delete.connect(
+        record_delete,
+        sender=model,
+        dispatch_uid=f'change_feed_delete_{model._meta.label_lower}'
+    )
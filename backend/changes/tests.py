@@ -0,0 +1,127 @@
+from datetime import timedelta
+
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from inventory.models import Item
+from users.models import User
+
+from .models import ChangeLogEntry, ChangeOperation
+from .services import compact_change_log
+
+
+@override_settings(CHANGE_FEED_SETTLE_SECONDS=0)
+class ChangeFeedTests(TestCase):
+    """Entries are written on commit and paged by sequence number"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(email='dana@example.com')
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def create_item(self, g_code):
+        with self.captureOnCommitCallbacks(execute=True):
+            return Item.objects.create(g_code=g_code, item_name=g_code)
+
+    def feed(self, **params):
+        response = self.client.get('/api/changes/', params)
+        self.assertEqual(response.status_code, 200)
+        return response.data
+
+    def test_entries_are_written_on_commit(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            Item.objects.create(g_code='G-100', item_name='Wire')
+            self.assertFalse(ChangeLogEntry.objects.exists())
+
+        for callback in callbacks:
+            callback()
+        entry = ChangeLogEntry.objects.get()
+        self.assertEqual((entry.entity_type, entry.operation), ('item', ChangeOperation.UPSERT))
+
+    def test_delete_leaves_a_tombstone(self):
+        item = self.create_item('G-100')
+        item_id = str(item.pk)
+        with self.captureOnCommitCallbacks(execute=True):
+            item.delete()
+
+        changes = self.feed()['changes']
+
+        self.assertEqual(changes, [{
+            'seq': ChangeLogEntry.objects.get(operation=ChangeOperation.DELETE).seq,
+            'entity': 'item',
+            'id': item_id,
+            'op': 'delete',
+        }])
+
+    def test_since_pages_through_the_feed(self):
+        for g_code in ('G-100', 'G-200', 'G-300'):
+            self.create_item(g_code)
+
+        first = self.feed(limit=2)
+        self.assertTrue(first['has_more'])
+        self.assertEqual([change['data']['g_code'] for change in first['changes']], ['G-100', 'G-200'])
+
+        second = self.feed(since=first['next_token'], limit=2)
+        self.assertFalse(second['has_more'])
+        self.assertEqual([change['data']['g_code'] for change in second['changes']], ['G-300'])
+
+        # Nothing new: the token stays put
+        third = self.feed(since=second['next_token'])
+        self.assertEqual((third['changes'], third['next_token']), ([], second['next_token']))
+
+        self.create_item('G-400')
+        self.assertEqual(
+            [change['data']['g_code'] for change in self.feed(since=second['next_token'])['changes']],
+            ['G-400'],
+        )
+
+    def test_invalid_since_is_rejected(self):
+        response = self.client.get('/api/changes/', {'since': 'abc'})
+
+        self.assertEqual(response.status_code, 400)
+
+
+@override_settings(CHANGE_FEED_SETTLE_SECONDS=0)
+class CompactionTests(TestCase):
+    """Compaction keeps each row's latest entry, so the feed is unchanged"""
+
+    def save_twice(self, g_code):
+        with self.captureOnCommitCallbacks(execute=True):
+            item = Item.objects.create(g_code=g_code, item_name=g_code)
+        with self.captureOnCommitCallbacks(execute=True):
+            item.save()
+        return item
+
+    def test_superseded_entries_are_deleted(self):
+        kept = self.save_twice('G-100')
+        deleted = self.save_twice('G-200')
+        deleted_id = str(deleted.pk)
+        with self.captureOnCommitCallbacks(execute=True):
+            deleted.delete()
+        self.save_twice('G-300')
+
+        result = compact_change_log(batch_size=2)
+
+        self.assertEqual(result, {'superseded': 4, 'tombstones': 0})
+        self.assertEqual(
+            list(ChangeLogEntry.objects.values_list('entity_id', 'operation')),
+            [
+                (str(kept.pk), ChangeOperation.UPSERT),
+                (deleted_id, ChangeOperation.DELETE),
+                (str(Item.objects.get(g_code='G-300').pk), ChangeOperation.UPSERT),
+            ],
+        )
+
+    def test_old_tombstones_expire_on_request(self):
+        item = self.save_twice('G-100')
+        with self.captureOnCommitCallbacks(execute=True):
+            item.delete()
+        ChangeLogEntry.objects.update(changed_at=timezone.now() - timedelta(days=100))
+
+        self.assertEqual(compact_change_log(), {'superseded': 2, 'tombstones': 0})
+        self.assertEqual(compact_change_log(tombstone_days=90), {'superseded': 0, 'tombstones': 1})
+        self.assertFalse(ChangeLogEntry.objects.exists())
@@ -0,0 +1,67 @@
+# backend/changes/views.py
+"""
+API views for the change feed
+"""
+from drf_spectacular.utils import OpenApiParameter, extend_schema
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from .services import DEFAULT_PAGE_SIZE, FEED_ENTITIES, MAX_PAGE_SIZE, get_changes
+
+
+@extend_schema(
+    tags=["Change Feed"],
+    summary="Rows changed since a continuation token",
+    description="""
+    Incremental sync for items, vendor items, item location policies and
+    locations. Start with no token (or `since=0`) for a full sync, then
+    pass the returned **next_token** on the next call. Keep paging while
+    **has_more** is true.
+
+    Each change has `seq`, `entity`, `id` and `op`:
+    - **upsert** - `data` holds the row's current values
+    - **delete** - tombstone; drop the row downstream
+
+    Several changes to one row within a page collapse to the latest.
+    Superseded entries are compacted away daily; if tombstones are expired
+    (compact_change_log --tombstone-days), a client that has not synced
+    within that window must start over from `since=0`.
+    """,
+    parameters=[
+        OpenApiParameter('since', str, description='next_token from the previous call'),
+        OpenApiParameter('limit', int, description=f'Log entries per page (default {DEFAULT_PAGE_SIZE}, max {MAX_PAGE_SIZE})'),
+        OpenApiParameter('entity', str, description=f'Comma-separated subset of: {", ".join(FEED_ENTITIES)}'),
+    ],
+)
+class ChangeFeedView(APIView):
+    """
+    GET /api/changes/?since=<token>
+    """
+
+    def get(self, request, *args, **kwargs):
+        try:
+            since = int(request.query_params.get('since') or 0)
+            limit = int(request.query_params.get('limit') or DEFAULT_PAGE_SIZE)
+        except ValueError:
+            return Response(
+                {"error": "since and limit must be integers."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if since < 0 or limit < 1:
+            return Response(
+                {"error": "since must be >= 0 and limit >= 1."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        entity_types = [
+            name.strip() for name in request.query_params.get('entity', '').split(',') if name.strip()
+        ]
+        unknown = [name for name in entity_types if name not in FEED_ENTITIES]
+        if unknown:
+            return Response(
+                {"error": f"Unknown entity: {', '.join(unknown)}"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        return Response(get_changes(since, min(limit, MAX_PAGE_SIZE), entity_types or None))
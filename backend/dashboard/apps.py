@@ -0,0 +1,11 @@
+from django.apps import AppConfig
+
+
+class DashboardConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'dashboard'
+    verbose_name = 'Dashboard'
+
+    def ready(self):
+        """Import signals when app is ready"""
+        import dashboard.signals  # noqa
@@ -0,0 +1,117 @@
+# backend/dashboard/services.py
+"""
+Dashboard Summary Service
+
+Builds the counts and status breakdowns shown on the dashboards in a
+single UNION ALL query and keeps the result in the cache for a short TTL.
+"""
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import CharField, Count, F, Value
+from django.utils import timezone
+
+from inventory.models import Item, PendingAllocation
+from vendors.models import Vendor
+from locations.models import Location
+from orders.models import Order
+from shipments.models import Shipment
+from equipment.models import Equipment
+from vehicles.models import Vehicle
+from users.models import User
+from rfqs.models import RFQ
+
+
+SUMMARY_CACHE_KEY = 'dashboard:summary'
+
+OPEN_PENDING_STATUSES = [
+    PendingAllocation.Status.AWAITING_RECEIPT,
+    PendingAllocation.Status.PARTIALLY_FULFILLED,
+]
+
+# metric name -> (queryset, status field or None for a plain count)
+SUMMARY_SOURCES = {
+    'items': (Item.objects.all(), None),
+    'vendors': (Vendor.objects.all(), None),
+    'locations': (Location.objects.all(), None),
+    'orders': (Order.objects.all(), 'order_status'),
+    'shipments': (Shipment.objects.all(), 'status'),
+    'equipment': (Equipment.objects.all(), 'status'),
+    'vehicles': (Vehicle.objects.all(), 'status'),
+    'users': (User.objects.all(), 'status'),
+    'rfqs': (RFQ.objects.all(), 'status'),
+    'pending_allocations': (
+        PendingAllocation.objects.filter(status__in=OPEN_PENDING_STATUSES),
+        'status'
+    ),
+}
+
+# Models whose writes invalidate the cached summary (see signals.py)
+SUMMARY_MODELS = [
+    Item, Vendor, Location, Order, Shipment, Equipment,
+    Vehicle, User, RFQ, PendingAllocation,
+]
+
+
+def _grouped_count(metric, queryset, status_field):
+    """Build a (metric, bucket, n) aggregate for one source table"""
+    bucket = F(status_field) if status_field else Value(None, output_field=CharField())
+    return (
+        queryset
+        .order_by()
+        .annotate(metric=Value(metric, output_field=CharField()), bucket=bucket)
+        .values('metric', 'bucket')
+        .annotate(n=Count('pk'))
+        .values_list('metric', 'bucket', 'n')
+    )
+
+
+def build_dashboard_summary():
+    """
+    Compute dashboard counts and status breakdowns.
+
+    Every source table is aggregated in its own GROUP BY and the results
+    are combined with UNION ALL, so the whole summary is one round trip.
+
+    Returns:
+        dict: {
+            'counts': {'items': 120, 'orders': 42, ...},
+            'orders_by_status': {'OPEN': 10, ...},
+            ...
+            'generated_at': ISO timestamp
+        }
+    """
+    parts = [
+        _grouped_count(metric, queryset, status_field)
+        for metric, (queryset, status_field) in SUMMARY_SOURCES.items()
+    ]
+    rows = parts[0].union(*parts[1:], all=True)
+
+    counts = {metric: 0 for metric in SUMMARY_SOURCES}
+    breakdowns = {
+        f'{metric}_by_status': {}
+        for metric, (_, status_field) in SUMMARY_SOURCES.items()
+        if status_field
+    }
+
+    for metric, bucket, n in rows:
+        counts[metric] += n
+        if SUMMARY_SOURCES[metric][1]:
+            breakdowns[f'{metric}_by_status'][bucket] = n
+
+    return {
+        'counts': counts,
+        **breakdowns,
+        'generated_at': timezone.now().isoformat(),
+    }
+
+
+def get_dashboard_summary():
+    """Return the cached dashboard summary, rebuilding it on a miss"""
+    ttl = getattr(settings, 'DASHBOARD_SUMMARY_CACHE_TTL', 60)
+    return cache.get_or_set(SUMMARY_CACHE_KEY, build_dashboard_summary, ttl)
+
+
+def invalidate_dashboard_summary():
+    """Drop the cached summary so the next request recomputes it"""
+    cache.delete(SUMMARY_CACHE_KEY)
@@ -0,0 +1,28 @@
+"""
+Signals for dashboard cache invalidation.
+Clears the cached summary whenever one of the counted models changes.
+
+Queryset .update() and bulk_create() don't send these signals; the short
+cache TTL covers those paths.
+"""
+from django.db.models.signals import post_save, post_delete
+
+from .services import SUMMARY_MODELS, invalidate_dashboard_summary
+
+
+def invalidate_summary_on_change(sender, **kwargs):
+    """Invalidate the dashboard summary after a save or delete"""
+    invalidate_dashboard_summary()
+
+
+for model in SUMMARY_MODELS:
+    post_save.connect(
+        invalidate_summary_on_change,
+        sender=model,
+        dispatch_uid=f'dashboard_summary_save_{model._meta.label_lower}'
+    )
+    post_delete.connect(
+        invalidate_summary_on_change,
+        sender=model,
+        dispatch_uid=f'dashboard_summary_delete_{model._meta.label_lower}'
+    )
@@ -0,0 +1,58 @@
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from inventory.models import Item
+from orders.models import Order, OrderStatus, OrderType
+from users.models import User
+from vendors.models import Vendor
+
+from .services import build_dashboard_summary
+
+
+class DashboardSummaryTests(TestCase):
+    """One query builds the summary; saves drop the cached copy"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(email='dana@example.com')
+        Vendor.objects.create(name='Acme Supply')
+        Item.objects.create(g_code='G-100', item_name='Wire')
+        Item.objects.create(g_code='G-200', item_name='Conduit')
+        Order.objects.create(order_type=OrderType.PURCHASE, order_status=OrderStatus.OPEN)
+        Order.objects.create(order_type=OrderType.PURCHASE, order_status=OrderStatus.OPEN)
+        Order.objects.create(order_type=OrderType.SALES, order_status=OrderStatus.CLOSED)
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_summary_counts_in_one_query(self):
+        with CaptureQueriesContext(connection) as queries:
+            summary = build_dashboard_summary()
+
+        self.assertEqual(len(queries), 1)
+        self.assertEqual(summary['counts']['items'], 2)
+        self.assertEqual(summary['counts']['vendors'], 1)
+        self.assertEqual(summary['counts']['orders'], 3)
+        self.assertEqual(summary['counts']['users'], 1)
+        self.assertEqual(summary['counts']['rfqs'], 0)
+        self.assertEqual(summary['orders_by_status'], {OrderStatus.OPEN: 2, OrderStatus.CLOSED: 1})
+        self.assertEqual(summary['rfqs_by_status'], {})
+
+    def test_summary_is_cached_until_a_save(self):
+        first = self.client.get('/api/dashboard/summary/').data
+        with CaptureQueriesContext(connection) as queries:
+            cached = self.client.get('/api/dashboard/summary/').data
+        self.assertEqual(len(queries), 0)
+        self.assertEqual(cached, first)
+
+        Item.objects.create(g_code='G-300', item_name='Box')
+        refreshed = self.client.get('/api/dashboard/summary/').data
+        self.assertEqual(refreshed['counts']['items'], 3)
+
+        Item.objects.get(g_code='G-300').delete()
+        self.assertEqual(self.client.get('/api/dashboard/summary/').data['counts']['items'], 2)
@@ -0,0 +1,33 @@
+# backend/dashboard/views.py
+"""
+API views for dashboard app
+"""
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from drf_spectacular.utils import extend_schema
+
+from .services import get_dashboard_summary
+
+
+@extend_schema(
+    tags=["Dashboard"],
+    summary="Dashboard counts and status breakdowns",
+    description="""
+    Returns every count the dashboards need in one response:
+    - **counts** - totals for items, vendors, locations, orders, shipments,
+      equipment, vehicles, users, RFQs and open pending allocations
+    - **orders_by_status**, **shipments_by_status**, **equipment_by_status**,
+      **vehicles_by_status**, **users_by_status**, **rfqs_by_status**,
+      **pending_allocations_by_status**
+
+    The summary is cached for a short TTL and invalidated on writes.
+    """,
+)
+class DashboardSummaryView(APIView):
+    """
+    GET /api/dashboard/summary/
+    Replaces the ?page_size=1 count probes on the dashboards
+    """
+
+    def get(self, request, *args, **kwargs):
+        return Response(get_dashboard_summary())
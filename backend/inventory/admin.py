@@ -10,6 +10,7 @@ from .models import (
     ItemDefaultBin,
     InventoryMovement,
     ItemLocationPolicy,
+    ItemDuplicateCandidate,
 )
 
 admin.site.register(ItemLocationPolicy)
@@ -21,4 +22,4 @@ admin.site.register(UnitOfMeasure)
 admin.site.register(Bin)
 admin.site.register(ItemDefaultBin)
 admin.site.register(InventoryMovement)
-
+admin.site.register(ItemDuplicateCandidate)
@@ -29,6 +29,7 @@ def receive_inventory(request):
         "qty": "100.0",
         "unit_cost": "5.50",
         "purchase_order_id": "uuid" (optional),
+        "order_line_id": "uuid" (optional, a line of the purchase order),
         "reference": "PO-2025-001" (optional)
     }
     
@@ -67,6 +68,9 @@ def receive_inventory(request):
         po_id = request.data.get('purchase_order_id')
         purchase_order = get_object_or_404(Order, order_id=po_id) if po_id else None
         
+        line_id = request.data.get('order_line_id')
+        order_line = get_object_or_404(OrderLine, order_line_id=line_id, order=purchase_order) if line_id and purchase_order else None
+        
         # Receive inventory
         layer, movement = FIFOInventoryService.receive_inventory(
             item=item,
@@ -75,7 +79,8 @@ def receive_inventory(request):
             unit_cost=Decimal(str(unit_cost)),
             bin=bin_obj,
             purchase_order=purchase_order,
-            reference=request.data.get('reference', '')
+            reference=request.data.get('reference', ''),
+            order_line=order_line
         )
         
         return Response({
@@ -0,0 +1,288 @@
+# backend/inventory/duplicates.py
+"""
+Duplicate item detection.
+
+Items are never compared all-pairs. Candidate pairs come from blocks:
+
+1. Exact mpn_key (normalized manufacturer + part number)      score 1.00
+2. Same normalized part number, different/blank manufacturer  score 0.90
+   (part numbers of at least PART_BLOCK_MIN_LENGTH characters)
+3. Exact name_key (same name tokens in any order)             score 0.95
+4. Similar names: trigram Jaccard >= NAME_SIMILARITY_THRESHOLD
+
+Similar names use prefix filtering: each name's trigrams are ordered from
+rarest to most common across the catalog and the name is only indexed
+under its first few (rare) trigrams. Two names with Jaccard >= t must share
+one of those prefix trigrams, so only items sharing a rare trigram are
+ever compared. Buckets larger than MAX_BUCKET_SIZE are skipped; a trigram
+that common carries no signal.
+
+Pairs whose part numbers are both present and different are never
+reported on name similarity alone ("Breaker 20A" vs "Breaker 30A").
+
+find_duplicates() scans the whole catalog (nightly find_duplicate_items
+command); check_items() checks just-imported items against the blocking
+keys inline.
+"""
+
+import math
+import time
+from collections import Counter, defaultdict
+from decimal import Decimal
+from itertools import combinations
+
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .matching import trigrams, jaccard
+from .models import (
+    Item,
+    ItemDuplicateCandidate,
+    DuplicateCandidateStatus,
+    DuplicateReason,
+)
+
+
+NAME_SIMILARITY_THRESHOLD = 0.85
+PART_BLOCK_MIN_LENGTH = 5
+MAX_BUCKET_SIZE = 200
+BATCH_SIZE = 5000
+
+SCORE_MANUFACTURER_PART = 1.0
+SCORE_NAME = 0.95
+SCORE_PART_NUMBER = 0.9
+
+
+def _pair(a, b):
+    """Canonical (item_a_id, item_b_id) order"""
+    return (a, b) if str(a) < str(b) else (b, a)
+
+
+def _part(key):
+    """Part number portion of an mpn_key"""
+    return key.partition('|')[2]
+
+
+class _Pairs:
+    """Best score per pair"""
+
+    def __init__(self):
+        self.scores = {}
+
+    def add(self, a, b, score, reason):
+        pair = _pair(a, b)
+        current = self.scores.get(pair)
+        if current is None or score > current[0]:
+            self.scores[pair] = (score, reason)
+
+    def add_block(self, pks, score, reason):
+        if len(pks) > MAX_BUCKET_SIZE:
+            return
+        for a, b in combinations(pks, 2):
+            self.add(a, b, score, reason)
+
+    def __len__(self):
+        return len(self.scores)
+
+
+def _conflicting_parts(key_a, key_b):
+    part_a, part_b = _part(key_a), _part(key_b)
+    return bool(part_a and part_b and part_a != part_b)
+
+
+def _similar_names(pks, mpn_keys, names, pairs, threshold):
+    """Trigram prefix-filter join over name_keys"""
+    frequency = Counter()
+    for name in names:
+        if name:
+            frequency.update(trigrams(name))
+
+    buckets = defaultdict(list)
+    sizes = []
+    for index, name in enumerate(names):
+        grams = trigrams(name) if name else set()
+        sizes.append(len(grams))
+        if not grams:
+            continue
+        ordered = sorted(grams, key=lambda gram: (frequency[gram], gram))
+        prefix_length = len(ordered) - math.ceil(threshold * len(ordered)) + 1
+        for gram in ordered[:prefix_length]:
+            buckets[gram].append(index)
+    del frequency
+
+    compared = set()
+    cache = {}
+    for members in buckets.values():
+        if len(members) < 2 or len(members) > MAX_BUCKET_SIZE:
+            continue
+        for i, j in combinations(members, 2):
+            if names[i] == names[j] or (i, j) in compared:
+                continue
+            # Length filter: Jaccard <= min/max of the set sizes
+            small, large = sorted((sizes[i], sizes[j]))
+            if small < threshold * large:
+                continue
+            compared.add((i, j))
+            if _conflicting_parts(mpn_keys[i], mpn_keys[j]):
+                continue
+            for index in (i, j):
+                if index not in cache:
+                    cache[index] = trigrams(names[index])
+            score = jaccard(cache[i], cache[j])
+            if score >= threshold:
+                pairs.add(pks[i], pks[j], round(score * SCORE_NAME, 4), DuplicateReason.NAME)
+        cache.clear()
+
+
+def _block_pairs(pks, mpn_keys, names, pairs):
+    """Exact blocks on mpn_key, part number and name_key"""
+    by_mpn = defaultdict(list)
+    by_part = defaultdict(list)
+    by_name = defaultdict(list)
+    for index, pk in enumerate(pks):
+        if mpn_keys[index]:
+            by_mpn[mpn_keys[index]].append(index)
+            part = _part(mpn_keys[index])
+            if len(part) >= PART_BLOCK_MIN_LENGTH:
+                by_part[part].append(index)
+        if names[index]:
+            by_name[names[index]].append(index)
+
+    for members in by_mpn.values():
+        pairs.add_block([pks[i] for i in members], SCORE_MANUFACTURER_PART, DuplicateReason.MANUFACTURER_PART)
+    for members in by_part.values():
+        if len(members) > 1 and len({mpn_keys[i] for i in members}) > 1:
+            pairs.add_block([pks[i] for i in members], SCORE_PART_NUMBER, DuplicateReason.PART_NUMBER)
+    for members in by_name.values():
+        if len(members) < 2 or len(members) > MAX_BUCKET_SIZE:
+            continue
+        for i, j in combinations(members, 2):
+            if not _conflicting_parts(mpn_keys[i], mpn_keys[j]):
+                pairs.add(pks[i], pks[j], SCORE_NAME, DuplicateReason.NAME)
+
+
+def _save_candidates(pairs, replace=False):
+    """
+    Upsert candidate rows. Reviewed pairs (dismissed/merged) are left as
+    they are. With replace=True, open candidates that were not found again
+    are deleted, so edited items drop out of the review queue.
+
+    Returns:
+        dict: created / updated / removed counts
+    """
+    now = timezone.now()
+    existing = {}
+    candidates = ItemDuplicateCandidate.objects.all()
+    if not replace:
+        item_ids = {pk for pair in pairs.scores for pk in pair}
+        candidates = candidates.filter(item_a_id__in=item_ids, item_b_id__in=item_ids)
+    for candidate_id, item_a_id, item_b_id, status, score in (
+        candidates.values_list('candidate_id', 'item_a_id', 'item_b_id', 'status', 'score')
+        .iterator(chunk_size=BATCH_SIZE)
+    ):
+        existing[(item_a_id, item_b_id)] = (candidate_id, status, score)
+
+    to_create = []
+    to_update = []
+    for (item_a_id, item_b_id), (score, reason) in pairs.scores.items():
+        score = Decimal(str(score)).quantize(Decimal('0.0001'))
+        current = existing.pop((item_a_id, item_b_id), None)
+        if current is None:
+            to_create.append(ItemDuplicateCandidate(
+                item_a_id=item_a_id,
+                item_b_id=item_b_id,
+                score=score,
+                reason=reason,
+                detected_at=now,
+            ))
+        elif current[1] == DuplicateCandidateStatus.OPEN and current[2] != score:
+            to_update.append(ItemDuplicateCandidate(candidate_id=current[0], score=score, reason=reason))
+
+    stale = []
+    if replace:
+        stale = [
+            candidate_id
+            for candidate_id, status, _ in existing.values()
+            if status == DuplicateCandidateStatus.OPEN
+        ]
+
+    with transaction.atomic():
+        ItemDuplicateCandidate.objects.bulk_create(to_create, batch_size=BATCH_SIZE, ignore_conflicts=True)
+        ItemDuplicateCandidate.objects.bulk_update(to_update, ['score', 'reason'], batch_size=BATCH_SIZE)
+        for start in range(0, len(stale), BATCH_SIZE):
+            ItemDuplicateCandidate.objects.filter(candidate_id__in=stale[start:start + BATCH_SIZE]).delete()
+
+    return {'created': len(to_create), 'updated': len(to_update), 'removed': len(stale)}
+
+
+def find_duplicates(threshold=NAME_SIMILARITY_THRESHOLD):
+    """
+    Scan the whole item master and refresh ItemDuplicateCandidate.
+
+    Args:
+        threshold: Minimum trigram Jaccard for similar names
+
+    Returns:
+        dict: items scanned, candidate pairs, created/updated/removed, seconds
+    """
+    started = time.monotonic()
+    pks, mpn_keys, names = [], [], []
+    for pk, mpn_key, name_key in (
+        Item.objects.values_list('item_id', 'mpn_key', 'name_key').iterator(chunk_size=BATCH_SIZE)
+    ):
+        pks.append(pk)
+        mpn_keys.append(mpn_key)
+        names.append(name_key)
+
+    pairs = _Pairs()
+    _block_pairs(pks, mpn_keys, names, pairs)
+    _similar_names(pks, mpn_keys, names, pairs, threshold)
+
+    result = _save_candidates(pairs, replace=True)
+    result.update({
+        'items': len(pks),
+        'pairs': len(pairs),
+        'elapsed_seconds': round(time.monotonic() - started, 3),
+    })
+    return result
+
+
+def check_items(items):
+    """
+    Inline check for newly imported or edited items: one indexed query for
+    other items sharing their mpn_key or name_key, plus matches within the
+    batch itself. Part-number-only and fuzzy name matches are left to the
+    nightly scan.
+
+    Args:
+        items: Saved Item instances with match keys set
+
+    Returns:
+        int: Candidate pairs found
+    """
+    items = [item for item in items if item.mpn_key or item.name_key]
+    if not items:
+        return 0
+
+    condition = (
+        Q(mpn_key__in={item.mpn_key for item in items if item.mpn_key})
+        | Q(name_key__in={item.name_key for item in items if item.name_key})
+    )
+    rows = {item.pk: (item.mpn_key, item.name_key) for item in items}
+    for pk, mpn_key, name_key in Item.objects.filter(condition).values_list('item_id', 'mpn_key', 'name_key'):
+        rows.setdefault(pk, (mpn_key, name_key))
+
+    pks = list(rows)
+    pairs = _Pairs()
+    _block_pairs(pks, [rows[pk][0] for pk in pks], [rows[pk][1] for pk in pks], pairs)
+
+    # Only pairs involving one of the checked items are new information
+    checked = {item.pk for item in items}
+    pairs.scores = {
+        pair: value for pair, value in pairs.scores.items()
+        if pair[0] in checked or pair[1] in checked
+    }
+    if pairs.scores:
+        _save_candidates(pairs)
+    return len(pairs)
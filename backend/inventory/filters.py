@@ -0,0 +1,57 @@
+# backend/inventory/filters.py
+"""
+Query-parameter filters shared by the item list endpoint and item exports
+"""
+from django.db.models import Q
+
+from manufacturers.services import resolve_manufacturer
+
+from .matching import normalize_manufacturer
+
+
+ITEM_ORDERING = ('g_code', '-g_code', 'item_name', '-item_name', 'category', '-category')
+
+
+def filter_items(queryset, params):
+    """
+    Apply the item list filters to a queryset.
+
+    Supported params: category, subcategory, subcategory2, subcategory3,
+    manufacturer (any known spelling), search (g_code / name / manufacturer
+    part no), ordering (one of ITEM_ORDERING).
+    """
+    for field in ('category', 'subcategory', 'subcategory2', 'subcategory3'):
+        value = params.get(field)
+        if value:
+            queryset = queryset.filter(**{field: value})
+
+    manufacturer = params.get('manufacturer')
+    if manufacturer:
+        # Filter on the indexed manufacturer id. Items without one yet (not
+        # backfilled) fall back to their text, matched on its normalized form.
+        mfr_id = resolve_manufacturer(manufacturer, create=False)
+        key = normalize_manufacturer(manufacturer)
+        spellings = [
+            text
+            for text in (
+                queryset.filter(mfr__isnull=True).exclude(manufacturer__isnull=True)
+                .order_by().values_list('manufacturer', flat=True).distinct()
+            )
+            if key and normalize_manufacturer(text) == key
+        ]
+        condition = Q(mfr__isnull=True, manufacturer__in=spellings)
+        queryset = queryset.filter(Q(mfr_id=mfr_id) | condition if mfr_id else condition)
+
+    search = params.get('search')
+    if search:
+        queryset = queryset.filter(
+            Q(g_code__icontains=search)
+            | Q(item_name__icontains=search)
+            | Q(manufacturer_part_no__icontains=search)
+        )
+
+    ordering = params.get('ordering')
+    if ordering in ITEM_ORDERING:
+        queryset = queryset.order_by(ordering)
+
+    return queryset
@@ -0,0 +1,90 @@
+"""
+Label sheet API - bin and item labels as printable PDFs (see labels.py)
+"""
+import tempfile
+
+from django.http import FileResponse
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from .filters import filter_items
+from .labels import (
+    LAYOUTS, bin_label_rows, draw_bin_label, draw_item_label, item_label_rows, render_labels, select_bins,
+)
+from .models import Item
+from .serializers import BinLabelSerializer, LabelSheetSerializer
+
+
+def _label_response(rows, draw, options, filename):
+    """Render the labels to a temporary file and stream it back as a PDF"""
+    output = tempfile.TemporaryFile()
+    result = render_labels(
+        output,
+        rows,
+        draw,
+        LAYOUTS[options['layout']],
+        copies=options['copies'],
+        skip=options['skip'],
+    )
+    if not result['labels']:
+        output.close()
+        return Response({'error': 'Nothing matches; no labels to print'}, status=status.HTTP_400_BAD_REQUEST)
+
+    output.seek(0)
+    response = FileResponse(output, as_attachment=True, filename=filename, content_type='application/pdf')
+    response['X-Labels'] = result['labels']
+    response['X-Pages'] = result['pages']
+    return response
+
+
+class LabelLayoutListView(APIView):
+    """
+    GET /api/labels/layouts/
+    Label sheet layouts accepted by the label endpoints
+    """
+
+    def get(self, request):
+        return Response([
+            {
+                'layout': key,
+                'name': layout.name,
+                'per_page': layout.per_page,
+                'width_in': round(layout.width / 72, 4),
+                'height_in': round(layout.height / 72, 4),
+            }
+            for key, layout in LAYOUTS.items()
+        ])
+
+
+class BinLabelsView(APIView):
+    """
+    GET /api/labels/bins/?location=<uuid>&bin_from=A-01&bin_to=A-20&zone=A
+        [&layout=5160&copies=1&skip=0]
+    Bin labels (bin code barcode, location, zone) by location and bin code
+    """
+
+    def get(self, request):
+        params = BinLabelSerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        options = params.validated_data
+        bins = select_bins(
+            location=options.get('location'),
+            bin_from=options.get('bin_from'),
+            bin_to=options.get('bin_to'),
+            zone=options.get('zone'),
+        )
+        return _label_response(bin_label_rows(bins), draw_bin_label, options, 'bin_labels.pdf')
+
+
+class ItemLabelsView(APIView):
+    """
+    GET /api/labels/items/?category=...&search=...[&layout=5160&copies=1&skip=0]
+    Item labels (g_code barcode, name, part no) for the item list filters
+    """
+
+    def get(self, request):
+        params = LabelSheetSerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        items = filter_items(Item.objects.order_by('g_code'), request.query_params)
+        return _label_response(item_label_rows(items), draw_item_label, params.validated_data, 'item_labels.pdf')
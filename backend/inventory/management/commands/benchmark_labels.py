@@ -0,0 +1,68 @@
+# backend/inventory/management/commands/benchmark_labels.py
+"""
+Label rendering benchmark.
+
+Renders synthetic bin and item labels (no database access) onto every
+sheet layout and reports labels/second, pages and PDF size:
+
+    python manage.py benchmark_labels
+    python manage.py benchmark_labels --labels 50000 --layouts 5160 5167
+"""
+
+import tempfile
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from inventory.labels import LAYOUTS, draw_bin_label, draw_item_label, render_labels
+
+
+KINDS = {
+    'bins': (
+        draw_bin_label,
+        lambda i: (f"{'ABCD'[i % 4]}-{i // 100:03d}-{i % 100:02d}", 'Bench Warehouse', 'ABCD'[i % 4]),
+    ),
+    'items': (
+        draw_item_label,
+        lambda i: (f"G{100000 + i}", f"Bench item {i} 3/4in EMT conduit connector", f"MFR-{i:06d}"),
+    ),
+}
+
+
+class Command(BaseCommand):
+    help = "Benchmark bin / item label sheet rendering"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--labels',
+            type=int,
+            default=10000,
+            help='Labels rendered per pass (default: 10000)'
+        )
+        parser.add_argument(
+            '--layouts',
+            nargs='*',
+            default=None,
+            help=f"Sheet layouts (default: all of {', '.join(LAYOUTS)})"
+        )
+
+    def handle(self, *args, **options):
+        layouts = options['layouts'] or list(LAYOUTS)
+        unknown = [key for key in layouts if key not in LAYOUTS]
+        if unknown:
+            raise CommandError(f"Unknown layouts: {', '.join(unknown)}")
+
+        count = options['labels']
+        self.stdout.write(f"{'kind':<8}{'layout':<8}{'labels':>8}{'pages':>7}{'KB':>9}{'seconds':>9}{'labels/s':>10}")
+        for kind, (draw, factory) in KINDS.items():
+            for key in layouts:
+                rows = (factory(i) for i in range(count))
+                with tempfile.TemporaryFile() as output:
+                    started = time.monotonic()
+                    result = render_labels(output, rows, draw, LAYOUTS[key])
+                    elapsed = time.monotonic() - started
+                    size = output.tell()
+                self.stdout.write(
+                    f"{kind:<8}{key:<8}{result['labels']:>8}{result['pages']:>7}{size / 1024:>9.0f}"
+                    f"{elapsed:>9.2f}{result['labels'] / elapsed if elapsed else 0:>10.0f}"
+                )
@@ -0,0 +1,37 @@
+# backend/inventory/management/commands/find_duplicate_items.py
+"""
+Nightly duplicate item scan.
+
+Refreshes the item merge-candidate queue from the whole item master:
+
+    python manage.py find_duplicate_items
+    python manage.py find_duplicate_items --threshold 0.9
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from inventory.duplicates import NAME_SIMILARITY_THRESHOLD, find_duplicates
+
+
+class Command(BaseCommand):
+    help = "Find likely duplicate items and refresh the merge-candidate queue"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--threshold',
+            type=float,
+            default=NAME_SIMILARITY_THRESHOLD,
+            help=f'Minimum name similarity, 0-1 (default: {NAME_SIMILARITY_THRESHOLD})'
+        )
+
+    def handle(self, *args, **options):
+        threshold = options['threshold']
+        if not 0 < threshold <= 1:
+            raise CommandError("--threshold must be between 0 and 1")
+
+        result = find_duplicates(threshold=threshold)
+        self.stdout.write(
+            f"Scanned {result['items']} items in {result['elapsed_seconds']}s: "
+            f"{result['pairs']} candidate pairs "
+            f"({result['created']} new, {result['updated']} rescored, {result['removed']} removed)"
+        )
@@ -0,0 +1,58 @@
+# backend/inventory/matching.py
+"""
+Normalization helpers for matching items across the catalog.
+
+These keys are stored on Item (mpn_key, name_key) and used to block
+duplicate-detection candidates, so they must stay cheap and deterministic.
+"""
+
+import re
+
+_NON_ALNUM = re.compile(r'[^0-9a-z]+')
+
+# Trailing corporate words dropped from manufacturer names
+_COMPANY_SUFFIXES = {
+    'inc', 'incorporated', 'llc', 'ltd', 'limited', 'co', 'corp', 'corporation',
+    'company', 'mfg', 'manufacturing', 'the',
+}
+
+
+def normalize_part_no(value):
+    """'QO-120 ' / 'qo120' / 'QO 120' -> 'QO120'"""
+    return _NON_ALNUM.sub('', (value or '').casefold()).upper()
+
+
+def normalize_manufacturer(value):
+    """'Square D Co.' / 'SQUARE-D' -> 'square d'"""
+    tokens = _NON_ALNUM.sub(' ', (value or '').casefold()).split()
+    while tokens and tokens[-1] in _COMPANY_SUFFIXES:
+        tokens.pop()
+    while tokens and tokens[0] == 'the':
+        tokens.pop(0)
+    return ' '.join(tokens)
+
+
+def mpn_key(manufacturer, part_no):
+    """Manufacturer + part number key; empty when there is no part number"""
+    part = normalize_part_no(part_no)
+    if not part:
+        return ''
+    return f"{normalize_manufacturer(manufacturer)}|{part}"[:255]
+
+
+def name_key(name):
+    """Item name reduced to its sorted, de-duplicated alphanumeric tokens"""
+    tokens = sorted(set(_NON_ALNUM.sub(' ', (name or '').casefold()).split()))
+    return ' '.join(tokens)[:255]
+
+
+def trigrams(text):
+    """Character trigrams of a normalized string (padded so short words count)"""
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def jaccard(a, b):
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
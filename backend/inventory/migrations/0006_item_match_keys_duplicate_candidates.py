@@ -0,0 +1,99 @@
+# Generated by Django 5.2.7 on 2026-10-19 15:59
+
+import django.db.models.deletion
+import django.utils.timezone
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+from inventory.matching import mpn_key, name_key
+
+
+BATCH_SIZE = 5000
+
+
+def backfill_match_keys(apps, schema_editor):
+    """Compute mpn_key / name_key for existing items"""
+    Item = apps.get_model('inventory', 'Item')
+    batch = []
+    rows = Item.objects.values_list('pk', 'item_name', 'manufacturer', 'manufacturer_part_no')
+    for pk, item_name, manufacturer, part_no in rows.iterator(chunk_size=BATCH_SIZE):
+        batch.append(Item(
+            pk=pk,
+            mpn_key=mpn_key(manufacturer, part_no),
+            name_key=name_key(item_name),
+        ))
+        if len(batch) >= BATCH_SIZE:
+            Item.objects.bulk_update(batch, ['mpn_key', 'name_key'])
+            batch = []
+    if batch:
+        Item.objects.bulk_update(batch, ['mpn_key', 'name_key'])
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventory', '0005_remove_item_idx_item_cat_subcat_item_subcategory2_and_more'),
+        ('vendoritems', '0004_vendoritempricehistory'),
+        ('vendors', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ItemDuplicateCandidate',
+            fields=[
+                ('candidate_id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('score', models.DecimalField(decimal_places=4, help_text='Similarity, 0-1', max_digits=5)),
+                ('reason', models.CharField(choices=[('MANUFACTURER_PART', 'Same manufacturer and part number'), ('PART_NUMBER', 'Same part number'), ('NAME', 'Similar name')], max_length=20)),
+                ('status', models.CharField(choices=[('OPEN', 'Open'), ('DISMISSED', 'Not a Duplicate'), ('MERGED', 'Merged')], default='OPEN', max_length=20)),
+                ('detected_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('reviewed_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'db_table': 'item_duplicate_candidates',
+                'ordering': ['-score', 'detected_at'],
+            },
+        ),
+        migrations.AddField(
+            model_name='item',
+            name='mpn_key',
+            field=models.CharField(blank=True, default='', editable=False, help_text='Normalized manufacturer|part number', max_length=255),
+        ),
+        migrations.AddField(
+            model_name='item',
+            name='name_key',
+            field=models.CharField(blank=True, default='', editable=False, help_text='Normalized item name tokens', max_length=255),
+        ),
+        migrations.AddIndex(
+            model_name='item',
+            index=models.Index(fields=['mpn_key'], name='idx_item_mpn_key'),
+        ),
+        migrations.AddIndex(
+            model_name='item',
+            index=models.Index(fields=['name_key'], name='idx_item_name_key'),
+        ),
+        migrations.RunPython(backfill_match_keys, migrations.RunPython.noop),
+        migrations.AddField(
+            model_name='itemduplicatecandidate',
+            name='item_a',
+            field=models.ForeignKey(db_column='item_a_id', on_delete=django.db.models.deletion.CASCADE, related_name='duplicate_candidates_a', to='inventory.item'),
+        ),
+        migrations.AddField(
+            model_name='itemduplicatecandidate',
+            name='item_b',
+            field=models.ForeignKey(db_column='item_b_id', on_delete=django.db.models.deletion.CASCADE, related_name='duplicate_candidates_b', to='inventory.item'),
+        ),
+        migrations.AddField(
+            model_name='itemduplicatecandidate',
+            name='reviewed_by',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='reviewed_duplicate_candidates', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddIndex(
+            model_name='itemduplicatecandidate',
+            index=models.Index(fields=['status', '-score'], name='idx_item_dup_status_score'),
+        ),
+        migrations.AddConstraint(
+            model_name='itemduplicatecandidate',
+            constraint=models.UniqueConstraint(fields=('item_a', 'item_b'), name='uq_item_duplicate_pair'),
+        ),
+    ]
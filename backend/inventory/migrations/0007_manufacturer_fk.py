@@ -0,0 +1,36 @@
+# Generated by Django 5.2.7 on 2026-10-19 16:03
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventory', '0006_item_match_keys_duplicate_candidates'),
+        ('locations', '0001_initial'),
+        ('manufacturers', '0002_manufactureralias'),
+        ('orders', '0006_orderline_expected_manufacturer_and_more'),
+        ('vendors', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='inventorylayer',
+            name='idx_layer_item_mfr',
+        ),
+        migrations.AddField(
+            model_name='inventorylayer',
+            name='mfr',
+            field=models.ForeignKey(blank=True, db_column='mfr_id', editable=False, help_text='Manufacturer resolved from the manufacturer text', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='inventory_layers', to='manufacturers.manufacturer'),
+        ),
+        migrations.AddField(
+            model_name='item',
+            name='mfr',
+            field=models.ForeignKey(blank=True, db_column='mfr_id', editable=False, help_text='Manufacturer resolved from the manufacturer text', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='items', to='manufacturers.manufacturer'),
+        ),
+        migrations.AddIndex(
+            model_name='inventorylayer',
+            index=models.Index(fields=['item', 'mfr'], name='idx_layer_item_mfr'),
+        ),
+    ]
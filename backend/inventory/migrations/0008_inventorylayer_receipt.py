@@ -0,0 +1,33 @@
+# Generated by Django 5.2.7 on 2026-10-19 16:05
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventory', '0007_manufacturer_fk'),
+        ('locations', '0001_initial'),
+        ('manufacturers', '0002_manufactureralias'),
+        ('orders', '0007_manufacturer_fk'),
+        ('shipments', '0001_initial'),
+        ('vendors', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='inventorylayer',
+            name='order_line',
+            field=models.ForeignKey(blank=True, db_column='order_line_id', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='inventory_layers', to='orders.orderline'),
+        ),
+        migrations.AddField(
+            model_name='inventorylayer',
+            name='shipment',
+            field=models.ForeignKey(blank=True, db_column='shipment_id', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='inventory_layers', to='shipments.shipment'),
+        ),
+        migrations.AddConstraint(
+            model_name='inventorylayer',
+            constraint=models.UniqueConstraint(condition=models.Q(('shipment__isnull', False)), fields=('shipment', 'order_line'), name='uq_layer_shipment_line'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.7 on 2026-10-19 16:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventory', '0008_inventorylayer_receipt'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='bin',
+            name='zone',
+            field=models.CharField(blank=True, help_text="Pick zone / aisle; walked in the location's pick_zone_sequence", max_length=32),
+        ),
+    ]
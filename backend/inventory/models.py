@@ -3,6 +3,7 @@ from vendors.models import Vendor
 import uuid
 from django.utils import timezone
 from locations.models import Location
+from manufacturers.services import sync_manufacturer
 
 
 
@@ -34,6 +35,16 @@ class Item(models.Model):
     subcategory3 = models.CharField(max_length=500, blank=True, null=True)
     manufacturer = models.CharField(max_length=500, blank=True, null=True)
     manufacturer_part_no = models.CharField(max_length=500, blank=True, null=True)
+    mfr = models.ForeignKey(
+        'manufacturers.Manufacturer',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        editable=False,
+        related_name='items',
+        db_column='mfr_id',
+        help_text="Manufacturer resolved from the manufacturer text"
+    )
 
     default_uom = models.ForeignKey(
         UnitOfMeasure,
@@ -63,6 +74,39 @@ class Item(models.Model):
         help_text="When cost was last updated"
     )
 
+    # Normalized match keys for duplicate detection (see inventory.matching)
+    mpn_key = models.CharField(
+        max_length=255,
+        blank=True,
+        default='',
+        editable=False,
+        help_text="Normalized manufacturer|part number"
+    )
+    name_key = models.CharField(
+        max_length=255,
+        blank=True,
+        default='',
+        editable=False,
+        help_text="Normalized item name tokens"
+    )
+
+    MATCH_SOURCE_FIELDS = {'item_name', 'manufacturer', 'manufacturer_part_no'}
+
+    def set_match_keys(self):
+        """Recompute mpn_key / name_key from the current field values"""
+        from .matching import mpn_key, name_key
+        self.mpn_key = mpn_key(self.manufacturer, self.manufacturer_part_no)
+        self.name_key = name_key(self.item_name)
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None or self.MATCH_SOURCE_FIELDS & set(update_fields):
+            self.set_match_keys()
+            if update_fields is not None:
+                kwargs['update_fields'] = {*update_fields, 'mpn_key', 'name_key'}
+        sync_manufacturer(self, 'manufacturer', 'mfr', kwargs)
+        super().save(*args, **kwargs)
+
     def update_replacement_cost(self, new_cost):
         """Update current replacement cost from latest purchase"""
         from django.utils import timezone
@@ -75,6 +119,8 @@ class Item(models.Model):
             models.Index(fields=['g_code'], name='idx_item_gcode'),
             models.Index(fields=['category', 'subcategory', 'subcategory2', 'subcategory3'], name='idx_item_full_cat'),
             models.Index(fields=['category'], name='idx_item_category'),
+            models.Index(fields=['mpn_key'], name='idx_item_mpn_key'),
+            models.Index(fields=['name_key'], name='idx_item_name_key'),
         ]
 
     def __str__(self):
@@ -105,6 +151,11 @@ class Bin(models.Model):
     )
     
     bin_code = models.CharField(max_length=64)
+    zone = models.CharField(
+        max_length=32,
+        blank=True,
+        help_text="Pick zone / aisle; walked in the location's pick_zone_sequence"
+    )
 
     class Meta:
         db_table = 'bins'
@@ -295,6 +346,70 @@ class ItemLocationPolicy(models.Model):
 
 
 
+class DuplicateCandidateStatus(models.TextChoices):
+    """Review state of a possible duplicate pair"""
+    OPEN = 'OPEN', 'Open'
+    DISMISSED = 'DISMISSED', 'Not a Duplicate'
+    MERGED = 'MERGED', 'Merged'
+
+
+class DuplicateReason(models.TextChoices):
+    """Why two items were paired"""
+    MANUFACTURER_PART = 'MANUFACTURER_PART', 'Same manufacturer and part number'
+    PART_NUMBER = 'PART_NUMBER', 'Same part number'
+    NAME = 'NAME', 'Similar name'
+
+
+class ItemDuplicateCandidate(models.Model):
+    """
+    Possible duplicate pair in the item master, found by the duplicate
+    detector (nightly find_duplicate_items run or inline on import).
+    Pairs are stored once, with item_a's id sorting before item_b's.
+    """
+    candidate_id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    item_a = models.ForeignKey(
+        'Item',
+        on_delete=models.CASCADE,
+        related_name='duplicate_candidates_a',
+        db_column='item_a_id'
+    )
+    item_b = models.ForeignKey(
+        'Item',
+        on_delete=models.CASCADE,
+        related_name='duplicate_candidates_b',
+        db_column='item_b_id'
+    )
+    score = models.DecimalField(max_digits=5, decimal_places=4, help_text="Similarity, 0-1")
+    reason = models.CharField(max_length=20, choices=DuplicateReason.choices)
+    status = models.CharField(
+        max_length=20,
+        choices=DuplicateCandidateStatus.choices,
+        default=DuplicateCandidateStatus.OPEN
+    )
+    detected_at = models.DateTimeField(default=timezone.now)
+    reviewed_at = models.DateTimeField(null=True, blank=True)
+    reviewed_by = models.ForeignKey(
+        'users.User',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='reviewed_duplicate_candidates'
+    )
+
+    class Meta:
+        db_table = 'item_duplicate_candidates'
+        ordering = ['-score', 'detected_at']
+        constraints = [
+            models.UniqueConstraint(fields=['item_a', 'item_b'], name='uq_item_duplicate_pair'),
+        ]
+        indexes = [
+            models.Index(fields=['status', '-score'], name='idx_item_dup_status_score'),
+        ]
+
+    def __str__(self):
+        return f"{self.item_a_id} ~ {self.item_b_id} ({self.score})"
+
+
 # =====================================================
 # FIFO COSTING MODELS
 # =====================================================
@@ -380,6 +495,17 @@ class InventoryLayer(models.Model):
         help_text="Actual manufacturer of items in this layer"
     )
 
+    mfr = models.ForeignKey(
+        'manufacturers.Manufacturer',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        editable=False,
+        related_name='inventory_layers',
+        db_column='mfr_id',
+        help_text="Manufacturer resolved from the manufacturer text"
+    )
+
     manufacturer_part_no = models.CharField(
         max_length=500,
         blank=True,
@@ -392,9 +518,34 @@ class InventoryLayer(models.Model):
         blank=True,
         help_text="Reference for manual adjustments or notes"
     )
+
+    # Receipt this layer came from; one layer per shipment and PO line
+    shipment = models.ForeignKey(
+        'shipments.Shipment',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='inventory_layers',
+        db_column='shipment_id'
+    )
+    order_line = models.ForeignKey(
+        'orders.OrderLine',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='inventory_layers',
+        db_column='order_line_id'
+    )
     
     class Meta:
         db_table = 'inventory_layers'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['shipment', 'order_line'],
+                condition=models.Q(shipment__isnull=False),
+                name='uq_layer_shipment_line'
+            ),
+        ]
         ordering = ['received_at']  # FIFO: oldest first
         indexes = [
             models.Index(
@@ -405,7 +556,7 @@ class InventoryLayer(models.Model):
             models.Index(fields=['location'], name='idx_layer_location'),
             models.Index(fields=['received_at'], name='idx_layer_received'),
             models.Index(fields=['vendor'], name='idx_layer_vendor'),
-            models.Index(fields=['item', 'manufacturer'], name='idx_layer_item_mfr'),
+            models.Index(fields=['item', 'mfr'], name='idx_layer_item_mfr'),
         ]
         verbose_name = 'Inventory Layer'
         verbose_name_plural = 'Inventory Layers'
@@ -421,6 +572,10 @@ class InventoryLayer(models.Model):
         """Calculate total value of this layer"""
         return self.qty_remaining * self.unit_cost
 
+    def save(self, *args, **kwargs):
+        sync_manufacturer(self, 'manufacturer', 'mfr', kwargs)
+        super().save(*args, **kwargs)
+
 
 class PendingAllocation(models.Model):
     """
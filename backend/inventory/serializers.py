@@ -1,10 +1,13 @@
 # backend/inventory/serializers.py
+from django.utils import timezone
 from rest_framework import serializers
+from .labels import DEFAULT_LAYOUT, LAYOUTS
 from .models import (
     Item,
     UnitOfMeasure,
     InventoryMovement,
     ItemLocationPolicy,
+    ItemDuplicateCandidate,
 )
 
 
@@ -97,4 +100,70 @@ class ItemLocationPolicySerializer(serializers.ModelSerializer):
             'preferred_vendor',
             'preferred_vendor_name'
         ]
-        read_only_fields = ['policy_id']
\ No newline at end of file
+        read_only_fields = ['policy_id']
+
+
+class ItemMatchSerializer(serializers.ModelSerializer):
+    """Compact item view for merge review"""
+    class Meta:
+        model = Item
+        fields = [
+            'item_id',
+            'g_code',
+            'item_name',
+            'manufacturer',
+            'manufacturer_part_no',
+        ]
+
+
+class ItemDuplicateCandidateSerializer(serializers.ModelSerializer):
+    """Possible duplicate pair; only status is writable (review decision)"""
+    item_a = ItemMatchSerializer(read_only=True)
+    item_b = ItemMatchSerializer(read_only=True)
+    reviewed_by_email = serializers.CharField(source='reviewed_by.email', read_only=True, default=None)
+
+    class Meta:
+        model = ItemDuplicateCandidate
+        fields = [
+            'candidate_id',
+            'item_a',
+            'item_b',
+            'score',
+            'reason',
+            'status',
+            'detected_at',
+            'reviewed_at',
+            'reviewed_by',
+            'reviewed_by_email',
+        ]
+        read_only_fields = [
+            'candidate_id', 'score', 'reason', 'detected_at', 'reviewed_at', 'reviewed_by',
+        ]
+
+    def update(self, instance, validated_data):
+        if validated_data.get('status', instance.status) != instance.status:
+            request = self.context.get('request')
+            instance.reviewed_at = timezone.now()
+            instance.reviewed_by = request.user if request and request.user.is_authenticated else None
+        return super().update(instance, validated_data)
+
+
+class LabelSheetSerializer(serializers.Serializer):
+    """Sheet options shared by the bin and item label endpoints"""
+    layout = serializers.ChoiceField(choices=list(LAYOUTS), default=DEFAULT_LAYOUT)
+    copies = serializers.IntegerField(min_value=1, max_value=100, default=1)
+    skip = serializers.IntegerField(min_value=0, default=0)
+
+    def validate(self, attrs):
+        per_page = LAYOUTS[attrs['layout']].per_page
+        if attrs['skip'] >= per_page:
+            raise serializers.ValidationError({'skip': f"Must be less than {per_page} labels per sheet."})
+        return attrs
+
+
+class BinLabelSerializer(LabelSheetSerializer):
+    """Bins to label: a location, a bin_code range and/or a zone"""
+    location = serializers.UUIDField(required=False)
+    bin_from = serializers.CharField(required=False)
+    bin_to = serializers.CharField(required=False)
+    zone = serializers.CharField(required=False)
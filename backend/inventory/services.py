@@ -6,6 +6,9 @@ from django.db import transaction
 from django.utils import timezone
 from typing import Dict, List, Optional, Tuple
 
+from orders.models import OrderType
+from orders.services import receive_purchase_qty
+
 from .models import (
     Item,
     Location,
@@ -32,11 +35,14 @@ class FIFOInventoryService:
         unit_cost: Decimal,
         bin: Optional[Bin] = None,
         purchase_order = None,
-        reference: str = ""
+        reference: str = "",
+        order_line = None
     ) -> Tuple[InventoryLayer, InventoryMovement]:
         """
         Receive inventory into warehouse.
         Creates a new inventory layer and movement record.
+        Receipts against a purchase order also count toward its lines'
+        qty_received (see orders.services.receive_purchase_qty).
         
         Args:
             item: Item instance
@@ -46,6 +52,8 @@ class FIFOInventoryService:
             bin: Bin instance (optional)
             purchase_order: Order instance (optional)
             reference: String reference (optional)
+            order_line: OrderLine received against (optional; default:
+                the PO's open lines for the item)
         
         Returns:
             tuple: (InventoryLayer, InventoryMovement)
@@ -68,7 +76,8 @@ class FIFOInventoryService:
             unit_cost=unit_cost,
             received_at=timezone.now(),
             purchase_order=purchase_order,
-            reference=reference
+            reference=reference,
+            order_line=order_line
         )
         
         # Create movement record
@@ -80,11 +89,16 @@ class FIFOInventoryService:
             to_location=location,
             to_bin=bin,
             order=purchase_order,
+            order_line=order_line,
             moved_at=timezone.now(),
             reference=reference,
             note=f"Received into inventory @ ${unit_cost}/unit"
         )
         
+        # Count the receipt against the purchase order's lines
+        if purchase_order is not None and purchase_order.order_type == OrderType.PURCHASE:
+            receive_purchase_qty(purchase_order, item.pk, qty, order_line=order_line)
+        
         # Update item's current replacement cost
         item.update_replacement_cost(unit_cost)
         
@@ -1,3 +1,112 @@
+from decimal import Decimal
+
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from .duplicates import check_items, find_duplicates
+from .models import DuplicateCandidateStatus, DuplicateReason, Item, ItemDuplicateCandidate
+
+
+def candidates():
+    """{(g_code, g_code): reason} for the stored candidate pairs"""
+    return {
+        tuple(sorted((candidate.item_a.g_code, candidate.item_b.g_code))): candidate.reason
+        for candidate in ItemDuplicateCandidate.objects.select_related('item_a', 'item_b')
+    }
+
+
+class FindDuplicatesTests(TestCase):
+    """The nightly scan pairs items by blocking key, never all-pairs"""
+
+    @classmethod
+    def setUpTestData(cls):
+        rows = [
+            ('G-1', 'Breaker 20A 1P', 'Square D', 'QO-120'),
+            ('G-2', 'QO 1 pole breaker', 'SQUARE-D Co.', 'qo120'),
+            ('G-3', 'Breaker, 20 amp', 'Eaton', 'QO120'),
+            ('G-4', 'Wire Nut Yellow', '', ''),
+            ('G-5', 'Yellow wire nut', '', ''),
+            ('G-6', 'Breaker 30A 1P', 'Square D', 'QO-130'),
+        ]
+        for g_code, item_name, manufacturer, part_no in rows:
+            Item.objects.create(
+                g_code=g_code, item_name=item_name,
+                manufacturer=manufacturer, manufacturer_part_no=part_no,
+            )
+
+    def test_blocks_pair_matching_items(self):
+        result = find_duplicates()
+
+        self.assertEqual(result['items'], 6)
+        self.assertEqual(candidates(), {
+            ('G-1', 'G-2'): DuplicateReason.MANUFACTURER_PART,
+            ('G-1', 'G-3'): DuplicateReason.PART_NUMBER,
+            ('G-2', 'G-3'): DuplicateReason.PART_NUMBER,
+            ('G-4', 'G-5'): DuplicateReason.NAME,
+        })
+        self.assertEqual(
+            ItemDuplicateCandidate.objects.get(reason=DuplicateReason.MANUFACTURER_PART).score,
+            Decimal('1.0000'),
+        )
+
+    def test_rescan_keeps_reviews_and_drops_stale_pairs(self):
+        find_duplicates()
+        ItemDuplicateCandidate.objects.filter(reason=DuplicateReason.NAME).update(
+            status=DuplicateCandidateStatus.DISMISSED,
+        )
+        item = Item.objects.get(g_code='G-3')
+        item.manufacturer_part_no = 'BR120'
+        item.save()
+
+        result = find_duplicates()
+
+        self.assertEqual(result['removed'], 2)
+        self.assertEqual(candidates(), {
+            ('G-1', 'G-2'): DuplicateReason.MANUFACTURER_PART,
+            ('G-4', 'G-5'): DuplicateReason.NAME,
+        })
+        self.assertEqual(
+            ItemDuplicateCandidate.objects.get(reason=DuplicateReason.NAME).status,
+            DuplicateCandidateStatus.DISMISSED,
+        )
+
+
+class CheckItemsTests(TestCase):
+    """The inline check costs the same few queries for any batch size"""
+
+    def create_items(self, count, start=0):
+        return [
+            Item.objects.create(
+                g_code=f'G-{i}', item_name=f'Breaker {i}',
+                manufacturer='Square D', manufacturer_part_no=f'QO{i}',
+            )
+            for i in range(start, start + count)
+        ]
+
+    def test_batch_is_checked_against_the_catalog(self):
+        existing = Item.objects.create(
+            g_code='G-OLD', item_name='Old breaker', manufacturer='Square D', manufacturer_part_no='QO-1',
+        )
+        imported = self.create_items(3)
+
+        self.assertEqual(check_items(imported), 1)
+        self.assertEqual(candidates(), {('G-1', 'G-OLD'): DuplicateReason.MANUFACTURER_PART})
+        self.assertEqual(check_items([existing]), 1)
+        self.assertEqual(ItemDuplicateCandidate.objects.count(), 1)
+
+    def test_query_count_does_not_grow_with_items(self):
+        few = self.create_items(2)
+        many = self.create_items(100, start=100)
+        # Each batch duplicates one catalog item, so both write a candidate
+        for g_code, part_no in (('G-D1', 'QO0'), ('G-D2', 'QO100')):
+            Item.objects.create(
+                g_code=g_code, item_name=g_code, manufacturer='Square D', manufacturer_part_no=part_no,
+            )
+
+        with CaptureQueriesContext(connection) as few_queries:
+            self.assertEqual(check_items(few), 1)
+        with CaptureQueriesContext(connection) as many_queries:
+            self.assertEqual(check_items(many), 1)
 
-# Create your tests here.
+        self.assertEqual(len(few_queries), len(many_queries))
@@ -1,8 +1,9 @@
 # backend/inventory/urls.py
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from .views import ItemViewSet, UnitOfMeasureViewSet
+from .views import ItemViewSet, UnitOfMeasureViewSet, ItemMergeCandidateViewSet
 from .stock_views import StockLevelsView
+from .label_views import BinLabelsView, ItemLabelsView, LabelLayoutListView
 from . import api_views
 
 app_name = 'inventory'
@@ -11,11 +12,17 @@ app_name = 'inventory'
 router = DefaultRouter()
 router.register(r'items', ItemViewSet, basename='item')
 router.register(r'units', UnitOfMeasureViewSet, basename='unitofmeasure')
+router.register(r'item-merge-candidates', ItemMergeCandidateViewSet, basename='item-merge-candidate')
 
 urlpatterns = [
     # Stock Levels
     path('stock-levels/', StockLevelsView.as_view(), name='stock_levels'),
 
+    # Label sheets
+    path('labels/layouts/', LabelLayoutListView.as_view(), name='label_layouts'),
+    path('labels/bins/', BinLabelsView.as_view(), name='bin_labels'),
+    path('labels/items/', ItemLabelsView.as_view(), name='item_labels'),
+
     # FIFO Inventory Management Endpoints
     path('receive/', api_views.receive_inventory, name='receive_inventory'),
     path('available/<uuid:item_id>/<uuid:location_id>/',
@@ -33,6 +40,6 @@ urlpatterns = [
          name='get_pending_allocations'),
     path('transfer/', api_views.transfer_inventory, name='transfer_inventory'),
 
-    # Router URLs (items, units)
+    # Router URLs (items, units, item merge candidates)
     path('', include(router.urls)),
 ]
\ No newline at end of file
@@ -1,7 +1,12 @@
-from rest_framework import viewsets
+from decimal import Decimal, InvalidOperation
+
+from django.db.models import Q
+from rest_framework import viewsets, mixins
+from rest_framework.exceptions import ValidationError
 from rest_framework.pagination import PageNumberPagination
-from .models import Item, UnitOfMeasure, Location, Bin, InventoryMovement
-from .serializers import ItemSerializer, UnitOfMeasureSerializer
+from .models import Item, UnitOfMeasure, Location, Bin, InventoryMovement, ItemDuplicateCandidate
+from .filters import filter_items
+from .serializers import ItemSerializer, UnitOfMeasureSerializer, ItemDuplicateCandidateSerializer
 from vendoritems.models import VendorItem
 
 
@@ -16,9 +21,51 @@ class ItemViewSet(viewsets.ModelViewSet):
     serializer_class = ItemSerializer
     pagination_class = ItemPagination
 
+    def get_queryset(self):
+        return filter_items(super().get_queryset(), self.request.query_params)
+
 
 class UnitOfMeasureViewSet(viewsets.ModelViewSet):
     queryset = UnitOfMeasure.objects.all()
     serializer_class = UnitOfMeasureSerializer
 
 
+class ItemMergeCandidateViewSet(mixins.ListModelMixin,
+                                mixins.RetrieveModelMixin,
+                                mixins.UpdateModelMixin,
+                                viewsets.GenericViewSet):
+    """
+    Review queue of possible duplicate items.
+
+    Candidates are produced by the nightly find_duplicate_items scan and
+    inline during item imports. PATCH {"status": "DISMISSED" | "MERGED"}
+    records the review decision; dismissed pairs are not raised again.
+
+    Query params:
+        status: OPEN (default), DISMISSED, MERGED or ALL
+        min_score: Only pairs scoring at least this much
+        item: Pairs involving this item_id
+    """
+    serializer_class = ItemDuplicateCandidateSerializer
+    pagination_class = ItemPagination
+    http_method_names = ['get', 'patch', 'head', 'options']
+
+    def get_queryset(self):
+        queryset = ItemDuplicateCandidate.objects.select_related('item_a', 'item_b', 'reviewed_by')
+        if self.action != 'list':
+            return queryset
+
+        params = self.request.query_params
+        status = params.get('status', 'OPEN').upper()
+        if status != 'ALL':
+            queryset = queryset.filter(status=status)
+        min_score = params.get('min_score')
+        if min_score:
+            try:
+                queryset = queryset.filter(score__gte=Decimal(min_score))
+            except InvalidOperation:
+                raise ValidationError({'min_score': 'Must be a number between 0 and 1.'})
+        item_id = params.get('item')
+        if item_id:
+            queryset = queryset.filter(Q(item_a_id=item_id) | Q(item_b_id=item_id))
+        return queryset
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.7 on 2026-10-19 16:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('locations', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='location',
+            name='pick_zone_sequence',
+            field=models.JSONField(blank=True, default=list),
+        ),
+    ]
@@ -28,6 +28,10 @@ class Location(models.Model):
     type = models.CharField(max_length=120, choices=LOCATION_TYPES, blank=False)
     is_active = models.BooleanField(default=True)
 
+    # Pick path: bin zones in the order pickers walk them; zones not
+    # listed come after, alphabetically
+    pick_zone_sequence = models.JSONField(default=list, blank=True)
+
     class Meta:
         db_table = 'locations'
         indexes = [
@@ -8,9 +8,15 @@ class LocationSerializer(serializers.ModelSerializer):
     Serializer for Location model
     Uses location_id (UUID) as primary key
     """
+    # Zone codes in walk order (see orders.pick_ticket_service.walk_key)
+    pick_zone_sequence = serializers.ListField(
+        child=serializers.CharField(max_length=32),
+        required=False,
+    )
+
     class Meta:
         model = Location
-        fields = ['location_id', 'name', 'type', 'is_active']
+        fields = ['location_id', 'name', 'type', 'is_active', 'pick_zone_sequence']
         read_only_fields = ['location_id']
     
     def validate_name(self, value):
@@ -26,4 +32,11 @@ class LocationSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError(
                 f"Invalid type. Must be one of: {', '.join(valid_types)}"
             )
-        return value
\ No newline at end of file
+        return value
+
+    def validate_pick_zone_sequence(self, value):
+        """Each zone may appear only once in the walk"""
+        duplicates = sorted({zone for zone in value if value.count(zone) > 1})
+        if duplicates:
+            raise serializers.ValidationError(f"Zones listed more than once: {', '.join(duplicates)}")
+        return value
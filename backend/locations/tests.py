@@ -1,3 +1,39 @@
 from django.test import TestCase
+from rest_framework.test import APIClient
 
-# Create your tests here.
+from users.models import User
+
+from .models import Location
+
+
+class PickZoneSequenceTests(TestCase):
+    """pick_zone_sequence must be a list of zone codes"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(email='dana@example.com')
+        cls.location = Location.objects.create(name='Main', type='WAREHOUSE')
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def patch(self, sequence):
+        return self.client.patch(
+            f'/api/locations/{self.location.pk}/', {'pick_zone_sequence': sequence}, format='json',
+        )
+
+    def test_list_of_zones_is_saved(self):
+        response = self.patch(['B', 'A', 'C'])
+
+        self.assertEqual(response.status_code, 200)
+        self.location.refresh_from_db()
+        self.assertEqual(self.location.pick_zone_sequence, ['B', 'A', 'C'])
+
+    def test_other_shapes_are_rejected(self):
+        for sequence in ('A,B', {'A': 1}, [['A']], ['A', 'B', 'A']):
+            with self.subTest(sequence=sequence):
+                self.assertEqual(self.patch(sequence).status_code, 400)
+
+        self.location.refresh_from_db()
+        self.assertEqual(self.location.pick_zone_sequence, [])
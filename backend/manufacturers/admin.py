@@ -1,11 +1,17 @@
 from django.contrib import admin
-from .models import Manufacturer, ManufacturerPart, ItemManufacturerPart
+from .models import Manufacturer, ManufacturerAlias, ManufacturerPart, ItemManufacturerPart
 
 @admin.register(Manufacturer)
 class ManufacturerAdmin(admin.ModelAdmin):
     list_display = ['name', 'website', 'support_email']
     search_fields = ['name']
 
+@admin.register(ManufacturerAlias)
+class ManufacturerAliasAdmin(admin.ModelAdmin):
+    list_display = ['alias', 'normalized', 'manufacturer']
+    search_fields = ['alias', 'normalized', 'manufacturer__name']
+    autocomplete_fields = ['manufacturer']
+
 @admin.register(ManufacturerPart)
 class ManufacturerPartAdmin(admin.ModelAdmin):
     list_display = ['part_number', 'manufacturer', 'description', 'upc']
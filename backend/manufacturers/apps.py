@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class ManufacturersConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'manufacturers'
+
+    def ready(self):
+        """Import signals when app is ready"""
+        import manufacturers.signals  # noqa
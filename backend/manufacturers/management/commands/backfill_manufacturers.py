@@ -0,0 +1,103 @@
+# backend/manufacturers/management/commands/backfill_manufacturers.py
+"""
+Manufacturer foreign-key backfill.
+
+Resolves the free-text manufacturer columns of existing rows to
+Manufacturer ids, one committed chunk at a time (keyset pagination on the
+primary key, one alias lookup and one bulk_update per chunk):
+
+    python manage.py backfill_manufacturers
+    python manage.py backfill_manufacturers --models item inventory_layer
+    python manage.py backfill_manufacturers --rebuild   # re-resolve every row,
+                                                        # e.g. after merging aliases
+"""
+
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from inventory.models import InventoryLayer, Item
+from manufacturers.services import resolve_manufacturers
+from orders.models import OrderLine
+from rfqs.models import VendorQuote
+
+
+# name -> (model, free-text field, foreign key field)
+BACKFILL_TARGETS = {
+    'item': (Item, 'manufacturer', 'mfr'),
+    'inventory_layer': (InventoryLayer, 'manufacturer', 'mfr'),
+    'order_line': (OrderLine, 'expected_manufacturer', 'expected_mfr'),
+    'vendor_quote': (VendorQuote, 'manufacturer', 'mfr'),
+}
+
+
+class Command(BaseCommand):
+    help = "Fill manufacturer foreign keys from the free-text manufacturer columns"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--models',
+            nargs='*',
+            default=None,
+            help=f"Targets to backfill (default: all of {', '.join(BACKFILL_TARGETS)})"
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=5000,
+            help='Rows per committed chunk (default: 5000)'
+        )
+        parser.add_argument(
+            '--rebuild',
+            action='store_true',
+            help='Re-resolve rows that already have a manufacturer id'
+        )
+
+    def handle(self, *args, **options):
+        targets = options['models'] or list(BACKFILL_TARGETS)
+        unknown = [name for name in targets if name not in BACKFILL_TARGETS]
+        if unknown:
+            raise CommandError(f"Unknown targets: {', '.join(unknown)}")
+
+        for name in targets:
+            started = time.monotonic()
+            scanned, updated = self.backfill(
+                *BACKFILL_TARGETS[name],
+                chunk_size=options['chunk_size'],
+                rebuild=options['rebuild'],
+            )
+            self.stdout.write(
+                f"{name}: {scanned} rows scanned, {updated} updated "
+                f"in {time.monotonic() - started:.1f}s"
+            )
+
+    def backfill(self, model, text_field, fk_field, chunk_size, rebuild):
+        fk_attname = f'{fk_field}_id'
+        queryset = model.objects.exclude(**{f'{text_field}__isnull': True}).exclude(**{text_field: ''})
+        if not rebuild:
+            queryset = queryset.filter(**{f'{fk_field}__isnull': True})
+
+        scanned = updated = 0
+        last_pk = None
+        while True:
+            page = queryset.order_by('pk')
+            if last_pk is not None:
+                page = page.filter(pk__gt=last_pk)
+            rows = list(page.values_list('pk', text_field, fk_attname)[:chunk_size])
+            if not rows:
+                break
+            last_pk = rows[-1][0]
+            scanned += len(rows)
+
+            with transaction.atomic():
+                resolved = resolve_manufacturers({text for _, text, _ in rows})
+                changed = [
+                    model(pk=pk, **{fk_attname: resolved.get(text)})
+                    for pk, text, current in rows
+                    if resolved.get(text) != current
+                ]
+                model.objects.bulk_update(changed, [fk_field], batch_size=1000)
+            updated += len(changed)
+
+        return scanned, updated
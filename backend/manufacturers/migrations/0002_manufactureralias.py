@@ -0,0 +1,46 @@
+# Generated by Django 5.2.7 on 2026-10-19 16:03
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+from inventory.matching import normalize_manufacturer
+
+
+def seed_own_aliases(apps, schema_editor):
+    """Every existing manufacturer resolves from its own name"""
+    Manufacturer = apps.get_model('manufacturers', 'Manufacturer')
+    ManufacturerAlias = apps.get_model('manufacturers', 'ManufacturerAlias')
+    aliases = {}
+    for manufacturer_id, name in Manufacturer.objects.order_by('name').values_list('manufacturer_id', 'name'):
+        normalized = normalize_manufacturer(name)[:255]
+        if normalized:
+            aliases.setdefault(normalized, ManufacturerAlias(
+                manufacturer_id=manufacturer_id,
+                alias=name,
+                normalized=normalized,
+            ))
+    ManufacturerAlias.objects.bulk_create(aliases.values(), batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('manufacturers', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ManufacturerAlias',
+            fields=[
+                ('alias_id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('alias', models.CharField(max_length=255)),
+                ('normalized', models.CharField(editable=False, max_length=255, unique=True)),
+                ('manufacturer', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='aliases', to='manufacturers.manufacturer')),
+            ],
+            options={
+                'verbose_name_plural': 'manufacturer aliases',
+            },
+        ),
+        migrations.RunPython(seed_own_aliases, migrations.RunPython.noop),
+    ]
@@ -2,6 +2,8 @@
 from django.db import models
 import uuid
 
+from inventory.matching import normalize_manufacturer
+
 class Manufacturer(models.Model):
     manufacturer_id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     name = models.CharField(max_length=255, unique=True)
@@ -12,6 +14,28 @@ class Manufacturer(models.Model):
         return self.name
 
 
+class ManufacturerAlias(models.Model):
+    """
+    A free-text spelling of a manufacturer ("SQUARE-D", "Square D Co.").
+    Free text is resolved to a Manufacturer through `normalized`, the
+    inventory.matching.normalize_manufacturer() form of the alias.
+    """
+    alias_id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    manufacturer = models.ForeignKey(Manufacturer, on_delete=models.CASCADE, related_name='aliases')
+    alias = models.CharField(max_length=255)
+    normalized = models.CharField(max_length=255, unique=True, editable=False)
+
+    class Meta:
+        verbose_name_plural = 'manufacturer aliases'
+
+    def save(self, *args, **kwargs):
+        self.normalized = normalize_manufacturer(self.alias)[:255]
+        super().save(*args, **kwargs)
+
+    def __str__(self):
+        return f"{self.alias} -> {self.manufacturer.name}"
+
+
 class ManufacturerPart(models.Model):
     mfr_part_id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     manufacturer = models.ForeignKey(Manufacturer, on_delete=models.CASCADE, related_name='parts')
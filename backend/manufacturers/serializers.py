@@ -0,0 +1,7 @@
+# backend/manufacturers/serializers.py
+from rest_framework import serializers
+
+
+class ManufacturerStockQuerySerializer(serializers.Serializer):
+    """Query parameters of the manufacturer stock report"""
+    location = serializers.UUIDField(required=False)
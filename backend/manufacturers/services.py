@@ -0,0 +1,176 @@
+# backend/manufacturers/services.py
+"""
+Manufacturer normalization.
+
+Free-text manufacturer names on items, inventory layers, PO lines and
+vendor quotes are resolved to a Manufacturer id when the row is written,
+so "Square D", "SQUARE-D" and "Square D Co." all land on one manufacturer
+and manufacturer reports join and group on an indexed id.
+
+Resolution goes through ManufacturerAlias.normalized. The alias map is
+kept in a per-process cache that is reloaded every
+MANUFACTURER_CACHE_SECONDS and cleared locally whenever an alias or
+manufacturer changes (see signals.py). Names that are not known yet get
+a new Manufacturer plus alias, so resolution never fails.
+"""
+
+import time
+
+from django.conf import settings
+from django.db import transaction
+
+from inventory.matching import normalize_manufacturer
+
+from .models import Manufacturer, ManufacturerAlias
+
+
+class ManufacturerCache:
+    """
+    Normalized name -> manufacturer_id, loaded from ManufacturerAlias.
+
+    Ids read or created inside a transaction only become shared cache
+    entries once it commits; until then they are used by that transaction
+    alone, so a rolled-back import never leaves ids of manufacturers that
+    do not exist in the cache.
+    """
+
+    def __init__(self):
+        self._ids = {}
+        self._pending = []
+        self._loaded_at = None
+
+    def clear(self):
+        self._ids = {}
+        self._pending = []
+        self._loaded_at = None
+
+    def _learn(self, ids):
+        connection = transaction.get_connection()
+        if not connection.in_atomic_block:
+            self._ids.update(ids)
+            return
+        self._pending.append((tuple(connection.atomic_blocks), ids))
+        transaction.on_commit(lambda: self._ids.update(ids))
+
+    def _known(self):
+        """Committed entries plus those learned in the still-open transaction"""
+        connection = transaction.get_connection()
+        blocks = connection.atomic_blocks if connection.in_atomic_block else []
+        self._pending = [
+            (learned_in, ids)
+            for learned_in, ids in self._pending
+            if len(learned_in) <= len(blocks)
+            and all(block is current for block, current in zip(learned_in, blocks))
+        ]
+        if not self._pending:
+            return self._ids
+        known = dict(self._ids)
+        for _, ids in self._pending:
+            known.update(ids)
+        return known
+
+    def _ensure_loaded(self):
+        ttl = getattr(settings, 'MANUFACTURER_CACHE_SECONDS', 300)
+        if self._loaded_at is not None and time.monotonic() - self._loaded_at < ttl:
+            return
+        self.clear()
+        self._learn(dict(ManufacturerAlias.objects.values_list('normalized', 'manufacturer_id')))
+        self._loaded_at = time.monotonic()
+
+    def _fetch(self, keys):
+        ids = dict(
+            ManufacturerAlias.objects
+            .filter(normalized__in=list(keys))
+            .values_list('normalized', 'manufacturer_id')
+        )
+        if ids:
+            self._learn(ids)
+        return ids
+
+    def resolve(self, name, create=True):
+        """manufacturer_id for one free-text name, or None when blank"""
+        return self.resolve_many([name], create=create).get(name)
+
+    def resolve_many(self, names, create=True):
+        """
+        Resolve free-text names in bulk.
+
+        Cached names cost nothing; the rest are looked up with one query,
+        and with create=True the still-unknown ones are created in bulk.
+
+        Returns:
+            dict: name -> manufacturer_id (None for blank or unknown names)
+        """
+        self._ensure_loaded()
+        known = self._known()
+        normalized = {name: normalize_manufacturer(name)[:255] for name in names}
+        missing = {
+            key: name.strip()[:255]
+            for name, key in normalized.items()
+            if key and key not in known
+        }
+        if missing:
+            known = {**known, **self._fetch(missing)}
+            missing = {key: name for key, name in missing.items() if key not in known}
+        if missing and create:
+            self._create(missing)
+            # Re-read: a concurrent writer may have claimed some aliases first
+            known = {**known, **self._fetch(missing)}
+
+        return {name: known.get(key) for name, key in normalized.items()}
+
+    def _create(self, missing):
+        """Create manufacturers and aliases for normalized key -> display name"""
+        with transaction.atomic():
+            by_name = dict(
+                Manufacturer.objects
+                .filter(name__in=list(missing.values()))
+                .values_list('name', 'manufacturer_id')
+            )
+            new = [
+                Manufacturer(name=name)
+                for name in set(missing.values())
+                if name not in by_name
+            ]
+            Manufacturer.objects.bulk_create(new, ignore_conflicts=True)
+            by_name.update(
+                Manufacturer.objects
+                .filter(name__in=[manufacturer.name for manufacturer in new])
+                .values_list('name', 'manufacturer_id')
+            )
+            ManufacturerAlias.objects.bulk_create(
+                [
+                    ManufacturerAlias(alias=name, normalized=key, manufacturer_id=by_name[name])
+                    for key, name in missing.items()
+                ],
+                ignore_conflicts=True,
+            )
+
+
+manufacturer_cache = ManufacturerCache()
+
+
+def resolve_manufacturer(name, create=True):
+    """manufacturer_id for a free-text manufacturer name (None when blank)"""
+    if not name or not name.strip():
+        return None
+    return manufacturer_cache.resolve(name, create=create)
+
+
+def resolve_manufacturers(names, create=True):
+    """Bulk resolve_manufacturer(); returns name -> manufacturer_id"""
+    return manufacturer_cache.resolve_many([name for name in names if name], create=create)
+
+
+def sync_manufacturer(instance, text_field, fk_field, save_kwargs):
+    """
+    Model.save() helper: resolve instance.<text_field> into <fk_field>
+    whenever the text field is part of the save. Mutates save_kwargs so a
+    save(update_fields=[text_field]) also writes the foreign key.
+    """
+    update_fields = save_kwargs.get('update_fields')
+    if update_fields is not None and text_field not in update_fields:
+        return
+    setattr(instance, f'{fk_field}_id', resolve_manufacturer(getattr(instance, text_field)))
+    if update_fields is not None:
+        save_kwargs['update_fields'] = {*update_fields, fk_field}
@@ -0,0 +1,32 @@
+"""
+Signals for the manufacturer normalization cache.
+
+Every manufacturer is reachable by its own name, and this process's
+cached alias map is dropped whenever a manufacturer or alias changes.
+Other processes pick changes up within MANUFACTURER_CACHE_SECONDS.
+"""
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from inventory.matching import normalize_manufacturer
+
+from .models import Manufacturer, ManufacturerAlias
+from .services import manufacturer_cache
+
+
+@receiver(post_save, sender=Manufacturer, dispatch_uid='manufacturer_own_alias')
+def ensure_own_alias(sender, instance, created, raw=False, **kwargs):
+    """Register a manufacturer's own name as an alias"""
+    if raw:
+        return
+    normalized = normalize_manufacturer(instance.name)
+    if normalized and not ManufacturerAlias.objects.filter(normalized=normalized).exists():
+        ManufacturerAlias.objects.create(manufacturer=instance, alias=instance.name)
+    manufacturer_cache.clear()
+
+
+@receiver(post_delete, sender=Manufacturer, dispatch_uid='manufacturer_cache_delete')
+@receiver(post_save, sender=ManufacturerAlias, dispatch_uid='manufacturer_alias_cache_save')
+@receiver(post_delete, sender=ManufacturerAlias, dispatch_uid='manufacturer_alias_cache_delete')
+def clear_manufacturer_cache(sender, **kwargs):
+    manufacturer_cache.clear()
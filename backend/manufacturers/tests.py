@@ -1,3 +1,112 @@
+from decimal import Decimal
+
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from inventory.filters import filter_items
+from inventory.models import InventoryLayer, Item
+from locations.models import Location
+from users.models import User
+
+from .models import Manufacturer, ManufacturerAlias
+from .services import manufacturer_cache, resolve_manufacturer, resolve_manufacturers
+
+
+class ResolveManufacturerTests(TestCase):
+    """Every spelling resolves to one manufacturer, in a bounded number of queries"""
+
+    def setUp(self):
+        manufacturer_cache.clear()
+
+    def test_spellings_share_one_manufacturer(self):
+        ids = resolve_manufacturers(['Square D', 'SQUARE-D', 'Square D Co.', 'Eaton', ''])
+
+        self.assertEqual(len({ids['Square D'], ids['SQUARE-D'], ids['Square D Co.']}), 1)
+        self.assertNotEqual(ids['Square D'], ids['Eaton'])
+        self.assertEqual(Manufacturer.objects.count(), 2)
+        self.assertIsNone(resolve_manufacturer('  '))
+        self.assertIsNone(resolve_manufacturer('Siemens', create=False))
+        self.assertFalse(Manufacturer.objects.filter(name='Siemens').exists())
+
+    def test_query_count_does_not_grow_with_names(self):
+        resolve_manufacturer('Warm-up')  # Loads the alias map
+
+        with CaptureQueriesContext(connection) as few:
+            resolve_manufacturers([f'Maker {i}' for i in range(2)])
+        with CaptureQueriesContext(connection) as many:
+            resolve_manufacturers([f'Maker {i}' for i in range(100, 200)])
+        self.assertEqual(len(few), len(many))
+        self.assertEqual(ManufacturerAlias.objects.count(), 103)
+
+        # Known names are served from the cache
+        with CaptureQueriesContext(connection) as cached:
+            resolve_manufacturers([f'MAKER {i}' for i in range(100, 200)])
+        self.assertEqual(len(cached), 0)
+
+
+class ManufacturerFilterTests(TestCase):
+    """The item manufacturer filter also finds items not backfilled yet"""
+
+    @classmethod
+    def setUpTestData(cls):
+        Item.objects.create(g_code='G-1', item_name='Breaker', manufacturer='Square D')
+        Item.objects.create(g_code='G-2', item_name='Breaker', manufacturer='SQUARE-D')
+        Item.objects.create(g_code='G-3', item_name='Breaker', manufacturer='Eaton')
+        Item.objects.create(g_code='G-4', item_name='Breaker', manufacturer='square d')
+        Item.objects.create(g_code='G-5', item_name='Relay', manufacturer='Omron')
+        # Rows written before manufacturer ids existed
+        Item.objects.filter(g_code__in=['G-2', 'G-4', 'G-5']).update(mfr=None)
+
+    def filtered(self, manufacturer):
+        return list(filter_items(Item.objects.order_by('g_code'), {'manufacturer': manufacturer})
+                    .values_list('g_code', flat=True))
+
+    def test_unresolved_items_match_on_text(self):
+        self.assertEqual(self.filtered('Square D Co.'), ['G-1', 'G-2', 'G-4'])
+        self.assertEqual(self.filtered('Eaton'), ['G-3'])
+
+        # No manufacturer at all yet: only the text can match
+        Manufacturer.objects.filter(name='Omron').delete()
+        manufacturer_cache.clear()
+        self.assertEqual(self.filtered('OMRON Inc.'), ['G-5'])
+        self.assertEqual(self.filtered('Siemens'), [])
+
+
+class ManufacturerStockViewTests(TestCase):
+    """Stock by manufacturer, with validated query parameters"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(email='dana@example.com')
+        cls.location = Location.objects.create(name='Main', type='WAREHOUSE')
+        other = Location.objects.create(name='Truck 7', type='WAREHOUSE')
+        item = Item.objects.create(g_code='G-1', item_name='Breaker')
+        for location, manufacturer, qty in (
+            (cls.location, 'Square D', '4'),
+            (cls.location, 'SQUARE-D', '6'),
+            (other, 'Square D', '5'),
+        ):
+            InventoryLayer.objects.create(
+                item=item, location=location, manufacturer=manufacturer,
+                qty_remaining=Decimal(qty), unit_cost=Decimal('2.00'),
+            )
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_stock_groups_spellings_per_location(self):
+        response = self.client.get('/api/manufacturers/stock/', {'location': str(self.location.pk)})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data), 1)
+        self.assertEqual(response.data[0]['manufacturer'], 'Square D')
+        self.assertEqual(response.data[0]['qty_on_hand'], Decimal('10'))
+
+    def test_invalid_location_is_rejected(self):
+        response = self.client.get('/api/manufacturers/stock/', {'location': 'main'})
 
-# Create your tests here.
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('location', response.data)
@@ -0,0 +1,7 @@
+# backend/manufacturers/urls.py
+from django.urls import path
+from .views import ManufacturerStockView
+
+urlpatterns = [
+    path('stock/', ManufacturerStockView.as_view(), name='manufacturer-stock'),
+]
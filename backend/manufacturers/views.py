@@ -1,3 +1,63 @@
-from django.shortcuts import render
+# backend/manufacturers/views.py
+"""
+API views for manufacturer reports
+"""
+from django.db.models import Count, DecimalField, ExpressionWrapper, F, Sum
+from drf_spectacular.utils import OpenApiParameter, extend_schema
+from rest_framework.response import Response
+from rest_framework.views import APIView
 
-# Create your views here.
+from inventory.models import InventoryLayer
+
+from .serializers import ManufacturerStockQuerySerializer
+
+
+@extend_schema(
+    tags=["Manufacturers"],
+    summary="On-hand stock by manufacturer",
+    description="""
+    Open FIFO layers grouped by the resolved manufacturer id, so every
+    spelling of a manufacturer ("Square D", "SQUARE-D") lands in one row.
+    Layers whose manufacturer text is blank or not yet backfilled are
+    reported with a null **manufacturer_id**.
+    """,
+    parameters=[
+        OpenApiParameter('location', str, description='Limit to one location_id (UUID)'),
+    ],
+)
+class ManufacturerStockView(APIView):
+    """
+    GET /api/manufacturers/stock/
+    """
+
+    def get(self, request, *args, **kwargs):
+        params = ManufacturerStockQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        layers = InventoryLayer.objects.filter(qty_remaining__gt=0)
+        location_id = params.validated_data.get('location')
+        if location_id:
+            layers = layers.filter(location_id=location_id)
+
+        rows = (
+            layers
+            .values('mfr_id', 'mfr__name')
+            .annotate(
+                item_count=Count('item_id', distinct=True),
+                qty_on_hand=Sum('qty_remaining'),
+                value=Sum(ExpressionWrapper(
+                    F('qty_remaining') * F('unit_cost'),
+                    output_field=DecimalField(max_digits=20, decimal_places=4)
+                )),
+            )
+            .order_by('-value')
+        )
+        return Response([
+            {
+                'manufacturer_id': row['mfr_id'],
+                'manufacturer': row['mfr__name'],
+                'item_count': row['item_count'],
+                'qty_on_hand': row['qty_on_hand'],
+                'value': row['value'],
+            }
+            for row in rows
+        ])
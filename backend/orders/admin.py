@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Order, OrderLine, SalesOrderInfo
+from .models import Order, OrderLine, OrderLineAllocation, PickTicketBatch, SalesOrderInfo
 
 
 class OrderLineInline(admin.TabularInline):
@@ -36,6 +36,20 @@ class OrderLineAdmin(admin.ModelAdmin):
     search_fields = ['description', 'g_code']
 
 
+@admin.register(OrderLineAllocation)
+class OrderLineAllocationAdmin(admin.ModelAdmin):
+    list_display = ['order_line', 'location', 'bin', 'qty', 'unit_cost', 'pending_allocation', 'allocated_at']
+    list_select_related = ['order_line', 'location', 'bin']
+    raw_id_fields = ['order_line', 'layer', 'pending_allocation']
+
+
+@admin.register(PickTicketBatch)
+class PickTicketBatchAdmin(admin.ModelAdmin):
+    list_display = ['batch_id', 'output_format', 'status', 'tickets_done', 'tickets_total', 'render_seconds', 'created_at']
+    list_filter = ['status', 'output_format', 'created_at']
+    readonly_fields = ['batch_id', 'created_at', 'started_at', 'finished_at', 'heartbeat_at']
+
+
 @admin.register(SalesOrderInfo)
 class SalesOrderInfoAdmin(admin.ModelAdmin):
     list_display = ['order', 'ship_to_name', 'contact_name']
\ No newline at end of file
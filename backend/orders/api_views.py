@@ -5,12 +5,25 @@ API views for orders app
 
 from rest_framework.decorators import api_view
 from rest_framework.response import Response
-from rest_framework import status
-from django.http import HttpResponse
+from rest_framework import generics, status
+from rest_framework.views import APIView
+from django.http import FileResponse, HttpResponse
 from django.shortcuts import get_object_or_404
+from django.utils.text import slugify
 
-from .models import Order
-from .pick_ticket_service import generate_pick_ticket
+from locations.models import Location
+
+from .fulfillment import allocations_by_line, fulfill_wave
+from .models import Order, PickTicketBatch, PickTicketBatchStatus
+from .pick_ticket_batches import enqueue_batch, select_orders
+from .pick_ticket_service import generate_pick_ticket, generate_wave_pick_list
+from .serializers import (
+    PickTicketBatchCreateSerializer,
+    PickTicketBatchSerializer,
+    PickTicketOptionsSerializer,
+    WaveRequestSerializer,
+)
+from .waves import plan_wave, wave_orders
 
 
 @api_view(['GET'])
@@ -18,13 +31,17 @@ def download_pick_ticket(request, order_id):
     """
     Generate and download pick ticket PDF for a sales order
     
-    GET /api/orders/{order_id}/pick-ticket/
+    GET /api/orders/{order_id}/pick-ticket/[?pick_path=true]
+
+    Once the order has been fulfilled (POST /api/orders/{order_id}/fulfill/)
+    the ticket shows the allocated bins. pick_path=true prints the lines
+    in walk order (location, zone, bin) grouped by bin.
     
     Returns:
         PDF file download
     """
     # Get the order
-    order = get_object_or_404(Order, order_id=order_id)
+    order = get_object_or_404(Order.objects.select_related('customer', 'job'), order_id=order_id)
     
     # Validate it's a sales order
     if order.order_type != 'SALES':
@@ -34,15 +51,25 @@ def download_pick_ticket(request, order_id):
         )
     
     # Check if order has lines
-    if not order.lines.exists():
+    lines = list(order.lines.all().select_related('item', 'uom').order_by('line_no'))
+    if not lines:
         return Response(
             {'error': 'Order has no line items'},
             status=status.HTTP_400_BAD_REQUEST
         )
     
+    options = PickTicketOptionsSerializer(data=request.query_params)
+    options.is_valid(raise_exception=True)
+
     try:
         # Generate PDF
-        pdf_buffer = generate_pick_ticket(order)
+        allocations = allocations_by_line(lines)
+        pdf_buffer = generate_pick_ticket(
+            order,
+            lines=lines,
+            allocations=allocations or None,
+            pick_path=options.validated_data['pick_path'],
+        )
         
         # Create response
         response = HttpResponse(pdf_buffer.read(), content_type='application/pdf')
@@ -57,4 +84,158 @@ def download_pick_ticket(request, order_id):
         return Response(
             {'error': f'Failed to generate pick ticket: {str(e)}'},
             status=status.HTTP_500_INTERNAL_SERVER_ERROR
-        )
\ No newline at end of file
+        )
+
+
+class PickTicketBatchListCreateView(generics.ListCreateAPIView):
+    """
+    GET  /api/orders/pick-tickets/batches/ - Recent batches
+    POST /api/orders/pick-tickets/batches/ - Queue a batch
+
+    POST body: {"order_ids": [...]} or {"order_status": "OPEN"}, plus
+    optional from_location, format (PDF | ZIP) and pick_path. Only sales
+    orders with lines are printed. Returns 202 with the batch to poll.
+    """
+    queryset = PickTicketBatch.objects.all()
+    serializer_class = PickTicketBatchSerializer
+
+    def create(self, request, *args, **kwargs):
+        serializer = PickTicketBatchCreateSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+
+        order_ids = select_orders(
+            order_ids=data.get('order_ids'),
+            order_status=data.get('order_status'),
+            from_location=data.get('from_location'),
+        )
+        if not order_ids:
+            return Response(
+                {'error': 'No sales orders with line items match'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        user = request.user if request.user.is_authenticated else None
+        batch = enqueue_batch(order_ids, output_format=data['format'], pick_path=data['pick_path'], user=user)
+        return Response(PickTicketBatchSerializer(batch).data, status=status.HTTP_202_ACCEPTED)
+
+
+class PickTicketBatchDetailView(generics.RetrieveAPIView):
+    """GET /api/orders/pick-tickets/batches/<batch_id>/"""
+    queryset = PickTicketBatch.objects.all()
+    serializer_class = PickTicketBatchSerializer
+    lookup_field = 'batch_id'
+
+
+@api_view(['GET'])
+def download_pick_ticket_batch(request, batch_id):
+    """
+    Download a completed batch's merged PDF or zip
+
+    GET /api/orders/pick-tickets/batches/{batch_id}/download/
+    """
+    batch = get_object_or_404(PickTicketBatch, batch_id=batch_id)
+    if batch.status != PickTicketBatchStatus.COMPLETED or not batch.file:
+        return Response(
+            {'error': f'Batch is {batch.status.lower()}, not ready for download'},
+            status=status.HTTP_409_CONFLICT
+        )
+
+    extension = batch.file.name.rsplit('.', 1)[-1]
+    return FileResponse(
+        batch.file.open('rb'),
+        as_attachment=True,
+        filename=f'pick_tickets_{str(batch.batch_id)[:8]}.{extension}',
+        content_type='application/zip' if extension == 'zip' else 'application/pdf',
+    )
+
+
+class WaveView(APIView):
+    """
+    Wave picking: open SALES orders from one location, picked together.
+
+    GET  /api/orders/waves/?from_location=...[&fulfillment_date=YYYY-MM-DD]
+         [&department=...][&order_ids=...&order_ids=...]
+         Consolidated picks and put-wall slots as JSON (nothing written).
+    POST /api/orders/waves/ with the same fields in the body, plus
+         optional allocate (default true) and allow_negative (default
+         true). Allocates the whole wave in one FIFO pass, then returns
+         the wave pick list PDF; X-Wave-Orders / X-Lines-Allocated /
+         X-Lines-Short / X-Lines-Skipped headers summarize it.
+    """
+
+    def _wave(self, data):
+        params = WaveRequestSerializer(data=data)
+        params.is_valid(raise_exception=True)
+        params = params.validated_data
+        location = get_object_or_404(Location, location_id=params['from_location'])
+        orders = wave_orders(
+            location,
+            fulfillment_date=params.get('fulfillment_date'),
+            department=params.get('department'),
+            order_ids=params.get('order_ids'),
+        )
+        return params, location, list(orders)
+
+    def get(self, request):
+        _, location, orders = self._wave(request.query_params)
+        plan = plan_wave(orders, location)
+
+        def row_data(row):
+            return {
+                'item': row['item'].pk,
+                'g_code': row['item'].g_code,
+                'item_name': row['item'].item_name,
+                'uom': row['uom'],
+                'bin': row['bin'].pk if row['bin'] else None,
+                'bin_code': row['bin'].bin_code if row['bin'] else None,
+                'zone': row['bin'].zone if row['bin'] else None,
+                'qty': row['qty'],
+                'slots': [{'slot': slot, 'qty': qty} for slot, qty in row['slots']],
+            }
+
+        return Response({
+            'location': location.pk,
+            'slots': [
+                {
+                    'slot': slot,
+                    'order': order.pk,
+                    'customer': order.customer.name if order.customer else None,
+                    'lines': len(plan['put_wall'].get(order.pk, [])),
+                }
+                for slot, order in plan['slots']
+            ],
+            'picks': [row_data(row) for row in plan['picks']],
+            'unassigned': [row_data(row) for row in plan['unassigned']],
+            'backorder': [row_data(row) for row in plan['backorder']],
+        })
+
+    def post(self, request):
+        params, location, orders = self._wave(request.data)
+        if not orders:
+            return Response(
+                {'error': 'No open sales orders with line items match'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        result = {'lines_allocated': 0, 'lines_short': 0, 'lines_skipped': 0}
+        if params['allocate']:
+            try:
+                result = fulfill_wave([order.pk for order in orders], location, params['allow_negative'])
+            except ValueError as e:
+                return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        filters = []
+        if params.get('fulfillment_date'):
+            filters.append(f"Due {params['fulfillment_date']:%m/%d/%Y}")
+        if params.get('department'):
+            filters.append(f"Department {str(params['department'])[:8]}")
+        pdf_buffer = generate_wave_pick_list(plan_wave(orders, location), title_note='  |  '.join(filters))
+
+        response = HttpResponse(pdf_buffer.read(), content_type='application/pdf')
+        response['Content-Disposition'] = f'attachment; filename="wave_{slugify(location.name)}.pdf"'
+        response['X-Wave-Orders'] = len(orders)
+        response['X-Lines-Allocated'] = result['lines_allocated']
+        response['X-Lines-Short'] = result['lines_short']
+        response['X-Lines-Skipped'] = result['lines_skipped']
+        return response
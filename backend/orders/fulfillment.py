@@ -0,0 +1,288 @@
+# backend/orders/fulfillment.py
+"""
+Sales Order Fulfillment
+
+fulfill_order() allocates every line of a SALES order in one batched
+FIFO pass and records what it chose as OrderLineAllocation rows (layer,
+bin, qty, cost), so the pick ticket sends pickers to the bins the stock
+was actually taken from.
+
+All FIFO layers for the order's items at its from_location are loaded
+(and locked) with one query and consumed in memory, oldest first, in
+line_no order; lines with a from_bin only draw from that bin. Layers,
+movements, pending allocations and allocation rows are then written in
+bulk, so the query count does not grow with the number of lines.
+
+Shortages follow FIFOInventoryService.allocate_inventory_fifo: with
+allow_negative the missing quantity becomes a PendingAllocation plus an
+estimated movement, otherwise nothing is written and ValueError is
+raised. Lines that already have allocations are skipped, so fulfilling
+twice does not double-allocate.
+
+fulfill_wave() runs the same pass over many orders from one location
+(see waves.py), so a wave costs the same handful of queries as a single
+order.
+"""
+
+from collections import defaultdict
+from decimal import Decimal
+
+from django.db import transaction
+from django.db.models import Exists, F, OuterRef
+from django.utils import timezone
+
+from inventory.models import InventoryLayer, InventoryMovement, PendingAllocation
+
+from .models import Order, OrderLine, OrderLineAllocation, OrderType
+
+
+BATCH_SIZE = 500
+
+
+def allocations_by_line(lines=None, order_ids=None):
+    """
+    order_line_id -> recorded allocations (bin and location loaded) for
+    the given lines, or for every line of the given orders
+    """
+    if order_ids is not None:
+        condition = {'order_line__order_id__in': order_ids}
+    else:
+        condition = {'order_line__in': lines}
+    allocations = defaultdict(list)
+    for allocation in (
+        OrderLineAllocation.objects
+        .filter(**condition)
+        .select_related('location', 'bin')
+        .order_by('allocated_at', F('pending_allocation').asc(nulls_first=True), 'bin__bin_code')
+    ):
+        allocations[allocation.order_line_id].append(allocation)
+    return allocations
+
+
+def _take(layers, qty):
+    """Consume up to qty from layers in order; returns [(layer, qty_taken)]"""
+    taken = []
+    for layer in layers:
+        if qty <= 0:
+            break
+        if layer.qty_remaining <= 0:
+            continue
+        take = min(layer.qty_remaining, qty)
+        layer.qty_remaining -= take
+        qty -= take
+        taken.append((layer, take))
+    return taken
+
+
+def _allocate(orders, location, allow_negative, reference=''):
+    """
+    Allocate every unallocated item line of the given (locked) orders from
+    location in one FIFO pass: orders in the given order, lines in line_no
+    order. Used for single orders and whole waves.
+
+    Returns:
+        dict: lines (all item lines, item and uom loaded), allocations
+            (order_line_id -> new OrderLineAllocations), lines_allocated,
+            lines_short, lines_skipped
+
+    Raises:
+        ValueError: Insufficient stock with allow_negative=False
+    """
+    rank = {order.pk: i for i, order in enumerate(orders)}
+    orders_by_id = {order.pk: order for order in orders}
+    lines = list(
+        OrderLine.objects
+        .filter(order_id__in=list(rank), item__isnull=False)
+        .select_related('item', 'uom', 'from_bin')
+        .annotate(allocated=Exists(OrderLineAllocation.objects.filter(order_line=OuterRef('pk'))))
+    )
+    lines.sort(key=lambda line: (rank[line.order_id], line.line_no))
+    to_allocate = [line for line in lines if not line.allocated and line.qty > 0]
+    result = {
+        'lines': lines,
+        'allocations': defaultdict(list),
+        'lines_allocated': 0,
+        'lines_short': 0,
+        'lines_skipped': sum(1 for line in lines if line.allocated),
+    }
+
+    layers_by_item = defaultdict(list)
+    for layer in (
+        InventoryLayer.objects
+        .select_for_update(of=('self',))
+        .select_related('bin')
+        .filter(
+            item_id__in={line.item_id for line in to_allocate},
+            location=location,
+            qty_remaining__gt=0,
+        )
+        .order_by('received_at', 'layer_id')
+    ):
+        layers_by_item[layer.item_id].append(layer)
+
+    now = timezone.now()
+    touched = {}
+    movements = []
+    pending = []
+    allocations = []
+    shortages = []
+    for line in to_allocate:
+        order = orders_by_id[line.order_id]
+        line_reference = reference or f"Sales order {order.order_id}"
+        layers = layers_by_item[line.item_id]
+        if line.from_bin_id:
+            layers = [layer for layer in layers if layer.bin_id == line.from_bin_id]
+
+        taken = _take(layers, line.qty)
+        for layer, qty in taken:
+            touched[layer.pk] = layer
+            movements.append(InventoryMovement(
+                item_id=line.item_id,
+                qty=-qty,
+                uom_id=line.uom_id,
+                unit_cost=layer.unit_cost,
+                total_cost=qty * layer.unit_cost,
+                from_location=location,
+                from_bin_id=layer.bin_id,
+                order=order,
+                order_line=line,
+                reference=line_reference,
+                note=f"FIFO allocation from layer {layer.layer_id}",
+                is_estimated=False,
+            ))
+            allocations.append(OrderLineAllocation(
+                order_line=line,
+                layer=layer,
+                location=location,
+                bin=layer.bin,
+                qty=qty,
+                unit_cost=layer.unit_cost,
+                allocated_at=now,
+            ))
+
+        shortage = line.qty - sum((qty for _, qty in taken), Decimal('0'))
+        if shortage <= 0:
+            result['lines_allocated'] += 1
+            continue
+        shortages.append(f"{line.item.g_code}: short {shortage}")
+        result['lines_short'] += 1
+
+        # Same estimate as FIFOInventoryService: replacement cost, else the newest layer's cost
+        estimated_cost = line.item.current_replacement_cost or Decimal('0')
+        if not estimated_cost and layers_by_item[line.item_id]:
+            estimated_cost = layers_by_item[line.item_id][-1].unit_cost
+        pending_allocation = PendingAllocation(
+            item_id=line.item_id,
+            location=location,
+            order=order,
+            qty=shortage,
+            estimated_unit_cost=estimated_cost,
+            estimated_total_cost=shortage * estimated_cost,
+            status=PendingAllocation.Status.AWAITING_RECEIPT,
+            notes=f"Shortage from allocation: {line_reference}",
+        )
+        pending.append(pending_allocation)
+        movements.append(InventoryMovement(
+            item_id=line.item_id,
+            qty=-shortage,
+            uom_id=line.uom_id,
+            unit_cost=estimated_cost,
+            total_cost=shortage * estimated_cost,
+            from_location=location,
+            from_bin_id=line.from_bin_id,
+            order=order,
+            order_line=line,
+            reference=line_reference,
+            note=f"ESTIMATED - Pending fulfillment: {pending_allocation.pending_allocation_id}",
+            is_estimated=True,
+        ))
+        allocations.append(OrderLineAllocation(
+            order_line=line,
+            location=location,
+            bin=line.from_bin,
+            qty=shortage,
+            unit_cost=estimated_cost,
+            pending_allocation=pending_allocation,
+            allocated_at=now,
+        ))
+
+    if shortages and not allow_negative:
+        raise ValueError(f"Insufficient inventory. {'; '.join(shortages)}")
+
+    InventoryLayer.objects.bulk_update(touched.values(), ['qty_remaining'], batch_size=BATCH_SIZE)
+    PendingAllocation.objects.bulk_create(pending, batch_size=BATCH_SIZE)
+    InventoryMovement.objects.bulk_create(movements, batch_size=BATCH_SIZE)
+    OrderLineAllocation.objects.bulk_create(allocations, batch_size=BATCH_SIZE)
+
+    for allocation in allocations:
+        result['allocations'][allocation.order_line_id].append(allocation)
+    return result
+
+
+@transaction.atomic
+def fulfill_order(order, allow_negative=True, reference=''):
+    """
+    Allocate all unallocated lines of a SALES order from its from_location.
+
+    Args:
+        order: Order instance (order_type SALES, from_location set)
+        allow_negative: Leave shortages pending instead of failing
+        reference: Reference stored on the movements
+
+    Returns:
+        dict: order (with customer/job/from_location loaded), lines (all
+            item lines, item and uom loaded), allocations
+            (order_line_id -> OrderLineAllocations), lines_allocated,
+            lines_short, lines_skipped
+
+    Raises:
+        ValueError: Not a fulfillable sales order, or insufficient stock
+            with allow_negative=False
+    """
+    order = (
+        Order.objects
+        .select_for_update(of=('self',))
+        .select_related('customer', 'job', 'from_location')
+        .get(pk=order.pk)
+    )
+    if order.order_type != OrderType.SALES:
+        raise ValueError('Only sales orders can be fulfilled')
+    if order.from_location is None:
+        raise ValueError('Order has no from_location to fulfill from')
+
+    result = _allocate([order], order.from_location, allow_negative, reference)
+    result['order'] = order
+    if result['lines_skipped']:
+        result['allocations'] = allocations_by_line(result['lines'])
+    return result
+
+
+@transaction.atomic
+def fulfill_wave(order_ids, location, allow_negative=True):
+    """
+    Allocate a wave of SALES orders picked from the same location in one
+    FIFO pass; earlier orders in order_ids get stock first.
+
+    Orders that are not SALES orders from location are left out.
+
+    Returns:
+        dict: orders (locked, in order_ids order), lines_allocated,
+            lines_short, lines_skipped
+
+    Raises:
+        ValueError: Insufficient stock with allow_negative=False
+    """
+    orders = Order.objects.select_for_update(of=('self',)).in_bulk(list(order_ids))
+    orders = [
+        orders[order_id] for order_id in order_ids
+        if order_id in orders
+        and orders[order_id].order_type == OrderType.SALES
+        and orders[order_id].from_location_id == location.pk
+    ]
+    result = _allocate(orders, location, allow_negative, reference='')
+    return {
+        'orders': orders,
+        'lines_allocated': result['lines_allocated'],
+        'lines_short': result['lines_short'],
+        'lines_skipped': result['lines_skipped'],
+    }
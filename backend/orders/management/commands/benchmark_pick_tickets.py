@@ -0,0 +1,131 @@
+# backend/orders/management/commands/benchmark_pick_tickets.py
+"""
+Pick-ticket rendering benchmark.
+
+Creates synthetic sales orders (with default bins, so tickets print real
+bin codes) and renders them through render_batch as a merged PDF and as
+a zip at each worker count. Reports tickets/second, output size and query
+counts. Everything runs in a transaction that is rolled back unless
+--keep is given.
+
+    python manage.py benchmark_pick_tickets
+    python manage.py benchmark_pick_tickets --orders 500 --lines 40 --workers 1 4
+"""
+
+import time
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+
+from inventory.models import Bin, Item, ItemDefaultBin
+from locations.models import Location
+from orders.models import Order, OrderLine, OrderType, PickTicketBatchFormat
+from orders.pick_ticket_batches import default_workers, render_batch
+
+
+BATCH_SIZE = 1000
+ZONES = ['A', 'B', 'C', 'D']
+
+
+class Rollback(Exception):
+    """Raised to roll the benchmark transaction back"""
+
+
+class Command(BaseCommand):
+    help = "Benchmark batch pick-ticket rendering with synthetic sales orders"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--orders',
+            type=int,
+            default=200,
+            help='Sales orders generated (default: 200)'
+        )
+        parser.add_argument(
+            '--lines',
+            type=int,
+            default=20,
+            help='Lines per order (default: 20)'
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            nargs='*',
+            default=None,
+            help='Worker counts to try for zip output (default: 1 and PICK_TICKET_WORKERS/CPU count)'
+        )
+        parser.add_argument(
+            '--pick-path',
+            action='store_true',
+            help='Render the walk-order layout'
+        )
+        parser.add_argument(
+            '--keep',
+            action='store_true',
+            help='Commit the generated orders instead of rolling back'
+        )
+
+    def handle(self, *args, **options):
+        worker_counts = options['workers'] or sorted({1, default_workers()})
+
+        self.stdout.write(f"{'format':<8}{'workers':>8}{'tickets':>9}{'queries':>9}{'KB':>10}{'tickets/s':>11}")
+        try:
+            with transaction.atomic():
+                order_ids = self.create_orders(options['orders'], options['lines'])
+                self.run_pass(order_ids, PickTicketBatchFormat.PDF, 1, options['pick_path'])
+                for workers in worker_counts:
+                    self.run_pass(order_ids, PickTicketBatchFormat.ZIP, workers, options['pick_path'])
+                if not options['keep']:
+                    raise Rollback()
+        except Rollback:
+            self.stdout.write("Rolled back benchmark data (use --keep to commit it)")
+
+    def create_orders(self, order_count, line_count):
+        location = Location.objects.create(name='Bench Pick Warehouse', type='WAREHOUSE', pick_zone_sequence=ZONES)
+        bins = Bin.objects.bulk_create([
+            Bin(location=location, bin_code=f"{zone}-{i:03d}", zone=zone)
+            for zone in ZONES
+            for i in range(50)
+        ])
+        items = Item.objects.bulk_create(
+            [Item(g_code=f"BENCH-PICK-{i}", item_name=f"Bench Pick Item {i}") for i in range(line_count * 10)],
+            batch_size=BATCH_SIZE,
+        )
+        ItemDefaultBin.objects.bulk_create(
+            [ItemDefaultBin(item=item, location=location, bin=bins[i % len(bins)]) for i, item in enumerate(items)],
+            batch_size=BATCH_SIZE,
+        )
+        orders = Order.objects.bulk_create(
+            [
+                Order(order_type=OrderType.SALES, from_location=location, description=f"Bench order {i}")
+                for i in range(order_count)
+            ],
+            batch_size=BATCH_SIZE,
+        )
+        lines = []
+        for o, order in enumerate(orders):
+            for line_no in range(1, line_count + 1):
+                item = items[(o + line_no * 7) % len(items)]
+                lines.append(OrderLine(
+                    order=order,
+                    line_no=line_no,
+                    item=item,
+                    g_code=item.g_code,
+                    description=item.item_name,
+                    qty=Decimal(1 + line_no % 5),
+                ))
+        OrderLine.objects.bulk_create(lines, batch_size=BATCH_SIZE)
+        return [order.pk for order in orders]
+
+    def run_pass(self, order_ids, output_format, workers, pick_path):
+        started = time.monotonic()
+        with CaptureQueriesContext(connection) as queries:
+            done, content = render_batch(order_ids, output_format=output_format, pick_path=pick_path, workers=workers)
+        elapsed = time.monotonic() - started
+
+        self.stdout.write(
+            f"{output_format:<8}{workers:>8}{done:>9}{len(queries):>9}"
+            f"{len(content) / 1024:>10.0f}{done / elapsed if elapsed else 0:>11.1f}"
+        )
@@ -0,0 +1,66 @@
+# backend/orders/management/commands/process_pick_ticket_batches.py
+"""
+Pick-ticket batch worker.
+
+Polls the pick_ticket_batches table and renders queued batches:
+
+    python manage.py process_pick_ticket_batches            # run until stopped
+    python manage.py process_pick_ticket_batches --once     # drain the queue and exit
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from orders.pick_ticket_batches import claim_next_batch, default_worker_id, process_batch
+
+
+class Command(BaseCommand):
+    help = "Render queued pick-ticket batches into merged PDFs or zips"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Exit when the queue is empty instead of polling'
+        )
+        parser.add_argument(
+            '--poll-interval',
+            type=float,
+            default=2.0,
+            help='Seconds to sleep when no batch is waiting (default: 2)'
+        )
+        parser.add_argument(
+            '--worker-id',
+            default=None,
+            help='Name recorded on claimed batches (default: host:pid)'
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=None,
+            help='Render processes for zip batches (default: PICK_TICKET_WORKERS or CPU count)'
+        )
+
+    def handle(self, *args, **options):
+        worker_id = options['worker_id'] or default_worker_id()
+        self.stdout.write(f"Pick ticket worker {worker_id} started")
+
+        while True:
+            batch = claim_next_batch(worker_id)
+            if batch is None:
+                if options['once']:
+                    break
+                time.sleep(options['poll_interval'])
+                continue
+
+            self.stdout.write(
+                f"Rendering {batch.tickets_total} tickets as {batch.output_format} "
+                f"for batch {batch.batch_id} (attempt {batch.attempts})"
+            )
+            batch = process_batch(batch, workers=options['workers'])
+            rate = batch.tickets_per_second
+            self.stdout.write(
+                f"  {batch.status}: {batch.tickets_done} tickets in {batch.render_seconds:.1f}s"
+                + (f" ({rate:.1f} tickets/s)" if rate else "")
+            )
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.7 on 2026-10-19 16:03
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('manufacturers', '0002_manufactureralias'),
+        ('orders', '0006_orderline_expected_manufacturer_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='orderline',
+            name='expected_mfr',
+            field=models.ForeignKey(blank=True, db_column='expected_mfr_id', editable=False, help_text='Manufacturer resolved from expected_manufacturer', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='order_lines', to='manufacturers.manufacturer'),
+        ),
+    ]
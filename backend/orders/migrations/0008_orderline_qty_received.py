@@ -0,0 +1,119 @@
+# Generated by Django 5.2.7 on 2026-10-19 16:09
+
+from collections import defaultdict
+from decimal import Decimal
+
+from django.db import migrations, models
+from django.db.models import Q, Sum
+
+
+BATCH_SIZE = 5000
+
+
+def backfill_qty_received(apps, schema_editor):
+    """
+    Rebuild each purchase order line's received total from the receipts
+    posted before the counter existed:
+
+    - Receipt movements posted against an order line count for that line.
+    - A PICKED_UP shipment received every item line of its PO in full
+      (the old post_save receipt wrote layers for OrderLine.qty and no
+      movements), when it had a receiving location.
+    - Other receipt movements against a PO (FIFOInventoryService.receive_inventory)
+      are summed per item and spread over the PO's lines for that item in
+      line_no order, up to each line's qty, any excess on the last line.
+    """
+    OrderLine = apps.get_model('orders', 'OrderLine')
+    InventoryMovement = apps.get_model('inventory', 'InventoryMovement')
+    Shipment = apps.get_model('shipments', 'Shipment')
+    receipts = InventoryMovement.objects.filter(
+        order__order_type='PURCHASE',
+        to_location__isnull=False,
+        from_location__isnull=True,
+    )
+
+    received = dict(
+        receipts
+        .filter(order_line__isnull=False)
+        .values('order_line_id')
+        .annotate(total=Sum('qty'))
+        .values_list('order_line_id', 'total')
+        .order_by()
+    )
+
+    picked_up_orders = set(
+        Shipment.objects
+        .filter(status='PICKED_UP', order__order_type='PURCHASE')
+        .filter(Q(staging_location__isnull=False) | Q(order__to_location__isnull=False))
+        .values_list('order_id', flat=True)
+    )
+    shipped_lines = (
+        OrderLine.objects
+        .filter(order_id__in=picked_up_orders, item__isnull=False)
+        .values_list('pk', 'qty')
+    )
+    for line_id, qty in shipped_lines.iterator(chunk_size=BATCH_SIZE):
+        received.setdefault(line_id, qty)
+
+    unassigned = (
+        receipts
+        .filter(order_line__isnull=True, item__isnull=False)
+        .values('order_id', 'item_id')
+        .annotate(total=Sum('qty'))
+        .values_list('order_id', 'item_id', 'total')
+        .order_by()
+    )
+    totals = {(order_id, item_id): total for order_id, item_id, total in unassigned}
+    lines_by_key = defaultdict(list)
+    for line_id, order_id, item_id, qty in (
+        OrderLine.objects
+        .filter(order_id__in={order_id for order_id, _ in totals}, item__isnull=False)
+        .order_by('line_no')
+        .values_list('pk', 'order_id', 'item_id', 'qty')
+        .iterator(chunk_size=BATCH_SIZE)
+    ):
+        lines_by_key[(order_id, item_id)].append((line_id, qty))
+    for key, remaining in totals.items():
+        lines = lines_by_key.get(key)
+        if not lines:
+            continue
+        for line_id, qty in lines:
+            take = min(max(qty - received.get(line_id, Decimal('0')), Decimal('0')), remaining)
+            if take > 0:
+                received[line_id] = received.get(line_id, Decimal('0')) + take
+                remaining -= take
+        if remaining > 0:
+            line_id = lines[-1][0]
+            received[line_id] = received.get(line_id, Decimal('0')) + remaining
+
+    batch = []
+    for line_id, total in received.items():
+        batch.append(OrderLine(pk=line_id, qty_received=total))
+        if len(batch) >= BATCH_SIZE:
+            OrderLine.objects.bulk_update(batch, ['qty_received'])
+            batch = []
+    if batch:
+        OrderLine.objects.bulk_update(batch, ['qty_received'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventory', '0008_inventorylayer_receipt'),
+        ('manufacturers', '0002_manufactureralias'),
+        ('orders', '0007_manufacturer_fk'),
+        ('shipments', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='orderline',
+            name='qty_received',
+            field=models.DecimalField(decimal_places=4, default=0, editable=False, help_text='Running total received against this line (maintained by shipment receipts)', max_digits=14),
+        ),
+        migrations.AddIndex(
+            model_name='orderline',
+            index=models.Index(condition=models.Q(('qty_received__lt', models.F('qty'))), fields=['item', 'order', 'qty', 'qty_received'], name='idx_ol_open_by_item'),
+        ),
+        migrations.RunPython(backfill_qty_received, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 5.2.7 on 2026-10-19 16:13
+
+import django.db.models.deletion
+import django.utils.timezone
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventory', '0008_inventorylayer_receipt'),
+        ('locations', '0001_initial'),
+        ('orders', '0008_orderline_qty_received'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OrderLineAllocation',
+            fields=[
+                ('allocation_id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('qty', models.DecimalField(decimal_places=4, max_digits=14)),
+                ('unit_cost', models.DecimalField(decimal_places=4, max_digits=12)),
+                ('allocated_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('bin', models.ForeignKey(blank=True, db_column='bin_id', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='line_allocations', to='inventory.bin')),
+                ('layer', models.ForeignKey(blank=True, db_column='layer_id', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='line_allocations', to='inventory.inventorylayer')),
+                ('location', models.ForeignKey(db_column='location_id', on_delete=django.db.models.deletion.CASCADE, related_name='line_allocations', to='locations.location')),
+                ('order_line', models.ForeignKey(db_column='order_line_id', on_delete=django.db.models.deletion.CASCADE, related_name='allocations', to='orders.orderline')),
+                ('pending_allocation', models.ForeignKey(blank=True, db_column='pending_allocation_id', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='line_allocations', to='inventory.pendingallocation')),
+            ],
+            options={
+                'db_table': 'order_line_allocations',
+                'indexes': [models.Index(fields=['order_line'], name='idx_line_alloc_line'), models.Index(fields=['layer'], name='idx_line_alloc_layer')],
+            },
+        ),
+    ]
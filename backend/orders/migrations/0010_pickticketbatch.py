@@ -0,0 +1,45 @@
+# Generated by Django 5.2.7 on 2026-10-19 16:17
+
+import django.db.models.deletion
+import django.utils.timezone
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orders', '0009_orderlineallocation'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PickTicketBatch',
+            fields=[
+                ('batch_id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('order_ids', models.JSONField(default=list, help_text='Sales orders to print, in print order')),
+                ('output_format', models.CharField(choices=[('PDF', 'Merged PDF'), ('ZIP', 'Zip of PDFs')], default='PDF', max_length=10)),
+                ('pick_path', models.BooleanField(default=False, help_text='Print tickets in walk order grouped by bin')),
+                ('status', models.CharField(choices=[('QUEUED', 'Queued'), ('RUNNING', 'Running'), ('COMPLETED', 'Completed'), ('FAILED', 'Failed')], default='QUEUED', max_length=20)),
+                ('file', models.FileField(blank=True, upload_to='pick_tickets/%Y/%m/')),
+                ('tickets_total', models.PositiveIntegerField(default=0)),
+                ('tickets_done', models.PositiveIntegerField(default=0)),
+                ('render_seconds', models.FloatField(default=0, help_text='Time spent rendering')),
+                ('attempts', models.PositiveIntegerField(default=0)),
+                ('worker_id', models.CharField(blank=True, max_length=100)),
+                ('heartbeat_at', models.DateTimeField(blank=True, null=True)),
+                ('last_error', models.TextField(blank=True)),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('started_at', models.DateTimeField(blank=True, null=True)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+                ('created_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='pick_ticket_batches', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'db_table': 'pick_ticket_batches',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['status', 'created_at'], name='idx_pick_batch_queue')],
+            },
+        ),
+    ]
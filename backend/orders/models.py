@@ -2,6 +2,8 @@ from django.db import models
 import uuid
 from django.utils import timezone
 
+from manufacturers.services import sync_manufacturer
+
 
 class OrderType(models.TextChoices):
     PURCHASE = 'PURCHASE', 'Purchase Order'
@@ -161,6 +163,13 @@ class OrderLine(models.Model):
         related_name='order_lines'
     )
     qty = models.DecimalField(max_digits=14, decimal_places=4)
+    qty_received = models.DecimalField(
+        max_digits=14,
+        decimal_places=4,
+        default=0,
+        editable=False,
+        help_text="Running total received against this line (maintained by shipment receipts)"
+    )
     price_each = models.DecimalField(max_digits=12, decimal_places=4, null=True, blank=True)
 
     # Expected manufacturer info (for purchase orders)
@@ -170,6 +179,16 @@ class OrderLine(models.Model):
         null=True,
         help_text="Expected manufacturer for this line item"
     )
+    expected_mfr = models.ForeignKey(
+        'manufacturers.Manufacturer',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        editable=False,
+        related_name='order_lines',
+        db_column='expected_mfr_id',
+        help_text="Manufacturer resolved from expected_manufacturer"
+    )
     expected_mfr_part_no = models.CharField(
         max_length=500,
         blank=True,
@@ -201,6 +220,12 @@ class OrderLine(models.Model):
         indexes = [
             models.Index(fields=['order', 'line_no'], name='uq_order_line_no'),
             models.Index(fields=['item'], name='idx_ol_item'),
+            # Covers open quantity by item: only lines not yet fully received
+            models.Index(
+                fields=['item', 'order', 'qty', 'qty_received'],
+                condition=models.Q(qty_received__lt=models.F('qty')),
+                name='idx_ol_open_by_item',
+            ),
         ]
     
     def __str__(self):
@@ -213,6 +238,152 @@ class OrderLine(models.Model):
             return self.qty * self.price_each
         return 0
 
+    @property
+    def qty_open(self):
+        """Ordered quantity not received yet"""
+        return max(self.qty - self.qty_received, 0)
+
+    def save(self, *args, **kwargs):
+        sync_manufacturer(self, 'expected_manufacturer', 'expected_mfr', kwargs)
+        super().save(*args, **kwargs)
+
+
+class OrderLineAllocation(models.Model):
+    """
+    Inventory allocated to an order line by order fulfillment: the FIFO
+    layer and bin a quantity was taken from, or the shortage left pending
+    (pending_allocation set, no layer). Pick tickets print these bins.
+    """
+    allocation_id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    order_line = models.ForeignKey(
+        OrderLine,
+        on_delete=models.CASCADE,
+        db_column='order_line_id',
+        related_name='allocations'
+    )
+    layer = models.ForeignKey(
+        'inventory.InventoryLayer',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        db_column='layer_id',
+        related_name='line_allocations'
+    )
+    location = models.ForeignKey(
+        'locations.Location',
+        on_delete=models.CASCADE,
+        db_column='location_id',
+        related_name='line_allocations'
+    )
+    bin = models.ForeignKey(
+        'inventory.Bin',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        db_column='bin_id',
+        related_name='line_allocations'
+    )
+    qty = models.DecimalField(max_digits=14, decimal_places=4)
+    unit_cost = models.DecimalField(max_digits=12, decimal_places=4)
+    pending_allocation = models.ForeignKey(
+        'inventory.PendingAllocation',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        db_column='pending_allocation_id',
+        related_name='line_allocations'
+    )
+    allocated_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        db_table = 'order_line_allocations'
+        indexes = [
+            models.Index(fields=['order_line'], name='idx_line_alloc_line'),
+            models.Index(fields=['layer'], name='idx_line_alloc_layer'),
+        ]
+
+    def __str__(self):
+        return f"{self.qty} for line {self.order_line_id}"
+
+    @property
+    def is_shortage(self):
+        return self.pending_allocation_id is not None
+
+
+class PickTicketBatchStatus(models.TextChoices):
+    """Lifecycle of a background pick-ticket batch"""
+    QUEUED = 'QUEUED', 'Queued'
+    RUNNING = 'RUNNING', 'Running'
+    COMPLETED = 'COMPLETED', 'Completed'
+    FAILED = 'FAILED', 'Failed'
+
+
+class PickTicketBatchFormat(models.TextChoices):
+    PDF = 'PDF', 'Merged PDF'
+    ZIP = 'ZIP', 'Zip of PDFs'
+
+
+class PickTicketBatch(models.Model):
+    """
+    Background rendering of many pick tickets into one merged PDF or a
+    zip with one PDF per order. The orders are fixed when the batch is
+    queued; the process_pick_ticket_batches worker renders them and
+    stores the result in `file`.
+    """
+    batch_id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    order_ids = models.JSONField(default=list, help_text='Sales orders to print, in print order')
+    output_format = models.CharField(
+        max_length=10,
+        choices=PickTicketBatchFormat.choices,
+        default=PickTicketBatchFormat.PDF
+    )
+    pick_path = models.BooleanField(default=False, help_text='Print tickets in walk order grouped by bin')
+    status = models.CharField(
+        max_length=20,
+        choices=PickTicketBatchStatus.choices,
+        default=PickTicketBatchStatus.QUEUED
+    )
+    file = models.FileField(upload_to='pick_tickets/%Y/%m/', blank=True)
+
+    # Progress
+    tickets_total = models.PositiveIntegerField(default=0)
+    tickets_done = models.PositiveIntegerField(default=0)
+    render_seconds = models.FloatField(default=0, help_text='Time spent rendering')
+
+    # Worker bookkeeping
+    attempts = models.PositiveIntegerField(default=0)
+    worker_id = models.CharField(max_length=100, blank=True)
+    heartbeat_at = models.DateTimeField(null=True, blank=True)
+    last_error = models.TextField(blank=True)
+
+    created_by = models.ForeignKey(
+        'users.User',
+        null=True,
+        blank=True,
+        on_delete=models.SET_NULL,
+        related_name='pick_ticket_batches'
+    )
+    created_at = models.DateTimeField(default=timezone.now)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = 'pick_ticket_batches'
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['status', 'created_at'], name='idx_pick_batch_queue'),
+        ]
+
+    def __str__(self):
+        return f"Pick ticket batch {self.batch_id} ({self.status})"
+
+    @property
+    def tickets_per_second(self):
+        """Rendering rate of the last run"""
+        if not self.render_seconds:
+            return None
+        return self.tickets_done / self.render_seconds
+
 
 # ==============================
 #  SALES ORDER INFO (Additional fields for sales orders)
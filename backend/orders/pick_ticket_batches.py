@@ -0,0 +1,302 @@
+# backend/orders/pick_ticket_batches.py
+"""
+Batch Pick Tickets
+
+Renders the morning's pick tickets in one go instead of one request per
+order. A PickTicketBatch is queued with its order ids fixed and picked up
+by the process_pick_ticket_batches worker, which stores the result on the
+batch for download; clients poll the batch for progress.
+
+Orders are loaded TICKET_CHUNK_SIZE at a time with a fixed number of
+queries per chunk (orders, lines, allocations, default bins), so renderers
+never touch the database:
+
+- ZIP: one PDF per order, rendered in a process pool.
+- PDF: every ticket's flowables go into one document joined by page
+  breaks. ReportLab cannot concatenate finished PDFs, so the merged
+  document is laid out in a single process.
+"""
+
+import os
+import socket
+import time
+import traceback
+import uuid
+import zipfile
+from collections import defaultdict
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor
+from datetime import timedelta
+from io import BytesIO
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.db import transaction
+from django.db.models import Exists, OuterRef, Q
+from django.utils import timezone
+from reportlab.platypus import PageBreak
+
+from .fulfillment import allocations_by_line
+from .models import (
+    Order,
+    OrderLine,
+    OrderType,
+    PickTicketBatch,
+    PickTicketBatchFormat,
+    PickTicketBatchStatus,
+)
+from .pick_ticket_service import PickTicketGenerator, load_default_bins, ticket_document
+
+
+MAX_ATTEMPTS = 3
+STALE_AFTER = timedelta(minutes=10)
+TICKET_CHUNK_SIZE = 50
+
+
+def default_workers():
+    """PICK_TICKET_WORKERS, or one worker per CPU when unset"""
+    return getattr(settings, 'PICK_TICKET_WORKERS', 0) or os.cpu_count() or 1
+
+
+def default_worker_id():
+    """Identify this worker process as host:pid"""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def select_orders(order_ids=None, order_status=None, from_location=None):
+    """
+    Ids of SALES orders that have lines: the given ids (kept in the given
+    order, others dropped) or every order with order_status, oldest first.
+    """
+    orders = Order.objects.filter(
+        Exists(OrderLine.objects.filter(order=OuterRef('pk'))),
+        order_type=OrderType.SALES,
+    )
+    if from_location is not None:
+        orders = orders.filter(from_location=from_location)
+    if order_ids is not None:
+        found = set(orders.filter(pk__in=order_ids).values_list('pk', flat=True))
+        return [order_id for order_id in order_ids if order_id in found]
+    if order_status:
+        orders = orders.filter(order_status=order_status)
+    return list(orders.order_by('ordered_at').values_list('pk', flat=True))
+
+
+def enqueue_batch(order_ids, output_format=PickTicketBatchFormat.PDF, pick_path=False, user=None):
+    """
+    Queue a batch for the worker.
+
+    Returns:
+        PickTicketBatch: The queued batch
+    """
+    return PickTicketBatch.objects.create(
+        order_ids=[str(order_id) for order_id in order_ids],
+        output_format=output_format,
+        pick_path=pick_path,
+        tickets_total=len(order_ids),
+        created_by=user,
+    )
+
+
+def load_tickets(order_ids, pick_path=False):
+    """
+    Everything needed to render the given orders' tickets, in four queries.
+
+    Returns:
+        list: (order, lines, allocations or None, default_bins, pick_path)
+            per order found, in order_ids order; picklable, so tickets can
+            be handed to pool workers
+    """
+    order_ids = [uuid.UUID(str(order_id)) for order_id in order_ids]  # JSON stores strings
+    orders = Order.objects.select_related('customer', 'job').in_bulk(order_ids)
+    lines_by_order = defaultdict(list)
+    for line in (
+        OrderLine.objects
+        .filter(order_id__in=order_ids)
+        .select_related('item', 'uom')
+        .order_by('line_no')
+    ):
+        lines_by_order[line.order_id].append(line)
+    allocations = allocations_by_line(order_ids=order_ids)
+    default_bins = load_default_bins({
+        line.item_id
+        for lines in lines_by_order.values()
+        for line in lines
+        if line.item_id
+    })
+
+    tickets = []
+    for order_id in order_ids:
+        order = orders.get(order_id)
+        if order is None:
+            continue  # Deleted since the batch was queued
+        lines = lines_by_order[order.pk]
+        order_allocations = {
+            line.order_line_id: allocations[line.order_line_id]
+            for line in lines
+            if line.order_line_id in allocations
+        }
+        order_bins = {line.item_id: default_bins[line.item_id] for line in lines if line.item_id in default_bins}
+        tickets.append((order, lines, order_allocations or None, order_bins, pick_path))
+    return tickets
+
+
+def _generator(ticket):
+    order, lines, allocations, default_bins, pick_path = ticket
+    return PickTicketGenerator(
+        order,
+        lines=lines,
+        allocations=allocations,
+        pick_path=pick_path,
+        default_bins=default_bins,
+    )
+
+
+def _init_worker():
+    """Process pool initializer: make models importable in spawned workers"""
+    import django
+    from django.apps import apps
+    if not apps.ready:
+        django.setup()
+
+
+def _render_ticket(ticket):
+    return _generator(ticket).generate().getvalue()
+
+
+@contextmanager
+def _renderer(workers):
+    """Yields render(tickets) -> [pdf bytes]; a process pool when workers > 1"""
+    if workers <= 1:
+        yield lambda tickets: [_render_ticket(ticket) for ticket in tickets]
+        return
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+        yield lambda tickets: list(pool.map(_render_ticket, tickets, chunksize=max(len(tickets) // workers, 1)))
+
+
+def render_batch(order_ids, output_format=PickTicketBatchFormat.PDF, pick_path=False, workers=None, progress=None):
+    """
+    Render the tickets for order_ids.
+
+    Args:
+        order_ids: Orders to print, in print order
+        output_format: PickTicketBatchFormat
+        pick_path: Walk-order layout grouped by bin
+        workers: Pool size for ZIP output (default: PICK_TICKET_WORKERS
+            or CPU count); 1 renders in this process
+        progress: Optional callable(tickets_done)
+
+    Returns:
+        tuple: (tickets rendered, file bytes)
+    """
+    chunks = [order_ids[start:start + TICKET_CHUNK_SIZE] for start in range(0, len(order_ids), TICKET_CHUNK_SIZE)]
+    output = BytesIO()
+    done = 0
+
+    if output_format == PickTicketBatchFormat.ZIP:
+        with zipfile.ZipFile(output, 'w', zipfile.ZIP_DEFLATED) as archive, _renderer(workers or default_workers()) as render:
+            for chunk in chunks:
+                tickets = load_tickets(chunk, pick_path)
+                for ticket, pdf in zip(tickets, render(tickets)):
+                    archive.writestr(f"pick_ticket_{ticket[0].order_id}.pdf", pdf)
+                done += len(tickets)
+                if progress:
+                    progress(done)
+        return done, output.getvalue()
+
+    story = []
+    for chunk in chunks:
+        for ticket in load_tickets(chunk, pick_path):
+            if story:
+                story.append(PageBreak())
+            story.extend(_generator(ticket).build_story())
+            done += 1
+    if story:
+        ticket_document(output).build(story)
+    if progress:
+        progress(done)
+    return done, output.getvalue()
+
+
+def claim_next_batch(worker_id, stale_after=STALE_AFTER):
+    """
+    Claim the oldest runnable batch for this worker.
+
+    Runnable means QUEUED, or RUNNING with a heartbeat older than
+    stale_after (its worker died). Locked rows are skipped on databases
+    that support SELECT ... FOR UPDATE SKIP LOCKED.
+
+    Returns:
+        PickTicketBatch or None
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        batch = (
+            PickTicketBatch.objects
+            .select_for_update(skip_locked=True)
+            .filter(
+                Q(status=PickTicketBatchStatus.QUEUED)
+                | Q(status=PickTicketBatchStatus.RUNNING, heartbeat_at__lt=now - stale_after)
+            )
+            .order_by('created_at')
+            .first()
+        )
+        if batch is None:
+            return None
+
+        batch.status = PickTicketBatchStatus.RUNNING
+        batch.worker_id = worker_id
+        batch.heartbeat_at = now
+        batch.attempts += 1
+        batch.started_at = batch.started_at or now
+        batch.save(update_fields=['status', 'worker_id', 'heartbeat_at', 'attempts', 'started_at'])
+    return batch
+
+
+def run_batch(batch, workers=None):
+    """Render a claimed batch from the start and store the file on it"""
+    started = time.monotonic()
+
+    def progress(done):
+        batch.tickets_done = done
+        batch.render_seconds = time.monotonic() - started
+        batch.heartbeat_at = timezone.now()
+        batch.save(update_fields=['tickets_done', 'render_seconds', 'heartbeat_at'])
+
+    progress(0)
+    done, content = render_batch(
+        batch.order_ids,
+        output_format=batch.output_format,
+        pick_path=batch.pick_path,
+        workers=workers,
+        progress=progress,
+    )
+    extension = 'zip' if batch.output_format == PickTicketBatchFormat.ZIP else 'pdf'
+    if batch.file:
+        batch.file.delete(save=False)
+    batch.file.save(f"pick_tickets_{batch.batch_id}.{extension}", ContentFile(content), save=False)
+    batch.tickets_done = done
+    batch.render_seconds = time.monotonic() - started
+    batch.status = PickTicketBatchStatus.COMPLETED
+    batch.finished_at = timezone.now()
+    batch.save(update_fields=['file', 'tickets_done', 'render_seconds', 'status', 'finished_at'])
+
+
+def process_batch(batch, workers=None):
+    """
+    Run a claimed batch and record the outcome.
+
+    A failed batch goes back to the queue until it has used MAX_ATTEMPTS,
+    then it is marked FAILED.
+    """
+    try:
+        run_batch(batch, workers=workers)
+    except Exception:
+        batch.last_error = traceback.format_exc()
+        if batch.attempts >= MAX_ATTEMPTS:
+            batch.status = PickTicketBatchStatus.FAILED
+            batch.finished_at = timezone.now()
+        else:
+            batch.status = PickTicketBatchStatus.QUEUED
+        batch.save(update_fields=['status', 'finished_at', 'last_error'])
+    return batch
@@ -3,86 +3,201 @@
 Pick Ticket PDF Generation Service
 
 Generates professional pick tickets for sales orders using ReportLab
+
+Paragraph styles are built once per process and barcodes are drawn as
+ReportLab vector graphics, so rendering many tickets (see
+pick_ticket_batches.py) costs no per-ticket style parsing or PNG
+encoding.
 """
 
+from collections import defaultdict
+from functools import lru_cache
+
+from reportlab.graphics.barcode import createBarcodeDrawing
 from reportlab.lib.pagesizes import letter
 from reportlab.lib.units import inch
 from reportlab.lib import colors
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, Image
+from reportlab.platypus import PageBreak, SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.enums import TA_CENTER, TA_RIGHT, TA_LEFT
 from io import BytesIO
 from datetime import datetime
-import barcode
-from barcode.writer import ImageWriter
 
+from inventory.models import ItemDefaultBin
 
-class PickTicketGenerator:
-    """Generates pick ticket PDFs for sales orders"""
-    
-    def __init__(self, order):
-        """
-        Initialize generator with an order
-        
-        Args:
-            order: Order object (must be order_type='SALES')
-        """
-        self.order = order
-        self.buffer = BytesIO()
-        self.styles = getSampleStyleSheet()
-        self._setup_custom_styles()
-    
-    def _setup_custom_styles(self):
-        """Setup custom paragraph styles"""
+
+# Item ids per ItemDefaultBin query (stays under SQLite's parameter limit)
+DEFAULT_BIN_BATCH_SIZE = 500
+
+
+def walk_key(location, bin):
+    """
+    Pick-path sort key for a bin: location, then the bin's zone in the
+    location's pick_zone_sequence (unlisted zones after, alphabetically),
+    then bin code.
+    """
+    zones = location.pick_zone_sequence or []
+    rank = zones.index(bin.zone) if bin.zone in zones else len(zones)
+    return (location.name, rank, bin.zone, bin.bin_code)
+
+
+def load_default_bins(item_ids):
+    """item_id -> [ItemDefaultBin, ...] (location and bin loaded, by location name)"""
+    item_ids = list(item_ids)
+    default_bins = defaultdict(list)
+    for start in range(0, len(item_ids), DEFAULT_BIN_BATCH_SIZE):
+        for default_bin in (
+            ItemDefaultBin.objects
+            .filter(item_id__in=item_ids[start:start + DEFAULT_BIN_BATCH_SIZE])
+            .select_related('location', 'bin')
+            .order_by('location__name')
+        ):
+            default_bins[default_bin.item_id].append(default_bin)
+    return default_bins
+
+
+@lru_cache(maxsize=1)
+def ticket_styles():
+    """Sample stylesheet plus the ticket's custom styles, built once per process"""
+    styles = getSampleStyleSheet()
+    return {
+        'styles': styles,
         # Title style
-        self.title_style = ParagraphStyle(
+        'title': ParagraphStyle(
             'CustomTitle',
-            parent=self.styles['Heading1'],
+            parent=styles['Heading1'],
             fontSize=24,
             textColor=colors.HexColor('#1a1a1a'),
             spaceAfter=12,
             alignment=TA_CENTER,
             fontName='Helvetica-Bold'
-        )
-        
+        ),
         # Header info style
-        self.header_style = ParagraphStyle(
+        'header': ParagraphStyle(
             'HeaderInfo',
-            parent=self.styles['Normal'],
+            parent=styles['Normal'],
             fontSize=10,
             textColor=colors.HexColor('#333333'),
             spaceAfter=6,
-        )
-        
+        ),
         # Bold label style
-        self.label_style = ParagraphStyle(
+        'label': ParagraphStyle(
             'Label',
-            parent=self.styles['Normal'],
+            parent=styles['Normal'],
             fontSize=10,
             textColor=colors.HexColor('#666666'),
             fontName='Helvetica-Bold'
-        )
+        ),
+        'notes': ParagraphStyle(
+            'Notes',
+            parent=styles['Normal'],
+            fontSize=9,
+            textColor=colors.HexColor('#666666'),
+        ),
+    }
+
+
+def ticket_document(buffer):
+    """Letter page template shared by single and batch tickets"""
+    return SimpleDocTemplate(
+        buffer,
+        pagesize=letter,
+        rightMargin=0.75*inch,
+        leftMargin=0.75*inch,
+        topMargin=0.75*inch,
+        bottomMargin=0.75*inch,
+    )
+
+
+def items_table_style(picked_column):
+    """Items table style shared by pick tickets and wave pick lists"""
+    return [
+        # Header row
+        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#4a4a4a')),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 11),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+        ('TOPPADDING', (0, 0), (-1, 0), 12),
+        
+        # Data rows
+        ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+        ('FONTSIZE', (0, 1), (-1, -1), 10),
+        ('TEXTCOLOR', (0, 1), (-1, -1), colors.black),
+        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+        ('ALIGN', (0, 0), (0, -1), 'CENTER'),  # Line number
+        ('ALIGN', (3, 0), (3, -1), 'RIGHT'),   # Qty
+        ('ALIGN', (picked_column, 0), (picked_column, -1), 'CENTER'),  # Picked checkbox
+        
+        # Grid
+        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#cccccc')),
+        ('LINEBELOW', (0, 0), (-1, 0), 2, colors.HexColor('#4a4a4a')),
+        
+        # Padding
+        ('TOPPADDING', (0, 1), (-1, -1), 8),
+        ('BOTTOMPADDING', (0, 1), (-1, -1), 8),
+        ('LEFTPADDING', (0, 0), (-1, -1), 6),
+        ('RIGHTPADDING', (0, 0), (-1, -1), 6),
+    ]
+
+
+class PickTicketGenerator:
+    """Generates pick ticket PDFs for sales orders"""
+    
+    def __init__(self, order, lines=None, allocations=None, pick_path=False, default_bins=None):
+        """
+        Initialize generator with an order
+        
+        Args:
+            order: Order object (must be order_type='SALES')
+            lines: Order lines to print, item and uom loaded (optional;
+                queried when omitted)
+            allocations: order_line_id -> OrderLineAllocations from
+                order fulfillment (optional); when given, the Location
+                column shows the allocated bins instead of default bins
+            pick_path: Print lines in walk order grouped by bin (see
+                walk_key) instead of line_no order
+            default_bins: Preloaded load_default_bins() result covering
+                the lines' items (optional; queried when omitted)
+        """
+        self.order = order
+        self.lines = lines
+        self.allocations = allocations
+        self.pick_path = pick_path
+        self.default_bins = default_bins
+        self.buffer = BytesIO()
+        self._setup_custom_styles()
+    
+    def _setup_custom_styles(self):
+        """Setup custom paragraph styles (shared, see ticket_styles)"""
+        styles = ticket_styles()
+        self.styles = styles['styles']
+        self.title_style = styles['title']
+        self.header_style = styles['header']
+        self.label_style = styles['label']
+        self.notes_style = styles['notes']
     
-    def _generate_barcode(self, code_text):
+    def _generate_barcode(self, code_text, width=3*inch, height=0.75*inch):
         """
-        Generate barcode image
+        Generate a Code128 barcode as vector graphics
         
         Args:
             code_text: Text to encode in barcode
+            width, height: Size the barcode is scaled to
             
         Returns:
-            BytesIO buffer containing barcode image
+            Drawing flowable, or None if the text cannot be encoded
         """
         try:
-            # Generate Code128 barcode
-            code128 = barcode.get_barcode_class('code128')
-            barcode_instance = code128(code_text, writer=ImageWriter())
-            
-            # Write to buffer
-            buffer = BytesIO()
-            barcode_instance.write(buffer)
-            buffer.seek(0)
-            return buffer
+            return createBarcodeDrawing(
+                'Code128',
+                value=code_text,
+                barHeight=height,
+                humanReadable=False,
+                quiet=False,
+                width=width,
+                height=height,
+            )
         except Exception as e:
             print(f"Barcode generation failed: {e}")
             return None
@@ -95,16 +210,17 @@ class PickTicketGenerator:
             BytesIO buffer containing the PDF
         """
         # Create PDF document
-        doc = SimpleDocTemplate(
-            self.buffer,
-            pagesize=letter,
-            rightMargin=0.75*inch,
-            leftMargin=0.75*inch,
-            topMargin=0.75*inch,
-            bottomMargin=0.75*inch,
-        )
+        doc = ticket_document(self.buffer)
+        
+        # Build PDF
+        doc.build(self.build_story())
         
-        # Build content
+        # Reset buffer position
+        self.buffer.seek(0)
+        return self.buffer
+
+    def build_story(self):
+        """Flowables for one ticket (batches join several with page breaks)"""
         story = []
         
         # Add header
@@ -121,13 +237,7 @@ class PickTicketGenerator:
         
         # Add footer
         story.extend(self._build_footer())
-        
-        # Build PDF
-        doc.build(story)
-        
-        # Reset buffer position
-        self.buffer.seek(0)
-        return self.buffer
+        return story
     
     def _build_header(self):
         """Build the header section with title and barcode"""
@@ -139,14 +249,10 @@ class PickTicketGenerator:
         
         # Barcode (if order has order_id)
         if self.order.order_id:
-            barcode_buffer = self._generate_barcode(str(self.order.order_id))
-            if barcode_buffer:
-                try:
-                    barcode_img = Image(barcode_buffer, width=3*inch, height=0.75*inch)
-                    barcode_img.hAlign = 'CENTER'
-                    elements.append(barcode_img)
-                except Exception as e:
-                    print(f"Failed to add barcode image: {e}")
+            barcode_drawing = self._generate_barcode(str(self.order.order_id))
+            if barcode_drawing:
+                barcode_drawing.hAlign = 'CENTER'
+                elements.append(barcode_drawing)
         
         return elements
     
@@ -178,8 +284,36 @@ class PickTicketGenerator:
         elements.append(table)
         return elements
     
+    def _get_lines(self):
+        """Lines to print, item and uom loaded (one query when not given)"""
+        if self.lines is None:
+            self.lines = list(self.order.lines.all().select_related('item', 'uom').order_by('line_no'))
+        return self.lines
+
+    def _default_bins(self, lines):
+        """
+        item_id -> ItemDefaultBin (location and bin loaded) for every item on
+        the ticket, in one query; the order's from_location wins when an
+        item has default bins in several locations.
+        """
+        if self.default_bins is None:
+            self.default_bins = load_default_bins({line.item_id for line in lines if line.item_id})
+        defaults = {}
+        for line in lines:
+            candidates = self.default_bins.get(line.item_id)
+            if not candidates:
+                continue
+            defaults[line.item_id] = next(
+                (candidate for candidate in candidates if candidate.location_id == self.order.from_location_id),
+                candidates[0],
+            )
+        return defaults
+
     def _build_items_table(self):
         """Build the items table with pick locations"""
+        if self.pick_path:
+            return self._build_pick_path_table()
+
         elements = []
         
         # Table header
@@ -188,16 +322,17 @@ class PickTicketGenerator:
         ]
         
         # Add order lines
-        lines = self.order.lines.all().order_by('line_no')
+        lines = self._get_lines()
+        default_bins = self._default_bins(lines) if self.allocations is None else {}
         for line in lines:
-            # Get default location/bin for item (if exists)
-            location = 'TBD'
-            try:
-                if hasattr(line.item, 'default_bins') and line.item.default_bins.exists():
-                    default_bin = line.item.default_bins.first()
-                    location = f"{default_bin.location.name}\n{default_bin.bin.bin_code if default_bin.bin else ''}"
-            except:
-                pass
+            if self.allocations is not None:
+                location = self._allocated_location(self.allocations.get(line.order_line_id, []))
+            else:
+                # Default location/bin for item (if exists)
+                location = 'TBD'
+                default_bin = default_bins.get(line.item_id)
+                if default_bin:
+                    location = f"{default_bin.location.name}\n{default_bin.bin.bin_code}"
             
             data.append([
                 str(line.line_no),
@@ -210,54 +345,122 @@ class PickTicketGenerator:
             ])
         
         # Create table
-        table = Table(data, colWidths=[0.5*inch, 1.2*inch, 2.5*inch, 0.7*inch, 0.6*inch, 1.3*inch, 0.7*inch])
+        table = Table(
+            data,
+            colWidths=[0.5*inch, 1.2*inch, 2.5*inch, 0.7*inch, 0.6*inch, 1.3*inch, 0.7*inch],
+            repeatRows=1,
+        )
         
         # Style the table
-        table.setStyle(TableStyle([
-            # Header row
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#4a4a4a')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 11),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('TOPPADDING', (0, 0), (-1, 0), 12),
-            
-            # Data rows
-            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 1), (-1, -1), 10),
-            ('TEXTCOLOR', (0, 1), (-1, -1), colors.black),
-            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-            ('ALIGN', (0, 0), (0, -1), 'CENTER'),  # Line number
-            ('ALIGN', (3, 0), (3, -1), 'RIGHT'),   # Qty
-            ('ALIGN', (6, 0), (6, -1), 'CENTER'),  # Picked checkbox
-            
-            # Grid
-            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#cccccc')),
-            ('LINEBELOW', (0, 0), (-1, 0), 2, colors.HexColor('#4a4a4a')),
-            
-            # Padding
-            ('TOPPADDING', (0, 1), (-1, -1), 8),
-            ('BOTTOMPADDING', (0, 1), (-1, -1), 8),
-            ('LEFTPADDING', (0, 0), (-1, -1), 6),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 6),
-        ]))
+        table.setStyle(TableStyle(self._table_style(picked_column=6)))
         
         elements.append(table)
         return elements
+
+    def _pick_rows(self, lines):
+        """
+        One (location, bin, line, qty) per pick: the allocated bins when
+        allocations were given, else each item's default bin. Picks without
+        a bin come back in `unassigned`, allocation shortages in `backorder`.
+        """
+        picks, unassigned, backorder = [], [], []
+        if self.allocations is not None:
+            for line in lines:
+                allocations = self.allocations.get(line.order_line_id)
+                if not allocations:
+                    unassigned.append((None, None, line, line.qty))
+                for allocation in allocations or []:
+                    pick = (allocation.location, allocation.bin, line, allocation.qty)
+                    if allocation.is_shortage:
+                        backorder.append(pick)
+                    elif allocation.bin is None:
+                        unassigned.append(pick)
+                    else:
+                        picks.append(pick)
+        else:
+            default_bins = self._default_bins(lines)
+            for line in lines:
+                default_bin = default_bins.get(line.item_id)
+                if default_bin:
+                    picks.append((default_bin.location, default_bin.bin, line, line.qty))
+                else:
+                    unassigned.append((None, None, line, line.qty))
+        return picks, unassigned, backorder
+
+    def _build_pick_path_table(self):
+        """
+        Items table in walk order: picks sorted by location, zone (in the
+        location's pick_zone_sequence) and bin code, grouped under one
+        heading row per bin so each aisle is walked once.
+        """
+        picks, unassigned, backorder = self._pick_rows(self._get_lines())
+        picks.sort(key=lambda pick: (*walk_key(pick[0], pick[1]), pick[2].line_no))
+
+        groups = []
+        for location, bin, line, qty in picks:
+            heading = f"{location.name}  |  {f'Zone {bin.zone}  |  ' if bin.zone else ''}Bin {bin.bin_code}"
+            if not groups or groups[-1][0] != heading:
+                groups.append((heading, []))
+            groups[-1][1].append((line, qty))
+        if unassigned:
+            groups.append(('No bin assigned', [(line, qty) for _, _, line, qty in unassigned]))
+        if backorder:
+            groups.append(('Backorder (not in stock)', [(line, qty) for _, _, line, qty in backorder]))
+
+        data = [['Line', 'G-Code', 'Description', 'Qty', 'UOM', 'Picked']]
+        style = self._table_style(picked_column=5)
+        for heading, rows in groups:
+            row = len(data)
+            data.append([heading, '', '', '', '', ''])
+            style.extend([
+                ('SPAN', (0, row), (-1, row)),
+                ('BACKGROUND', (0, row), (-1, row), colors.HexColor('#e6e6e6')),
+                ('FONTNAME', (0, row), (-1, row), 'Helvetica-Bold'),
+                ('ALIGN', (0, row), (-1, row), 'LEFT'),
+            ])
+            for line, qty in rows:
+                data.append([
+                    str(line.line_no),
+                    line.g_code,
+                    line.description,
+                    f"{qty.normalize():f}",
+                    line.uom.uom_code if line.uom else 'EA',
+                    '☐'  # Checkbox
+                ])
+
+        table = Table(
+            data,
+            colWidths=[0.5*inch, 1.3*inch, 3.6*inch, 0.8*inch, 0.6*inch, 0.7*inch],
+            repeatRows=1,
+        )
+        table.setStyle(TableStyle(style))
+        return [table]
+
+    def _table_style(self, picked_column):
+        """Shared items table style"""
+        return items_table_style(picked_column)
     
+    def _allocated_location(self, allocations):
+        """Location cell for allocated lines: one row per bin, shortages as backorder"""
+        if not allocations:
+            return 'TBD'
+        rows = [allocations[0].location.name]
+        for allocation in allocations:
+            qty = f"{allocation.qty.normalize():f}"
+            if allocation.is_shortage:
+                rows.append(f"BACKORDER x {qty}")
+            else:
+                bin_code = allocation.bin.bin_code if allocation.bin else 'No bin'
+                rows.append(f"{bin_code} x {qty}" if len(allocations) > 1 else bin_code)
+        return '\n'.join(rows)
+
     def _build_footer(self):
         """Build footer with signature lines and notes"""
         elements = []
         
         # Notes section
-        if self.order.notes:
-            notes_style = ParagraphStyle(
-                'Notes',
-                parent=self.styles['Normal'],
-                fontSize=9,
-                textColor=colors.HexColor('#666666'),
-            )
-            notes = Paragraph(f"<b>Notes:</b> {self.order.notes}", notes_style)
+        if self.order.description:
+            notes = Paragraph(f"<b>Notes:</b> {self.order.description}", self.notes_style)
             elements.append(notes)
             elements.append(Spacer(1, 0.2*inch))
         
@@ -281,15 +484,176 @@ class PickTicketGenerator:
         return elements
 
 
-def generate_pick_ticket(order):
+def generate_pick_ticket(order, lines=None, allocations=None, pick_path=False):
     """
     Convenience function to generate a pick ticket PDF
     
     Args:
         order: Order object
+        lines: Order lines (optional, see PickTicketGenerator)
+        allocations: Fulfillment allocations by line (optional)
+        pick_path: Walk-order layout grouped by bin
         
     Returns:
         BytesIO buffer containing PDF
     """
-    generator = PickTicketGenerator(order)
-    return generator.generate()
\ No newline at end of file
+    generator = PickTicketGenerator(order, lines=lines, allocations=allocations, pick_path=pick_path)
+    return generator.generate()
+
+class WavePickListGenerator:
+    """
+    Generates the wave pick list PDF for a plan_wave() result: one
+    consolidated list in walk order (each bin visited once, with the
+    put-wall split per pick), then the put wall, one slot per order.
+    """
+
+    def __init__(self, plan, title_note=''):
+        """
+        Args:
+            plan: orders.waves.plan_wave() result
+            title_note: Extra line under the title (e.g. the wave filters)
+        """
+        self.plan = plan
+        self.title_note = title_note
+        self.buffer = BytesIO()
+        styles = ticket_styles()
+        self.title_style = styles['title']
+        self.header_style = styles['header']
+
+    def generate(self):
+        """
+        Generate the wave pick list PDF
+
+        Returns:
+            BytesIO buffer containing the PDF
+        """
+        doc = ticket_document(self.buffer)
+        story = self._build_header("WAVE PICK LIST")
+        story.append(self._build_pick_table())
+        story.append(PageBreak())
+        story.extend(self._build_header("PUT WALL"))
+        story.append(self._build_put_wall_table())
+        doc.build(story)
+        self.buffer.seek(0)
+        return self.buffer
+
+    def _build_header(self, title):
+        plan = self.plan
+        picks = len(plan['picks'])
+        elements = [Paragraph(title, self.title_style)]
+        info = (
+            f"<b>Location:</b> {plan['location'].name} &nbsp;&nbsp; "
+            f"<b>Orders:</b> {len(plan['slots'])} &nbsp;&nbsp; "
+            f"<b>Picks:</b> {picks} &nbsp;&nbsp; "
+            f"<b>Printed:</b> {datetime.now().strftime('%m/%d/%Y %H:%M')}"
+        )
+        elements.append(Paragraph(info, self.header_style))
+        if self.title_note:
+            elements.append(Paragraph(self.title_note, self.header_style))
+        elements.append(Spacer(1, 0.2*inch))
+        return elements
+
+    def _grouped_table(self, header, groups, col_widths, picked_column):
+        """Table with a shaded heading row per group; groups are (heading, [row cells])"""
+        data = [header]
+        style = items_table_style(picked_column)
+        for heading, rows in groups:
+            row = len(data)
+            data.append([heading] + [''] * (len(header) - 1))
+            style.extend([
+                ('SPAN', (0, row), (-1, row)),
+                ('BACKGROUND', (0, row), (-1, row), colors.HexColor('#e6e6e6')),
+                ('FONTNAME', (0, row), (-1, row), 'Helvetica-Bold'),
+                ('ALIGN', (0, row), (-1, row), 'LEFT'),
+            ])
+            data.extend(rows)
+        table = Table(data, colWidths=col_widths, repeatRows=1)
+        table.setStyle(TableStyle(style))
+        return table
+
+    @staticmethod
+    def _bin_heading(bin):
+        return f"{bin.location.name}  |  {f'Zone {bin.zone}  |  ' if bin.zone else ''}Bin {bin.bin_code}"
+
+    @staticmethod
+    def _qty(qty):
+        return f"{qty.normalize():f}"
+
+    def _build_pick_table(self):
+        """Consolidated picks grouped by bin, each with its put-wall split"""
+        groups = []
+        count = 0
+
+        def cells(row):
+            nonlocal count
+            count += 1
+            split = '  '.join(f"{slot}:{self._qty(qty)}" for slot, qty in row['slots'])
+            return [
+                str(count),
+                row['item'].g_code,
+                Paragraph(row['item'].item_name, self.header_style),
+                self._qty(row['qty']),
+                row['uom'],
+                Paragraph(split, self.header_style),
+                '☐'  # Checkbox
+            ]
+
+        for row in self.plan['picks']:
+            heading = self._bin_heading(row['bin'])
+            if not groups or groups[-1][0] != heading:
+                groups.append((heading, []))
+            groups[-1][1].append(cells(row))
+        if self.plan['unassigned']:
+            groups.append(('No bin assigned', [cells(row) for row in self.plan['unassigned']]))
+        if self.plan['backorder']:
+            groups.append(('Backorder (not in stock)', [cells(row) for row in self.plan['backorder']]))
+
+        return self._grouped_table(
+            ['#', 'G-Code', 'Description', 'Qty', 'UOM', 'Slot:Qty', 'Picked'],
+            groups,
+            [0.4*inch, 1.2*inch, 2.4*inch, 0.7*inch, 0.5*inch, 1.1*inch, 0.7*inch],
+            picked_column=6,
+        )
+
+    def _build_put_wall_table(self):
+        """One group per slot: what goes into that order's slot"""
+        groups = []
+        for slot, order in self.plan['slots']:
+            customer = order.customer.name if order.customer else 'N/A'
+            rows = []
+            for i, row in enumerate(self.plan['put_wall'].get(order.pk, []), start=1):
+                if row['bin'] is not None:
+                    source = row['bin'].bin_code
+                else:
+                    source = 'BACKORDER' if row['backorder'] else 'TBD'
+                rows.append([
+                    str(i),
+                    row['item'].g_code,
+                    Paragraph(row['item'].item_name, self.header_style),
+                    self._qty(row['qty']),
+                    row['uom'],
+                    source,
+                    '☐'  # Checkbox
+                ])
+            groups.append((f"Slot {slot}  |  Order {str(order.order_id)[:8]}  |  {customer}", rows))
+
+        return self._grouped_table(
+            ['#', 'G-Code', 'Description', 'Qty', 'UOM', 'Bin', 'Put'],
+            groups,
+            [0.4*inch, 1.2*inch, 2.6*inch, 0.7*inch, 0.5*inch, 1.1*inch, 0.5*inch],
+            picked_column=6,
+        )
+
+
+def generate_wave_pick_list(plan, title_note=''):
+    """
+    Convenience function to generate a wave pick list PDF
+
+    Args:
+        plan: orders.waves.plan_wave() result
+        title_note: Extra header line
+
+    Returns:
+        BytesIO buffer containing PDF
+    """
+    return WavePickListGenerator(plan, title_note=title_note).generate()
@@ -3,7 +3,14 @@
 Serializers for Orders REST API
 """
 from rest_framework import serializers
-from .models import Order, OrderLine, SalesOrderInfo
+from .models import (
+    Order,
+    OrderLine,
+    OrderStatus,
+    PickTicketBatch,
+    PickTicketBatchFormat,
+    SalesOrderInfo,
+)
 
 
 class OrderLineSerializer(serializers.ModelSerializer):
@@ -19,19 +26,35 @@ class OrderLineSerializer(serializers.ModelSerializer):
             'description',
             'uom',
             'qty',
+            'qty_received',
             'price_each',
             'from_bin',
             'to_bin',
             'g_code',
             'notes'
         ]
-        read_only_fields = ['order_line_id']
+        read_only_fields = ['order_line_id', 'qty_received']
+
+
+def user_summary(user_id, email, display_name, first_name, last_name):
+    """User reference as {'user_id', 'email', 'name'}; name is "F. Lastname" when employee info is available"""
+    if user_id is None:
+        return None
+    if first_name and last_name:
+        name = f"{first_name[0]}. {last_name}"
+    else:
+        name = display_name or email
+    return {'user_id': str(user_id), 'email': email, 'name': name}
 
 
 class OrderListSerializer(serializers.ModelSerializer):
     """
     Lightweight serializer for list views
-    Shows summary info without nested lines
+    Shows summary info; nested lines only with ?include=lines
+
+    Expects the annotated queryset from OrderViewSet (line_count, totals
+    and the assigned_user_* / created_by_* values), so serializing a page
+    issues no per-order queries.
     """
     # Nested object references with names
     vendor = serializers.SerializerMethodField()
@@ -43,8 +66,10 @@ class OrderListSerializer(serializers.ModelSerializer):
     department = serializers.SerializerMethodField()
     created_by = serializers.SerializerMethodField()
 
-    # Computed fields
-    line_count = serializers.SerializerMethodField()
+    # Computed in SQL
+    line_count = serializers.IntegerField(read_only=True)
+    total_qty = serializers.DecimalField(max_digits=18, decimal_places=4, read_only=True)
+    order_total = serializers.DecimalField(max_digits=18, decimal_places=4, read_only=True)
     lines = OrderLineSerializer(many=True, read_only=True)
 
     class Meta:
@@ -65,13 +90,20 @@ class OrderListSerializer(serializers.ModelSerializer):
             'assigned_user',
             'created_by',
             'line_count',
+            'total_qty',
+            'order_total',
             'lines'
         ]
         read_only_fields = ['order_id', 'ordered_at']
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        if not self.context.get('include_lines'):
+            self.fields.pop('lines')
+
     def get_vendor(self, obj):
         if obj.vendor:
-            return {'vendor_id': str(obj.vendor.vendor_id), 'name': obj.vendor.name}
+            return {'vendor_id': str(obj.vendor.pk), 'name': obj.vendor.name}
         return None
 
     def get_customer(self, obj):
@@ -95,15 +127,13 @@ class OrderListSerializer(serializers.ModelSerializer):
         return None
 
     def get_assigned_user(self, obj):
-        if obj.assigned_user:
-            user = obj.assigned_user
-            # Format as "F. Lastname" if employee info available
-            if user.employee and user.employee.first_name and user.employee.last_name:
-                name = f"{user.employee.first_name[0]}. {user.employee.last_name}"
-            else:
-                name = user.display_name or user.email
-            return {'user_id': str(user.user_id), 'email': user.email, 'name': name}
-        return None
+        return user_summary(
+            obj.assigned_user_id,
+            obj.assigned_user_email,
+            obj.assigned_user_display_name,
+            obj.assigned_user_first_name,
+            obj.assigned_user_last_name,
+        )
 
     def get_department(self, obj):
         if obj.department:
@@ -111,18 +141,13 @@ class OrderListSerializer(serializers.ModelSerializer):
         return None
 
     def get_created_by(self, obj):
-        if obj.created_by:
-            user = obj.created_by
-            # Format as "F. Lastname" if employee info available
-            if user.employee and user.employee.first_name and user.employee.last_name:
-                name = f"{user.employee.first_name[0]}. {user.employee.last_name}"
-            else:
-                name = user.display_name or user.email
-            return {'user_id': str(user.user_id), 'email': user.email, 'name': name}
-        return None
-
-    def get_line_count(self, obj):
-        return obj.lines.count()
+        return user_summary(
+            obj.created_by_id,
+            obj.created_by_email,
+            obj.created_by_display_name,
+            obj.created_by_first_name,
+            obj.created_by_last_name,
+        )
 
 
 class OrderDetailSerializer(serializers.ModelSerializer):
@@ -169,7 +194,7 @@ class OrderDetailSerializer(serializers.ModelSerializer):
 
     def get_vendor(self, obj):
         if obj.vendor:
-            return {'vendor_id': str(obj.vendor.vendor_id), 'name': obj.vendor.name}
+            return {'vendor_id': str(obj.vendor.pk), 'name': obj.vendor.name}
         return None
 
     def get_customer(self, obj):
@@ -322,4 +347,82 @@ class SalesOrderInfoSerializer(serializers.ModelSerializer):
 
 # Backwards compatibility aliases
 OrderSummarySerializer = OrderListSerializer
-OrderSerializer = OrderCreateSerializer  # Default to create serializer
\ No newline at end of file
+OrderSerializer = OrderCreateSerializer  # Default to create serializer
+
+
+class PickTicketBatchSerializer(serializers.ModelSerializer):
+    """Pick-ticket batch progress for polling clients"""
+    percent_complete = serializers.SerializerMethodField()
+    tickets_per_second = serializers.SerializerMethodField()
+    download_url = serializers.SerializerMethodField()
+
+    class Meta:
+        model = PickTicketBatch
+        fields = [
+            'batch_id',
+            'output_format',
+            'pick_path',
+            'status',
+            'tickets_total',
+            'tickets_done',
+            'percent_complete',
+            'render_seconds',
+            'tickets_per_second',
+            'download_url',
+            'attempts',
+            'last_error',
+            'created_by',
+            'created_at',
+            'started_at',
+            'finished_at',
+        ]
+        read_only_fields = fields
+
+    def get_percent_complete(self, obj):
+        if not obj.tickets_total:
+            return None
+        return round(100 * obj.tickets_done / obj.tickets_total, 1)
+
+    def get_tickets_per_second(self, obj):
+        rate = obj.tickets_per_second
+        return round(rate, 1) if rate else None
+
+    def get_download_url(self, obj):
+        if not obj.file:
+            return None
+        return f"/api/orders/pick-tickets/batches/{obj.batch_id}/download/"
+
+
+class PickTicketOptionsSerializer(serializers.Serializer):
+    """Pick ticket layout; pick_path prints the lines in walk order grouped by bin"""
+    pick_path = serializers.BooleanField(default=False)
+
+
+class FulfillRequestSerializer(PickTicketOptionsSerializer):
+    """Options for fulfilling a sales order (see orders.fulfillment.fulfill_order)"""
+    allow_negative = serializers.BooleanField(default=True)
+    reference = serializers.CharField(required=False, allow_blank=True, default='')
+
+
+class PickTicketBatchCreateSerializer(serializers.Serializer):
+    """Validates a new pick-ticket batch: explicit order ids or a status filter"""
+    order_ids = serializers.ListField(child=serializers.UUIDField(), required=False, allow_empty=False)
+    order_status = serializers.ChoiceField(choices=OrderStatus.choices, required=False)
+    from_location = serializers.UUIDField(required=False)
+    format = serializers.ChoiceField(choices=PickTicketBatchFormat.choices, default=PickTicketBatchFormat.PDF)
+    pick_path = serializers.BooleanField(default=False)
+
+    def validate(self, attrs):
+        if ('order_ids' in attrs) == ('order_status' in attrs):
+            raise serializers.ValidationError('Provide either order_ids or order_status.')
+        return attrs
+
+
+class WaveRequestSerializer(serializers.Serializer):
+    """Selects the orders of a pick wave (see orders.waves.wave_orders)"""
+    from_location = serializers.UUIDField()
+    fulfillment_date = serializers.DateField(required=False)
+    department = serializers.UUIDField(required=False)
+    order_ids = serializers.ListField(child=serializers.UUIDField(), required=False, allow_empty=False)
+    allocate = serializers.BooleanField(default=True)
+    allow_negative = serializers.BooleanField(default=True)
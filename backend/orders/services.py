@@ -0,0 +1,125 @@
+# backend/orders/services.py
+"""
+Order quantity services.
+
+OrderLine.qty_received is the running total received against a line; it
+is maintained in bulk by shipment receipts (shipments.services) and by
+receive_purchase_qty() for receipts posted outside a shipment, so open
+purchase quantity is qty - qty_received and never needs the movement
+history. Lines still open are covered by the partial index
+idx_ol_open_by_item, which makes open PO quantity by item an index scan
+over open lines only.
+"""
+
+from django.db.models import F, Sum
+from django.utils import timezone
+
+from .models import Order, OrderLine, OrderStatus, OrderType
+
+
+# Purchase orders that can still receive goods
+OPEN_PURCHASE_STATUSES = (OrderStatus.OPEN, OrderStatus.PARTIAL)
+
+# PO statuses a receipt moves on to PARTIAL / CLOSED
+RECEIVABLE_STATUSES = (OrderStatus.DRAFT, OrderStatus.OPEN, OrderStatus.PARTIAL)
+
+
+def open_purchase_lines(item_ids=None, location=None):
+    """
+    Purchase order lines with quantity still to be received.
+
+    Args:
+        item_ids: Restrict to these items (None for all)
+        location: Restrict to POs delivering to this location
+
+    Returns:
+        QuerySet: OrderLines with qty_received < qty on OPEN/PARTIAL POs
+    """
+    lines = OrderLine.objects.filter(
+        qty_received__lt=F('qty'),
+        item__isnull=False,
+        order__order_type=OrderType.PURCHASE,
+        order__order_status__in=OPEN_PURCHASE_STATUSES,
+    )
+    if item_ids is not None:
+        lines = lines.filter(item_id__in=item_ids)
+    if location is not None:
+        lines = lines.filter(order__to_location=location)
+    return lines
+
+
+def open_purchase_qty(item_ids=None, location=None):
+    """
+    Open purchase order quantity (ordered, not yet received) per item.
+
+    Returns:
+        dict: item_id -> Decimal quantity on order; items with nothing
+            open are absent
+    """
+    return dict(
+        open_purchase_lines(item_ids, location)
+        .values('item_id')
+        .annotate(qty_open=Sum(F('qty') - F('qty_received')))
+        .values_list('item_id', 'qty_open')
+        .order_by()
+    )
+
+
+def update_receipt_status(order):
+    """
+    PARTIAL while any line is still open, CLOSED once all are received.
+
+    Returns:
+        str: The order's status after the receipt
+    """
+    if order.order_status not in RECEIVABLE_STATUSES:
+        return order.order_status
+    if order.lines.filter(qty_received__lt=F('qty')).exists():
+        updates = {'order_status': OrderStatus.PARTIAL}
+    else:
+        updates = {'order_status': OrderStatus.CLOSED, 'fulfillment_date': timezone.localdate()}
+    Order.objects.filter(pk=order.pk).update(**updates)
+    return updates['order_status']
+
+
+def receive_purchase_qty(order, item_id, qty, order_line=None):
+    """
+    Add a receipt posted outside a shipment to the PO's received totals.
+
+    Credits order_line when given; otherwise the PO's lines for the item in
+    line_no order, each up to its open quantity, with any excess on the
+    last line. Then moves the PO to PARTIAL or CLOSED.
+
+    Args:
+        order: Purchase order received against
+        item_id: Item received
+        qty: Quantity received
+        order_line: OrderLine received against (optional)
+
+    Returns:
+        list: OrderLines credited (empty when the PO has no line for the item)
+    """
+    if order_line is not None:
+        credits = {order_line.pk: (order_line, qty)}
+    else:
+        credits = {}
+        remaining = qty
+        lines = list(order.lines.filter(item_id=item_id).order_by('line_no'))
+        for line in lines:
+            take = min(max(line.qty - line.qty_received, 0), remaining)
+            if take > 0:
+                credits[line.pk] = (line, take)
+                remaining -= take
+        if lines and remaining > 0:
+            line, take = credits.get(lines[-1].pk, (lines[-1], 0))
+            credits[line.pk] = (line, take + remaining)
+
+    lines = []
+    for line, take in credits.values():
+        # Increment in SQL so concurrent receipts against the same PO add up
+        line.qty_received = F('qty_received') + take
+        lines.append(line)
+    OrderLine.objects.bulk_update(lines, ['qty_received'])
+    if lines:
+        update_receipt_status(order)
+    return lines
@@ -1,3 +1,183 @@
+from decimal import Decimal
+from importlib import import_module
+
+from django.apps import apps
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from employees.models import Employee
+from inventory.models import InventoryLayer, InventoryMovement, Item, UnitOfMeasure
+from inventory.services import FIFOInventoryService
+from locations.models import Location
+from shipments.models import Shipment, ShipmentStatus
+from users.models import User
+from vendors.models import Vendor
+
+from .models import Order, OrderLine, OrderLineAllocation, OrderStatus, OrderType
+from .services import open_purchase_qty
+
+
+class OrderListQueryTests(TestCase):
+    """The order list must cost a constant number of queries per page"""
+
+    @classmethod
+    def setUpTestData(cls):
+        employee = Employee.objects.create(first_name='Dana', last_name='Reyes', email='dana@example.com')
+        cls.user = User.objects.create(email='dana@example.com', employee=employee)
+        cls.vendor = Vendor.objects.create(name='Acme Supply')
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def create_orders(self, count):
+        for _ in range(count):
+            order = Order.objects.create(
+                order_type=OrderType.PURCHASE,
+                vendor=self.vendor,
+                assigned_user=self.user,
+                created_by=self.user,
+            )
+            OrderLine.objects.bulk_create([
+                OrderLine(order=order, line_no=1, description='Wire', qty=Decimal('2'), price_each=Decimal('3.50')),
+                OrderLine(order=order, line_no=2, description='Conduit', qty=Decimal('4'), price_each=None),
+            ])
+
+    def list_queries(self, url):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return response, len(queries)
+
+    def test_list_query_count_is_constant(self):
+        self.create_orders(2)
+        _, few = self.list_queries('/api/orders/')
+        self.create_orders(10)
+        response, many = self.list_queries('/api/orders/')
+
+        self.assertEqual(few, many)
+        self.assertLessEqual(many, 2)  # count + page
+        self.assertEqual(len(response.data['results']), 12)
+
+    def test_list_with_lines_query_count_is_constant(self):
+        self.create_orders(2)
+        _, few = self.list_queries('/api/orders/?include=lines')
+        self.create_orders(10)
+        response, many = self.list_queries('/api/orders/?include=lines')
+
+        self.assertEqual(few, many)
+        self.assertLessEqual(many, 3)  # count + page + lines
+        self.assertEqual(len(response.data['results'][0]['lines']), 2)
+
+    def test_list_annotations(self):
+        self.create_orders(1)
+        response, _ = self.list_queries('/api/orders/')
+        order = response.data['results'][0]
+
+        self.assertNotIn('lines', order)
+        self.assertEqual(order['line_count'], 2)
+        self.assertEqual(Decimal(order['total_qty']), Decimal('6'))
+        self.assertEqual(Decimal(order['order_total']), Decimal('7'))
+        self.assertEqual(order['assigned_user']['name'], 'D. Reyes')
+        self.assertEqual(order['created_by']['email'], 'dana@example.com')
+
+
+class FulfillRequestTests(TestCase):
+    """Fulfill parses its flags as booleans, whatever the request encoding"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(email='dana@example.com')
+        location = Location.objects.create(name='Main', type='WAREHOUSE')
+        uom = UnitOfMeasure.objects.create(uom_code='EA')
+        item = Item.objects.create(g_code='G-100', item_name='Wire')
+        cls.order = Order.objects.create(order_type=OrderType.SALES, from_location=location)
+        OrderLine.objects.create(order=cls.order, line_no=1, item=item, uom=uom, description='Wire', qty=Decimal('5'))
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_form_encoded_false_is_strict(self):
+        response = self.client.post(f'/api/orders/{self.order.pk}/fulfill/', {'allow_negative': 'false'})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('Insufficient inventory', response.data['error'])
+        self.assertFalse(OrderLineAllocation.objects.exists())
+
+
+class ReceiptCounterTests(TestCase):
+    """qty_received counts every receipt against a PO, old or new"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.location = Location.objects.create(name='Main', type='WAREHOUSE')
+        cls.uom = UnitOfMeasure.objects.create(uom_code='EA')
+        cls.wire = Item.objects.create(g_code='G-100', item_name='Wire')
+        cls.conduit = Item.objects.create(g_code='G-200', item_name='Conduit')
+
+    def create_po(self):
+        order = Order.objects.create(
+            order_type=OrderType.PURCHASE, order_status=OrderStatus.OPEN, to_location=self.location,
+        )
+        lines = [
+            OrderLine.objects.create(order=order, line_no=1, item=self.wire, uom=self.uom, qty=Decimal('10')),
+            OrderLine.objects.create(order=order, line_no=2, item=self.wire, uom=self.uom, qty=Decimal('5')),
+            OrderLine.objects.create(order=order, line_no=3, item=self.conduit, uom=self.uom, qty=Decimal('8')),
+        ]
+        return order, lines
+
+    def received(self, lines):
+        return [OrderLine.objects.get(pk=line.pk).qty_received for line in lines]
+
+    def test_backfill_counts_receipts_posted_before_the_counter(self):
+        backfill_qty_received = import_module('orders.migrations.0008_orderline_qty_received').backfill_qty_received
+        shipped, shipped_lines = self.create_po()
+        # The old post_save receipt: full layers, no movements
+        Shipment.objects.bulk_create([Shipment(order=shipped, status=ShipmentStatus.PICKED_UP)])
+        InventoryLayer.objects.create(
+            item=self.wire, location=self.location, qty_remaining=Decimal('0'), unit_cost=Decimal('1'),
+            purchase_order=shipped,
+        )
+        manual, manual_lines = self.create_po()
+        InventoryMovement.objects.bulk_create([
+            InventoryMovement(item=self.wire, qty=Decimal('12'), to_location=self.location, order=manual),
+            InventoryMovement(
+                item=self.conduit, qty=Decimal('3'), to_location=self.location,
+                order=manual, order_line=manual_lines[2],
+            ),
+        ])
+        OrderLine.objects.update(qty_received=0)
+
+        backfill_qty_received(apps, None)
+
+        self.assertEqual(self.received(shipped_lines), [Decimal('10'), Decimal('5'), Decimal('8')])
+        self.assertEqual(self.received(manual_lines), [Decimal('10'), Decimal('2'), Decimal('3')])
+        self.assertEqual(open_purchase_qty(), {self.wire.pk: Decimal('3'), self.conduit.pk: Decimal('5')})
+
+    def test_receive_inventory_counts_against_the_po(self):
+        order, lines = self.create_po()
+
+        FIFOInventoryService.receive_inventory(
+            item=self.wire, location=self.location, qty=Decimal('12'), unit_cost=Decimal('1'),
+            purchase_order=order,
+        )
+        self.assertEqual(self.received(lines), [Decimal('10'), Decimal('2'), Decimal('0')])
+        order.refresh_from_db()
+        self.assertEqual(order.order_status, OrderStatus.PARTIAL)
 
-# Create your tests here.
+        FIFOInventoryService.receive_inventory(
+            item=self.wire, location=self.location, qty=Decimal('4'), unit_cost=Decimal('1'),
+            purchase_order=order,
+        )
+        FIFOInventoryService.receive_inventory(
+            item=self.conduit, location=self.location, qty=Decimal('8'), unit_cost=Decimal('1'),
+            purchase_order=order, order_line=lines[2],
+        )
+        self.assertEqual(self.received(lines), [Decimal('10'), Decimal('6'), Decimal('8')])
+        order.refresh_from_db()
+        self.assertEqual(order.order_status, OrderStatus.CLOSED)
+        self.assertEqual(InventoryMovement.objects.get(order_line=lines[2]).qty, Decimal('8'))
+        self.assertEqual(open_purchase_qty(), {})
@@ -12,6 +12,20 @@ router.register(r'', OrderViewSet, basename='order')
 router.register(r'lines', OrderLineViewSet, basename='orderline')
 
 urlpatterns = [
+    # Batch pick tickets (before the router, whose detail route would match 'pick-tickets')
+    path('pick-tickets/batches/',
+         api_views.PickTicketBatchListCreateView.as_view(),
+         name='pick_ticket_batch_list'),
+    path('pick-tickets/batches/<uuid:batch_id>/',
+         api_views.PickTicketBatchDetailView.as_view(),
+         name='pick_ticket_batch_detail'),
+    path('pick-tickets/batches/<uuid:batch_id>/download/',
+         api_views.download_pick_ticket_batch,
+         name='download_pick_ticket_batch'),
+
+    # Wave picking (also ahead of the router)
+    path('waves/', api_views.WaveView.as_view(), name='wave'),
+
     # REST API endpoints (NO 'api/' prefix here!)
     path('', include(router.urls)),
     
@@ -2,12 +2,19 @@
 """
 ViewSets for Orders REST API
 """
-from rest_framework import viewsets, filters
+from django.db.models import Count, DecimalField, F, OuterRef, Prefetch, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+from django.http import HttpResponse
+from rest_framework import viewsets, filters, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from django_filters.rest_framework import DjangoFilterBackend
 from .models import Order, OrderLine
+from .fulfillment import fulfill_order
+from .pick_ticket_service import generate_pick_ticket
+from .services import open_purchase_qty
 from .serializers import (
+    FulfillRequestSerializer,
     OrderListSerializer,
     OrderDetailSerializer,
     OrderCreateSerializer,
@@ -15,11 +22,37 @@ from .serializers import (
 )
 
 
+def _line_total(expression):
+    """Per-order SUM over the order's lines, 0 for orders without lines"""
+    total = (
+        OrderLine.objects
+        .filter(order=OuterRef('pk'))
+        .order_by()
+        .values('order')
+        .annotate(total=Sum(expression))
+        .values('total')
+    )
+    output_field = DecimalField(max_digits=18, decimal_places=4)
+    return Coalesce(Subquery(total, output_field=output_field), Value(0), output_field=output_field)
+
+
+def _user_values(field):
+    """Annotations for user_summary() read through the user and employee joins"""
+    return {
+        f'{field}_email': F(f'{field}__email'),
+        f'{field}_display_name': F(f'{field}__display_name'),
+        f'{field}_first_name': F(f'{field}__employee__first_name'),
+        f'{field}_last_name': F(f'{field}__employee__last_name'),
+    }
+
+
 class OrderViewSet(viewsets.ModelViewSet):
     """
     ViewSet for managing orders
     
-    Provides CRUD operations and filtering
+    Provides CRUD operations and filtering. The list is annotated in SQL
+    (line count, totals, user names) and only nests lines with
+    ?include=lines, so a page costs the same few queries at any size.
     """
     queryset = Order.objects.all().select_related(
         'customer', 'vendor', 'job', 'work_order', 'from_location', 'to_location',
@@ -31,6 +64,41 @@ class OrderViewSet(viewsets.ModelViewSet):
     ordering_fields = ['ordered_at', 'order_status']
     ordering = ['-ordered_at']  # Default: newest first
     
+    def include_lines(self):
+        return 'lines' in self.request.query_params.get('include', '').split(',')
+
+    def get_queryset(self):
+        if self.action != 'list':
+            return super().get_queryset()
+        line_count = (
+            OrderLine.objects
+            .filter(order=OuterRef('pk'))
+            .order_by()
+            .values('order')
+            .annotate(count=Count('pk'))
+            .values('count')
+        )
+        queryset = Order.objects.select_related(
+            'customer', 'vendor', 'job', 'from_location', 'to_location', 'department'
+        ).annotate(
+            line_count=Coalesce(Subquery(line_count), Value(0)),
+            total_qty=_line_total(F('qty')),
+            order_total=_line_total(F('qty') * F('price_each')),
+            **_user_values('assigned_user'),
+            **_user_values('created_by'),
+        )
+        if self.include_lines():
+            queryset = queryset.prefetch_related(
+                Prefetch('lines', queryset=OrderLine.objects.order_by('line_no'))
+            )
+        return queryset
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        if self.action == 'list':
+            context['include_lines'] = self.include_lines()
+        return context
+
     def get_serializer_class(self):
         """Use different serializers for different actions"""
         if self.action == 'list':
@@ -47,6 +115,43 @@ class OrderViewSet(viewsets.ModelViewSet):
         serializer = OrderLineSerializer(lines, many=True)
         return Response(serializer.data)
 
+    @action(detail=True, methods=['post'])
+    def fulfill(self, request, pk=None):
+        """
+        Allocate every line of a sales order (FIFO, from its from_location)
+        and return the pick ticket for the bins allocated.
+
+        Body: {"allow_negative": true, "reference": "", "pick_path": false}
+        (all optional; pick_path prints the ticket in walk order by bin)
+        Returns the pick ticket PDF; X-Lines-Allocated / X-Lines-Short /
+        X-Lines-Skipped headers summarize the allocation.
+        """
+        order = self.get_object()
+        params = FulfillRequestSerializer(data=request.data)
+        params.is_valid(raise_exception=True)
+        params = params.validated_data
+        try:
+            result = fulfill_order(
+                order,
+                allow_negative=params['allow_negative'],
+                reference=params['reference'],
+            )
+        except ValueError as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        pdf_buffer = generate_pick_ticket(
+            result['order'],
+            lines=result['lines'],
+            allocations=result['allocations'],
+            pick_path=params['pick_path'],
+        )
+        response = HttpResponse(pdf_buffer.read(), content_type='application/pdf')
+        response['Content-Disposition'] = f'attachment; filename="pick_ticket_{str(order.order_id)[:8]}.pdf"'
+        response['X-Lines-Allocated'] = result['lines_allocated']
+        response['X-Lines-Short'] = result['lines_short']
+        response['X-Lines-Skipped'] = result['lines_skipped']
+        return response
+
 
 class OrderLineViewSet(viewsets.ModelViewSet):
     """
@@ -57,4 +162,19 @@ class OrderLineViewSet(viewsets.ModelViewSet):
     filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
     filterset_fields = ['order', 'item']
     ordering_fields = ['line_no']
-    ordering = ['line_no']
\ No newline at end of file
+    ordering = ['line_no']
+
+    @action(detail=False, methods=['get'], url_path='open-po-qty')
+    def open_po_qty(self, request):
+        """
+        Open purchase order quantity (ordered, not yet received) per item.
+
+        Query params: item (repeatable), location (PO to_location)
+        """
+        item_ids = request.query_params.getlist('item') or None
+        location = request.query_params.get('location')
+        quantities = open_purchase_qty(item_ids=item_ids, location=location)
+        return Response([
+            {'item_id': str(item_id), 'qty_open': qty_open}
+            for item_id, qty_open in quantities.items()
+        ])
@@ -0,0 +1,198 @@
+# backend/orders/waves.py
+"""
+Wave Picking
+
+A wave is a set of SALES orders shipped from the same location. They are
+picked together: one consolidated pick list walks every bin once, and a
+put wall (one slot per order) splits each pick between the orders.
+
+Quantities are aggregated in SQL over OrderLine: one grouped query by
+item and bin for the pick list, and one by order, item and bin for the
+put wall. Allocated lines are grouped by their recorded allocations (see
+fulfillment.py); lines not yet allocated use their from_bin, else the
+item's default bin at the wave location. Allocation shortages are listed
+as backorders. Loading a wave costs a fixed number of queries whatever
+its size.
+"""
+
+from collections import defaultdict
+
+from django.db.models import (
+    BooleanField, Exists, ExpressionWrapper, OuterRef, Q, Sum,
+)
+from django.db.models.functions import Coalesce
+
+from inventory.models import Bin, Item
+
+from .models import Order, OrderLine, OrderStatus, OrderType
+from .pick_ticket_service import load_default_bins, walk_key
+
+
+# Orders still waiting to be picked
+CLOSED_STATUSES = (OrderStatus.CLOSED, OrderStatus.CANCELED)
+
+
+def wave_orders(location, fulfillment_date=None, department=None, order_ids=None):
+    """
+    Open SALES orders with lines shipping from location, oldest first.
+
+    Args:
+        location: Location the wave is picked from
+        fulfillment_date: Only orders due on this date
+        department: Only orders for this department (instance or id)
+        order_ids: Only these orders
+
+    Returns:
+        QuerySet: Orders with customer loaded
+    """
+    orders = (
+        Order.objects
+        .filter(
+            Exists(OrderLine.objects.filter(order=OuterRef('pk'), item__isnull=False)),
+            order_type=OrderType.SALES,
+            from_location=location,
+        )
+        .exclude(order_status__in=CLOSED_STATUSES)
+        .select_related('customer')
+    )
+    if fulfillment_date is not None:
+        orders = orders.filter(fulfillment_date=fulfillment_date)
+    if department is not None:
+        orders = orders.filter(department=department)
+    if order_ids is not None:
+        orders = orders.filter(pk__in=order_ids)
+    return orders.order_by('ordered_at', 'order_id')
+
+
+def _grouped_quantities(order_ids, *by):
+    """
+    Pick quantities grouped by item, uom, bin and backorder (plus `by`):
+    allocation quantities for allocated lines, line quantities otherwise.
+    """
+    return (
+        OrderLine.objects
+        .filter(order_id__in=order_ids, item__isnull=False)
+        .annotate(
+            pick_bin_id=Coalesce('allocations__bin_id', 'from_bin_id'),
+            backorder=ExpressionWrapper(
+                Q(allocations__pending_allocation__isnull=False),
+                output_field=BooleanField(),
+            ),
+        )
+        .values(*by, 'item_id', 'uom_id', 'pick_bin_id', 'backorder')
+        .annotate(pick_qty=Sum(Coalesce('allocations__qty', 'qty')))
+        .order_by()
+    )
+
+
+def plan_wave(orders, location):
+    """
+    Consolidated picks and put-wall slots for a wave.
+
+    Args:
+        orders: Orders in the wave; put-wall slots are numbered from 1 in
+            this order
+        location: Location the wave is picked from
+
+    Returns:
+        dict:
+            location
+            slots: [(slot, order)]
+            picks: rows in walk order, one per item, uom and bin
+            unassigned: rows with no bin to pick from
+            backorder: rows short of stock
+            put_wall: order_id -> rows for that order, in walk order
+
+        Each row is a dict with item, uom, bin (None when unassigned or
+        backordered), qty, backorder and slots ([(slot, qty)]; put_wall
+        rows have one).
+    """
+    slots = list(enumerate(orders, start=1))
+    slot_by_order = {order.pk: slot for slot, order in slots}
+    order_ids = list(slot_by_order)
+
+    totals = list(_grouped_quantities(order_ids))
+    by_order = list(_grouped_quantities(order_ids, 'order_id'))
+
+    # Unallocated lines without a from_bin pick from the item's default bin here
+    default_bins = {}
+    unbinned = {row['item_id'] for row in totals if row['pick_bin_id'] is None and not row['backorder']}
+    for item_id, candidates in load_default_bins(unbinned).items():
+        for candidate in candidates:
+            if candidate.location_id == location.pk:
+                default_bins[item_id] = candidate.bin_id
+                break
+
+    def key(row):
+        bin_id = row['pick_bin_id']
+        if bin_id is None and not row['backorder']:
+            bin_id = default_bins.get(row['item_id'])
+        return row['item_id'], row['uom_id'], bin_id, row['backorder']
+
+    bins = Bin.objects.select_related('location').in_bulk(
+        {key(row)[2] for row in totals if key(row)[2] is not None}
+    )
+    items = Item.objects.in_bulk({row['item_id'] for row in totals})
+
+    def new_row(item_id, uom_id, bin_id, backorder):
+        return {
+            'item': items[item_id],
+            'uom': uom_id or 'EA',
+            'bin': bins.get(bin_id) if not backorder else None,
+            'qty': 0,
+            'slots': [],
+            'backorder': backorder,
+        }
+
+    rows = {}
+    for row in totals:
+        row_key = key(row)
+        if row_key not in rows:
+            rows[row_key] = new_row(*row_key)
+        rows[row_key]['qty'] += row['pick_qty']
+
+    put_wall = defaultdict(dict)
+    for row in by_order:
+        row_key = key(row)
+        slot = slot_by_order[row['order_id']]
+        order_rows = put_wall[row['order_id']]
+        if row_key not in order_rows:
+            order_rows[row_key] = new_row(*row_key)
+        order_rows[row_key]['qty'] += row['pick_qty']
+        order_rows[row_key]['slots'] = [(slot, order_rows[row_key]['qty'])]
+        rows[row_key]['slots'].append((slot, row['pick_qty']))
+
+    def sort_key(row):
+        walk = walk_key(row['bin'].location, row['bin']) if row['bin'] else ()
+        return (*walk, row['item'].g_code)
+
+    plan = {
+        'location': location,
+        'slots': slots,
+        'picks': [],
+        'unassigned': [],
+        'backorder': [],
+        'put_wall': {},
+    }
+    for row in sorted(rows.values(), key=sort_key):
+        row['slots'] = _merge_slots(row['slots'])
+        if row['backorder']:
+            plan['backorder'].append(row)
+        elif row['bin'] is None:
+            plan['unassigned'].append(row)
+        else:
+            plan['picks'].append(row)
+    for order_id, order_rows in put_wall.items():
+        plan['put_wall'][order_id] = sorted(
+            order_rows.values(),
+            key=lambda row: (row['bin'] is None, *sort_key(row)),
+        )
+    return plan
+
+
+def _merge_slots(slots):
+    """Sum quantities per slot (a line can be split over several layers) and sort"""
+    merged = defaultdict(int)
+    for slot, qty in slots:
+        merged[slot] += qty
+    return sorted(merged.items())
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.7 on 2026-10-19 16:03
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('manufacturers', '0002_manufactureralias'),
+        ('rfqs', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='vendorquote',
+            name='mfr',
+            field=models.ForeignKey(blank=True, db_column='mfr_id', editable=False, help_text='Manufacturer resolved from the manufacturer name', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='quotes', to='manufacturers.manufacturer'),
+        ),
+    ]
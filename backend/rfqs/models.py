@@ -7,6 +7,8 @@ from django.db import models
 import uuid
 from django.utils import timezone
 
+from manufacturers.services import sync_manufacturer
+
 
 class RFQStatus(models.TextChoices):
     """Status choices for RFQ"""
@@ -216,6 +218,16 @@ class VendorQuote(models.Model):
 
     # Product details from vendor
     manufacturer = models.CharField(max_length=255, blank=True, help_text='Manufacturer name')
+    mfr = models.ForeignKey(
+        'manufacturers.Manufacturer',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        editable=False,
+        related_name='quotes',
+        db_column='mfr_id',
+        help_text='Manufacturer resolved from the manufacturer name'
+    )
     manufacturer_part_number = models.CharField(
         max_length=255,
         blank=True,
@@ -250,6 +262,10 @@ class VendorQuote(models.Model):
     def __str__(self):
         return f"{self.vendor.name} quote for {self.rfq_line}: ${self.price_each}"
 
+    def save(self, *args, **kwargs):
+        sync_manufacturer(self, 'manufacturer', 'mfr', kwargs)
+        super().save(*args, **kwargs)
+
 
 class ReplenishmentOrder(models.Model):
     """
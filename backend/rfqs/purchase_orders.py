@@ -0,0 +1,113 @@
+# backend/rfqs/purchase_orders.py
+"""
+Purchase Orders from Replenishments
+
+create_purchase_orders() turns a DRAFT replenishment into one DRAFT
+purchase order per selected vendor. The replenishment is locked and its
+lines are loaded with their quotes, vendors, items and uoms in a single
+prefetch; every Order and OrderLine is built in memory and written with
+bulk_create, and the replenishment lines are linked to their POs with
+one bulk_update. A 2,000-line replenishment is a handful of statements
+in one short transaction.
+
+POs are raised in vendor name order; each PO's lines follow the RFQ's
+line order.
+"""
+
+from django.db import transaction
+from django.db.models import Prefetch
+from django.utils import timezone
+
+from orders.models import Order, OrderLine, OrderStatus, OrderType
+
+from .models import ReplenishmentLine, ReplenishmentOrder, ReplenishmentStatus, RFQStatus
+
+
+BATCH_SIZE = 1000
+
+
+@transaction.atomic
+def create_purchase_orders(replenishment, user=None):
+    """
+    Raise the purchase orders for a DRAFT replenishment.
+
+    Marks the replenishment POS_CREATED and its RFQ COMPLETED.
+
+    Args:
+        replenishment: ReplenishmentOrder (reloaded and locked here)
+        user: User recorded as the POs' creator
+
+    Returns:
+        list: (Order, vendor, line count) per PO created
+
+    Raises:
+        ValueError: Not a draft, or no lines selected
+    """
+    replenishment = (
+        ReplenishmentOrder.objects
+        .select_for_update(of=('self',))
+        .select_related('rfq')
+        .prefetch_related(Prefetch(
+            'lines',
+            queryset=ReplenishmentLine.objects.select_related(
+                'selected_vendor_quote__vendor',
+                'rfq_line__item',
+                'rfq_line__uom',
+            ),
+        ))
+        .get(pk=replenishment.pk)
+    )
+    if replenishment.status != ReplenishmentStatus.DRAFT:
+        raise ValueError('Only draft replenishments can be finalized')
+    repl_lines = sorted(
+        replenishment.lines.all(),
+        key=lambda line: (line.selected_vendor_quote.vendor.name, line.selected_vendor_quote.vendor_id, line.rfq_line.line_no),
+    )
+    if not repl_lines:
+        raise ValueError('Replenishment has no lines to order')
+
+    now = timezone.now()
+    purchase_orders = {}  # vendor_id -> [Order, vendor, lines]
+    order_lines = []
+    for repl_line in repl_lines:
+        quote = repl_line.selected_vendor_quote
+        if quote.vendor_id not in purchase_orders:
+            purchase_orders[quote.vendor_id] = [
+                Order(
+                    order_type=OrderType.PURCHASE,
+                    order_status=OrderStatus.DRAFT,
+                    ordered_at=now,
+                    vendor=quote.vendor,
+                    description=f"From RFQ {replenishment.rfq.rfq_number}",
+                    created_by=user,
+                ),
+                quote.vendor,
+                0,
+            ]
+        entry = purchase_orders[quote.vendor_id]
+        entry[2] += 1
+        item = repl_line.rfq_line.item
+        order_lines.append(OrderLine(
+            order=entry[0],
+            line_no=entry[2],
+            item=item,
+            description=item.item_name,
+            uom=repl_line.rfq_line.uom,
+            qty=repl_line.qty_to_order,
+            price_each=quote.price_each,
+            g_code=item.g_code,
+        ))
+        repl_line.purchase_order = entry[0]
+
+    Order.objects.bulk_create([entry[0] for entry in purchase_orders.values()], batch_size=BATCH_SIZE)
+    OrderLine.objects.bulk_create(order_lines, batch_size=BATCH_SIZE)
+    ReplenishmentLine.objects.bulk_update(repl_lines, ['purchase_order'], batch_size=BATCH_SIZE)
+
+    replenishment.status = ReplenishmentStatus.POS_CREATED
+    replenishment.finalized_at = now
+    replenishment.save(update_fields=['status', 'finalized_at'])
+    # Also refreshes the dashboard summary, which bulk_create does not signal
+    replenishment.rfq.status = RFQStatus.COMPLETED
+    replenishment.rfq.save(update_fields=['status'])
+
+    return [tuple(entry) for entry in purchase_orders.values()]
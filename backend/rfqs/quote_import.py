@@ -0,0 +1,186 @@
+# backend/rfqs/quote_import.py
+"""
+Bulk Vendor Quote Import
+
+Imports a vendor quote sheet (thousands of rows) in a fixed number of
+queries instead of validating and saving row by row:
+
+- Rows are validated with VendorQuoteImportSerializer, which runs no
+  queries; rfq lines, vendors, vendor items, existing quotes and RFQ
+  vendors are then loaded once for the whole sheet and each row is
+  checked against those maps. Rows that fail are returned with their
+  index and errors; the rest are imported.
+- Quotes are written with bulk_create (manufacturer text resolved in one
+  resolve_manufacturers() call, as VendorQuote.save() would per row).
+- The quoting vendors' PENDING RFQVendor rows become QUOTED with one
+  bulk_update.
+- Quoted prices update the vendors' catalog like a PO receipt does (see
+  shipments.services.confirm_vendor_prices): missing VendorItems are
+  created, changed prices get a price history row, and both are written
+  in bulk. When an item is quoted on several rows, the last price wins.
+"""
+
+from django.db import transaction
+from django.utils import timezone
+
+from changes.services import record_changes
+from manufacturers.services import resolve_manufacturers
+from vendoritems.models import VendorItem, VendorItemPriceHistory
+from vendors.models import Vendor
+
+from .models import RFQLine, RFQVendor, RFQVendorStatus, VendorQuote
+from .serializers import VendorQuoteImportSerializer
+
+
+BATCH_SIZE = 1000
+
+UNIQUE_ERROR = 'The fields rfq_line, vendor must make a unique set.'
+
+
+def _missing(pk):
+    return [f'Invalid pk "{pk}" - object does not exist.']
+
+
+def _validate(rows):
+    """
+    Per-row validation without queries.
+
+    Returns:
+        tuple: ([(index, validated data)], [error dicts])
+    """
+    valid = []
+    errors = []
+    for index, row in enumerate(rows):
+        serializer = VendorQuoteImportSerializer(data=row)
+        if serializer.is_valid():
+            valid.append((index, serializer.validated_data))
+        else:
+            errors.append({'row': index, 'data': row, 'errors': serializer.errors})
+    return valid, errors
+
+
+def _update_vendor_items(quotes, now):
+    """
+    Create or reprice the quoting vendors' VendorItems.
+
+    Returns:
+        int: VendorItems created or repriced
+    """
+    prices = {}
+    for quote in quotes:
+        if quote.price_each and quote.rfq_line.item_id:
+            prices[(quote.vendor_id, quote.rfq_line.item_id)] = (quote.price_each, quote.rfq_line.rfq_id)
+    if not prices:
+        return 0
+
+    existing = {
+        (vendor_item.vendor_id, vendor_item.item_id): vendor_item
+        for vendor_item in VendorItem.objects.filter(
+            vendor_id__in={vendor_id for vendor_id, _ in prices},
+            item_id__in={item_id for _, item_id in prices},
+        )
+    }
+    created = []
+    changed = []
+    history = []
+    for key, (price, rfq_id) in prices.items():
+        vendor_item = existing.get(key)
+        if vendor_item is None:
+            created.append(VendorItem(vendor_id=key[0], item_id=key[1], unit_price=price))
+            continue
+        if vendor_item.unit_price == price:
+            continue
+        vendor_item.unit_price = price
+        vendor_item.last_updated = now
+        changed.append(vendor_item)
+        history.append(VendorItemPriceHistory(
+            vendor_item=vendor_item,
+            unit_price=price,
+            effective_date=now,
+            notes=f"Updated from RFQ quote (RFQ #{rfq_id})"
+        ))
+
+    VendorItem.objects.bulk_create(created, batch_size=BATCH_SIZE)
+    VendorItemPriceHistory.objects.bulk_create(history, batch_size=BATCH_SIZE)
+    VendorItem.objects.bulk_update(changed, ['unit_price', 'last_updated'], batch_size=BATCH_SIZE)
+    record_changes(VendorItem, [vendor_item.pk for vendor_item in (*created, *changed)])
+    return len(created) + len(changed)
+
+
+@transaction.atomic
+def import_quotes(rows):
+    """
+    Import vendor quote rows (VendorQuoteSerializer fields).
+
+    Args:
+        rows: List of dicts, e.g. parsed from a quote CSV
+
+    Returns:
+        dict: quotes (created VendorQuotes, vendor and rfq_line.item
+            loaded), errors ([{row, data, errors}]), rfq_vendors_updated,
+            vendor_items_updated
+    """
+    valid, errors = _validate(rows)
+
+    rfq_lines = RFQLine.objects.select_related('item').in_bulk({data['rfq_line'] for _, data in valid})
+    vendors = Vendor.objects.in_bulk({data['vendor'] for _, data in valid})
+    vendor_items = VendorItem.objects.in_bulk({data['vendor_item'] for _, data in valid if data.get('vendor_item')})
+    taken = set(
+        VendorQuote.objects
+        .filter(rfq_line_id__in=list(rfq_lines))
+        .values_list('rfq_line_id', 'vendor_id')
+    )
+
+    accepted = []
+    for index, data in valid:
+        row_errors = {}
+        rfq_line = rfq_lines.get(data['rfq_line'])
+        vendor = vendors.get(data['vendor'])
+        if rfq_line is None:
+            row_errors['rfq_line'] = _missing(data['rfq_line'])
+        if vendor is None:
+            row_errors['vendor'] = _missing(data['vendor'])
+        if data.get('vendor_item') and data['vendor_item'] not in vendor_items:
+            row_errors['vendor_item'] = _missing(data['vendor_item'])
+        if not row_errors and (rfq_line.pk, vendor.pk) in taken:
+            row_errors['non_field_errors'] = [UNIQUE_ERROR]
+        if row_errors:
+            errors.append({'row': index, 'data': rows[index], 'errors': row_errors})
+            continue
+        taken.add((rfq_line.pk, vendor.pk))
+        accepted.append((rfq_line, vendor, data))
+
+    manufacturers = resolve_manufacturers({data.get('manufacturer') for _, _, data in accepted})
+    quotes = []
+    for rfq_line, vendor, data in accepted:
+        fields = {name: value for name, value in data.items() if name not in ('rfq_line', 'vendor', 'vendor_item')}
+        quotes.append(VendorQuote(
+            rfq_line=rfq_line,
+            vendor=vendor,
+            vendor_item_id=data.get('vendor_item'),
+            mfr_id=manufacturers.get(data.get('manufacturer')),
+            **fields,
+        ))
+    VendorQuote.objects.bulk_create(quotes, batch_size=BATCH_SIZE)
+
+    now = timezone.now()
+    quoted = {(quote.rfq_line.rfq_id, quote.vendor_id) for quote in quotes}
+    responded = []
+    for rfq_vendor in RFQVendor.objects.filter(
+        rfq_id__in={rfq_id for rfq_id, _ in quoted},
+        vendor_id__in={vendor_id for _, vendor_id in quoted},
+        status=RFQVendorStatus.PENDING,
+    ):
+        if (rfq_vendor.rfq_id, rfq_vendor.vendor_id) in quoted:
+            rfq_vendor.status = RFQVendorStatus.QUOTED
+            rfq_vendor.responded_at = now
+            responded.append(rfq_vendor)
+    RFQVendor.objects.bulk_update(responded, ['status', 'responded_at'], batch_size=BATCH_SIZE)
+
+    errors.sort(key=lambda error: error['row'])
+    return {
+        'quotes': quotes,
+        'errors': errors,
+        'rfq_vendors_updated': len(responded),
+        'vendor_items_updated': _update_vendor_items(quotes, now),
+    }
@@ -0,0 +1,211 @@
+# backend/rfqs/quote_matrix.py
+"""
+RFQ Quote Comparison
+
+Loads an RFQ's lines and every quote against them in two queries (lines,
+then quotes as values() rows) and ranks each line's quotes in memory:
+
+- cheapest: lowest price_each (ties: shorter lead time, then vendor name)
+- fastest: shortest lead_time_days among quotes that state one (ties:
+  lower price)
+- can fill: qty_available covers qty_requested; best_can_fill is the
+  cheapest of those
+
+build_quote_matrix() pivots the result into a line x vendor grid with a
+column per quoting vendor and each vendor's total if it were awarded
+every line it quoted.
+"""
+
+from decimal import Decimal
+
+from .models import VendorQuote
+
+
+QUOTE_FIELDS = (
+    'quote_id',
+    'rfq_line_id',
+    'vendor_id',
+    'vendor__name',
+    'price_each',
+    'qty_available',
+    'lead_time_days',
+    'manufacturer',
+    'manufacturer_part_number',
+    'is_selected',
+)
+
+
+def _cheapest_key(quote):
+    lead_time = quote['lead_time_days']
+    return (
+        quote['price_each'],
+        lead_time is None,
+        lead_time or 0,
+        quote['vendor__name'],
+    )
+
+
+def _fastest_key(quote):
+    return (quote['lead_time_days'], quote['price_each'], quote['vendor__name'])
+
+
+def rank_quotes(qty_requested, quotes):
+    """
+    Best quotes for one line.
+
+    Args:
+        qty_requested: Line quantity
+        quotes: The line's quote rows (QUOTE_FIELDS)
+
+    Returns:
+        dict: cheapest, fastest, best_can_fill (quote rows or None) and
+            can_fill (rows whose qty_available covers qty_requested)
+    """
+    can_fill = [quote for quote in quotes if quote['qty_available'] >= qty_requested]
+    with_lead_time = [quote for quote in quotes if quote['lead_time_days'] is not None]
+    return {
+        'cheapest': min(quotes, key=_cheapest_key, default=None),
+        'fastest': min(with_lead_time, key=_fastest_key, default=None),
+        'best_can_fill': min(can_fill, key=_cheapest_key, default=None),
+        'can_fill': can_fill,
+    }
+
+
+def load_quote_lines(rfq):
+    """
+    The RFQ's lines (item and uom loaded, line_no order) with their quotes.
+
+    Returns:
+        list: (line, quote rows in vendor name order, rank_quotes result)
+    """
+    lines = list(rfq.lines.select_related('item', 'uom').order_by('line_no'))
+    quotes_by_line = {line.pk: [] for line in lines}
+    for quote in (
+        VendorQuote.objects
+        .filter(rfq_line__rfq=rfq)
+        .order_by('vendor__name', 'vendor_id')
+        .values(*QUOTE_FIELDS)
+    ):
+        quotes_by_line[quote['rfq_line_id']].append(quote)
+    return [
+        (line, quotes_by_line[line.pk], rank_quotes(line.qty_requested, quotes_by_line[line.pk]))
+        for line in lines
+    ]
+
+
+def _quote_id(quote):
+    return str(quote['quote_id']) if quote else None
+
+
+def _line_data(line, ranking):
+    return {
+        'rfq_line_id': str(line.rfq_line_id),
+        'line_no': line.line_no,
+        'item': {
+            'item_id': str(line.item.item_id),
+            'name': line.item.item_name,
+            'g_code': line.item.g_code,
+        },
+        'qty_requested': float(line.qty_requested),
+        'uom': line.uom.uom_code,
+        'cheapest_quote_id': _quote_id(ranking['cheapest']),
+        'fastest_quote_id': _quote_id(ranking['fastest']),
+        'best_can_fill_quote_id': _quote_id(ranking['best_can_fill']),
+    }
+
+
+def _quote_data(quote, qty_requested, can_fill):
+    return {
+        'quote_id': str(quote['quote_id']),
+        'price_each': float(quote['price_each']),
+        'qty_available': float(quote['qty_available']),
+        'lead_time_days': quote['lead_time_days'],
+        'extended': float(quote['price_each'] * qty_requested),
+        'can_fill': can_fill,
+        'manufacturer': quote['manufacturer'],
+        'manufacturer_part_number': quote['manufacturer_part_number'],
+        'is_selected': quote['is_selected'],
+    }
+
+
+def replenishment_lines(rfq):
+    """Per-line data for the replenishment view: each line with its quotes side by side"""
+    data = []
+    for line, quotes, ranking in load_quote_lines(rfq):
+        can_fill = {quote['quote_id'] for quote in ranking['can_fill']}
+        row = _line_data(line, ranking)
+        row['quotes'] = [
+            {
+                **_quote_data(quote, line.qty_requested, quote['quote_id'] in can_fill),
+                'vendor': {
+                    'vendor_id': str(quote['vendor_id']),
+                    'name': quote['vendor__name'],
+                },
+            }
+            for quote in quotes
+        ]
+        data.append(row)
+    return data
+
+
+def build_quote_matrix(rfq):
+    """
+    Line x vendor comparison grid for an RFQ.
+
+    Returns:
+        dict: vendors (one column per quoting vendor, name order, with
+            lines_quoted, lines_can_fill, lines_cheapest, award_all_total
+            and complete), lines (each with cells aligned to vendors, None
+            where the vendor did not quote, and the best quote ids) and
+            cheapest_total (every quoted line awarded to its cheapest quote)
+    """
+    quote_lines = load_quote_lines(rfq)
+
+    vendors = {}
+    for _, quotes, _ in quote_lines:
+        for quote in quotes:
+            if quote['vendor_id'] not in vendors:
+                vendors[quote['vendor_id']] = {
+                    'vendor_id': str(quote['vendor_id']),
+                    'name': quote['vendor__name'],
+                    'lines_quoted': 0,
+                    'lines_can_fill': 0,
+                    'lines_cheapest': 0,
+                    'award_all_total': Decimal('0'),
+                }
+    columns = sorted(vendors, key=lambda vendor_id: (vendors[vendor_id]['name'], str(vendor_id)))
+    column_of = {vendor_id: i for i, vendor_id in enumerate(columns)}
+
+    lines = []
+    cheapest_total = Decimal('0')
+    for line, quotes, ranking in quote_lines:
+        can_fill = {quote['quote_id'] for quote in ranking['can_fill']}
+        cells = [None] * len(columns)
+        for quote in quotes:
+            fills = quote['quote_id'] in can_fill
+            cells[column_of[quote['vendor_id']]] = _quote_data(quote, line.qty_requested, fills)
+            vendor = vendors[quote['vendor_id']]
+            vendor['lines_quoted'] += 1
+            vendor['lines_can_fill'] += fills
+            vendor['award_all_total'] += quote['price_each'] * line.qty_requested
+        if ranking['cheapest']:
+            vendors[ranking['cheapest']['vendor_id']]['lines_cheapest'] += 1
+            cheapest_total += ranking['cheapest']['price_each'] * line.qty_requested
+        row = _line_data(line, ranking)
+        row['cells'] = cells
+        lines.append(row)
+
+    return {
+        'rfq_id': str(rfq.rfq_id),
+        'rfq_number': rfq.rfq_number,
+        'vendors': [
+            {
+                **vendors[vendor_id],
+                'award_all_total': float(vendors[vendor_id]['award_all_total']),
+                'complete': vendors[vendor_id]['lines_quoted'] == len(lines),
+            }
+            for vendor_id in columns
+        ],
+        'lines': lines,
+        'cheapest_total': float(cheapest_total),
+    }
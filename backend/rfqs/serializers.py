@@ -2,7 +2,10 @@
 """
 Serializers for RFQ REST API
 """
+from decimal import Decimal
+
 from rest_framework import serializers
+from .award_optimizer import PREFERENCE_DISCOUNT
 from .models import (
     RFQ, RFQLine, RFQVendor, VendorQuote,
     ReplenishmentOrder, ReplenishmentLine
@@ -11,7 +14,7 @@ from .models import (
 
 class RFQLineSerializer(serializers.ModelSerializer):
     """Serializer for RFQ Line items"""
-    item_name = serializers.CharField(source='item.name', read_only=True)
+    item_name = serializers.CharField(source='item.item_name', read_only=True)
     item_g_code = serializers.CharField(source='item.g_code', read_only=True)
     uom_code = serializers.CharField(source='uom.uom_code', read_only=True)
 
@@ -55,7 +58,7 @@ class RFQVendorSerializer(serializers.ModelSerializer):
 class VendorQuoteSerializer(serializers.ModelSerializer):
     """Serializer for Vendor Quotes"""
     vendor_name = serializers.CharField(source='vendor.name', read_only=True)
-    item_name = serializers.CharField(source='rfq_line.item.name', read_only=True)
+    item_name = serializers.CharField(source='rfq_line.item.item_name', read_only=True)
     item_g_code = serializers.CharField(source='rfq_line.item.g_code', read_only=True)
 
     class Meta:
@@ -82,12 +85,48 @@ class VendorQuoteSerializer(serializers.ModelSerializer):
         read_only_fields = ['quote_id', 'quoted_at']
 
 
+class VendorQuoteImportSerializer(serializers.ModelSerializer):
+    """
+    One row of a bulk quote import (see rfqs.quote_import). Related ids
+    are validated as plain values and resolved against maps preloaded for
+    the whole sheet, and the rfq_line/vendor uniqueness check is done in
+    batch, so validating a row issues no queries.
+    """
+    rfq_line = serializers.UUIDField()
+    vendor = serializers.IntegerField()
+    vendor_item = serializers.IntegerField(required=False, allow_null=True)
+
+    class Meta:
+        model = VendorQuote
+        fields = [
+            'rfq_line',
+            'vendor',
+            'vendor_item',
+            'price_each',
+            'qty_available',
+            'lead_time_days',
+            'manufacturer',
+            'manufacturer_part_number',
+            'vendor_part_number',
+            'valid_until',
+            'notes',
+            'is_selected',
+        ]
+        validators = []
+
+
 class RFQListSerializer(serializers.ModelSerializer):
-    """Lightweight serializer for RFQ list view"""
+    """
+    Lightweight serializer for RFQ list view
+    Expects the annotated queryset from RFQViewSet (counts and the
+    created_by_* values), so serializing a page issues no per-RFQ queries.
+    """
     created_by_name = serializers.SerializerMethodField()
-    line_count = serializers.SerializerMethodField()
-    vendor_count = serializers.SerializerMethodField()
-    quote_count = serializers.SerializerMethodField()
+    # Computed in SQL
+    line_count = serializers.IntegerField(read_only=True)
+    vendor_count = serializers.IntegerField(read_only=True)
+    responded_count = serializers.IntegerField(read_only=True)
+    quote_count = serializers.IntegerField(read_only=True)
 
     class Meta:
         model = RFQ
@@ -103,26 +142,17 @@ class RFQListSerializer(serializers.ModelSerializer):
             'created_by_name',
             'line_count',
             'vendor_count',
+            'responded_count',
             'quote_count',
         ]
         read_only_fields = ['rfq_id', 'created_at']
 
     def get_created_by_name(self, obj):
-        if obj.created_by and obj.created_by.employee:
-            emp = obj.created_by.employee
-            if emp.first_name and emp.last_name:
-                return f"{emp.first_name[0]}. {emp.last_name}"
-        return obj.created_by.display_name if obj.created_by else None
-
-    def get_line_count(self, obj):
-        return obj.lines.count()
-
-    def get_vendor_count(self, obj):
-        return obj.rfq_vendors.count()
-
-    def get_quote_count(self, obj):
-        """Count of quotes received across all lines"""
-        return VendorQuote.objects.filter(rfq_line__rfq=obj).count()
+        if obj.created_by_id is None:
+            return None
+        if obj.created_by_first_name and obj.created_by_last_name:
+            return f"{obj.created_by_first_name[0]}. {obj.created_by_last_name}"
+        return obj.created_by_display_name
 
 
 class RFQDetailSerializer(serializers.ModelSerializer):
@@ -213,7 +243,7 @@ class RFQCreateSerializer(serializers.ModelSerializer):
 
 class ReplenishmentLineSerializer(serializers.ModelSerializer):
     """Serializer for Replenishment Lines"""
-    item_name = serializers.CharField(source='rfq_line.item.name', read_only=True)
+    item_name = serializers.CharField(source='rfq_line.item.item_name', read_only=True)
     item_g_code = serializers.CharField(source='rfq_line.item.g_code', read_only=True)
     vendor_name = serializers.CharField(source='selected_vendor_quote.vendor.name', read_only=True)
     price_each = serializers.DecimalField(
@@ -267,3 +297,14 @@ class ReplenishmentOrderSerializer(serializers.ModelSerializer):
             if emp.first_name and emp.last_name:
                 return f"{emp.first_name[0]}. {emp.last_name}"
         return obj.created_by.display_name if obj.created_by else None
+
+
+class AwardOptimizerSerializer(serializers.Serializer):
+    """Options for the vendor award optimizer (see rfqs.award_optimizer)"""
+    max_lead_time_days = serializers.IntegerField(required=False, min_value=0)
+    po_fixed_cost = serializers.DecimalField(max_digits=12, decimal_places=2, default=Decimal('0'), min_value=0)
+    location = serializers.UUIDField(required=False)
+    preference_discount = serializers.DecimalField(
+        max_digits=4, decimal_places=3, default=PREFERENCE_DISCOUNT, min_value=0, max_value=Decimal('0.5')
+    )
+    dry_run = serializers.BooleanField(default=False)
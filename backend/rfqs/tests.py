@@ -1,3 +1,302 @@
+import uuid
+from datetime import timedelta
+from decimal import Decimal
+
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from employees.models import Employee
+from inventory.models import Item, UnitOfMeasure
+from manufacturers.services import manufacturer_cache, resolve_manufacturers
+from orders.models import Order, OrderStatus, OrderType
+from users.models import User
+from vendoritems.models import VendorItem, VendorItemPriceHistory
+from vendors.models import Vendor
+
+from .award_optimizer import create_replenishment, optimize_awards
+from .models import (
+    RFQ, RFQLine, RFQStatus, RFQVendor, RFQVendorStatus, ReplenishmentLine, ReplenishmentOrder,
+    ReplenishmentStatus, VendorQuote,
+)
+from .purchase_orders import create_purchase_orders
+from .quote_import import UNIQUE_ERROR, import_quotes
+
+
+def create_rfq(line_count, vendors, rfq_number='RFQ-2026-4-001'):
+    """SENT RFQ with one 10-unit line per item and a PENDING invitation per vendor"""
+    uom, _ = UnitOfMeasure.objects.get_or_create(uom_code='EA')
+    rfq = RFQ.objects.create(rfq_number=rfq_number, status=RFQStatus.SENT)
+    RFQLine.objects.bulk_create([
+        RFQLine(
+            rfq=rfq, line_no=line_no, uom=uom, qty_requested=Decimal('10'),
+            item=Item.objects.create(g_code=f'{rfq_number}-{line_no}', item_name=f'Item {line_no}'),
+        )
+        for line_no in range(1, line_count + 1)
+    ])
+    RFQVendor.objects.bulk_create([RFQVendor(rfq=rfq, vendor=vendor) for vendor in vendors])
+    return rfq
+
+
+class RFQListQueryTests(TestCase):
+    """The RFQ list must cost a constant number of queries per page"""
+
+    @classmethod
+    def setUpTestData(cls):
+        employee = Employee.objects.create(first_name='Dana', last_name='Reyes', email='dana@example.com')
+        cls.user = User.objects.create(email='dana@example.com', employee=employee)
+        cls.vendors = [Vendor.objects.create(name=name) for name in ('Acme Supply', 'Border States', 'Crescent')]
+        cls.uom = UnitOfMeasure.objects.create(uom_code='EA')
+        cls.items = [
+            Item.objects.create(g_code='G-100', item_name='Wire'),
+            Item.objects.create(g_code='G-200', item_name='Conduit'),
+        ]
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def create_rfqs(self, count, status=RFQStatus.SENT):
+        """RFQs with 2 lines, 3 vendors (one quoted on both lines, one declined)"""
+        rfqs = []
+        for _ in range(count):
+            rfq = RFQ.objects.create(
+                rfq_number=f"RFQ-2026-4-{RFQ.objects.count() + 1:03d}",
+                status=status,
+                created_by=self.user,
+            )
+            lines = [
+                RFQLine.objects.create(rfq=rfq, line_no=i + 1, item=item, qty_requested=Decimal('10'), uom=self.uom)
+                for i, item in enumerate(self.items)
+            ]
+            quoted, declined, pending = self.vendors
+            RFQVendor.objects.create(rfq=rfq, vendor=quoted, status=RFQVendorStatus.QUOTED)
+            RFQVendor.objects.create(rfq=rfq, vendor=declined, status=RFQVendorStatus.DECLINED)
+            RFQVendor.objects.create(rfq=rfq, vendor=pending, status=RFQVendorStatus.PENDING)
+            for line in lines:
+                VendorQuote.objects.create(
+                    rfq_line=line, vendor=quoted, price_each=Decimal('1.25'), qty_available=Decimal('10'),
+                )
+            rfqs.append(rfq)
+        return rfqs
+
+    def list_queries(self, url):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return response, len(queries)
+
+    def test_list_query_count_is_constant(self):
+        self.create_rfqs(2)
+        _, few = self.list_queries('/api/rfqs/')
+        self.create_rfqs(10)
+        response, many = self.list_queries('/api/rfqs/')
+
+        self.assertEqual(few, many)
+        self.assertLessEqual(many, 2)  # count + page
+        self.assertEqual(len(response.data['results']), 12)
+
+    def test_list_annotations(self):
+        self.create_rfqs(1)
+        response, _ = self.list_queries('/api/rfqs/')
+        rfq = response.data['results'][0]
+
+        self.assertEqual(rfq['line_count'], 2)
+        self.assertEqual(rfq['vendor_count'], 3)
+        self.assertEqual(rfq['responded_count'], 2)
+        self.assertEqual(rfq['quote_count'], 2)
+        self.assertEqual(rfq['created_by_name'], 'D. Reyes')
+
+    def test_list_empty_rfq(self):
+        RFQ.objects.create(rfq_number='RFQ-2026-4-900')
+        response, _ = self.list_queries('/api/rfqs/')
+        rfq = response.data['results'][0]
+
+        self.assertEqual((rfq['line_count'], rfq['vendor_count'], rfq['quote_count']), (0, 0, 0))
+        self.assertIsNone(rfq['created_by_name'])
+
+    def test_dashboard(self):
+        sent = self.create_rfqs(2)
+        self.create_rfqs(1, status=RFQStatus.DRAFT)  # Invitations not sent yet
+        RFQ.objects.filter(pk=sent[0].pk).update(quote_deadline=timezone.localdate() - timedelta(days=1))
+        now = timezone.now()
+        RFQVendor.objects.filter(rfq__in=sent, status=RFQVendorStatus.QUOTED).update(
+            sent_at=now - timedelta(hours=6), responded_at=now,
+        )
+
+        response, queries = self.list_queries('/api/rfqs/dashboard/')
+        data = response.data
+
+        self.assertLessEqual(queries, 3)
+        self.assertEqual(data['rfqs']['total'], 3)
+        self.assertEqual(data['rfqs']['overdue'], 1)
+        self.assertEqual(data['rfqs']['by_status'][RFQStatus.SENT], 2)
+        self.assertEqual(data['rfqs']['by_status'][RFQStatus.DRAFT], 1)
+        self.assertEqual(data['responses']['invited'], 6)
+        self.assertEqual(data['responses']['responded'], 4)
+        self.assertEqual(data['responses']['pending'], 2)
+        self.assertEqual(data['responses']['response_rate'], 66.7)
+        self.assertEqual(data['responses']['avg_response_hours'], 6.0)
+        self.assertEqual(len(data['vendors']), 3)
+        self.assertEqual(data['vendors'][0]['response_rate'], 100.0)
+
+
+class AwardOptimizerTests(TestCase):
+    """Awards never include zero quantities"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.vendors = [Vendor.objects.create(name=name) for name in ('Acme Supply', 'Border States')]
+        uom = UnitOfMeasure.objects.create(uom_code='EA')
+        cls.rfq = RFQ.objects.create(rfq_number='RFQ-2026-4-001')
+        wire = RFQLine.objects.create(
+            rfq=cls.rfq, line_no=1, item=Item.objects.create(g_code='G-100', item_name='Wire'),
+            qty_requested=Decimal('10'), uom=uom,
+        )
+        conduit = RFQLine.objects.create(
+            rfq=cls.rfq, line_no=2, item=Item.objects.create(g_code='G-200', item_name='Conduit'),
+            qty_requested=Decimal('0'), uom=uom,
+        )
+        acme, border = cls.vendors
+        VendorQuote.objects.create(rfq_line=wire, vendor=acme, price_each=Decimal('2.00'), qty_available=Decimal('50'))
+        VendorQuote.objects.create(rfq_line=conduit, vendor=border, price_each=Decimal('1.00'), qty_available=Decimal('50'))
+
+    def test_zero_quantity_line_is_not_awarded(self):
+        plan = optimize_awards(self.rfq)
+
+        self.assertEqual([(award['line_no'], award['qty']) for award in plan['awards']], [(1, Decimal('10'))])
+        self.assertEqual(plan['po_count'], 1)
+        self.assertEqual(plan['landed_total'], Decimal('20'))
+        self.assertEqual(plan['shortfalls'], [])
+
+        replenishment = create_replenishment(self.rfq, plan)
+        self.assertEqual(list(replenishment.lines.values_list('qty_to_order', flat=True)), [Decimal('10')])
+
+
+class QuoteImportTests(TestCase):
+    """Quote sheets are validated per row and written in bulk"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.acme, cls.border = [Vendor.objects.create(name=name) for name in ('Acme Supply', 'Border States')]
+        cls.rfq = create_rfq(2, [cls.acme, cls.border])
+        cls.wire, cls.conduit = cls.rfq.lines.order_by('line_no')
+        VendorItem.objects.create(vendor=cls.acme, item=cls.wire.item, unit_price=Decimal('2.00'))
+
+    def setUp(self):
+        manufacturer_cache.clear()
+
+    def row(self, rfq_line, vendor, price='1.00', **fields):
+        return {'rfq_line': str(rfq_line.pk), 'vendor': vendor.pk, 'price_each': price, 'qty_available': '10', **fields}
+
+    def test_rows_are_imported_or_rejected(self):
+        rows = [
+            self.row(self.wire, self.acme, '2.50', manufacturer='Square D'),
+            self.row(self.conduit, self.acme),
+            self.row(self.wire, self.border, 'abc'),
+            {**self.row(self.wire, self.border), 'rfq_line': str(uuid.uuid4())},
+            self.row(self.wire, self.acme, '2.25'),
+        ]
+
+        result = import_quotes(rows)
+
+        self.assertEqual(len(result['quotes']), 2)
+        self.assertEqual([error['row'] for error in result['errors']], [2, 3, 4])
+        self.assertIn('price_each', result['errors'][0]['errors'])
+        self.assertIn('rfq_line', result['errors'][1]['errors'])
+        self.assertEqual(result['errors'][2]['errors'], {'non_field_errors': [UNIQUE_ERROR]})
+        self.assertIsNotNone(VendorQuote.objects.get(rfq_line=self.wire).mfr_id)
+
+        self.assertEqual(result['rfq_vendors_updated'], 1)
+        self.assertEqual(
+            dict(RFQVendor.objects.filter(rfq=self.rfq).values_list('vendor__name', 'status')),
+            {'Acme Supply': RFQVendorStatus.QUOTED, 'Border States': RFQVendorStatus.PENDING},
+        )
+
+        # Wire is repriced with history, conduit joins Acme's catalog
+        self.assertEqual(result['vendor_items_updated'], 2)
+        self.assertEqual(
+            dict(VendorItem.objects.filter(vendor=self.acme).values_list('item__g_code', 'unit_price')),
+            {self.wire.item.g_code: Decimal('2.50'), self.conduit.item.g_code: Decimal('1.00')},
+        )
+        self.assertEqual(
+            list(VendorItemPriceHistory.objects.values_list('unit_price', flat=True)),
+            [Decimal('2.50')],
+        )
+
+    def test_query_count_does_not_grow_with_rows(self):
+        rfq = create_rfq(40, [self.acme, self.border], rfq_number='RFQ-2026-4-002')
+        lines = list(rfq.lines.order_by('line_no'))
+        resolve_manufacturers(['Square D'])
+
+        with CaptureQueriesContext(connection) as few:
+            result = import_quotes([self.row(line, self.acme, manufacturer='Square D') for line in lines[:2]])
+        self.assertEqual(len(result['quotes']), 2)
+        with CaptureQueriesContext(connection) as many:
+            result = import_quotes([self.row(line, self.border, manufacturer='Square D') for line in lines])
+        self.assertEqual(len(result['quotes']), 40)
+
+        self.assertEqual(len(few), len(many))
+
+
+class CreatePurchaseOrdersTests(TestCase):
+    """A replenishment becomes one draft PO per vendor in a fixed number of queries"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(email='dana@example.com')
+        cls.vendors = [Vendor.objects.create(name=name) for name in ('Border States', 'Acme Supply')]
+
+    def create_replenishment(self, line_count, rfq_number='RFQ-2026-4-001'):
+        """Draft replenishment with its lines alternating between the two vendors"""
+        rfq = create_rfq(line_count, self.vendors, rfq_number=rfq_number)
+        replenishment = ReplenishmentOrder.objects.create(rfq=rfq)
+        for index, line in enumerate(rfq.lines.order_by('line_no')):
+            vendor = self.vendors[index % 2]
+            quote = VendorQuote.objects.create(
+                rfq_line=line, vendor=vendor, price_each=Decimal(line.line_no), qty_available=Decimal('10'),
+            )
+            ReplenishmentLine.objects.create(
+                replenishment=replenishment, rfq_line=line, selected_vendor_quote=quote, qty_to_order=Decimal('10'),
+            )
+        return replenishment
+
+    def test_one_purchase_order_per_vendor(self):
+        replenishment = self.create_replenishment(3)
+
+        created = create_purchase_orders(replenishment, user=self.user)
+
+        self.assertEqual([(vendor.name, count) for _, vendor, count in created], [('Acme Supply', 1), ('Border States', 2)])
+        for order, vendor, _ in created:
+            order = Order.objects.get(pk=order.pk)
+            self.assertEqual((order.order_type, order.order_status), (OrderType.PURCHASE, OrderStatus.DRAFT))
+            self.assertEqual((order.vendor, order.created_by), (vendor, self.user))
+        border_order = created[1][0]
+        self.assertEqual(
+            list(border_order.lines.order_by('line_no').values_list('line_no', 'g_code', 'price_each')),
+            [(1, 'RFQ-2026-4-001-1', Decimal('1')), (2, 'RFQ-2026-4-001-3', Decimal('3'))],
+        )
+        self.assertEqual(
+            dict(replenishment.lines.values_list('rfq_line__line_no', 'purchase_order')),
+            {1: border_order.pk, 2: created[0][0].pk, 3: border_order.pk},
+        )
+
+        replenishment.refresh_from_db()
+        self.assertEqual(replenishment.status, ReplenishmentStatus.POS_CREATED)
+        self.assertEqual(replenishment.rfq.status, RFQStatus.COMPLETED)
+        with self.assertRaises(ValueError):
+            create_purchase_orders(replenishment)
+
+    def test_query_count_does_not_grow_with_lines(self):
+        small = self.create_replenishment(2)
+        large = self.create_replenishment(40, rfq_number='RFQ-2026-4-002')
+
+        with CaptureQueriesContext(connection) as few:
+            create_purchase_orders(small)
+        with CaptureQueriesContext(connection) as many:
+            create_purchase_orders(large)
 
-# Create your tests here.
+        self.assertEqual(len(few), len(many))
+        self.assertEqual(Order.objects.filter(lines__isnull=False).distinct().count(), 4)
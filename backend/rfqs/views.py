@@ -7,7 +7,9 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 from django_filters.rest_framework import DjangoFilterBackend
 from django.utils import timezone
-from django.db import transaction
+from django.db.models import Avg, Count, F, OuterRef, Q, Subquery, Value
+from django.db.models.functions import Coalesce
+from django.shortcuts import get_object_or_404
 
 from .models import (
     RFQ, RFQLine, RFQVendor, VendorQuote,
@@ -17,8 +19,30 @@ from .models import (
 from .serializers import (
     RFQListSerializer, RFQDetailSerializer, RFQCreateSerializer,
     RFQLineSerializer, RFQVendorSerializer, VendorQuoteSerializer,
-    ReplenishmentOrderSerializer, ReplenishmentLineSerializer
+    ReplenishmentOrderSerializer, ReplenishmentLineSerializer,
+    AwardOptimizerSerializer
 )
+from .award_optimizer import create_replenishment, optimize_awards
+from .purchase_orders import create_purchase_orders
+from .quote_import import import_quotes
+from .quote_matrix import build_quote_matrix, replenishment_lines
+
+
+# Vendor statuses that count as a response
+RESPONDED_STATUSES = (RFQVendorStatus.QUOTED, RFQVendorStatus.DECLINED)
+
+
+def _count_per_rfq(queryset, rfq_field):
+    """Correlated COUNT(*) of queryset rows whose rfq_field is the outer RFQ, 0 when none"""
+    count = (
+        queryset
+        .filter(**{rfq_field: OuterRef('pk')})
+        .order_by()
+        .values(rfq_field)
+        .annotate(count=Count('pk'))
+        .values('count')
+    )
+    return Coalesce(Subquery(count), Value(0))
 
 
 class RFQViewSet(viewsets.ModelViewSet):
@@ -32,6 +56,26 @@ class RFQViewSet(viewsets.ModelViewSet):
     ordering_fields = ['created_at', 'sent_at', 'rfq_number']
     ordering = ['-created_at']
 
+    def get_queryset(self):
+        if self.action != 'list':
+            return super().get_queryset()
+        # Counts in SQL so a page costs the same queries however many RFQs it holds;
+        # lines and quotes are counted in subqueries so their joins cannot fan out
+        return RFQ.objects.annotate(
+            line_count=_count_per_rfq(RFQLine.objects.all(), 'rfq'),
+            quote_count=_count_per_rfq(VendorQuote.objects.all(), 'rfq_line__rfq'),
+            vendor_count=Count('rfq_vendors', distinct=True),
+            responded_count=Count(
+                'rfq_vendors',
+                filter=Q(rfq_vendors__status__in=RESPONDED_STATUSES),
+                distinct=True,
+            ),
+            created_by_email=F('created_by__email'),
+            created_by_display_name=F('created_by__display_name'),
+            created_by_first_name=F('created_by__employee__first_name'),
+            created_by_last_name=F('created_by__employee__last_name'),
+        )
+
     def get_serializer_class(self):
         if self.action == 'list':
             return RFQListSerializer
@@ -39,6 +83,71 @@ class RFQViewSet(viewsets.ModelViewSet):
             return RFQCreateSerializer
         return RFQDetailSerializer
 
+    @action(detail=False, methods=['get'])
+    def dashboard(self, request):
+        """
+        Purchasing dashboard: RFQ counts by status, overdue RFQs and vendor
+        response rates (overall and for the 10 most-invited vendors).
+
+        GET /api/rfqs/dashboard/
+        """
+        today = timezone.localdate()
+        rfqs = RFQ.objects.aggregate(
+            total=Count('pk'),
+            overdue=Count('pk', filter=Q(status=RFQStatus.SENT, quote_deadline__lt=today)),
+            **{status_value: Count('pk', filter=Q(status=status_value)) for status_value in RFQStatus.values},
+        )
+
+        # Only invitations that were actually sent can be answered
+        invitations = RFQVendor.objects.exclude(rfq__status=RFQStatus.DRAFT)
+        responses = invitations.aggregate(
+            invited=Count('pk'),
+            responded=Count('pk', filter=Q(status__in=RESPONDED_STATUSES)),
+            quoted=Count('pk', filter=Q(status=RFQVendorStatus.QUOTED)),
+            declined=Count('pk', filter=Q(status=RFQVendorStatus.DECLINED)),
+            pending=Count('pk', filter=Q(status=RFQVendorStatus.PENDING)),
+            avg_response=Avg(
+                F('responded_at') - F('sent_at'),
+                filter=Q(responded_at__isnull=False, sent_at__isnull=False),
+            ),
+        )
+        avg_response = responses.pop('avg_response')
+        vendors = (
+            invitations
+            .values('vendor', 'vendor__name')
+            .annotate(
+                invited=Count('pk'),
+                responded=Count('pk', filter=Q(status__in=RESPONDED_STATUSES)),
+            )
+            .order_by('-invited', 'vendor__name')[:10]
+        )
+
+        def rate(responded, invited):
+            return round(100 * responded / invited, 1) if invited else None
+
+        return Response({
+            'rfqs': {
+                'total': rfqs.pop('total'),
+                'overdue': rfqs.pop('overdue'),
+                'by_status': rfqs,
+            },
+            'responses': {
+                **responses,
+                'response_rate': rate(responses['responded'], responses['invited']),
+                'avg_response_hours': round(avg_response.total_seconds() / 3600, 1) if avg_response else None,
+            },
+            'vendors': [
+                {
+                    'vendor_id': str(row['vendor']),
+                    'name': row['vendor__name'],
+                    'invited': row['invited'],
+                    'responded': row['responded'],
+                    'response_rate': rate(row['responded'], row['invited']),
+                }
+                for row in vendors
+            ],
+        })
+
     @action(detail=True, methods=['post'])
     def send_to_vendors(self, request, pk=None):
         """
@@ -96,45 +205,84 @@ class RFQViewSet(viewsets.ModelViewSet):
     def replenishment_data(self, request, pk=None):
         """
         Get data formatted for replenishment view
-        Returns RFQ lines with all vendor quotes side-by-side
+        Returns RFQ lines with all vendor quotes side-by-side, plus the
+        cheapest, fastest and best can-fill quote per line
+        """
+        return Response(replenishment_lines(self.get_object()))
+
+    @action(detail=True, methods=['get'])
+    def quote_matrix(self, request, pk=None):
         """
+        Line x vendor quote comparison grid with per-line best quotes and
+        each vendor's total if awarded everything it quoted
+
+        GET /api/rfqs/{id}/quote_matrix/
+        """
+        return Response(build_quote_matrix(self.get_object()))
+
+    @action(detail=True, methods=['post'])
+    def optimize_awards(self, request, pk=None):
+        """
+        Award the RFQ's lines to vendors at the lowest landed cost and save
+        the result as a DRAFT replenishment (lines split across vendors
+        where one quote cannot cover the qty)
+
+        POST /api/rfqs/{id}/optimize_awards/
+            max_lead_time_days, po_fixed_cost, location (whose
+            preferred_vendor policies count), preference_discount,
+            dry_run (plan only, nothing saved)
+        """
+        from locations.models import Location
+
         rfq = self.get_object()
+        params = AwardOptimizerSerializer(data=request.data)
+        params.is_valid(raise_exception=True)
+        params = params.validated_data
+        location = None
+        if params.get('location'):
+            location = get_object_or_404(Location, location_id=params['location'])
+
+        plan = optimize_awards(
+            rfq,
+            max_lead_time_days=params.get('max_lead_time_days'),
+            po_fixed_cost=params['po_fixed_cost'],
+            location=location,
+            preference_discount=params['preference_discount'],
+        )
+        replenishment = None
+        if not params['dry_run'] and plan['awards']:
+            replenishment = create_replenishment(
+                rfq, plan, user=request.user if request.user.is_authenticated else None
+            )
 
-        data = []
-        for line in rfq.lines.all().select_related('item', 'uom'):
-            quotes = VendorQuote.objects.filter(
-                rfq_line=line
-            ).select_related('vendor')
-
-            data.append({
-                'rfq_line_id': str(line.rfq_line_id),
-                'line_no': line.line_no,
-                'item': {
-                    'item_id': str(line.item.item_id),
-                    'name': line.item.name,
-                    'g_code': line.item.g_code,
-                },
-                'qty_requested': float(line.qty_requested),
-                'uom': line.uom.uom_code,
-                'quotes': [
-                    {
-                        'quote_id': str(q.quote_id),
-                        'vendor': {
-                            'vendor_id': str(q.vendor.vendor_id),
-                            'name': q.vendor.name,
-                        },
-                        'price_each': float(q.price_each),
-                        'qty_available': float(q.qty_available),
-                        'lead_time_days': q.lead_time_days,
-                        'manufacturer': q.manufacturer,
-                        'manufacturer_part_number': q.manufacturer_part_number,
-                        'is_selected': q.is_selected,
-                    }
-                    for q in quotes
-                ]
-            })
-
-        return Response(data)
+        return Response({
+            'replenishment_id': str(replenishment.replenishment_id) if replenishment else None,
+            'awards': [
+                {
+                    **award,
+                    'rfq_line': str(award['rfq_line']),
+                    'quote_id': str(award['quote_id']),
+                    'vendor_id': str(award['vendor_id']),
+                    'qty': float(award['qty']),
+                    'price_each': float(award['price_each']),
+                }
+                for award in plan['awards']
+            ],
+            'vendors': [
+                {**vendor, 'vendor_id': str(vendor['vendor_id']), 'goods_total': float(vendor['goods_total'])}
+                for vendor in plan['vendors']
+            ],
+            'shortfalls': [
+                {**shortfall, 'rfq_line': str(shortfall['rfq_line']), 'qty_short': float(shortfall['qty_short'])}
+                for shortfall in plan['shortfalls']
+            ],
+            'goods_total': float(plan['goods_total']),
+            'po_count': plan['po_count'],
+            'po_cost': float(plan['po_cost']),
+            'landed_total': float(plan['landed_total']),
+            'greedy_landed_total': float(plan['greedy_landed_total']),
+            'moves': plan['moves'],
+        }, status=status.HTTP_201_CREATED if replenishment else status.HTTP_200_OK)
 
 
 class RFQLineViewSet(viewsets.ModelViewSet):
@@ -204,10 +352,11 @@ class VendorQuoteViewSet(viewsets.ModelViewSet):
         Bulk create quotes from CSV import
         Expects array of quote data
 
-        Also updates VendorItem pricing when quotes are imported.
+        Rows are validated and written in batch (see rfqs.quote_import);
+        invalid rows are reported with their index and the rest imported.
+        Also marks the quoting vendors' RFQVendor rows QUOTED and updates
+        VendorItem pricing.
         """
-        from vendoritems.models import VendorItem, VendorItemPriceHistory
-
         quotes_data = request.data.get('quotes', [])
 
         if not quotes_data:
@@ -216,62 +365,15 @@ class VendorQuoteViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        created_quotes = []
-        errors = []
-        updated_vendor_items = 0
-
-        with transaction.atomic():
-            for quote_data in quotes_data:
-                serializer = VendorQuoteSerializer(data=quote_data)
-                if serializer.is_valid():
-                    quote = serializer.save()
-                    created_quotes.append(serializer.data)
-
-                    # Update RFQVendor status
-                    rfq_vendor = RFQVendor.objects.filter(
-                        rfq=quote.rfq_line.rfq,
-                        vendor=quote.vendor
-                    ).first()
-                    if rfq_vendor and rfq_vendor.status == RFQVendorStatus.PENDING:
-                        rfq_vendor.status = RFQVendorStatus.QUOTED
-                        rfq_vendor.responded_at = timezone.now()
-                        rfq_vendor.save()
-
-                    # Update VendorItem pricing with quoted price
-                    if quote.price_each and quote.rfq_line.item:
-                        vendor_item, created = VendorItem.objects.get_or_create(
-                            vendor=quote.vendor,
-                            item=quote.rfq_line.item,
-                            defaults={'unit_price': quote.price_each}
-                        )
-
-                        # If VendorItem already exists and price changed, update it
-                        if not created and vendor_item.unit_price != quote.price_each:
-                            # Create price history record
-                            VendorItemPriceHistory.objects.create(
-                                vendor_item=vendor_item,
-                                unit_price=quote.price_each,
-                                effective_date=timezone.now(),
-                                notes=f"Updated from RFQ quote (RFQ #{quote.rfq_line.rfq.rfq_id})"
-                            )
-
-                            # Update current price
-                            vendor_item.unit_price = quote.price_each
-                            vendor_item.save(update_fields=['unit_price', 'last_updated'])
-                            updated_vendor_items += 1
-                        elif created:
-                            updated_vendor_items += 1
-                else:
-                    errors.append({
-                        'data': quote_data,
-                        'errors': serializer.errors
-                    })
+        result = import_quotes(quotes_data)
+        errors = result['errors']
 
         return Response({
-            'created': len(created_quotes),
+            'created': len(result['quotes']),
             'errors': errors,
-            'quotes': created_quotes,
-            'vendor_items_updated': updated_vendor_items
+            'quotes': VendorQuoteSerializer(result['quotes'], many=True).data,
+            'rfq_vendors_updated': result['rfq_vendors_updated'],
+            'vendor_items_updated': result['vendor_items_updated']
         }, status=status.HTTP_201_CREATED if not errors else status.HTTP_207_MULTI_STATUS)
 
 
@@ -288,86 +390,37 @@ class ReplenishmentOrderViewSet(viewsets.ModelViewSet):
     filter_backends = [DjangoFilterBackend]
     filterset_fields = ['rfq', 'status']
 
+    def get_queryset(self):
+        if self.action == 'finalize':
+            return ReplenishmentOrder.objects.all()  # create_purchase_orders loads the lines itself
+        return super().get_queryset()
+
     @action(detail=True, methods=['post'])
     def finalize(self, request, pk=None):
         """
         Finalize replenishment and create Purchase Orders
+        One DRAFT PO per selected vendor, written in bulk
+        (see rfqs.purchase_orders)
         """
-        from orders.models import Order, OrderLine, OrderType, OrderStatus
-        from django.db.models import Sum
-
         replenishment = self.get_object()
 
-        if replenishment.status != 'DRAFT':
-            return Response(
-                {'error': 'Only draft replenishments can be finalized'},
-                status=status.HTTP_400_BAD_REQUEST
+        try:
+            purchase_orders = create_purchase_orders(
+                replenishment, user=request.user if request.user.is_authenticated else None
             )
-
-        # Group selections by vendor
-        vendor_lines = {}
-        for line in replenishment.lines.all():
-            vendor_id = line.selected_vendor_quote.vendor.vendor_id
-            if vendor_id not in vendor_lines:
-                vendor_lines[vendor_id] = {
-                    'vendor': line.selected_vendor_quote.vendor,
-                    'lines': []
-                }
-            vendor_lines[vendor_id]['lines'].append(line)
-
-        created_pos = []
-
-        with transaction.atomic():
-            # Create a PO for each vendor
-            for vendor_id, data in vendor_lines.items():
-                vendor = data['vendor']
-
-                # Create Purchase Order
-                po = Order.objects.create(
-                    order_type=OrderType.PURCHASE,
-                    order_status=OrderStatus.DRAFT,
-                    vendor=vendor,
-                    description=f"From RFQ {replenishment.rfq.rfq_number}",
-                    created_by=request.user if request.user.is_authenticated else None
-                )
-
-                # Create order lines
-                for idx, repl_line in enumerate(data['lines'], start=1):
-                    quote = repl_line.selected_vendor_quote
-
-                    OrderLine.objects.create(
-                        order=po,
-                        line_no=idx,
-                        item=repl_line.rfq_line.item,
-                        description=repl_line.rfq_line.item.name,
-                        uom=repl_line.rfq_line.uom,
-                        qty=repl_line.qty_to_order,
-                        price_each=quote.price_each,
-                        g_code=repl_line.rfq_line.item.g_code
-                    )
-
-                    # Link replenishment line to PO
-                    repl_line.purchase_order = po
-                    repl_line.save()
-
-                created_pos.append({
-                    'order_id': str(po.order_id),
-                    'vendor': vendor.name,
-                    'line_count': len(data['lines'])
-                })
-
-            # Update replenishment status
-            replenishment.status = 'POS_CREATED'
-            replenishment.finalized_at = timezone.now()
-            replenishment.save()
-
-            # Update RFQ status
-            replenishment.rfq.status = RFQStatus.COMPLETED
-            replenishment.rfq.save()
+        except ValueError as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
 
         return Response({
             'message': 'Purchase Orders created successfully',
-            'purchase_orders': created_pos
+            'purchase_orders': [
+                {
+                    'order_id': str(po.order_id),
+                    'vendor': vendor.name,
+                    'line_count': line_count
+                }
+                for po, vendor, line_count in purchase_orders
+            ]
         }, status=status.HTTP_201_CREATED)
 
 
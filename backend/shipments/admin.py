@@ -1,5 +1,5 @@
 from django.contrib import admin
-from shipments.models import Shipment, ShipmentLine
+from shipments.models import Shipment, ShipmentEvent, ShipmentLine
 
 
 class ShipmentLineInline(admin.TabularInline):
@@ -23,3 +23,10 @@ class ShipmentLineAdmin(admin.ModelAdmin):
     search_fields = ('shipment_line_id', 'shipment__shipment_id')
     readonly_fields = ('shipment_line_id',)
 
+
+@admin.register(ShipmentEvent)
+class ShipmentEventAdmin(admin.ModelAdmin):
+    list_display = ('event_id', 'shipment', 'event_type', 'status', 'attempts', 'available_at', 'processed_at')
+    list_filter = ('status', 'event_type')
+    search_fields = ('event_id', 'shipment__shipment_id')
+    readonly_fields = ('event_id', 'created_at', 'claimed_at', 'processed_at', 'result', 'last_error')
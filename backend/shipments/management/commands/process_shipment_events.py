@@ -0,0 +1,80 @@
+# backend/shipments/management/commands/process_shipment_events.py
+"""
+Shipment outbox worker.
+
+Polls the shipment_outbox table and runs queued side effects (receipt
+processing) in batches:
+
+    python manage.py process_shipment_events            # run until stopped
+    python manage.py process_shipment_events --once     # drain the queue and exit
+    python manage.py process_shipment_events --requeue-dead
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from shipments.outbox import (
+    DEFAULT_BATCH_SIZE,
+    claim_events,
+    default_worker_id,
+    process_events,
+    requeue_dead_events,
+)
+
+
+class Command(BaseCommand):
+    help = "Process queued shipment side effects with retries and dead-lettering"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Exit when no event is due instead of polling'
+        )
+        parser.add_argument(
+            '--poll-interval',
+            type=float,
+            default=1.0,
+            help='Seconds to sleep when no event is due (default: 1)'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            help=f'Events claimed per batch (default: {DEFAULT_BATCH_SIZE})'
+        )
+        parser.add_argument(
+            '--worker-id',
+            default=None,
+            help='Name recorded on claimed events (default: host:pid)'
+        )
+        parser.add_argument(
+            '--requeue-dead',
+            action='store_true',
+            help='Move dead-lettered events back to the queue and exit'
+        )
+
+    def handle(self, *args, **options):
+        if options['requeue_dead']:
+            count = requeue_dead_events()
+            self.stdout.write(f"Requeued {count} dead-lettered events")
+            return
+
+        worker_id = options['worker_id'] or default_worker_id()
+        self.stdout.write(f"Shipment event worker {worker_id} started")
+
+        while True:
+            events = claim_events(worker_id, limit=options['batch_size'])
+            if not events:
+                if options['once']:
+                    break
+                time.sleep(options['poll_interval'])
+                continue
+
+            started = time.monotonic()
+            counts = process_events(events)
+            self.stdout.write(
+                f"Processed {len(events)} events in {time.monotonic() - started:.2f}s: "
+                f"{counts['done']} done, {counts['retried']} retried, {counts['dead']} dead-lettered"
+            )
@@ -0,0 +1,38 @@
+# Generated by Django 5.2.7 on 2026-10-19 16:07
+
+import django.db.models.deletion
+import django.utils.timezone
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('shipments', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ShipmentEvent',
+            fields=[
+                ('event_id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('event_type', models.CharField(choices=[('RECEIVED', 'Received (picked up)')], max_length=20)),
+                ('status', models.CharField(choices=[('PENDING', 'Pending'), ('PROCESSING', 'Processing'), ('DONE', 'Done'), ('DEAD', 'Dead-lettered')], default='PENDING', max_length=20)),
+                ('available_at', models.DateTimeField(default=django.utils.timezone.now, help_text='Not processed before this time (retry backoff)')),
+                ('attempts', models.PositiveIntegerField(default=0)),
+                ('worker_id', models.CharField(blank=True, max_length=100)),
+                ('claimed_at', models.DateTimeField(blank=True, null=True)),
+                ('last_error', models.TextField(blank=True)),
+                ('result', models.JSONField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('processed_at', models.DateTimeField(blank=True, null=True)),
+                ('shipment', models.ForeignKey(db_column='shipment_id', on_delete=django.db.models.deletion.CASCADE, related_name='events', to='shipments.shipment')),
+            ],
+            options={
+                'db_table': 'shipment_outbox',
+                'ordering': ['created_at'],
+                'indexes': [models.Index(fields=['status', 'available_at'], name='idx_ship_outbox_queue'), models.Index(fields=['shipment'], name='idx_ship_outbox_shipment')],
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.7 on 2026-10-19 16:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('shipments', '0002_shipmentevent'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='shipmentline',
+            name='qty_received',
+            field=models.DecimalField(blank=True, decimal_places=4, help_text='Quantity that actually arrived; blank means qty_to_ship arrived in full', max_digits=14, null=True),
+        ),
+    ]
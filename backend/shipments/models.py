@@ -1,5 +1,5 @@
 import uuid
-from django.db import models
+from django.db import models, transaction
 from django.utils import timezone
 
 
@@ -61,6 +61,24 @@ class Shipment(models.Model):
     def __str__(self):
         return f"Shipment {self.shipment_id} - {self.status}"
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Status as loaded, so post_save handlers can detect transitions
+        instance._loaded_status = dict(zip(field_names, values)).get('status')
+        return instance
+
+    def save(self, *args, **kwargs):
+        # Status transitions write outbox events from post_save; they must
+        # commit (or roll back) together with the shipment row
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+        self._loaded_status = self.status
+
+    def became(self, status):
+        """True while saving the change that moved this shipment into `status`"""
+        return self.status == status and getattr(self, '_loaded_status', None) != status
+
 
 class ShipmentLine(models.Model):
     """
@@ -82,6 +100,13 @@ class ShipmentLine(models.Model):
     )
     qty_to_ship = models.DecimalField(max_digits=14, decimal_places=4)
     qty_picked = models.DecimalField(max_digits=14, decimal_places=4, default=0)
+    qty_received = models.DecimalField(
+        max_digits=14,
+        decimal_places=4,
+        null=True,
+        blank=True,
+        help_text="Quantity that actually arrived; blank means qty_to_ship arrived in full"
+    )
     notes = models.CharField(max_length=500, blank=True)
 
     class Meta:
@@ -100,3 +125,60 @@ class ShipmentLine(models.Model):
     def __str__(self):
         return f"ShipmentLine {self.shipment_line_id}"
 
+
+class ShipmentEventType(models.TextChoices):
+    """Side effects queued by shipment status transitions"""
+    RECEIVED = 'RECEIVED', 'Received (picked up)'
+
+
+class ShipmentEventStatus(models.TextChoices):
+    PENDING = 'PENDING', 'Pending'
+    PROCESSING = 'PROCESSING', 'Processing'
+    DONE = 'DONE', 'Done'
+    DEAD = 'DEAD', 'Dead-lettered'
+
+
+class ShipmentEvent(models.Model):
+    """
+    Transactional outbox for shipment side effects.
+
+    Written in the same transaction as the status change that caused it
+    and processed later by the process_shipment_events worker, which
+    retries failures with backoff and dead-letters events that keep
+    failing.
+    """
+    event_id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    shipment = models.ForeignKey(
+        Shipment,
+        on_delete=models.CASCADE,
+        db_column='shipment_id',
+        related_name='events'
+    )
+    event_type = models.CharField(max_length=20, choices=ShipmentEventType.choices)
+    status = models.CharField(
+        max_length=20,
+        choices=ShipmentEventStatus.choices,
+        default=ShipmentEventStatus.PENDING
+    )
+    available_at = models.DateTimeField(
+        default=timezone.now,
+        help_text="Not processed before this time (retry backoff)"
+    )
+    attempts = models.PositiveIntegerField(default=0)
+    worker_id = models.CharField(max_length=100, blank=True)
+    claimed_at = models.DateTimeField(null=True, blank=True)
+    last_error = models.TextField(blank=True)
+    result = models.JSONField(null=True, blank=True)
+    created_at = models.DateTimeField(default=timezone.now)
+    processed_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = 'shipment_outbox'
+        ordering = ['created_at']
+        indexes = [
+            models.Index(fields=['status', 'available_at'], name='idx_ship_outbox_queue'),
+            models.Index(fields=['shipment'], name='idx_ship_outbox_shipment'),
+        ]
+
+    def __str__(self):
+        return f"{self.event_type} for shipment {self.shipment_id} ({self.status})"
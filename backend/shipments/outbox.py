@@ -0,0 +1,140 @@
+# backend/shipments/outbox.py
+"""
+Shipment Outbox
+
+Status transitions enqueue a ShipmentEvent in the same transaction as the
+shipment update (see signals.py), so pickup returns in constant time and
+an event exists if and only if the transition committed. The
+process_shipment_events worker claims events in batches and runs their
+handlers, each event in its own transaction.
+
+Delivery is at-least-once: a worker that dies after a handler commits
+but before the event is marked done leaves it to be claimed again, so
+handlers must be idempotent (receive_shipment is). Failed events are
+retried with exponential backoff and dead-lettered after MAX_ATTEMPTS.
+"""
+
+import os
+import socket
+import traceback
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .models import ShipmentEvent, ShipmentEventStatus, ShipmentEventType
+from .services import receive_shipment
+
+
+DEFAULT_BATCH_SIZE = 50
+MAX_ATTEMPTS = 5
+RETRY_BASE = timedelta(seconds=30)
+STALE_AFTER = timedelta(minutes=10)
+
+# event type -> handler(shipment) returning a JSON-ready result
+EVENT_HANDLERS = {
+    ShipmentEventType.RECEIVED: receive_shipment,
+}
+
+
+def default_worker_id():
+    """Identify this worker process as host:pid"""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def enqueue_event(shipment, event_type):
+    """Queue a side effect; call inside the transaction that caused it"""
+    return ShipmentEvent.objects.create(shipment=shipment, event_type=event_type)
+
+
+def claim_events(worker_id, limit=DEFAULT_BATCH_SIZE, stale_after=STALE_AFTER):
+    """
+    Claim up to `limit` due events, oldest first.
+
+    Due means PENDING with available_at reached, or PROCESSING with a claim
+    older than stale_after (its worker died). Locked rows are skipped on
+    databases that support SELECT ... FOR UPDATE SKIP LOCKED.
+
+    Returns:
+        list: Claimed ShipmentEvents with their shipment loaded
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        events = list(
+            ShipmentEvent.objects
+            .select_for_update(skip_locked=True, of=('self',))
+            .select_related('shipment')
+            .filter(
+                Q(status=ShipmentEventStatus.PENDING, available_at__lte=now)
+                | Q(status=ShipmentEventStatus.PROCESSING, claimed_at__lt=now - stale_after)
+            )
+            .order_by('available_at', 'created_at')[:limit]
+        )
+        for event in events:
+            event.status = ShipmentEventStatus.PROCESSING
+            event.worker_id = worker_id
+            event.claimed_at = now
+            event.attempts += 1
+        ShipmentEvent.objects.bulk_update(events, ['status', 'worker_id', 'claimed_at', 'attempts'])
+    return events
+
+
+def retry_delay(attempts):
+    """Exponential backoff: 30s, 1m, 2m, 4m, ..."""
+    return RETRY_BASE * (2 ** (attempts - 1))
+
+
+def process_events(events):
+    """
+    Run the handlers for a batch of claimed events and record outcomes
+    with one bulk_update.
+
+    Returns:
+        dict: done / retried / dead counts
+    """
+    counts = {'done': 0, 'retried': 0, 'dead': 0}
+    for event in events:
+        now = timezone.now()
+        try:
+            with transaction.atomic():
+                event.result = EVENT_HANDLERS[event.event_type](event.shipment)
+        except Exception:
+            event.last_error = traceback.format_exc()
+            if event.attempts >= MAX_ATTEMPTS:
+                event.status = ShipmentEventStatus.DEAD
+                event.processed_at = now
+                counts['dead'] += 1
+            else:
+                event.status = ShipmentEventStatus.PENDING
+                event.available_at = now + retry_delay(event.attempts)
+                counts['retried'] += 1
+        else:
+            event.status = ShipmentEventStatus.DONE
+            event.processed_at = now
+            event.last_error = ''
+            counts['done'] += 1
+
+    ShipmentEvent.objects.bulk_update(
+        events,
+        ['status', 'result', 'last_error', 'available_at', 'processed_at'],
+    )
+    return counts
+
+
+def requeue_dead_events(shipment_ids=None):
+    """
+    Put dead-lettered events back in the queue with a fresh attempt budget.
+
+    Returns:
+        int: Events requeued
+    """
+    events = ShipmentEvent.objects.filter(status=ShipmentEventStatus.DEAD)
+    if shipment_ids:
+        events = events.filter(shipment_id__in=shipment_ids)
+    return events.update(
+        status=ShipmentEventStatus.PENDING,
+        attempts=0,
+        available_at=timezone.now(),
+        processed_at=None,
+    )
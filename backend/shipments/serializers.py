@@ -1,7 +1,9 @@
 # backend/shipments/serializers.py
 
+from django.db import transaction
+from django.utils import timezone
 from rest_framework import serializers
-from .models import Shipment, ShipmentLine
+from .models import Shipment, ShipmentLine, ShipmentStatus
 
 
 class ShipmentLineSerializer(serializers.ModelSerializer):
@@ -15,6 +17,7 @@ class ShipmentLineSerializer(serializers.ModelSerializer):
             'order_line',
             'qty_to_ship',
             'qty_picked',
+            'qty_received',
             'notes'
         ]
         read_only_fields = ['shipment_line_id']
@@ -63,25 +66,73 @@ class ShipmentListSerializer(serializers.ModelSerializer):
         return obj.lines.count()
 
 
+class ShipmentCreateLineSerializer(ShipmentLineSerializer):
+    """Line nested in a new shipment; its shipment is set on create"""
+
+    class Meta(ShipmentLineSerializer.Meta):
+        read_only_fields = ['shipment_line_id', 'shipment']
+
+
 class ShipmentCreateSerializer(serializers.ModelSerializer):
-    """Serializer for creating shipments with lines"""
-    lines = ShipmentLineSerializer(many=True)
-    
+    """
+    Serializer for creating shipments with lines.
+
+    The shipment is saved in its initial status, its lines are written,
+    and only then is the requested status applied, all in one transaction.
+    A shipment created as PICKED_UP therefore queues its receipt after its
+    lines exist, and the worker never sees it line-less.
+    """
+    lines = ShipmentCreateLineSerializer(many=True)
+
     class Meta:
         model = Shipment
         fields = [
             'order',
             'staging_location',
             'staging_bin',
+            'status',
             'notes',
             'lines'
         ]
-    
+
+    @transaction.atomic
     def create(self, validated_data):
         lines_data = validated_data.pop('lines')
+        status = validated_data.pop('status', ShipmentStatus.PICKING)
         shipment = Shipment.objects.create(**validated_data)
-        
-        for line_data in lines_data:
-            ShipmentLine.objects.create(shipment=shipment, **line_data)
-        
-        return shipment
\ No newline at end of file
+
+        ShipmentLine.objects.bulk_create([
+            ShipmentLine(shipment=shipment, **line_data) for line_data in lines_data
+        ])
+
+        if status != shipment.status:
+            now = timezone.now()
+            shipment.status = status
+            if status in (ShipmentStatus.STAGED, ShipmentStatus.PICKED_UP):
+                shipment.staged_at = now
+            if status == ShipmentStatus.PICKED_UP:
+                shipment.picked_up_at = now
+            shipment.save()
+
+        return shipment
+
+
+class ShipmentReceiptLineSerializer(serializers.Serializer):
+    """Quantity that arrived for one shipment line"""
+    shipment_line = serializers.UUIDField()
+    qty_received = serializers.DecimalField(max_digits=14, decimal_places=4, min_value=0)
+
+
+class ShipmentReceiveSerializer(serializers.Serializer):
+    """Received quantities posted for a shipment's lines"""
+    lines = ShipmentReceiptLineSerializer(many=True, allow_empty=False)
+
+    def validate_lines(self, lines):
+        shipment = self.context['shipment']
+        shipment_lines = {line.shipment_line_id: line for line in shipment.lines.all()}
+        unknown = [str(line['shipment_line']) for line in lines if line['shipment_line'] not in shipment_lines]
+        if unknown:
+            raise serializers.ValidationError(f"Not lines of this shipment: {', '.join(unknown)}")
+        for line in lines:
+            line['shipment_line'] = shipment_lines[line['shipment_line']]
+        return lines
@@ -0,0 +1,253 @@
+# backend/shipments/services.py
+"""
+Shipment Receiving Services
+
+Receiving a purchase-order shipment confirms the PO prices on the
+vendor's catalog (VendorItem + price history), creates one FIFO
+InventoryLayer and one receipt InventoryMovement per PO line received,
+adds the received quantities to OrderLine.qty_received, moves the PO to
+PARTIAL or CLOSED, refreshes the items' replacement costs and fulfills
+pending allocations waiting on the received items.
+
+A shipment with ShipmentLines receives exactly what they say arrived
+(qty_received, or qty_to_ship when that was not posted); a shipment
+without lines receives each PO line's open quantity.
+
+Receipts are idempotent per shipment and order line: layers carry their
+shipment and order line (unique together), lines that already have a
+layer are skipped, and the shipment row is locked while receiving so two
+concurrent saves cannot both write. Layers, movements and replacement
+costs are written in bulk, so a 500-line PO is received in a handful of
+queries. Receipts run in the process_shipment_events worker (see
+outbox.py), not in the pickup request.
+"""
+
+from decimal import Decimal
+
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from changes.services import record_changes
+from inventory.models import InventoryLayer, InventoryMovement, Item, PendingAllocation
+from inventory.services import FIFOInventoryService
+from manufacturers.services import resolve_manufacturers
+from orders.models import OrderLine, OrderType
+from orders.services import update_receipt_status
+from vendoritems.models import VendorItem, VendorItemPriceHistory
+
+from .models import Shipment
+
+
+BATCH_SIZE = 1000
+
+# VendorItem.unit_price precision
+PRICE_PLACES = Decimal('0.01')
+
+
+def confirm_vendor_prices(shipment, order, lines):
+    """
+    Treat received PO prices as the vendor's current prices.
+
+    Loads the vendor's VendorItems for every item on the lines in one
+    query, and writes a history row plus the new unit_price for each price
+    that changed (bulk_create / bulk_update). When an item appears on
+    several lines, the last line's price wins. Items the vendor has no
+    VendorItem for are skipped.
+
+    Args:
+        shipment: Shipment being received
+        order: Its purchase order
+        lines: OrderLines being received (item loaded)
+
+    Returns:
+        int: Number of prices changed
+    """
+    if not order.vendor_id:
+        return 0  # Not a vendor purchase order
+
+    prices = {}
+    for line in lines:
+        if line.price_each:
+            prices[line.item_id] = line.price_each.quantize(PRICE_PLACES)
+    if not prices:
+        return 0
+
+    now = timezone.now()
+    effective_date = shipment.picked_up_at or now
+    history = []
+    changed = []
+    for vendor_item in VendorItem.objects.filter(vendor_id=order.vendor_id, item_id__in=list(prices)):
+        price = prices[vendor_item.item_id]
+        if vendor_item.unit_price == price:
+            continue
+        vendor_item.unit_price = price
+        vendor_item.last_updated = now
+        changed.append(vendor_item)
+        history.append(VendorItemPriceHistory(
+            vendor_item=vendor_item,
+            unit_price=price,
+            effective_date=effective_date,
+            purchase_order=order,
+            notes=f"Confirmed from PO receipt (Shipment {shipment.shipment_id})"
+        ))
+
+    if changed:
+        VendorItemPriceHistory.objects.bulk_create(history, batch_size=BATCH_SIZE)
+        VendorItem.objects.bulk_update(changed, ['unit_price', 'last_updated'], batch_size=BATCH_SIZE)
+        record_changes(VendorItem, [vendor_item.pk for vendor_item in changed])
+    return len(changed)
+
+
+def _receipt_quantities(shipment, order, received_line_ids):
+    """
+    (order line, quantity) pairs still to receive for this shipment, in
+    line_no order, with the order lines' items loaded.
+    """
+    shipment_lines = list(
+        shipment.lines
+        .filter(order_line__order=order, order_line__item__isnull=False)
+        .select_related('order_line', 'order_line__item')
+    )
+    if shipment_lines:
+        receipts = [
+            (
+                shipment_line.order_line,
+                shipment_line.qty_to_ship if shipment_line.qty_received is None else shipment_line.qty_received,
+            )
+            for shipment_line in shipment_lines
+        ]
+    else:
+        receipts = [
+            (line, line.qty - line.qty_received)
+            for line in order.lines.filter(item__isnull=False).select_related('item')
+        ]
+    receipts.sort(key=lambda receipt: receipt[0].line_no)
+    return [
+        (line, qty) for line, qty in receipts
+        if line.order_line_id not in received_line_ids and qty > 0
+    ]
+
+
+@transaction.atomic
+def receive_shipment(shipment):
+    """
+    Receive a PICKED_UP purchase-order shipment: confirm vendor prices,
+    then receive its lines into inventory.
+
+    Safe to call any number of times; only order lines without a layer
+    for this shipment are received, and prices are only written when
+    they differ.
+
+    Args:
+        shipment: Shipment instance
+
+    Returns:
+        dict: price_changes, layers_created, lines_skipped, pending_items
+            (items whose pending allocations were checked), order_status;
+            None when the shipment is not a purchase order
+    """
+    shipment = (
+        Shipment.objects
+        .select_for_update(of=('self',))
+        .select_related('order', 'order__to_location', 'staging_location', 'staging_bin')
+        .get(pk=shipment.pk)
+    )
+    order = shipment.order
+    if order is None or order.order_type != OrderType.PURCHASE:
+        return None
+
+    received_line_ids = set(
+        InventoryLayer.objects
+        .filter(shipment=shipment)
+        .values_list('order_line_id', flat=True)
+    )
+    receipts = _receipt_quantities(shipment, order, received_line_ids)
+    lines = [line for line, _ in receipts]
+    result = {
+        'price_changes': confirm_vendor_prices(shipment, order, lines),
+        'layers_created': 0,
+        'lines_skipped': len(received_line_ids),
+        'pending_items': 0,
+        'order_status': order.order_status,
+    }
+
+    receiving_location = shipment.staging_location or order.to_location
+    if not lines or receiving_location is None:
+        return result  # Nothing left to receive, or nowhere to receive it
+
+    received_at = shipment.picked_up_at or timezone.now()
+    reference = f"Received from PO via Shipment {shipment.shipment_id}"
+    manufacturer_ids = resolve_manufacturers({line.expected_manufacturer for line in lines})
+
+    layers = []
+    movements = []
+    latest_costs = {}
+    for line, qty in receipts:
+        unit_cost = line.price_each or 0
+        bin_id = shipment.staging_bin_id or line.to_bin_id
+        layers.append(InventoryLayer(
+            item_id=line.item_id,
+            location=receiving_location,
+            bin_id=bin_id,
+            qty_remaining=qty,
+            unit_cost=unit_cost,
+            received_at=received_at,
+            purchase_order=order,
+            vendor_id=order.vendor_id,
+            manufacturer=line.expected_manufacturer or '',
+            mfr_id=manufacturer_ids.get(line.expected_manufacturer),
+            manufacturer_part_no=line.expected_mfr_part_no or '',
+            reference=reference,
+            shipment=shipment,
+            order_line=line,
+        ))
+        movements.append(InventoryMovement(
+            item_id=line.item_id,
+            qty=qty,
+            uom_id=line.uom_id,
+            unit_cost=unit_cost,
+            total_cost=qty * unit_cost,
+            to_location=receiving_location,
+            to_bin_id=bin_id,
+            order=order,
+            order_line=line,
+            reference=reference,
+            note=f"Received into inventory @ ${unit_cost}/unit",
+        ))
+        if line.price_each:
+            # Lines are in line_no order, so the last price per item wins
+            latest_costs[line.item_id] = (line.item, line.price_each)
+        # Increment in SQL so concurrent receipts against the same PO add up
+        line.qty_received = F('qty_received') + qty
+
+    InventoryLayer.objects.bulk_create(layers, batch_size=BATCH_SIZE)
+    InventoryMovement.objects.bulk_create(movements, batch_size=BATCH_SIZE)
+    OrderLine.objects.bulk_update(lines, ['qty_received'], batch_size=BATCH_SIZE)
+    result['order_status'] = update_receipt_status(order)
+
+    now = timezone.now()
+    items = []
+    for item, price in latest_costs.values():
+        item.current_replacement_cost = price
+        item.last_cost_update = now
+        items.append(item)
+    Item.objects.bulk_update(items, ['current_replacement_cost', 'last_cost_update'], batch_size=BATCH_SIZE)
+
+    # Only items that actually have allocations waiting need the FIFO pass
+    pending_item_ids = set(
+        PendingAllocation.objects
+        .filter(
+            location=receiving_location,
+            item_id__in={line.item_id for line in lines},
+            status=PendingAllocation.Status.AWAITING_RECEIPT,
+        )
+        .values_list('item_id', flat=True)
+    )
+    items_by_id = {line.item_id: line.item for line in lines}
+    for item_id in pending_item_ids:
+        FIFOInventoryService._auto_fulfill_pending_allocations(items_by_id[item_id], receiving_location)
+
+    result['layers_created'] = len(layers)
+    result['pending_items'] = len(pending_item_ids)
+    return result
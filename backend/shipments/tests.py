@@ -1,3 +1,236 @@
+from datetime import timedelta
+from decimal import Decimal
+from unittest import mock
+
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from inventory.models import InventoryLayer, InventoryMovement, Item, UnitOfMeasure
+from locations.models import Location
+from orders.models import Order, OrderLine, OrderStatus, OrderType
+from users.models import User
+from vendors.models import Vendor
+
+from .models import (
+    Shipment, ShipmentEvent, ShipmentEventStatus, ShipmentEventType, ShipmentLine, ShipmentStatus,
+)
+from .outbox import (
+    EVENT_HANDLERS, MAX_ATTEMPTS, RETRY_BASE, STALE_AFTER, claim_events, process_events, requeue_dead_events,
+)
+from .services import receive_shipment
+
+
+def create_purchase_order(line_qtys, location=None):
+    """OPEN purchase order with one priced item line per quantity"""
+    location = location or Location.objects.create(name='Main', type='WAREHOUSE')
+    uom, _ = UnitOfMeasure.objects.get_or_create(uom_code='EA')
+    order = Order.objects.create(
+        order_type=OrderType.PURCHASE,
+        order_status=OrderStatus.OPEN,
+        vendor=Vendor.objects.create(name='Acme Supply'),
+        to_location=location,
+    )
+    for line_no, qty in enumerate(line_qtys, start=1):
+        item = Item.objects.create(g_code=f'G-{order.pk.hex[:6]}-{line_no}', item_name=f'Item {line_no}')
+        OrderLine.objects.create(
+            order=order, line_no=line_no, item=item, uom=uom,
+            qty=Decimal(qty), price_each=Decimal('2.50'),
+        )
+    return order
+
+
+class ShipmentCreateTests(TestCase):
+    """A shipment created as picked up is received from its lines"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(email='dana@example.com')
+        cls.order = create_purchase_order(['10', '4'])
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_lines_exist_before_the_receipt_is_queued(self):
+        line = self.order.lines.get(line_no=1)
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post('/api/shipments/shipments/', {
+                'order': str(self.order.pk),
+                'status': ShipmentStatus.PICKED_UP,
+                'lines': [{'order_line': str(line.pk), 'qty_to_ship': '6'}],
+            }, format='json')
+        self.assertEqual(response.status_code, 201)
+
+        shipment = Shipment.objects.get()
+        self.assertEqual(shipment.status, ShipmentStatus.PICKED_UP)
+        self.assertIsNotNone(shipment.picked_up_at)
+        self.assertEqual(ShipmentEvent.objects.filter(shipment=shipment).count(), 1)
+
+        counts = process_events(claim_events('test'))
+        self.assertEqual(counts['done'], 1)
+        received = dict(self.order.lines.values_list('line_no', 'qty_received'))
+        self.assertEqual(received, {1: Decimal('6'), 2: Decimal('0')})
+
+    def test_created_shipment_starts_picking(self):
+        response = self.client.post('/api/shipments/shipments/', {
+            'order': str(self.order.pk),
+            'lines': [{'order_line': str(self.order.lines.get(line_no=2).pk), 'qty_to_ship': '4'}],
+        }, format='json')
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(Shipment.objects.get().status, ShipmentStatus.PICKING)
+        self.assertEqual(ShipmentLine.objects.count(), 1)
+        self.assertFalse(ShipmentEvent.objects.exists())
+
+
+class ReceiveShipmentTests(TestCase):
+    """Receipts are idempotent, follow the shipment lines and close the PO"""
+
+    def ship(self, order, status=ShipmentStatus.PICKED_UP, **line_qtys):
+        """Shipment for `order`; line_qtys maps 'line<no>' -> qty_to_ship"""
+        shipment = Shipment.objects.create(order=order, status=status)
+        ShipmentLine.objects.bulk_create([
+            ShipmentLine(shipment=shipment, order_line=order.lines.get(line_no=int(name[4:])), qty_to_ship=Decimal(qty))
+            for name, qty in line_qtys.items()
+        ])
+        return shipment
+
+    def received(self, order):
+        return dict(order.lines.values_list('line_no', 'qty_received'))
+
+    def test_receiving_twice_writes_once(self):
+        order = create_purchase_order(['10', '4'])
+        shipment = self.ship(order)
+
+        first = receive_shipment(shipment)
+        second = receive_shipment(shipment)
+
+        self.assertEqual((first['layers_created'], first['order_status']), (2, OrderStatus.CLOSED))
+        self.assertEqual((second['layers_created'], second['lines_skipped']), (0, 2))
+        self.assertEqual(InventoryLayer.objects.filter(shipment=shipment).count(), 2)
+        self.assertEqual(InventoryMovement.objects.filter(order=order).count(), 2)
+        self.assertEqual(self.received(order), {1: Decimal('10'), 2: Decimal('4')})
+
+    def test_partial_lines_then_close(self):
+        order = create_purchase_order(['10', '4'])
+
+        result = receive_shipment(self.ship(order, line1='6'))
+        self.assertEqual(result['order_status'], OrderStatus.PARTIAL)
+        self.assertEqual(self.received(order), {1: Decimal('6'), 2: Decimal('0')})
+
+        # A line-less shipment receives what is still open
+        result = receive_shipment(self.ship(order))
+        self.assertEqual(result['layers_created'], 2)
+        self.assertEqual(result['order_status'], OrderStatus.CLOSED)
+        self.assertEqual(self.received(order), {1: Decimal('10'), 2: Decimal('4')})
+        order.refresh_from_db()
+        self.assertEqual(order.order_status, OrderStatus.CLOSED)
+        self.assertIsNotNone(order.fulfillment_date)
+
+        # Nothing left open: another line-less shipment receives nothing
+        self.assertEqual(receive_shipment(self.ship(order))['layers_created'], 0)
+
+    def test_posted_quantity_overrides_qty_to_ship(self):
+        order = create_purchase_order(['10'])
+        shipment = self.ship(order, line1='10')
+        shipment.lines.update(qty_received=Decimal('7'))
+
+        receive_shipment(shipment)
+
+        self.assertEqual(self.received(order), {1: Decimal('7')})
+        self.assertEqual(InventoryLayer.objects.get(shipment=shipment).qty_remaining, Decimal('7'))
+
+    def test_receipt_query_count_is_constant(self):
+        small = create_purchase_order(['1'] * 2)
+        large = create_purchase_order(['1'] * 40, location=small.to_location)
+
+        with CaptureQueriesContext(connection) as few:
+            receive_shipment(self.ship(small))
+        with CaptureQueriesContext(connection) as many:
+            receive_shipment(self.ship(large))
+
+        self.assertEqual(len(few), len(many))
+        self.assertEqual(InventoryLayer.objects.filter(purchase_order=large).count(), 40)
+
+
+class ShipmentOutboxTests(TestCase):
+    """Pickup queues one event; the worker retries, dead-letters and reclaims"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.order = create_purchase_order(['10'])
+
+    def pick_up(self):
+        shipment = Shipment.objects.create(order=self.order, status=ShipmentStatus.STAGED)
+        shipment.status = ShipmentStatus.PICKED_UP
+        shipment.save()
+        return shipment
+
+    def test_only_the_pickup_transition_queues_an_event(self):
+        shipment = self.pick_up()
+        shipment.notes = 'Left at dock 3'
+        shipment.save()
+
+        event = ShipmentEvent.objects.get()
+        self.assertEqual((event.event_type, event.status), (ShipmentEventType.RECEIVED, ShipmentEventStatus.PENDING))
+
+    def test_processed_event_records_the_receipt(self):
+        self.pick_up()
+
+        counts = process_events(claim_events('worker-1'))
+
+        self.assertEqual(counts, {'done': 1, 'retried': 0, 'dead': 0})
+        event = ShipmentEvent.objects.get()
+        self.assertEqual(event.status, ShipmentEventStatus.DONE)
+        self.assertEqual(event.result['layers_created'], 1)
+        self.assertEqual(event.worker_id, 'worker-1')
+        self.assertEqual(self.order.lines.get().qty_received, Decimal('10'))
+        self.assertEqual(claim_events('worker-1'), [])
+
+    def test_failures_back_off_then_dead_letter(self):
+        self.pick_up()
+        failing = mock.Mock(side_effect=RuntimeError('inventory locked'))
+
+        with mock.patch.dict(EVENT_HANDLERS, {ShipmentEventType.RECEIVED: failing}):
+            before = timezone.now()
+            self.assertEqual(process_events(claim_events('worker-1'))['retried'], 1)
+            event = ShipmentEvent.objects.get()
+            self.assertEqual(event.status, ShipmentEventStatus.PENDING)
+            self.assertIn('inventory locked', event.last_error)
+            self.assertGreaterEqual(event.available_at, before + RETRY_BASE)
+            self.assertEqual(claim_events('worker-1'), [])  # Not due yet
+
+            for _ in range(MAX_ATTEMPTS - 1):
+                ShipmentEvent.objects.update(available_at=timezone.now())
+                counts = process_events(claim_events('worker-1'))
+        self.assertEqual(counts['dead'], 1)
+        event.refresh_from_db()
+        self.assertEqual((event.status, event.attempts), (ShipmentEventStatus.DEAD, MAX_ATTEMPTS))
+        self.assertEqual(self.order.lines.get().qty_received, Decimal('0'))
+
+        self.assertEqual(requeue_dead_events(), 1)
+        self.assertEqual(process_events(claim_events('worker-2'))['done'], 1)
+        self.assertEqual(self.order.lines.get().qty_received, Decimal('10'))
+
+    def test_stale_claims_are_reclaimed(self):
+        self.pick_up()
+        self.assertEqual(len(claim_events('worker-1')), 1)
+
+        # worker-1 is still inside its claim window
+        self.assertEqual(claim_events('worker-2'), [])
+
+        # worker-1 died: its claim goes stale and another worker takes over
+        ShipmentEvent.objects.update(claimed_at=timezone.now() - STALE_AFTER - timedelta(seconds=1))
+        events = claim_events('worker-2')
+        self.assertEqual([(event.worker_id, event.attempts) for event in events], [('worker-2', 2)])
+        process_events(events)
 
-# Create your tests here.
+        # The receipt is idempotent, so a late retry of the same event writes nothing
+        ShipmentEvent.objects.update(status=ShipmentEventStatus.PENDING)
+        events = claim_events('worker-1')
+        process_events(events)
+        self.assertEqual(events[0].result['layers_created'], 0)
+        self.assertEqual(self.order.lines.get().qty_received, Decimal('10'))
@@ -6,6 +6,8 @@ from django.shortcuts import render
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
+from django.db import transaction
+from django.utils import timezone
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.filters import SearchFilter, OrderingFilter
 
@@ -14,7 +16,8 @@ from .serializers import (
     ShipmentSerializer,
     ShipmentListSerializer,
     ShipmentCreateSerializer,
-    ShipmentLineSerializer
+    ShipmentLineSerializer,
+    ShipmentReceiveSerializer
 )
 
 
@@ -30,6 +33,7 @@ class ShipmentViewSet(viewsets.ModelViewSet):
     - destroy: Delete shipment
     - stage: Mark shipment as staged
     - pickup: Mark shipment as picked up
+    - receive: Post received quantities per line and mark as picked up
     """
     queryset = Shipment.objects.all().select_related(
         'order',
@@ -71,7 +75,7 @@ class ShipmentViewSet(viewsets.ModelViewSet):
     
     @action(detail=True, methods=['post'])
     def pickup(self, request, pk=None):
-        """Mark shipment as picked up"""
+        """Mark shipment as picked up; receipt processing is queued for the outbox worker"""
         shipment = self.get_object()
         
         if shipment.status != 'STAGED':
@@ -88,6 +92,42 @@ class ShipmentViewSet(viewsets.ModelViewSet):
         serializer = self.get_serializer(shipment)
         return Response(serializer.data)
 
+    @action(detail=True, methods=['post'])
+    def receive(self, request, pk=None):
+        """
+        Post what actually arrived and mark the shipment as picked up.
+
+        Body: {"lines": [{"shipment_line": <id>, "qty_received": <qty>}]}
+        Only the posted quantities are received into inventory; lines left
+        out are received at qty_to_ship. Receipt processing is queued for
+        the outbox worker, as with pickup.
+        """
+        shipment = self.get_object()
+
+        if shipment.status not in ('PICKING', 'STAGED'):
+            return Response(
+                {'error': 'Can only receive shipments in PICKING or STAGED status'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        receipt = ShipmentReceiveSerializer(data=request.data, context={'shipment': shipment})
+        receipt.is_valid(raise_exception=True)
+
+        lines = []
+        for line_data in receipt.validated_data['lines']:
+            line = line_data['shipment_line']
+            line.qty_received = line_data['qty_received']
+            lines.append(line)
+
+        with transaction.atomic():
+            ShipmentLine.objects.bulk_update(lines, ['qty_received'])
+            shipment.status = 'PICKED_UP'
+            shipment.picked_up_at = timezone.now()
+            shipment.save()
+
+        serializer = self.get_serializer(shipment)
+        return Response(serializer.data)
+
 
 class ShipmentLineViewSet(viewsets.ModelViewSet):
     """
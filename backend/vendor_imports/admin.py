@@ -1,3 +1,10 @@
 from django.contrib import admin
+from vendor_imports.models import ImportJob
 
-# Register your models here.
+
+@admin.register(ImportJob)
+class ImportJobAdmin(admin.ModelAdmin):
+    list_display = ('job_id', 'template_key', 'status', 'rows_done', 'rows_total', 'error_count', 'created_at')
+    list_filter = ('status', 'template_key', 'created_at')
+    search_fields = ('job_id', 'original_filename')
+    readonly_fields = ('job_id', 'created_at', 'started_at', 'finished_at', 'heartbeat_at', 'lease_expires_at', 'checkpoint_row')
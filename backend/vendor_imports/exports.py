@@ -0,0 +1,151 @@
+# backend/vendor_imports/exports.py
+"""
+Streaming CSV / NDJSON exports.
+
+Exports read rows with values_list().iterator(chunk_size=...) and
+serialize them as they come, so memory stays flat no matter how many
+rows are exported and the first bytes go out right away. On PostgreSQL
+the iterator uses a server-side cursor.
+
+Query parameters understood by every export:
+    export_format=csv|ndjson   (default csv)
+    gzip=1                     compress on the fly (.gz download)
+
+Example:
+    columns = [
+        ExportColumn('g_code'),
+        ExportColumn('default_uom', 'default_uom_id'),
+    ]
+    return streaming_export(request, queryset, columns, 'items_export')
+"""
+
+import csv
+import json
+import zlib
+
+from django.conf import settings
+from django.http import StreamingHttpResponse
+from rest_framework.exceptions import ValidationError
+
+
+EXPORT_CHUNK_SIZE = getattr(settings, 'EXPORT_CHUNK_SIZE', 2000)
+
+# Rows serialized per yielded block; fewer, larger writes keep the
+# per-row overhead of the streaming response low.
+ROWS_PER_BLOCK = 500
+
+EXPORT_FORMATS = {
+    'csv': ('text/csv', 'csv'),
+    'ndjson': ('application/x-ndjson', 'ndjson'),
+}
+
+
+class ExportColumn:
+    """
+    One exported column.
+
+    Args:
+        header: Column name in the CSV header / NDJSON key
+        path: values_list() lookup; defaults to `header`
+        format: Optional callable applied to non-null values
+    """
+
+    def __init__(self, header, path=None, format=None):
+        self.header = header
+        self.path = path or header
+        self.format = format
+
+
+class _LineBuffer:
+    """Write target for csv.writer that just hands the line back"""
+
+    def write(self, value):
+        return value
+
+
+def _rows(queryset, columns, chunk_size):
+    """Formatted value tuples straight from the database cursor"""
+    formatters = [(index, column.format) for index, column in enumerate(columns) if column.format]
+    values = queryset.values_list(*(column.path for column in columns)).iterator(chunk_size=chunk_size)
+    if not formatters:
+        yield from values
+        return
+    for row in values:
+        row = list(row)
+        for index, format_value in formatters:
+            if row[index] is not None:
+                row[index] = format_value(row[index])
+        yield row
+
+
+def _csv_blocks(columns, rows):
+    writer = csv.writer(_LineBuffer())
+    yield writer.writerow([column.header for column in columns]).encode()
+    block = []
+    for row in rows:
+        block.append(writer.writerow(row))
+        if len(block) >= ROWS_PER_BLOCK:
+            yield ''.join(block).encode()
+            block = []
+    if block:
+        yield ''.join(block).encode()
+
+
+def _ndjson_blocks(columns, rows):
+    headers = [column.header for column in columns]
+    block = []
+    for row in rows:
+        block.append(json.dumps(dict(zip(headers, row)), default=str))
+        if len(block) >= ROWS_PER_BLOCK:
+            yield ('\n'.join(block) + '\n').encode()
+            block = []
+    if block:
+        yield ('\n'.join(block) + '\n').encode()
+
+
+def gzip_blocks(blocks):
+    """Compress a byte stream into a gzip stream incrementally"""
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+    for block in blocks:
+        data = compressor.compress(block)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def streaming_export(request, queryset, columns, filename, chunk_size=EXPORT_CHUNK_SIZE):
+    """
+    Stream `queryset` as a CSV or NDJSON download.
+
+    Args:
+        request: DRF request (export_format / gzip query parameters)
+        queryset: Filtered queryset to export
+        columns: List of ExportColumn
+        filename: Download name without extension
+        chunk_size: Rows fetched from the database per round trip
+
+    Raises:
+        ValidationError: For an unknown export_format (400)
+    """
+    export_format = request.query_params.get('export_format', 'csv').lower()
+    if export_format not in EXPORT_FORMATS:
+        raise ValidationError({
+            'export_format': f"Unknown format '{export_format}'. Use one of: {', '.join(EXPORT_FORMATS)}."
+        })
+    content_type, extension = EXPORT_FORMATS[export_format]
+
+    rows = _rows(queryset, columns, chunk_size)
+    if export_format == 'csv':
+        blocks = _csv_blocks(columns, rows)
+    else:
+        blocks = _ndjson_blocks(columns, rows)
+
+    filename = f"{filename}.{extension}"
+    if request.query_params.get('gzip', '').lower() in ('1', 'true', 'yes'):
+        blocks = gzip_blocks(blocks)
+        content_type = 'application/gzip'
+        filename += '.gz'
+
+    response = StreamingHttpResponse(blocks, content_type=content_type)
+    response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    return response
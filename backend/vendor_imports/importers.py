@@ -0,0 +1,1081 @@
+# backend/vendor_imports/importers.py
+"""
+Streaming CSV importers.
+
+Uploads are decoded incrementally and processed in chunks: each chunk
+prefetches the rows it touches in one query and writes with
+bulk_create / bulk_update, so the query count grows with the number of
+chunks rather than the number of rows.
+
+Every CSV_TEMPLATES entry is imported by a TemplateImporter subclass that
+declares how its columns map onto model fields (Field), how foreign keys
+are resolved from natural keys (Lookup) and which model fields form the
+row's natural key. The engine does the rest:
+
+1. Foreign-key maps (vendor name -> id, g_code -> item_id, ...) are loaded
+   once per import.
+2. Each chunk is parsed and validated in one pass; missing lookup targets
+   that may be created (units of measure, vehicle models, ...) are
+   inserted with a single bulk_create.
+3. Existing target rows are fetched with one query per chunk, diffed, and
+   only new or changed rows are written.
+"""
+
+import codecs
+import csv
+import time
+from decimal import Decimal, InvalidOperation
+from itertools import islice
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.core.validators import validate_email
+from django.db import transaction
+from django.db.models import Q
+from django.db.models.functions import Lower
+from django.utils import timezone
+
+from changes.services import record_changes
+from departments.models import Department
+from equipment.models import Equipment, EquipmentModel, EquipmentStatus
+from inventory.duplicates import check_items
+from inventory.models import Bin, Item, ItemLocationPolicy, UnitOfMeasure
+from locations.models import Location
+from manufacturers.services import resolve_manufacturer
+from users.models import Role, RoleName, User, UserDepartmentAccess, UserRole
+from vehicles.models import Vehicle, VehicleModel, VehicleStatus
+from vendors.models import Vendor
+from vendoritems.models import VendorItem, VendorItemPriceHistory
+
+from .templates import CSV_TEMPLATES
+
+
+DEFAULT_CHUNK_SIZE = getattr(settings, 'IMPORT_CHUNK_SIZE', 1000)
+
+
+def iter_csv_rows(file_obj, encoding='utf-8-sig'):
+    """
+    Yield (row_number, row_dict) from an uploaded CSV file.
+
+    The file is decoded line by line with an incremental decoder, so the
+    upload is never held in memory as one string. Row numbers start at 1
+    for the first data row.
+    """
+    lines = codecs.iterdecode(file_obj, encoding)
+    reader = csv.DictReader(lines)
+    for row_number, row in enumerate(reader, start=1):
+        yield row_number, row
+
+
+def chunked(iterable, size):
+    """Split an iterable into lists of at most `size` elements"""
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _clean(row, key):
+    """Strip a CSV cell, treating missing columns as empty"""
+    return (row.get(key) or '').strip()
+
+
+def normalize_key(value):
+    """Normalize a natural key (vendor name, g_code) for case-insensitive lookups"""
+    return (value or '').strip().casefold()
+
+
+# =====================================================
+# CELL PARSERS
+# =====================================================
+# Parsers receive the stripped, non-empty cell value(s) of a row and
+# raise ValueError when a value is invalid.
+
+def parse_text(value):
+    return value
+
+
+# Largest value an IntegerField holds on every supported database
+MAX_INTEGER = 2147483647
+
+
+def _check_range(number, min_value, max_value):
+    if min_value is not None and number < min_value:
+        raise ValueError(f"must be at least {min_value}")
+    if max_value is not None and number > max_value:
+        raise ValueError(f"must be at most {max_value}")
+
+
+def parse_int(min_value=None, max_value=MAX_INTEGER):
+    """Parser for integer cells between min_value and max_value"""
+    def parse(value):
+        try:
+            number = int(value)
+        except ValueError:
+            raise ValueError() from None
+        _check_range(number, min_value, max_value)
+        return number
+    return parse
+
+
+def parse_decimal(places=None, max_digits=None, min_value=None):
+    """
+    Parser for decimal cells, optionally quantized to `places` decimals.
+
+    max_digits and places match the target DecimalField, so values it
+    cannot store are rejected here rather than by the database.
+    """
+    exponent = Decimal(1).scaleb(-places) if places is not None else None
+    max_whole_digits = max_digits - (places or 0) if max_digits is not None else None
+
+    def parse(value):
+        try:
+            number = Decimal(value)
+            if not number.is_finite():
+                raise ValueError()
+            if exponent is not None:
+                number = number.quantize(exponent)
+        except InvalidOperation:
+            raise ValueError() from None
+        _check_range(number, min_value, None)
+        if max_whole_digits is not None and number and number.adjusted() >= max_whole_digits:
+            raise ValueError(f"more than {max_whole_digits} digits before the decimal point")
+        return number
+    return parse
+
+
+def parse_choice(choices):
+    """Parser accepting a choice value or label, case-insensitively"""
+    lookup = {}
+    for value, label in choices:
+        lookup[normalize_key(str(label))] = value
+        lookup[normalize_key(value)] = value
+
+    def parse(value):
+        try:
+            return lookup[normalize_key(value)]
+        except KeyError:
+            expected = ', '.join(value for value, _ in choices)
+            raise ValueError(f"expected one of {expected}") from None
+    return parse
+
+
+def parse_email(value):
+    try:
+        validate_email(value)
+    except ValidationError:
+        raise ValueError() from None
+    return value.lower()
+
+
+def join_name(*parts):
+    """First/last name cells -> display name"""
+    return ' '.join(part for part in parts if part)
+
+
+def join_address(street, city, state, zip_code):
+    """Street/city/state/zip cells -> single address block"""
+    region = ' '.join(part for part in (state, zip_code) if part)
+    locality = ', '.join(part for part in (city, region) if part)
+    return '\n'.join(part for part in (street, locality) if part)
+
+
+# =====================================================
+# IMPORT SPECS
+# =====================================================
+
+class Field:
+    """
+    Maps one or more CSV columns onto a model field.
+
+    Args:
+        field: Model field (attname) the parsed value is written to
+        columns: CSV column or tuple of columns; defaults to `field`.
+            With several columns the parser receives one argument per column.
+        parse: Cell parser; raises ValueError for invalid values
+        default: Value used when every column is blank
+        update_blank: When False, blank cells leave existing rows untouched
+            and `default` only applies to new rows
+        extra: Value is not a model field; it is handed to after_write()
+    """
+
+    def __init__(self, field, columns=None, parse=parse_text, default=None,
+                 update_blank=True, extra=False):
+        self.field = field
+        if columns is None:
+            columns = field
+        self.columns = (columns,) if isinstance(columns, str) else tuple(columns)
+        self.parse = parse
+        self.default = default
+        self.update_blank = update_blank
+        self.extra = extra
+
+    def parse_cells(self, cells):
+        return self.parse(*cells)
+
+
+class Lookup:
+    """
+    Resolves CSV column(s) to a foreign key through a preloaded map.
+
+    The map is keyed by the normalized values of `key_fields` on `model`
+    and is loaded once per import.
+
+    Args:
+        field: FK attname written on the imported row (e.g. 'item_id')
+        model: Referenced model
+        columns: CSV column(s) holding the natural key
+        key_fields: Fields of `model` matching `columns`, in order
+        label: Name used in "not found" errors
+        required: Reject rows where every key column is blank
+        create_missing: Insert unknown keys instead of rejecting the row
+        parse: key_field -> parser for values of created rows
+        extra_columns: model field -> CSV column copied onto created rows
+        extra: Value is not a model field; it is handed to after_write()
+    """
+
+    def __init__(self, field, model, columns, key_fields, label=None, required=False,
+                 create_missing=False, parse=None, extra_columns=None, extra=False):
+        self.field = field
+        self.model = model
+        self.columns = (columns,) if isinstance(columns, str) else tuple(columns)
+        self.key_fields = (key_fields,) if isinstance(key_fields, str) else tuple(key_fields)
+        self.label = label or model._meta.verbose_name.capitalize()
+        self.required = required
+        self.create_missing = create_missing
+        self.parse = parse or {}
+        self.extra_columns = extra_columns or {}
+        self.extra = extra
+        self.update_blank = not required
+
+    def build(self, cells, row):
+        """Unsaved `model` instance for a key that is not in the map yet"""
+        values = {}
+        for key_field, cell in zip(self.key_fields, cells):
+            if cell:
+                values[key_field] = self.parse.get(key_field, parse_text)(cell)
+            else:
+                values[key_field] = self.model._meta.get_field(key_field).get_default()
+        for field, column in self.extra_columns.items():
+            values[field] = _clean(row, column)
+        return self.model(**values)
+
+
+class LookupMap:
+    """Normalized natural key -> primary key for one model"""
+
+    def __init__(self, model, key_fields):
+        self.model = model
+        self.key_fields = key_fields
+        self.ids = None
+
+    @staticmethod
+    def make_key(values):
+        return tuple(normalize_key('' if value is None else str(value)) for value in values)
+
+    def load(self):
+        pk_name = self.model._meta.pk.name
+        self.ids = {
+            self.make_key(values[:-1]): values[-1]
+            for values in (
+                self.model.objects
+                .values_list(*self.key_fields, pk_name)
+                .iterator(chunk_size=5000)
+            )
+        }
+
+    def get(self, key):
+        return self.ids.get(key)
+
+    def add(self, key, pk):
+        self.ids[key] = pk
+
+
+class KeySet:
+    """
+    Dry-run stand-in for LookupMap: a set of normalized natural keys.
+
+    get() returns the key itself when it exists, so validated rows carry
+    the natural key in place of the primary key. keys=None (lookups that
+    create missing rows) makes every key look new.
+    """
+
+    def __init__(self, keys=None):
+        self.keys = keys
+
+    def get(self, key):
+        if self.keys is not None and key in self.keys:
+            return key
+        return None
+
+
+class BaseImporter:
+    """
+    Shared chunking, counters and result payload for the CSV importers.
+
+    Subclasses implement process_chunk(chunk), where chunk is a list of
+    (row_number, row_dict) pairs, and update the counters as they go.
+    changed_by is the user the import runs for, when the target keeps one.
+    """
+
+    def __init__(self, chunk_size=DEFAULT_CHUNK_SIZE, changed_by=None):
+        self.chunk_size = chunk_size
+        self.changed_by = changed_by
+        self.created = 0
+        self.updated = 0
+        self.unchanged = 0
+        self.rows_processed = 0
+        self.errors = []
+
+    def run(self, rows):
+        """
+        Import every (row_number, row) pair, one committed chunk at a time.
+
+        Returns:
+            dict: created/updated/unchanged counts, errors and throughput
+        """
+        started = time.monotonic()
+        for chunk in chunked(rows, self.chunk_size):
+            with transaction.atomic():
+                self.process_chunk(chunk)
+        return self.summary(time.monotonic() - started)
+
+    def process_chunk(self, chunk):
+        raise NotImplementedError
+
+    def summary(self, elapsed):
+        """Build the result payload returned to the client"""
+        return {
+            'rows': self.rows_processed,
+            'created': self.created,
+            'updated': self.updated,
+            'unchanged': self.unchanged,
+            'errors': self.errors,
+            'error_count': len(self.errors),
+            'elapsed_seconds': round(elapsed, 3),
+            'rows_per_second': round(self.rows_processed / elapsed, 1) if elapsed else None,
+        }
+
+
+class TemplateImporter(BaseImporter):
+    """
+    Declarative bulk importer for one CSV_TEMPLATES entry.
+
+    Subclasses declare:
+        template_key: CSV_TEMPLATES key; its 'required' columns are enforced
+        model: Model the rows are written to
+        key: Model attnames forming the row's natural key
+        case_insensitive: Key fields matched case-insensitively
+        fields: Field specs
+        lookups: Lookup specs
+        unique_fields: Other unique model fields, checked before writing so
+            one conflicting row cannot fail the whole chunk
+        touch_fields: auto_now fields bulk_update has to set explicitly
+        derived_fields: Fields prepare() computes from other fields; written
+            whenever a row is updated
+
+    Hooks:
+        prepare(obj): called for every row about to be created or updated
+        record_change(obj, changes): called before an existing row is updated
+        after_write(rows): called with (obj, extras) pairs once the chunk
+            is written, for related rows (history, many-to-many links)
+    """
+
+    template_key = None
+    model = None
+    key = ()
+    case_insensitive = ()
+    fields = ()
+    lookups = ()
+    unique_fields = ()
+    touch_fields = ()
+    derived_fields = ()
+
+    def __init__(self, chunk_size=DEFAULT_CHUNK_SIZE, changed_by=None):
+        super().__init__(chunk_size=chunk_size, changed_by=changed_by)
+        self.required_columns = CSV_TEMPLATES[self.template_key]['required']
+        self._maps = None
+        self._max_lengths = {}
+        for spec in self.fields:
+            if spec.extra:
+                continue
+            max_length = getattr(self.model._meta.get_field(spec.field), 'max_length', None)
+            if max_length:
+                self._max_lengths[spec.field] = max_length
+        self.create_defaults = {
+            spec.field: spec.default
+            for spec in self.fields
+            if not spec.update_blank and not spec.extra and spec.default is not None
+        }
+
+    def load_lookup_maps(self):
+        """Load one natural-key map per referenced model (one query each)"""
+        maps = {}
+        self._maps = {}
+        for lookup in self.lookups:
+            map_key = (lookup.model, lookup.key_fields)
+            if map_key not in maps:
+                maps[map_key] = LookupMap(lookup.model, lookup.key_fields)
+                maps[map_key].load()
+            self._maps[lookup] = maps[map_key]
+
+    def load_key_sets(self):
+        """
+        Natural keys of every lookup target, aligned with self.lookups, for
+        dry-run validation. Lookups that create missing rows get None.
+        """
+        key_sets = []
+        loaded = {}
+        for lookup in self.lookups:
+            if lookup.create_missing:
+                key_sets.append(None)
+                continue
+            map_key = (lookup.model, lookup.key_fields)
+            if map_key not in loaded:
+                lookup_map = LookupMap(lookup.model, lookup.key_fields)
+                lookup_map.load()
+                loaded[map_key] = frozenset(lookup_map.ids)
+            key_sets.append(loaded[map_key])
+        return key_sets
+
+    def use_key_sets(self, key_sets):
+        """Resolve lookups against key sets instead of the database"""
+        self._maps = {
+            lookup: KeySet(keys) for lookup, keys in zip(self.lookups, key_sets)
+        }
+
+    def key_columns(self):
+        """CSV columns that supply the natural key, for messages"""
+        columns = []
+        for spec in (*self.fields, *self.lookups):
+            if spec.field in self.key:
+                columns.extend(spec.columns)
+        return columns
+
+    def key_value(self, field, value):
+        if field in self.case_insensitive and value is not None:
+            return value.lower()
+        return value
+
+    def natural_key(self, values):
+        return tuple(self.key_value(field, values.get(field)) for field in self.key)
+
+    def parse_row(self, row_number, row):
+        """
+        Validate one CSV row and resolve its foreign keys from the maps.
+
+        Returns:
+            dict: row_number, values, extras and the create_missing lookups
+            still to resolve, or None if the row was rejected
+        """
+        missing = [column for column in self.required_columns if not _clean(row, column)]
+        if missing:
+            self.errors.append(f"Row {row_number}: missing required fields ({', '.join(missing)}).")
+            return None
+
+        values = {}
+        extras = {}
+        for spec in self.fields:
+            target = extras if spec.extra else values
+            cells = [_clean(row, column) for column in spec.columns]
+            if not any(cells):
+                if spec.update_blank:
+                    target[spec.field] = spec.default
+                continue
+            try:
+                value = spec.parse_cells(cells)
+            except ValueError as exc:
+                raw = ' '.join(cell for cell in cells if cell)
+                detail = f" ({exc})" if str(exc) else ''
+                self.errors.append(
+                    f"Row {row_number}: invalid {'/'.join(spec.columns)} '{raw}'{detail}."
+                )
+                return None
+            max_length = self._max_lengths.get(spec.field)
+            if max_length and isinstance(value, str) and len(value) > max_length:
+                self.errors.append(
+                    f"Row {row_number}: {'/'.join(spec.columns)} is longer than {max_length} characters."
+                )
+                return None
+            target[spec.field] = value
+
+        pending = []
+        for lookup in self.lookups:
+            target = extras if lookup.extra else values
+            cells = [_clean(row, column) for column in lookup.columns]
+            if not any(cells):
+                if lookup.required:
+                    self.errors.append(
+                        f"Row {row_number}: missing required fields ({', '.join(lookup.columns)})."
+                    )
+                    return None
+                if lookup.update_blank:
+                    target[lookup.field] = None
+                continue
+
+            key = LookupMap.make_key(cells)
+            pk = self._maps[lookup].get(key)
+            if pk is None:
+                if not lookup.create_missing:
+                    raw = ' / '.join(cell for cell in cells if cell)
+                    self.errors.append(f"Row {row_number}: {lookup.label} '{raw}' not found.")
+                    return None
+                pending.append((lookup, key, cells, row))
+                continue
+            target[lookup.field] = pk
+
+        return {'row_number': row_number, 'values': values, 'extras': extras, 'pending': pending}
+
+    def create_missing(self, parsed_rows):
+        """
+        Insert the lookup targets referenced by this chunk but not in the
+        maps yet, one bulk_create per referenced model, then resolve the
+        rows that were waiting on them.
+        """
+        new_objects = {}
+        invalid = {}
+        for parsed in parsed_rows:
+            for lookup, key, cells, row in parsed['pending']:
+                lookup_map = self._maps[lookup]
+                if (lookup_map, key) in new_objects or (lookup_map, key) in invalid:
+                    continue
+                try:
+                    new_objects[(lookup_map, key)] = lookup.build(cells, row)
+                except ValueError:
+                    invalid[(lookup_map, key)] = ' / '.join(cell for cell in cells if cell)
+
+        by_model = {}
+        for (lookup_map, key), obj in new_objects.items():
+            by_model.setdefault(lookup_map.model, []).append(obj)
+        for model, objects in by_model.items():
+            model.objects.bulk_create(objects, batch_size=self.chunk_size)
+        for (lookup_map, key), obj in new_objects.items():
+            lookup_map.add(key, obj.pk)
+
+        resolved = []
+        for parsed in parsed_rows:
+            ok = True
+            for lookup, key, cells, row in parsed['pending']:
+                lookup_map = self._maps[lookup]
+                if (lookup_map, key) in invalid:
+                    self.errors.append(
+                        f"Row {parsed['row_number']}: invalid {lookup.label} '{invalid[(lookup_map, key)]}'."
+                    )
+                    ok = False
+                    break
+                target = parsed['extras'] if lookup.extra else parsed['values']
+                target[lookup.field] = lookup_map.get(key)
+            if ok:
+                resolved.append(parsed)
+        return resolved
+
+    def fetch_existing(self, keys):
+        """Existing rows for a chunk's natural keys, in a single query"""
+        queryset = self.model.objects.all()
+        for index, field in enumerate(self.key):
+            values = {key[index] for key in keys}
+            condition = Q()
+            if None in values:
+                values.discard(None)
+                condition |= Q(**{f'{field}__isnull': True})
+            if field in self.case_insensitive:
+                alias = f'_key_{index}'
+                queryset = queryset.alias(**{alias: Lower(field)})
+                condition |= Q(**{f'{alias}__in': values})
+            else:
+                condition |= Q(**{f'{field}__in': values})
+            queryset = queryset.filter(condition)
+        return {
+            self.natural_key({field: getattr(obj, field) for field in self.key}): obj
+            for obj in queryset
+        }
+
+    def check_unique(self, parsed, existing):
+        """Reject rows whose unique field values belong to another record"""
+        for field in self.unique_fields:
+            owners = {}
+            for key, row in list(parsed.items()):
+                value = row['values'].get(field)
+                if value in (None, ''):
+                    continue
+                if value in owners:
+                    self.errors.append(
+                        f"Row {row['row_number']}: {field} '{value}' is repeated in the file."
+                    )
+                    del parsed[key]
+                    continue
+                owners[value] = key
+            if not owners:
+                continue
+
+            taken = dict(
+                self.model.objects
+                .filter(**{f'{field}__in': list(owners)})
+                .values_list(field, 'pk')
+            )
+            for value, key in owners.items():
+                pk = taken.get(value)
+                if pk is None:
+                    continue
+                current = existing.get(key)
+                if current is None or current.pk != pk:
+                    self.errors.append(
+                        f"Row {parsed[key]['row_number']}: {field} '{value}' already belongs to another record."
+                    )
+                    del parsed[key]
+
+    def validate_chunk(self, chunk):
+        """
+        Dry-run counterpart of process_chunk: parse and check a chunk
+        without touching the database. Call use_key_sets() first.
+
+        Returns:
+            tuple: (errors, keys) where keys lists (row_number, natural key,
+            key display, unique field values) for every valid row
+        """
+        errors_before = len(self.errors)
+        key_columns = self.key_columns()
+        keys = []
+        for row_number, row in chunk:
+            self.rows_processed += 1
+            parsed = self.parse_row(row_number, row)
+            if parsed is None:
+                continue
+
+            valid = True
+            for lookup, key, cells, source in parsed['pending']:
+                try:
+                    lookup.build(cells, source)
+                except ValueError:
+                    raw = ' / '.join(cell for cell in cells if cell)
+                    self.errors.append(f"Row {row_number}: invalid {lookup.label} '{raw}'.")
+                    valid = False
+                    break
+                target = parsed['extras'] if lookup.extra else parsed['values']
+                target[lookup.field] = key
+            if not valid:
+                continue
+
+            values = parsed['values']
+            keys.append((
+                row_number,
+                self.natural_key(values),
+                ' / '.join(_clean(row, column) for column in key_columns),
+                {field: values.get(field) for field in self.unique_fields},
+            ))
+
+        errors = self.errors[errors_before:]
+        del self.errors[errors_before:]
+        return errors, keys
+
+    def process_chunk(self, chunk):
+        """
+        Import one chunk of (row_number, row) pairs.
+
+        Rows repeating a natural key inside the chunk collapse to the last
+        one, the same result a row-by-row update_or_create would produce.
+        """
+        if self._maps is None:
+            self.load_lookup_maps()
+
+        parsed_rows = []
+        for row_number, row in chunk:
+            self.rows_processed += 1
+            parsed = self.parse_row(row_number, row)
+            if parsed:
+                parsed_rows.append(parsed)
+
+        if any(parsed['pending'] for parsed in parsed_rows):
+            parsed_rows = self.create_missing(parsed_rows)
+
+        parsed = {}
+        for row in parsed_rows:
+            parsed[self.natural_key(row['values'])] = row
+        if not parsed:
+            return
+
+        existing = self.fetch_existing(list(parsed))
+        if self.unique_fields:
+            self.check_unique(parsed, existing)
+
+        now = timezone.now()
+        to_create = []
+        to_update = []
+        changed_fields = set()
+        written = []
+
+        for key, row in parsed.items():
+            values = row['values']
+            obj = existing.get(key)
+
+            if obj is None:
+                obj = self.model(**{**self.create_defaults, **values})
+                self.prepare(obj)
+                to_create.append(obj)
+            else:
+                changes = {
+                    field: (getattr(obj, field), value)
+                    for field, value in values.items()
+                    if getattr(obj, field) != value
+                }
+                if changes:
+                    self.record_change(obj, changes)
+                    for field, (_, value) in changes.items():
+                        setattr(obj, field, value)
+                    for field in self.touch_fields:
+                        setattr(obj, field, now)
+                    self.prepare(obj)
+                    changed_fields.update(changes)
+                    to_update.append(obj)
+                else:
+                    self.unchanged += 1
+            written.append((obj, row['extras']))
+
+        if to_create:
+            self.model.objects.bulk_create(to_create, batch_size=self.chunk_size)
+        if to_update:
+            update_fields = [self.model._meta.get_field(field).name for field in sorted(changed_fields)]
+            update_fields.extend(self.touch_fields)
+            update_fields.extend(self.derived_fields)
+            self.model.objects.bulk_update(to_update, update_fields, batch_size=self.chunk_size)
+
+        self.created += len(to_create)
+        self.updated += len(to_update)
+        record_changes(self.model, [obj.pk for obj in (*to_create, *to_update)])
+        self.after_write(written)
+
+    def prepare(self, obj):
+        """Hook: set derived_fields on a row about to be written"""
+
+    def record_change(self, obj, changes):
+        """Hook: `changes` maps field -> (old, new) for an existing row"""
+
+    def after_write(self, rows):
+        """Hook: `rows` is a list of (obj, extras) for every row written or unchanged"""
+
+
+# =====================================================
+# TEMPLATE IMPORTERS
+# =====================================================
+
+def _location_lookup(field, required=False):
+    return Lookup(field, Location, 'location_name', 'name', label='Location', required=required)
+
+
+class ItemImporter(TemplateImporter):
+    """
+    Bulk importer for the 'items' CSV template.
+
+    Creates or updates Item records keyed by g_code. Missing units of
+    measure are created in one statement per chunk, and existing items are
+    only written when a field actually changed.
+    New and changed items get their match keys and manufacturer set and
+    are checked against the catalog for likely duplicates (counted in
+    possible_duplicates).
+
+    Example:
+        importer = ItemImporter()
+        result = importer.run(iter_csv_rows(request.FILES['file']))
+    """
+    template_key = 'items'
+    model = Item
+    key = ('g_code',)
+    fields = (
+        Field('g_code'),
+        Field('item_name'),
+        Field('description', default=''),
+        Field('category'),
+        Field('subcategory'),
+        Field('subcategory2'),
+        Field('subcategory3'),
+        Field('manufacturer'),
+        Field('manufacturer_part_no'),
+    )
+    lookups = (
+        Lookup('default_uom_id', UnitOfMeasure, 'default_uom', 'uom_code',
+               label='Unit of measure', create_missing=True),
+    )
+    derived_fields = ('mpn_key', 'name_key', 'mfr')
+
+    def __init__(self, chunk_size=DEFAULT_CHUNK_SIZE, changed_by=None):
+        super().__init__(chunk_size=chunk_size, changed_by=changed_by)
+        self.possible_duplicates = 0
+        self._written = []
+
+    def summary(self, elapsed):
+        result = super().summary(elapsed)
+        result['possible_duplicates'] = self.possible_duplicates
+        return result
+
+    def prepare(self, obj):
+        obj.set_match_keys()
+        obj.mfr_id = resolve_manufacturer(obj.manufacturer)
+        self._written.append(obj)
+
+    def after_write(self, rows):
+        if self._written:
+            self.possible_duplicates += check_items(self._written)
+            self._written = []
+
+
+class VendorItemImporter(TemplateImporter):
+    """
+    Bulk importer for the 'vendor_items' CSV template (vendor price books).
+
+    Vendor names and g_codes are resolved through in-memory maps loaded
+    once per import. Rows are diffed against the existing VendorItems;
+    only new or changed rows are written, and every price change gets a
+    VendorItemPriceHistory row.
+
+    Example:
+        importer = VendorItemImporter()
+        result = importer.run(iter_csv_rows(request.FILES['file']))
+    """
+    template_key = 'vendor_items'
+    model = VendorItem
+    key = ('vendor_id', 'item_id')
+    fields = (
+        Field('unit_price', 'price', parse=parse_decimal(2, max_digits=10, min_value=0)),
+        Field('lead_time_days', parse=parse_int(min_value=0), default=0),
+    )
+    lookups = (
+        Lookup('vendor_id', Vendor, 'vendor_name', 'name', label='Vendor', required=True),
+        Lookup('item_id', Item, 'item_sku', 'g_code', label='Item with g_code', required=True),
+        Lookup('vendor_uom_id', UnitOfMeasure, 'vendor_uom', 'uom_code',
+               label='Unit of measure', create_missing=True),
+    )
+    touch_fields = ('last_updated',)
+
+    def __init__(self, chunk_size=DEFAULT_CHUNK_SIZE, changed_by=None):
+        super().__init__(chunk_size=chunk_size, changed_by=changed_by)
+        self.price_changes = 0
+        self._history = []
+
+    def summary(self, elapsed):
+        result = super().summary(elapsed)
+        result['price_changes'] = self.price_changes
+        return result
+
+    def record_change(self, obj, changes):
+        if 'unit_price' in changes:
+            self._history.append(VendorItemPriceHistory(
+                vendor_item=obj,
+                unit_price=changes['unit_price'][1],
+                effective_date=timezone.now(),
+                changed_by=self.changed_by,
+                notes="Updated from vendor price import"
+            ))
+
+    def after_write(self, rows):
+        if self._history:
+            VendorItemPriceHistory.objects.bulk_create(self._history, batch_size=self.chunk_size)
+            self.price_changes += len(self._history)
+            self._history = []
+
+
+class ItemLocationPolicyImporter(TemplateImporter):
+    """Bulk importer for the 'item_location_policies' CSV template"""
+    template_key = 'item_location_policies'
+    model = ItemLocationPolicy
+    key = ('item_id', 'location_id')
+    fields = (
+        Field('min_qty', parse=parse_decimal(4, max_digits=14, min_value=0)),
+        Field('max_qty', parse=parse_decimal(4, max_digits=14, min_value=0)),
+        Field('reorder_qty', parse=parse_decimal(4, max_digits=14, min_value=0)),
+        Field('lead_time_days', parse=parse_int(min_value=0)),
+    )
+    lookups = (
+        Lookup('item_id', Item, 'g_code', 'g_code', label='Item with g_code', required=True),
+        _location_lookup('location_id', required=True),
+        Lookup('preferred_vendor_id', Vendor, 'preferred_vendor_name', 'name', label='Vendor'),
+    )
+
+
+class LocationImporter(TemplateImporter):
+    """
+    Bulk importer for the 'locations' CSV template.
+
+    Locations are matched by name, case-insensitively. Location has no
+    address fields, so the address columns are not imported.
+    """
+    template_key = 'locations'
+    model = Location
+    key = ('name',)
+    case_insensitive = ('name',)
+    fields = (
+        Field('name'),
+        Field('type', 'location_type', parse=parse_choice(Location.LOCATION_TYPES),
+              default='WAREHOUSE', update_blank=False),
+    )
+
+
+class VendorImporter(TemplateImporter):
+    """
+    Bulk importer for the 'vendors' CSV template.
+
+    Vendors are matched by name, case-insensitively. The address columns
+    are combined into Vendor.address; contact_name and website have no
+    Vendor field and are not imported.
+    """
+    template_key = 'vendors'
+    model = Vendor
+    key = ('name',)
+    case_insensitive = ('name',)
+    fields = (
+        Field('name'),
+        Field('email', parse=parse_email),
+        Field('phone'),
+        Field('address', ('address', 'city', 'state', 'zip_code'), parse=join_address),
+    )
+
+
+class VehicleModelImporter(TemplateImporter):
+    """Bulk importer for the 'vehicle_models' CSV template, keyed by make/model/year"""
+    template_key = 'vehicle_models'
+    model = VehicleModel
+    key = ('make', 'model', 'year')
+    case_insensitive = ('make', 'model')
+    fields = (
+        Field('make'),
+        Field('model'),
+        Field('year', parse=parse_int()),
+    )
+
+
+class VehicleImporter(TemplateImporter):
+    """
+    Bulk importer for the 'vehicles' CSV template.
+
+    Vehicles are matched by unit number. Make/model/year resolve to a
+    VehicleModel, created when it does not exist yet.
+    """
+    template_key = 'vehicles'
+    model = Vehicle
+    key = ('unit_no',)
+    fields = (
+        Field('unit_no', 'unit_number'),
+        Field('vin'),
+        Field('plate_no', 'license_plate', default=''),
+        Field('status', parse=parse_choice(VehicleStatus.choices),
+              default=VehicleStatus.AVAILABLE, update_blank=False),
+    )
+    lookups = (
+        Lookup('vehicle_model_id', VehicleModel, ('make', 'model', 'year'), ('make', 'model', 'year'),
+               label='Vehicle model', required=True, create_missing=True,
+               parse={'year': parse_int()}),
+        _location_lookup('location_id', required=True),
+    )
+    unique_fields = ('vin',)
+
+
+class UserImporter(TemplateImporter):
+    """
+    Bulk importer for the 'users' CSV template.
+
+    Users are matched by email and created as INVITED (sign-in goes
+    through Azure AD). The role and department columns add UserRole and
+    UserDepartmentAccess links; existing links are kept.
+    """
+    template_key = 'users'
+    model = User
+    key = ('email',)
+    case_insensitive = ('email',)
+    fields = (
+        Field('email', parse=parse_email),
+        Field('display_name', ('first_name', 'last_name'), parse=join_name, default=''),
+    )
+    lookups = (
+        Lookup('role_id', Role, 'role', 'name', label='Role', create_missing=True,
+               parse={'name': parse_choice(RoleName.choices)}, extra=True),
+        Lookup('department_id', Department, 'department', 'name', label='Department', extra=True),
+    )
+
+    def after_write(self, rows):
+        roles = [
+            UserRole(user_id=user.pk, role_id=extras['role_id'])
+            for user, extras in rows if extras.get('role_id')
+        ]
+        departments = [
+            UserDepartmentAccess(user_id=user.pk, department_id=extras['department_id'])
+            for user, extras in rows if extras.get('department_id')
+        ]
+        if roles:
+            UserRole.objects.bulk_create(roles, batch_size=self.chunk_size, ignore_conflicts=True)
+        if departments:
+            UserDepartmentAccess.objects.bulk_create(
+                departments, batch_size=self.chunk_size, ignore_conflicts=True
+            )
+
+
+class BinImporter(TemplateImporter):
+    """Bulk importer for the 'bins' CSV template (inventory bins per location)"""
+    template_key = 'bins'
+    model = Bin
+    key = ('location_id', 'bin_code')
+    fields = (
+        Field('bin_code'),
+    )
+    lookups = (
+        _location_lookup('location_id', required=True),
+    )
+
+
+class EquipmentImporter(TemplateImporter):
+    """
+    Bulk importer for the 'equipment' CSV template.
+
+    The equipment_id column is the asset tag. Manufacturer/model resolve
+    to an EquipmentModel, created (named after equipment_type) when it
+    does not exist yet. Equipment has no name field, so the name column
+    is stored in notes.
+    """
+    template_key = 'equipment'
+    model = Equipment
+    key = ('asset_tag',)
+    fields = (
+        Field('asset_tag', 'equipment_id'),
+        Field('notes', 'name', default=''),
+        Field('serial_no', 'serial_number'),
+        Field('status', parse=parse_choice(EquipmentStatus.choices),
+              default=EquipmentStatus.IN_STOCK, update_blank=False),
+    )
+    lookups = (
+        Lookup('equipment_model_id', EquipmentModel, ('manufacturer', 'model'), ('manufacturer', 'model_no'),
+               label='Equipment model', required=True, create_missing=True,
+               extra_columns={'name': 'equipment_type'}),
+        _location_lookup('current_location_id'),
+    )
+    unique_fields = ('serial_no',)
+
+
+# CSV_TEMPLATES key -> importer class, used by the upload views and
+# background import jobs
+IMPORTERS = {
+    importer.template_key: importer
+    for importer in (
+        ItemImporter,
+        VendorItemImporter,
+        ItemLocationPolicyImporter,
+        LocationImporter,
+        VehicleImporter,
+        VehicleModelImporter,
+        UserImporter,
+        VendorImporter,
+        BinImporter,
+        EquipmentImporter,
+    )
+}
+
+
+def get_importer(template_key, **kwargs):
+    """
+    Instantiate the importer registered for a CSV template.
+
+    Raises:
+        ValueError: If no importer handles the template
+    """
+    if template_key not in IMPORTERS:
+        raise ValueError(f"No importer registered for template: {template_key}")
+    return IMPORTERS[template_key](**kwargs)
@@ -0,0 +1,200 @@
+# backend/vendor_imports/jobs.py
+"""
+Background Import Jobs
+
+DB-backed queue for CSV imports. Uploads are stored on an ImportJob and
+picked up by the process_import_jobs management command, which runs the
+template's importer one committed chunk at a time and checkpoints after
+every chunk.
+
+A RUNNING job holds a lease that every checkpoint extends. The lease is
+STALE_AFTER, or STALE_CHUNK_FACTOR times the job's slowest chunk when
+that is longer, so a worker inside one long chunk is not mistaken for a
+dead one. Once a job completes or fails for good, its stored upload is
+deleted.
+"""
+
+import os
+import socket
+import time
+import traceback
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .importers import DEFAULT_CHUNK_SIZE, chunked, get_importer, iter_csv_rows
+from .models import ImportJob, ImportJobStatus
+
+
+MAX_STORED_ERRORS = 1000
+MAX_ATTEMPTS = 3
+STALE_AFTER = timedelta(minutes=5)
+STALE_CHUNK_FACTOR = 3
+
+PROGRESS_FIELDS = [
+    'rows_done', 'checkpoint_row', 'created_count', 'updated_count',
+    'unchanged_count', 'error_count', 'errors', 'processing_seconds',
+    'heartbeat_at', 'lease_expires_at',
+]
+
+
+def default_worker_id():
+    """Identify this worker process as host:pid"""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def job_lease(job, slowest_chunk=0.0):
+    """
+    How long a RUNNING job may go without a checkpoint before it is
+    considered dead: STALE_AFTER, or STALE_CHUNK_FACTOR times its slowest
+    chunk (this run's, or the average of earlier attempts) when longer.
+    """
+    chunks_done = -(-job.rows_done // job.chunk_size)
+    average = job.processing_seconds / chunks_done if chunks_done else 0.0
+    return max(STALE_AFTER, timedelta(seconds=STALE_CHUNK_FACTOR * max(slowest_chunk, average)))
+
+
+def _discard_upload(job):
+    """Delete a finished job's stored upload; the job keeps its results"""
+    if job.file:
+        job.file.delete(save=False)
+
+
+def enqueue_import(template_key, file_obj, user=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Store an uploaded file and queue it for the import worker.
+
+    Args:
+        template_key: CSV_TEMPLATES key the file follows
+        file_obj: Uploaded file
+        user: User who uploaded the file (optional)
+        chunk_size: Rows per committed chunk
+
+    Returns:
+        ImportJob: The queued job
+    """
+    return ImportJob.objects.create(
+        template_key=template_key,
+        file=file_obj,
+        original_filename=getattr(file_obj, 'name', '') or '',
+        chunk_size=chunk_size,
+        created_by=user,
+    )
+
+
+def claim_next_job(worker_id):
+    """
+    Claim the oldest runnable job for this worker.
+
+    Runnable means QUEUED, or RUNNING with an expired lease (its worker
+    died mid-import). Locked rows are skipped on databases that support
+    SELECT ... FOR UPDATE SKIP LOCKED.
+
+    Returns:
+        ImportJob or None
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        job = (
+            ImportJob.objects
+            .select_for_update(skip_locked=True)
+            .filter(
+                Q(status=ImportJobStatus.QUEUED)
+                | Q(status=ImportJobStatus.RUNNING, lease_expires_at__lt=now)
+            )
+            .order_by('created_at')
+            .first()
+        )
+        if job is None:
+            return None
+
+        job.status = ImportJobStatus.RUNNING
+        job.worker_id = worker_id
+        job.heartbeat_at = now
+        job.lease_expires_at = now + job_lease(job)
+        job.attempts += 1
+        job.started_at = job.started_at or now
+        job.save(update_fields=['status', 'worker_id', 'heartbeat_at', 'lease_expires_at', 'attempts', 'started_at'])
+    return job
+
+
+def run_import_job(job):
+    """
+    Process a claimed job from its checkpoint to the end of the file.
+
+    Each chunk's writes and the job's progress are committed together, so
+    checkpoint_row always matches what is in the database. Every
+    checkpoint renews the lease from the slowest chunk so far.
+    """
+    importer = get_importer(
+        job.template_key,
+        chunk_size=job.chunk_size,
+        changed_by=job.created_by,
+    )
+
+    with job.file.open('rb') as file_obj:
+        if job.rows_total is None:
+            job.rows_total = sum(1 for _ in iter_csv_rows(file_obj))
+            job.save(update_fields=['rows_total'])
+            file_obj.seek(0)
+
+        rows = (
+            (row_number, row)
+            for row_number, row in iter_csv_rows(file_obj)
+            if row_number > job.checkpoint_row
+        )
+        slowest_chunk = 0.0
+
+        for chunk in chunked(rows, job.chunk_size):
+            errors_before = len(importer.errors)
+            created_before = importer.created
+            updated_before = importer.updated
+            unchanged_before = importer.unchanged
+            started = time.monotonic()
+
+            with transaction.atomic():
+                importer.process_chunk(chunk)
+
+                new_errors = importer.errors[errors_before:]
+                job.rows_done += len(chunk)
+                job.checkpoint_row = chunk[-1][0]
+                job.created_count += importer.created - created_before
+                job.updated_count += importer.updated - updated_before
+                job.unchanged_count += importer.unchanged - unchanged_before
+                job.error_count += len(new_errors)
+                job.errors.extend(new_errors[:max(MAX_STORED_ERRORS - len(job.errors), 0)])
+                elapsed = time.monotonic() - started
+                slowest_chunk = max(slowest_chunk, elapsed)
+                job.processing_seconds += elapsed
+                job.heartbeat_at = timezone.now()
+                job.lease_expires_at = job.heartbeat_at + job_lease(job, slowest_chunk)
+                job.save(update_fields=PROGRESS_FIELDS)
+
+    _discard_upload(job)
+    job.status = ImportJobStatus.COMPLETED
+    job.finished_at = timezone.now()
+    job.save(update_fields=['status', 'finished_at', 'file'])
+
+
+def process_job(job):
+    """
+    Run a claimed job and record the outcome.
+
+    A failed job goes back to the queue (resuming from its checkpoint)
+    until it has used MAX_ATTEMPTS, then it is marked FAILED and its
+    upload is deleted.
+    """
+    try:
+        run_import_job(job)
+    except Exception:
+        job.last_error = traceback.format_exc()
+        if job.attempts >= MAX_ATTEMPTS:
+            _discard_upload(job)
+            job.status = ImportJobStatus.FAILED
+            job.finished_at = timezone.now()
+        else:
+            job.status = ImportJobStatus.QUEUED
+        job.save(update_fields=['status', 'finished_at', 'last_error', 'file'])
+    return job
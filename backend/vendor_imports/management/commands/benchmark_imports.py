@@ -0,0 +1,204 @@
+# backend/vendor_imports/management/commands/benchmark_imports.py
+"""
+Import throughput benchmark.
+
+Generates synthetic rows for every CSV template and imports them twice
+through the template importers: once into an empty key space (inserts)
+and once again unchanged (diff only). Reports rows/second and query
+counts per template. Everything runs in a transaction that is rolled
+back unless --keep is given.
+
+    python manage.py benchmark_imports
+    python manage.py benchmark_imports --rows 20000 --templates items vendor_items
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+
+from vendor_imports.importers import IMPORTERS, get_importer
+
+
+# Templates in dependency order: later templates reference rows created by
+# earlier ones (locations, vendors, items).
+BENCHMARK_ORDER = [
+    'locations',
+    'vendors',
+    'vehicle_models',
+    'items',
+    'bins',
+    'vendor_items',
+    'item_location_policies',
+    'vehicles',
+    'equipment',
+    'users',
+]
+
+# Number of distinct locations/vendors referenced by dependent templates
+FANOUT = 20
+
+ROLES = ['ADMIN', 'MANAGER', 'WAREHOUSE', 'SALES', 'VIEWER']
+
+
+def _location(i):
+    return f"Bench Location {i % FANOUT}"
+
+
+def _vendor(i):
+    return f"Bench Vendor {i % FANOUT}"
+
+
+ROW_FACTORIES = {
+    'locations': lambda i: {
+        'name': f"Bench Location {i}",
+        'address': f"{i} Industrial Pkwy",
+        'city': 'Houston',
+        'state': 'TX',
+        'zip_code': '77001',
+        'location_type': 'WAREHOUSE',
+    },
+    'vendors': lambda i: {
+        'name': f"Bench Vendor {i}",
+        'email': f"sales{i}@bench-vendor.test",
+        'phone': '555-0100',
+        'address': f"{i} Commerce St",
+        'city': 'Houston',
+        'state': 'TX',
+        'zip_code': '77002',
+    },
+    'vehicle_models': lambda i: {
+        'make': 'Bench',
+        'model': f"Model {i}",
+        'year': str(2000 + i % 25),
+    },
+    'items': lambda i: {
+        'g_code': f"BENCH-{i}",
+        'item_name': f"Bench Item {i}",
+        'description': 'Benchmark item',
+        'category': 'Electrical',
+        'subcategory': 'Breakers',
+        'manufacturer': 'Square D',
+        'manufacturer_part_no': f"QO{i}",
+        'default_uom': 'EA',
+    },
+    'bins': lambda i: {
+        'location_name': _location(i),
+        'bin_code': f"B-{i}",
+    },
+    'vendor_items': lambda i: {
+        'vendor_name': _vendor(i),
+        'item_sku': f"BENCH-{i}",
+        'price': f"{1 + i % 500}.25",
+        'vendor_uom': 'EA',
+        'lead_time_days': str(i % 14),
+    },
+    'item_location_policies': lambda i: {
+        'g_code': f"BENCH-{i}",
+        'location_name': _location(i),
+        'min_qty': '10',
+        'max_qty': '50',
+        'reorder_qty': '25',
+        'lead_time_days': '3',
+        'preferred_vendor_name': _vendor(i),
+    },
+    'vehicles': lambda i: {
+        'unit_number': f"BENCH-TRUCK-{i}",
+        'vin': f"BENCHVIN{i:09d}",
+        'make': 'Bench',
+        'model': f"Model {i % FANOUT}",
+        'year': str(2000 + i % FANOUT),
+        'license_plate': f"B{i:06d}",
+        'status': 'AVAILABLE',
+        'location_name': _location(i),
+    },
+    'equipment': lambda i: {
+        'equipment_id': f"BENCH-EQ-{i}",
+        'name': f"Bench Equipment {i}",
+        'equipment_type': 'FORKLIFT',
+        'manufacturer': 'Toyota',
+        'model': f"8FG{i % FANOUT}",
+        'serial_number': f"BENCH-SN-{i}",
+        'location_name': _location(i),
+        'status': 'IN_STOCK',
+    },
+    'users': lambda i: {
+        'email': f"bench.user{i}@example.test",
+        'first_name': 'Bench',
+        'last_name': f"User {i}",
+        'role': ROLES[i % len(ROLES)],
+    },
+}
+
+
+class Rollback(Exception):
+    """Raised to roll the benchmark transaction back"""
+
+
+class Command(BaseCommand):
+    help = "Benchmark the CSV template importers with synthetic rows"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--rows',
+            type=int,
+            default=5000,
+            help='Rows generated per template (default: 5000)'
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=None,
+            help='Rows per chunk (default: IMPORT_CHUNK_SIZE)'
+        )
+        parser.add_argument(
+            '--templates',
+            nargs='*',
+            default=None,
+            help='Templates to benchmark (default: all, in dependency order)'
+        )
+        parser.add_argument(
+            '--keep',
+            action='store_true',
+            help='Commit the generated rows instead of rolling back'
+        )
+
+    def handle(self, *args, **options):
+        templates = options['templates'] or BENCHMARK_ORDER
+        unknown = [key for key in templates if key not in IMPORTERS]
+        if unknown:
+            raise CommandError(f"Unknown templates: {', '.join(unknown)}")
+
+        rows = options['rows']
+        importer_kwargs = {}
+        if options['chunk_size']:
+            importer_kwargs['chunk_size'] = options['chunk_size']
+
+        self.stdout.write(
+            f"{'template':<24}{'pass':<8}{'rows':>8}{'created':>9}{'updated':>9}"
+            f"{'errors':>8}{'queries':>9}{'rows/s':>11}"
+        )
+        try:
+            with transaction.atomic():
+                for key in templates:
+                    for label in ('insert', 'rerun'):
+                        self.run_pass(key, label, rows, importer_kwargs)
+                if not options['keep']:
+                    raise Rollback()
+        except Rollback:
+            self.stdout.write("Rolled back benchmark data (use --keep to commit it)")
+
+    def run_pass(self, template_key, label, rows, importer_kwargs):
+        factory = ROW_FACTORIES[template_key]
+        importer = get_importer(template_key, **importer_kwargs)
+        generated = ((i + 1, factory(i)) for i in range(rows))
+
+        with CaptureQueriesContext(connection) as queries:
+            result = importer.run(generated)
+
+        self.stdout.write(
+            f"{template_key:<24}{label:<8}{result['rows']:>8}{result['created']:>9}"
+            f"{result['updated']:>9}{result['error_count']:>8}{len(queries):>9}"
+            f"{result['rows_per_second'] or 0:>11.1f}"
+        )
+        for error in result['errors'][:3]:
+            self.stdout.write(f"    {error}")
@@ -0,0 +1,57 @@
+# backend/vendor_imports/management/commands/process_import_jobs.py
+"""
+Import job worker.
+
+Polls the import_jobs table and processes queued CSV imports:
+
+    python manage.py process_import_jobs            # run until stopped
+    python manage.py process_import_jobs --once     # drain the queue and exit
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from vendor_imports.jobs import claim_next_job, default_worker_id, process_job
+
+
+class Command(BaseCommand):
+    help = "Process queued CSV import jobs in committed, resumable chunks"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Exit when the queue is empty instead of polling'
+        )
+        parser.add_argument(
+            '--poll-interval',
+            type=float,
+            default=2.0,
+            help='Seconds to sleep when no job is waiting (default: 2)'
+        )
+        parser.add_argument(
+            '--worker-id',
+            default=None,
+            help='Name recorded on claimed jobs (default: host:pid)'
+        )
+
+    def handle(self, *args, **options):
+        worker_id = options['worker_id'] or default_worker_id()
+        self.stdout.write(f"Import worker {worker_id} started")
+
+        while True:
+            job = claim_next_job(worker_id)
+            if job is None:
+                if options['once']:
+                    break
+                time.sleep(options['poll_interval'])
+                continue
+
+            self.stdout.write(f"Processing {job.template_key} import {job.job_id} (attempt {job.attempts})")
+            job = process_job(job)
+            self.stdout.write(
+                f"  {job.status}: {job.rows_done} rows, "
+                f"{job.created_count} created, {job.updated_count} updated, "
+                f"{job.error_count} errors"
+            )
@@ -0,0 +1,52 @@
+# Generated by Django 5.2.7 on 2026-10-19 15:45
+
+import django.db.models.deletion
+import django.utils.timezone
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ImportJob',
+            fields=[
+                ('job_id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('template_key', models.CharField(choices=[('items', 'Items'), ('vendor_items', 'Vendor Pricing'), ('item_location_policies', 'Item Location Policies'), ('locations', 'Locations'), ('vehicles', 'Vehicles'), ('vehicle_models', 'Vehicle Models'), ('users', 'Users'), ('vendors', 'Vendors'), ('bins', 'Bins'), ('equipment', 'Equipment')], help_text='CSV_TEMPLATES key the file follows', max_length=50)),
+                ('file', models.FileField(upload_to='imports/%Y/%m/')),
+                ('original_filename', models.CharField(blank=True, max_length=255)),
+                ('status', models.CharField(choices=[('QUEUED', 'Queued'), ('RUNNING', 'Running'), ('COMPLETED', 'Completed'), ('FAILED', 'Failed')], default='QUEUED', max_length=20)),
+                ('chunk_size', models.PositiveIntegerField(default=1000)),
+                ('rows_total', models.PositiveIntegerField(blank=True, help_text='Data rows in the file', null=True)),
+                ('rows_done', models.PositiveIntegerField(default=0)),
+                ('checkpoint_row', models.PositiveIntegerField(default=0, help_text='Last CSV row number included in a committed chunk')),
+                ('created_count', models.PositiveIntegerField(default=0)),
+                ('updated_count', models.PositiveIntegerField(default=0)),
+                ('unchanged_count', models.PositiveIntegerField(default=0)),
+                ('error_count', models.PositiveIntegerField(default=0)),
+                ('errors', models.JSONField(blank=True, default=list, help_text='Per-row errors (capped)')),
+                ('processing_seconds', models.FloatField(default=0, help_text='Time spent processing chunks')),
+                ('attempts', models.PositiveIntegerField(default=0)),
+                ('worker_id', models.CharField(blank=True, max_length=100)),
+                ('heartbeat_at', models.DateTimeField(blank=True, null=True)),
+                ('last_error', models.TextField(blank=True)),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('started_at', models.DateTimeField(blank=True, null=True)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+                ('created_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='import_jobs', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'db_table': 'import_jobs',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['status', 'created_at'], name='idx_import_job_queue'), models.Index(fields=['created_by'], name='idx_import_job_user')],
+            },
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.2.7 on 2026-10-19 17:05
+
+from datetime import timedelta
+
+from django.db import migrations, models
+from django.db.models import F
+
+
+def backfill_lease(apps, schema_editor):
+    """Running jobs keep the old fixed five-minute heartbeat window"""
+    ImportJob = apps.get_model('vendor_imports', 'ImportJob')
+    ImportJob.objects.filter(status='RUNNING', heartbeat_at__isnull=False).update(
+        lease_expires_at=F('heartbeat_at') + timedelta(minutes=5),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vendor_imports', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='importjob',
+            name='lease_expires_at',
+            field=models.DateTimeField(blank=True, help_text='A RUNNING job not checkpointed by then may be reclaimed', null=True),
+        ),
+        migrations.AlterField(
+            model_name='importjob',
+            name='file',
+            field=models.FileField(blank=True, help_text='Deleted when the job finishes', upload_to='imports/%Y/%m/'),
+        ),
+        migrations.RunPython(backfill_lease, migrations.RunPython.noop),
+    ]
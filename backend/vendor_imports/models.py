@@ -1,3 +1,101 @@
 from django.db import models
+import uuid
+from django.utils import timezone
 
-# Create your models here.
+from .templates import CSV_TEMPLATES
+
+
+class ImportJobStatus(models.TextChoices):
+    """Lifecycle of a background CSV import"""
+    QUEUED = 'QUEUED', 'Queued'
+    RUNNING = 'RUNNING', 'Running'
+    COMPLETED = 'COMPLETED', 'Completed'
+    FAILED = 'FAILED', 'Failed'
+
+
+class ImportJob(models.Model):
+    """
+    Background CSV import.
+
+    The uploaded file is stored and processed by the process_import_jobs
+    worker in committed chunks. checkpoint_row records the last CSV row
+    whose chunk was committed, so a crashed or retried job resumes from
+    the next chunk instead of starting over. The file is deleted once the
+    job has completed or failed for good.
+    """
+    job_id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    template_key = models.CharField(
+        max_length=50,
+        choices=[(key, template['name']) for key, template in CSV_TEMPLATES.items()],
+        help_text='CSV_TEMPLATES key the file follows'
+    )
+    file = models.FileField(upload_to='imports/%Y/%m/', blank=True, help_text='Deleted when the job finishes')
+    original_filename = models.CharField(max_length=255, blank=True)
+    status = models.CharField(
+        max_length=20,
+        choices=ImportJobStatus.choices,
+        default=ImportJobStatus.QUEUED
+    )
+    chunk_size = models.PositiveIntegerField(default=1000)
+
+    # Progress
+    rows_total = models.PositiveIntegerField(null=True, blank=True, help_text='Data rows in the file')
+    rows_done = models.PositiveIntegerField(default=0)
+    checkpoint_row = models.PositiveIntegerField(
+        default=0,
+        help_text='Last CSV row number included in a committed chunk'
+    )
+    created_count = models.PositiveIntegerField(default=0)
+    updated_count = models.PositiveIntegerField(default=0)
+    unchanged_count = models.PositiveIntegerField(default=0)
+    error_count = models.PositiveIntegerField(default=0)
+    errors = models.JSONField(default=list, blank=True, help_text='Per-row errors (capped)')
+    processing_seconds = models.FloatField(default=0, help_text='Time spent processing chunks')
+
+    # Worker bookkeeping
+    attempts = models.PositiveIntegerField(default=0)
+    worker_id = models.CharField(max_length=100, blank=True)
+    heartbeat_at = models.DateTimeField(null=True, blank=True)
+    lease_expires_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text='A RUNNING job not checkpointed by then may be reclaimed'
+    )
+    last_error = models.TextField(blank=True)
+
+    created_by = models.ForeignKey(
+        'users.User',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='import_jobs'
+    )
+    created_at = models.DateTimeField(default=timezone.now)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = 'import_jobs'
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['status', 'created_at'], name='idx_import_job_queue'),
+            models.Index(fields=['created_by'], name='idx_import_job_user'),
+        ]
+
+    def __str__(self):
+        return f"{self.template_key} import {self.job_id} ({self.status})"
+
+    @property
+    def rows_per_second(self):
+        """Average processing rate across all attempts"""
+        if not self.processing_seconds:
+            return None
+        return self.rows_done / self.processing_seconds
+
+    @property
+    def eta_seconds(self):
+        """Estimated seconds until the remaining rows are processed"""
+        rate = self.rows_per_second
+        if not rate or self.rows_total is None:
+            return None
+        return max(self.rows_total - self.rows_done, 0) / rate
@@ -0,0 +1,66 @@
+# backend/vendor_imports/serializers.py
+"""
+Serializers for background import jobs
+"""
+from rest_framework import serializers
+from .models import ImportJob
+from .importers import IMPORTERS
+from .templates import CSV_TEMPLATES
+
+
+class ImportJobSerializer(serializers.ModelSerializer):
+    """Import job progress for polling clients"""
+    percent_complete = serializers.SerializerMethodField()
+    rows_per_second = serializers.SerializerMethodField()
+    eta_seconds = serializers.SerializerMethodField()
+
+    class Meta:
+        model = ImportJob
+        fields = [
+            'job_id',
+            'template_key',
+            'original_filename',
+            'status',
+            'rows_total',
+            'rows_done',
+            'percent_complete',
+            'rows_per_second',
+            'eta_seconds',
+            'created_count',
+            'updated_count',
+            'unchanged_count',
+            'error_count',
+            'errors',
+            'attempts',
+            'last_error',
+            'created_by',
+            'created_at',
+            'started_at',
+            'finished_at',
+        ]
+        read_only_fields = fields
+
+    def get_percent_complete(self, obj):
+        if not obj.rows_total:
+            return None
+        return round(100 * obj.rows_done / obj.rows_total, 1)
+
+    def get_rows_per_second(self, obj):
+        rate = obj.rows_per_second
+        return round(rate, 1) if rate else None
+
+    def get_eta_seconds(self, obj):
+        eta = obj.eta_seconds
+        return round(eta, 1) if eta is not None else None
+
+
+class ImportJobCreateSerializer(serializers.Serializer):
+    """Validates a new background import upload"""
+    template_key = serializers.ChoiceField(choices=list(CSV_TEMPLATES))
+    file = serializers.FileField()
+    chunk_size = serializers.IntegerField(required=False, min_value=1, max_value=50000)
+
+    def validate_template_key(self, value):
+        if value not in IMPORTERS:
+            raise serializers.ValidationError(f"Template '{value}' has no importer yet.")
+        return value
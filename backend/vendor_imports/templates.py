@@ -110,7 +110,8 @@ CSV_TEMPLATES = {
             'model',
             'year',
             'license_plate',
-            'status'
+            'status',
+            'location_name'
         ],
         'example_row': [
             'TRUCK-01',
@@ -119,9 +120,10 @@ CSV_TEMPLATES = {
             'F-150',
             '2020',
             'ABC1234',
-            'ACTIVE'
+            'AVAILABLE',
+            'Main Warehouse'
         ],
-        'required': ['unit_number']
+        'required': ['unit_number', 'make', 'model', 'location_name']
     },
 
     'vehicle_models': {
@@ -154,7 +156,7 @@ CSV_TEMPLATES = {
             'john.doe@gse.com',
             'John',
             'Doe',
-            'technician',
+            'WAREHOUSE',
             'Field Services'
         ],
         'required': ['email']
@@ -223,7 +225,7 @@ CSV_TEMPLATES = {
             '8FG25',
             'SN123456',
             'Main Warehouse',
-            'ACTIVE'
+            'IN_STOCK'
         ],
         'required': ['equipment_id', 'name']
     }
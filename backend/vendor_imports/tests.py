@@ -1,3 +1,264 @@
-from django.test import TestCase
+import shutil
+import tempfile
+from datetime import timedelta
+from decimal import Decimal
+from io import BytesIO
+from unittest import mock
 
-# Create your tests here.
+from django.core.files.base import ContentFile
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from inventory.models import Item, UnitOfMeasure
+from vendoritems.models import VendorItem, VendorItemPriceHistory
+from vendors.models import Vendor
+
+from .importers import ItemImporter, VendorItemImporter, iter_csv_rows
+from .jobs import MAX_ATTEMPTS, STALE_AFTER, STALE_CHUNK_FACTOR, claim_next_job, enqueue_import, process_job
+from .models import ImportJob, ImportJobStatus
+from .validation import validate_csv
+
+
+def csv_file(*lines):
+    return BytesIO(('\n'.join(lines) + '\n').encode())
+
+
+ITEM_HEADER = 'g_code,item_name,description,category,manufacturer,manufacturer_part_no,default_uom'
+
+
+def item_rows(count, start=0):
+    return [f'G-{i},Breaker {i},,Electrical,Square D,QO{i},EA' for i in range(start, start + count)]
+
+
+class ItemImportTests(TestCase):
+    """Item CSVs are diffed against the catalog and written per chunk"""
+
+    def test_creates_updates_and_skips_unchanged_rows(self):
+        Item.objects.create(g_code='G-1', item_name='Old name', category='Electrical')
+        upload = [
+            ITEM_HEADER,
+            *item_rows(3),
+            ',No g_code,,,,,',
+            'G-9,Wire,,Electrical,,,FT',
+        ]
+
+        result = ItemImporter().run(iter_csv_rows(csv_file(*upload)))
+
+        self.assertEqual((result['created'], result['updated'], result['unchanged']), (3, 1, 0))
+        self.assertEqual(result['errors'], ['Row 4: missing required fields (g_code).'])
+        self.assertEqual(Item.objects.get(g_code='G-1').item_name, 'Breaker 1')
+        self.assertEqual(set(UnitOfMeasure.objects.values_list('uom_code', flat=True)), {'EA', 'FT'})
+
+        again = ItemImporter().run(iter_csv_rows(csv_file(*upload)))
+        self.assertEqual((again['created'], again['updated'], again['unchanged']), (0, 0, 4))
+
+    def test_query_count_does_not_grow_with_rows(self):
+        # Creates the unit of measure and manufacturer the later files share
+        ItemImporter().run(iter_csv_rows(csv_file(ITEM_HEADER, *item_rows(1, start=1000))))
+
+        # 40 rows stay inside one SQLite INSERT (its bound-variable limit splits larger ones)
+        with CaptureQueriesContext(connection) as few:
+            ItemImporter().run(iter_csv_rows(csv_file(ITEM_HEADER, *item_rows(5))))
+        with CaptureQueriesContext(connection) as many:
+            ItemImporter().run(iter_csv_rows(csv_file(ITEM_HEADER, *item_rows(40, start=100))))
+
+        self.assertEqual(Item.objects.count(), 46)
+        self.assertEqual(len(few), len(many))
+
+        # Each further chunk costs a fixed number of queries, not one per row
+        with CaptureQueriesContext(connection) as chunked:
+            ItemImporter(chunk_size=40).run(iter_csv_rows(csv_file(ITEM_HEADER, *item_rows(80, start=400))))
+        self.assertLess(len(chunked), 2 * len(many))
+
+
+PRICE_HEADER = 'vendor_name,item_sku,price,lead_time_days'
+
+
+def price_rows(count, price='10.00'):
+    return [f'Acme Supply,G-{i},{price},5' for i in range(count)]
+
+
+class PriceBookImportTests(TestCase):
+    """Price books write only changed rows and record every price change"""
+
+    @classmethod
+    def setUpTestData(cls):
+        Vendor.objects.create(name='Acme Supply')
+        Item.objects.bulk_create([Item(g_code=f'G-{i}', item_name=f'Item {i}') for i in range(40)])
+
+    def import_prices(self, *rows):
+        return VendorItemImporter().run(iter_csv_rows(csv_file(PRICE_HEADER, *rows)))
+
+    def test_price_changes_are_recorded(self):
+        self.import_prices(*price_rows(3))
+        self.assertFalse(VendorItemPriceHistory.objects.exists())
+
+        result = self.import_prices(
+            'Acme Supply,G-0,12.00,5',
+            'Acme Supply,G-1,10.00,7',
+            'Acme Supply,G-2,10.00,5',
+        )
+
+        self.assertEqual((result['updated'], result['unchanged'], result['price_changes']), (2, 1, 1))
+        self.assertEqual(
+            list(VendorItemPriceHistory.objects.values_list('vendor_item__item__g_code', 'unit_price')),
+            [('G-0', Decimal('12.00'))],
+        )
+        self.assertEqual(VendorItem.objects.get(item__g_code='G-1').lead_time_days, 7)
+
+    def test_unchanged_rows_are_not_written(self):
+        self.import_prices(*price_rows(3))
+        stamps = dict(VendorItem.objects.values_list('item__g_code', 'last_updated'))
+
+        result = self.import_prices(*price_rows(3))
+
+        self.assertEqual((result['updated'], result['unchanged'], result['price_changes']), (0, 3, 0))
+        self.assertEqual(dict(VendorItem.objects.values_list('item__g_code', 'last_updated')), stamps)
+
+    def test_query_count_does_not_grow_with_rows(self):
+        self.import_prices(*price_rows(40))
+
+        with CaptureQueriesContext(connection) as few:
+            self.import_prices(*price_rows(2, price='11.00'))
+        with CaptureQueriesContext(connection) as many:
+            self.import_prices(*price_rows(40, price='12.00'))
+
+        self.assertEqual(len(few), len(many))
+        self.assertEqual(VendorItemPriceHistory.objects.filter(unit_price=Decimal('12.00')).count(), 40)
+
+
+class CellRangeTests(TestCase):
+    """Cells the target field cannot store are row errors, not crashes"""
+
+    @classmethod
+    def setUpTestData(cls):
+        Vendor.objects.create(name='Acme Supply')
+        for g_code in ('G-100', 'G-200', 'G-300', 'G-400'):
+            Item.objects.create(g_code=g_code, item_name=g_code)
+
+    def test_out_of_range_cells_are_rejected_per_row(self):
+        upload = csv_file(
+            'vendor_name,item_sku,price,lead_time_days',
+            'Acme Supply,G-100,12.50,3',
+            'Acme Supply,G-200,12.50,-1',
+            'Acme Supply,G-300,123456789.00,3',
+            'Acme Supply,G-400,1e30,3',
+        )
+
+        result = VendorItemImporter().run(iter_csv_rows(upload))
+
+        self.assertEqual(result['created'], 1)
+        self.assertEqual(result['errors'], [
+            "Row 2: invalid lead_time_days '-1' (must be at least 0).",
+            "Row 3: invalid price '123456789.00' (more than 8 digits before the decimal point).",
+            "Row 4: invalid price '1e30'.",
+        ])
+        self.assertEqual(VendorItem.objects.get().unit_price, Decimal('12.50'))
+
+
+class DryRunTests(TestCase):
+    """The dry run reports exactly what the import would reject"""
+
+    @classmethod
+    def setUpTestData(cls):
+        Vendor.objects.create(name='Acme Supply')
+        for g_code in ('G-100', 'G-200', 'G-300'):
+            Item.objects.create(g_code=g_code, item_name=g_code)
+
+    def upload(self):
+        return csv_file(
+            'vendor_name,item_sku,price,lead_time_days',
+            'Acme Supply,G-100,12.50,3',
+            'Acme Supply,G-200,12.50,-1',
+            'Acme Supply,G-300,123456789.00,3',
+            'Acme Supply,G-999,1.00,3',
+        )
+
+    def test_dry_run_agrees_with_import(self):
+        report = validate_csv('vendor_items', self.upload(), workers=1)
+
+        self.assertFalse(VendorItem.objects.exists())
+        self.assertEqual((report['rows'], report['valid_rows'], report['error_count']), (4, 1, 3))
+
+        result = VendorItemImporter().run(iter_csv_rows(self.upload()))
+        self.assertEqual(result['created'], report['valid_rows'])
+        self.assertEqual(result['errors'], report['errors'])
+
+    def test_pool_agrees_with_in_process(self):
+        in_process = validate_csv('vendor_items', self.upload(), workers=1)
+        pooled = validate_csv('vendor_items', self.upload(), chunk_size=1, workers=2, parallel_rows=1)
+
+        self.assertEqual(pooled['errors'], in_process['errors'])
+        self.assertEqual(pooled['valid_rows'], in_process['valid_rows'])
+
+
+class ImportJobTests(TestCase):
+    """Leases follow chunk timing; finished jobs drop their upload"""
+
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root)
+        settings_override = override_settings(MEDIA_ROOT=media_root)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+    def enqueue(self, rows=4, chunk_size=2):
+        upload = ContentFile('\n'.join([ITEM_HEADER, *item_rows(rows)]).encode(), name='items.csv')
+        return enqueue_import('items', upload, chunk_size=chunk_size)
+
+    def test_completed_job_deletes_its_upload(self):
+        job = self.enqueue()
+        path = job.file.path
+
+        job = process_job(claim_next_job('worker-1'))
+
+        self.assertEqual((job.status, job.rows_done, job.created_count), (ImportJobStatus.COMPLETED, 4, 4))
+        job.refresh_from_db()
+        self.assertFalse(job.file)
+        self.assertFalse(job.file.storage.exists(path))
+
+    def test_upload_is_kept_until_the_last_attempt_fails(self):
+        job = self.enqueue()
+        path = job.file.path
+
+        with mock.patch('vendor_imports.jobs.get_importer', side_effect=RuntimeError('importer missing')):
+            for attempt in range(1, MAX_ATTEMPTS + 1):
+                job = process_job(claim_next_job('worker-1'))
+                self.assertEqual(job.attempts, attempt)
+                if attempt < MAX_ATTEMPTS:
+                    self.assertEqual(job.status, ImportJobStatus.QUEUED)
+                    self.assertTrue(job.file.storage.exists(path))
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, ImportJobStatus.FAILED)
+        self.assertIn('importer missing', job.last_error)
+        self.assertFalse(job.file)
+        self.assertFalse(job.file.storage.exists(path))
+
+    def test_lease_covers_the_slowest_chunk(self):
+        job = self.enqueue()
+        # Each chunk takes 1,000 seconds
+        clock = iter(range(0, 10000, 1000))
+        with mock.patch('vendor_imports.jobs.time') as jobs_time:
+            jobs_time.monotonic.side_effect = lambda: next(clock)
+            process_job(claim_next_job('worker-1'))
+
+        job.refresh_from_db()
+        self.assertEqual(job.lease_expires_at - job.heartbeat_at, timedelta(seconds=STALE_CHUNK_FACTOR * 1000))
+
+    def test_only_expired_leases_are_reclaimed(self):
+        job = self.enqueue()
+        claim_next_job('worker-1')
+        # No checkpoint for longer than STALE_AFTER, but the lease still runs
+        ImportJob.objects.filter(pk=job.pk).update(
+            heartbeat_at=timezone.now() - STALE_AFTER * 2,
+            lease_expires_at=timezone.now() + timedelta(minutes=1),
+        )
+        self.assertIsNone(claim_next_job('worker-2'))
+
+        ImportJob.objects.filter(pk=job.pk).update(lease_expires_at=timezone.now() - timedelta(seconds=1))
+        reclaimed = claim_next_job('worker-2')
+        self.assertEqual((reclaimed.pk, reclaimed.worker_id, reclaimed.attempts), (job.pk, 'worker-2', 2))
+        self.assertEqual(reclaimed.lease_expires_at - reclaimed.heartbeat_at, STALE_AFTER)
@@ -1,5 +1,8 @@
 from django.urls import path
-from .views import VendorItemUploadView, ItemUploadView, ItemExportView, VendorItemExportView
+from .views import (
+    VendorItemUploadView, ItemUploadView, ItemExportView, VendorItemExportView,
+    ImportJobListCreateView, ImportJobDetailView, TemplateUploadView,
+)
 from .views_templates import TemplateListView, TemplateDownloadView
 
 urlpatterns = [
@@ -7,7 +10,10 @@ urlpatterns = [
     path('items-upload/', ItemUploadView.as_view(), name='item-upload'),
     path('csv-templates/', TemplateListView.as_view(), name='template-list'),
     path('csv-templates/<str:template_key>/', TemplateDownloadView.as_view(), name='template-download'),
+    path('csv-upload/<str:template_key>/', TemplateUploadView.as_view(), name='template-upload'),
     path('items-export/', ItemExportView.as_view(), name='item-export'),
     path('vendor-items-export/', VendorItemExportView.as_view(), name='vendor-item-export'),
+    path('imports/', ImportJobListCreateView.as_view(), name='import-job-list'),
+    path('imports/<uuid:job_id>/', ImportJobDetailView.as_view(), name='import-job-detail'),
 ]
 
@@ -0,0 +1,248 @@
+# backend/vendor_imports/validation.py
+"""
+Dry-run CSV validation.
+
+Checks a whole upload without writing anything: required fields, value
+parsing (prices, lead times, choices, ...), foreign-key existence and
+duplicate keys within the file. Duplicate detection needs the whole file
+and happens in the parent as chunk results come back.
+
+The first IMPORT_VALIDATION_PARALLEL_ROWS rows are validated in the
+request process; only the rest of a larger file goes to the process
+pool. The pool is shared by every request in the web worker and bounded
+by IMPORT_VALIDATION_WORKERS. The lookup key sets are loaded once in the
+parent and pickled to a temporary file that each worker loads once per
+upload, so workers never query the database.
+"""
+
+import codecs
+import csv
+import itertools
+import os
+import pickle
+import tempfile
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from django.conf import settings
+
+from .importers import DEFAULT_CHUNK_SIZE, get_importer
+
+
+# Uploads whose key sets a worker keeps loaded
+WORKER_CACHE_SIZE = 4
+
+# Worker-process state: key set file -> importer using it
+_worker = {}
+
+# Process pool shared by every dry run in this process, created on first use
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def default_workers():
+    """IMPORT_VALIDATION_WORKERS, or one worker per CPU when unset"""
+    return getattr(settings, 'IMPORT_VALIDATION_WORKERS', 0) or os.cpu_count() or 1
+
+
+def default_parallel_rows():
+    """Rows validated in the request process before the pool is used"""
+    return getattr(settings, 'IMPORT_VALIDATION_PARALLEL_ROWS', 20000)
+
+
+def _get_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(max_workers=default_workers(), initializer=_init_worker)
+        return _pool
+
+
+def _discard_pool(pool):
+    """Drop a broken pool so the next dry run starts a fresh one"""
+    global _pool
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def iter_csv_chunks(file_obj, chunk_size, encoding='utf-8-sig'):
+    """
+    Yield (header, [(row_number, values), ...]) chunks from an uploaded CSV.
+
+    Rows stay as lists until they reach a worker, which keeps the data
+    pickled to the pool small.
+    """
+    reader = csv.reader(codecs.iterdecode(file_obj, encoding))
+    header = next(reader, None)
+    if header is None:
+        return
+    chunk = []
+    row_number = 0
+    for values in reader:
+        # Blank lines are skipped without a row number, as csv.DictReader does
+        if not values:
+            continue
+        row_number += 1
+        chunk.append((row_number, values))
+        if len(chunk) >= chunk_size:
+            yield header, chunk
+            chunk = []
+    if chunk:
+        yield header, chunk
+
+
+def _init_worker():
+    """Process pool initializer: set up Django once per worker"""
+    import django
+    from django.apps import apps
+    if not apps.ready:
+        django.setup()
+
+
+def _worker_importer(template_key, key_sets_path):
+    """The importer for one upload, its key sets loaded on first use"""
+    importer = _worker.get(key_sets_path)
+    if importer is None:
+        if len(_worker) >= WORKER_CACHE_SIZE:
+            _worker.clear()
+        with open(key_sets_path, 'rb') as key_sets_file:
+            key_sets = pickle.load(key_sets_file)
+        importer = get_importer(template_key)
+        importer.use_key_sets(key_sets)
+        _worker[key_sets_path] = importer
+    return importer
+
+
+def _rows(header, chunk):
+    return [(row_number, dict(zip(header, values))) for row_number, values in chunk]
+
+
+def _validate_chunk(template_key, key_sets_path, header, chunk):
+    return _worker_importer(template_key, key_sets_path).validate_chunk(_rows(header, chunk))
+
+
+def validate_csv(template_key, file_obj, chunk_size=DEFAULT_CHUNK_SIZE, workers=None, parallel_rows=None):
+    """
+    Validate an uploaded CSV against a template without touching the database.
+
+    Args:
+        template_key: CSV_TEMPLATES key the file follows
+        file_obj: Uploaded file
+        chunk_size: Rows per validation task
+        workers: 1 validates the whole file in this process; otherwise rows
+            past parallel_rows go to the shared pool (IMPORT_VALIDATION_WORKERS)
+        parallel_rows: Rows validated in this process first
+            (default: IMPORT_VALIDATION_PARALLEL_ROWS)
+
+    Returns:
+        dict: Row counts, every error in row order, and throughput
+    """
+    started = time.monotonic()
+    workers = workers or default_workers()
+    if parallel_rows is None:
+        parallel_rows = default_parallel_rows()
+    importer = get_importer(template_key)
+    key_sets = importer.load_key_sets()
+    importer.use_key_sets(key_sets)
+
+    report = _Report(importer.unique_fields)
+    chunks = iter_csv_chunks(file_obj, chunk_size)
+
+    for header, chunk in chunks:
+        report.add(len(chunk), *importer.validate_chunk(_rows(header, chunk)))
+        if workers > 1 and report.rows >= parallel_rows:
+            break
+    next_chunk = next(chunks, None)
+    if next_chunk is None:
+        return report.summary(time.monotonic() - started, 1)
+
+    with tempfile.NamedTemporaryFile(suffix='.pickle', delete=False) as key_sets_file:
+        pickle.dump(key_sets, key_sets_file, protocol=pickle.HIGHEST_PROTOCOL)
+    pool_size = default_workers()
+    pool = _get_pool()
+    try:
+        # Keep a bounded number of chunks in flight so a huge file is never
+        # queued in memory all at once; results are consumed in file order.
+        pending = deque()
+        for header, chunk in itertools.chain([next_chunk], chunks):
+            future = pool.submit(_validate_chunk, template_key, key_sets_file.name, header, chunk)
+            pending.append((len(chunk), future))
+            if len(pending) >= pool_size * 2:
+                size, future = pending.popleft()
+                report.add(size, *future.result())
+        while pending:
+            size, future = pending.popleft()
+            report.add(size, *future.result())
+    except BrokenProcessPool:
+        _discard_pool(pool)
+        raise
+    finally:
+        os.unlink(key_sets_file.name)
+
+    return report.summary(time.monotonic() - started, pool_size)
+
+
+class _Report:
+    """Merges chunk results in file order and flags duplicate keys"""
+
+    def __init__(self, unique_fields):
+        self.rows = 0
+        self.valid_rows = 0
+        self.errors = []
+        self.duplicate_keys = 0
+        self.first_seen = {}
+        self.unique_seen = {field: {} for field in unique_fields}
+
+    def add(self, size, errors, keys):
+        self.rows += size
+        chunk_errors = [(self._row_number(error), error) for error in errors]
+
+        for row_number, key, display, unique_values in keys:
+            first = self.first_seen.setdefault(key, row_number)
+            if first != row_number:
+                self.duplicate_keys += 1
+                chunk_errors.append((
+                    row_number,
+                    f"Row {row_number}: duplicate key '{display}' (first seen on row {first})."
+                ))
+                continue
+
+            duplicate = False
+            for field, value in unique_values.items():
+                if value in (None, ''):
+                    continue
+                first = self.unique_seen[field].setdefault(value, row_number)
+                if first != row_number:
+                    chunk_errors.append((
+                        row_number,
+                        f"Row {row_number}: {field} '{value}' is repeated in the file (first seen on row {first})."
+                    ))
+                    duplicate = True
+            if not duplicate:
+                self.valid_rows += 1
+
+        chunk_errors.sort(key=lambda pair: pair[0])
+        self.errors.extend(error for _, error in chunk_errors)
+
+    @staticmethod
+    def _row_number(error):
+        # Messages are "Row N: ..."
+        return int(error[4:error.index(':')])
+
+    def summary(self, elapsed, workers):
+        return {
+            'dry_run': True,
+            'rows': self.rows,
+            'valid_rows': self.valid_rows,
+            'duplicate_keys': self.duplicate_keys,
+            'errors': self.errors,
+            'error_count': len(self.errors),
+            'workers': workers,
+            'elapsed_seconds': round(elapsed, 3),
+            'rows_per_second': round(self.rows / elapsed, 1) if elapsed else None,
+        }
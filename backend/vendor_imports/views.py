@@ -1,19 +1,57 @@
-from drf_spectacular.utils import extend_schema
+from drf_spectacular.utils import OpenApiParameter, extend_schema
 
 
-import csv
-import io
-from django.db import transaction
-from django.http import HttpResponse
+from rest_framework import generics
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
-from vendors.models import Vendor
-from inventory.models import Item, UnitOfMeasure
+from inventory.filters import filter_items
+from inventory.models import Item
+from vendoritems.filters import filter_vendor_items
 from vendoritems.models import VendorItem
+from .exports import ExportColumn, streaming_export
+from .importers import (
+    DEFAULT_CHUNK_SIZE, IMPORTERS, ItemImporter, VendorItemImporter, get_importer, iter_csv_rows,
+)
+from .jobs import enqueue_import
+from .models import ImportJob
+from .serializers import ImportJobSerializer, ImportJobCreateSerializer
+from .validation import validate_csv
 import uuid
 
 
+def _wants_background(request):
+    """True when the client asked for ?background=1"""
+    return request.query_params.get('background', '').lower() in ('1', 'true', 'yes')
+
+
+def _wants_dry_run(request):
+    """True when the client asked for ?dry_run=1"""
+    return request.query_params.get('dry_run', '').lower() in ('1', 'true', 'yes')
+
+
+def _dry_run_upload(template_key, file_obj):
+    """Validate an upload without writing and return the full error report"""
+    try:
+        result = validate_csv(template_key, file_obj)
+    except UnicodeDecodeError:
+        return Response(
+            {"error": "File must be UTF-8 encoded CSV."},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    return Response({
+        "message": "Validation complete",
+        **result,
+    })
+
+
+def _queue_upload(request, template_key, file_obj):
+    """Queue an upload as an ImportJob and return the 202 response"""
+    user = request.user if request.user.is_authenticated else None
+    job = enqueue_import(template_key, file_obj, user=user)
+    return Response(ImportJobSerializer(job).data, status=status.HTTP_202_ACCEPTED)
+
+
 @extend_schema(
     tags=["Vendor CSV Upload"],
     summary="Upload or update vendor pricing via CSV file",
@@ -25,7 +63,13 @@ import uuid
     - **vendor_uom** (optional) - Vendor's unit of measure
     - **lead_time_days** (optional) - Lead time in days
 
-    This endpoint will create or update VendorItem records.
+    This endpoint will create or update VendorItem records. Only rows whose
+    price, UOM or lead time changed are written, and each price change is
+    recorded in the vendor item price history.
+    Pass **?background=1** to queue the file as an import job instead (202 + job).
+    Pass **?dry_run=1** to validate the whole file without writing anything:
+    required fields, value parsing, missing vendors/items/locations and
+    duplicate keys are all reported, row by row.
     Note: The 'item_sku' column should contain your internal G-code, not the vendor's SKU.
     """,
     responses={
@@ -33,12 +77,18 @@ import uuid
             "type": "object",
             "properties": {
                 "message": {"type": "string"},
+                "rows": {"type": "integer"},
                 "created": {"type": "integer"},
                 "updated": {"type": "integer"},
+                "unchanged": {"type": "integer"},
+                "price_changes": {"type": "integer"},
                 "errors": {
                     "type": "array",
                     "items": {"type": "string"}
                 },
+                "error_count": {"type": "integer"},
+                "elapsed_seconds": {"type": "number"},
+                "rows_per_second": {"type": "number"},
             },
         },
         400: {"description": "Bad request or missing file"},
@@ -60,61 +110,25 @@ class VendorItemUploadView(APIView):
         if not file_obj:
             return Response({"error": "No file uploaded."}, status=status.HTTP_400_BAD_REQUEST)
 
-        decoded_file = file_obj.read().decode('utf-8')
-        io_string = io.StringIO(decoded_file)
-        reader = csv.DictReader(io_string)
-
-        created, updated, errors = 0, 0, []
-
-        with transaction.atomic():
-            for i, row in enumerate(reader, start=1):
-                vendor_name = row.get('vendor_name')
-                item_sku = row.get('item_sku')
-                price = row.get('price')
-
-                if not (vendor_name and item_sku and price):
-                    errors.append(f"Row {i}: missing required fields.")
-                    continue
-
-                try:
-                    vendor = Vendor.objects.get(name__iexact=vendor_name.strip())
-                    item = Item.objects.get(g_code__iexact=item_sku.strip())
-                except Vendor.DoesNotExist:
-                    errors.append(f"Row {i}: Vendor '{vendor_name}' not found.")
-                    continue
-                except Item.DoesNotExist:
-                    errors.append(f"Row {i}: Item with g_code '{item_sku}' not found.")
-                    continue
-
-                vendor_uom = None
-                if row.get('vendor_uom'):
-                    vendor_uom, _ = UnitOfMeasure.objects.get_or_create(
-                        uom_code=row['vendor_uom'].strip()
-                    )
-
-                lead_time = int(row['lead_time_days']) if row.get('lead_time_days') else 0
-                price = float(price)
-
-                vendor_item, created_flag = VendorItem.objects.update_or_create(
-                    vendor=vendor,
-                    item=item,
-                    defaults={
-                        'price': price,
-                        'vendor_uom': vendor_uom,
-                        'lead_time_days': lead_time,
-                    }
-                )
-
-                if created_flag:
-                    created += 1
-                else:
-                    updated += 1
+        if _wants_dry_run(request):
+            return _dry_run_upload('vendor_items', file_obj)
+
+        if _wants_background(request):
+            return _queue_upload(request, 'vendor_items', file_obj)
+
+        changed_by = request.user if request.user.is_authenticated else None
+
+        try:
+            result = VendorItemImporter(changed_by=changed_by).run(iter_csv_rows(file_obj))
+        except UnicodeDecodeError:
+            return Response(
+                {"error": "File must be UTF-8 encoded CSV."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
 
         return Response({
             "message": "Upload complete",
-            "created": created,
-            "updated": updated,
-            "errors": errors,
+            **result,
         })
 
 
@@ -134,19 +148,29 @@ class VendorItemUploadView(APIView):
     - **manufacturer_part_no** (optional)
     - **default_uom** (optional) - Unit of measure code
 
-    This endpoint will create or update Item records.
+    This endpoint will create or update Item records. The file is streamed
+    and written in chunks with bulk inserts/updates.
+    Pass **?background=1** to queue the file as an import job instead (202 + job).
+    Pass **?dry_run=1** to validate the whole file without writing anything:
+    required fields, value parsing, missing vendors/items/locations and
+    duplicate keys are all reported, row by row.
     """,
     responses={
         200: {
             "type": "object",
             "properties": {
                 "message": {"type": "string"},
+                "rows": {"type": "integer"},
                 "created": {"type": "integer"},
                 "updated": {"type": "integer"},
+                "unchanged": {"type": "integer"},
                 "errors": {
                     "type": "array",
                     "items": {"type": "string"}
                 },
+                "error_count": {"type": "integer"},
+                "elapsed_seconds": {"type": "number"},
+                "rows_per_second": {"type": "number"},
             },
         },
         400: {"description": "Bad request or missing file"},
@@ -164,134 +188,217 @@ class ItemUploadView(APIView):
         if not file_obj:
             return Response({"error": "No file uploaded."}, status=status.HTTP_400_BAD_REQUEST)
 
-        decoded_file = file_obj.read().decode('utf-8')
-        io_string = io.StringIO(decoded_file)
-        reader = csv.DictReader(io_string)
-
-        created, updated, errors = 0, 0, []
-
-        with transaction.atomic():
-            for i, row in enumerate(reader, start=1):
-                g_code = row.get('g_code')
-                item_name = row.get('item_name')
-
-                if not (g_code and item_name):
-                    errors.append(f"Row {i}: missing required fields (g_code, item_name).")
-                    continue
-
-                # Get or create UOM if provided
-                default_uom = None
-                if row.get('default_uom'):
-                    uom_code = row['default_uom'].strip()
-                    default_uom, _ = UnitOfMeasure.objects.get_or_create(
-                        uom_code=uom_code
-                    )
-
-                # Update or create item
-                item, created_flag = Item.objects.update_or_create(
-                    g_code=g_code.strip(),
-                    defaults={
-                        'item_name': item_name.strip(),
-                        'description': row.get('description', '').strip(),
-                        'category': row.get('category', '').strip() or None,
-                        'subcategory': row.get('subcategory', '').strip() or None,
-                        'subcategory2': row.get('subcategory2', '').strip() or None,
-                        'subcategory3': row.get('subcategory3', '').strip() or None,
-                        'manufacturer': row.get('manufacturer', '').strip() or None,
-                        'manufacturer_part_no': row.get('manufacturer_part_no', '').strip() or None,
-                        'default_uom': default_uom,
-                    }
-                )
-
-                if created_flag:
-                    created += 1
-                else:
-                    updated += 1
+        if _wants_dry_run(request):
+            return _dry_run_upload('items', file_obj)
+
+        if _wants_background(request):
+            return _queue_upload(request, 'items', file_obj)
+
+        try:
+            result = ItemImporter().run(iter_csv_rows(file_obj))
+        except UnicodeDecodeError:
+            return Response(
+                {"error": "File must be UTF-8 encoded CSV."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
 
         return Response({
             "message": "Upload complete",
-            "created": created,
-            "updated": updated,
-            "errors": errors,
+            **result,
         })
 
 
+@extend_schema(
+    tags=["CSV Templates"],
+    summary="Upload a CSV file for any import template",
+    description="""
+    Import a CSV file that follows one of the CSV templates
+    (`/api/csv-templates/`): items, vendor_items, item_location_policies,
+    locations, vehicles, vehicle_models, users, vendors, bins or equipment.
+
+    Rows are matched to existing records by the template's natural key
+    (g_code, vendor + item, location name, unit number, email, ...), and
+    foreign keys are resolved by name. New and changed rows are written in
+    chunks with bulk inserts/updates; unchanged rows are skipped.
+    Pass **?background=1** to queue the file as an import job instead (202 + job).
+    Pass **?dry_run=1** to validate the whole file without writing anything:
+    required fields, value parsing, missing vendors/items/locations and
+    duplicate keys are all reported, row by row.
+    """,
+    responses={
+        200: {
+            "type": "object",
+            "properties": {
+                "message": {"type": "string"},
+                "rows": {"type": "integer"},
+                "created": {"type": "integer"},
+                "updated": {"type": "integer"},
+                "unchanged": {"type": "integer"},
+                "errors": {
+                    "type": "array",
+                    "items": {"type": "string"}
+                },
+                "error_count": {"type": "integer"},
+                "elapsed_seconds": {"type": "number"},
+                "rows_per_second": {"type": "number"},
+            },
+        },
+        400: {"description": "Bad request or missing file"},
+        404: {"description": "Unknown template"},
+    }
+)
+class TemplateUploadView(APIView):
+    """
+    POST /api/csv-upload/{template_key}/
+    Accepts a CSV file laid out like the template's download
+    """
+
+    def post(self, request, template_key, *args, **kwargs):
+        if template_key not in IMPORTERS:
+            return Response(
+                {"error": f"Template '{template_key}' not found"},
+                status=status.HTTP_404_NOT_FOUND
+            )
+
+        file_obj = request.FILES.get('file')
+        if not file_obj:
+            return Response({"error": "No file uploaded."}, status=status.HTTP_400_BAD_REQUEST)
+
+        if _wants_dry_run(request):
+            return _dry_run_upload(template_key, file_obj)
+
+        if _wants_background(request):
+            return _queue_upload(request, template_key, file_obj)
+
+        changed_by = request.user if request.user.is_authenticated else None
+
+        try:
+            result = get_importer(template_key, changed_by=changed_by).run(iter_csv_rows(file_obj))
+        except UnicodeDecodeError:
+            return Response(
+                {"error": "File must be UTF-8 encoded CSV."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        return Response({
+            "message": "Upload complete",
+            **result,
+        })
+
+
+EXPORT_PARAMETERS = [
+    OpenApiParameter('export_format', str, enum=['csv', 'ndjson'], description='Output format (default csv)'),
+    OpenApiParameter('gzip', bool, description='Compress the download with gzip'),
+]
+
+ITEM_EXPORT_COLUMNS = [
+    ExportColumn('g_code'),
+    ExportColumn('item_name'),
+    ExportColumn('description'),
+    ExportColumn('category'),
+    ExportColumn('subcategory'),
+    ExportColumn('subcategory2'),
+    ExportColumn('subcategory3'),
+    ExportColumn('manufacturer'),
+    ExportColumn('manufacturer_part_no'),
+    ExportColumn('default_uom', 'default_uom_id'),
+]
+
+VENDOR_ITEM_EXPORT_COLUMNS = [
+    ExportColumn('vendor_name', 'vendor__name'),
+    ExportColumn('item_sku', 'item__g_code'),
+    ExportColumn('price', 'unit_price'),
+    ExportColumn('vendor_uom', 'vendor_uom_id'),
+    ExportColumn('lead_time_days'),
+]
+
+
 @extend_schema(
     tags=["Item CSV Export"],
-    summary="Export all items to CSV",
-    description="Download all items from the database as a CSV file",
+    summary="Export items to CSV or NDJSON",
+    description="""
+    Streams items in the items import template layout, so the file can be
+    edited and uploaded again. Accepts the item list filters (category,
+    subcategory..subcategory3, manufacturer, search, ordering).
+    """,
+    parameters=EXPORT_PARAMETERS,
 )
 class ItemExportView(APIView):
     """
-    GET /api/items/export/
-    Exports all items to CSV format
+    GET /api/items-export/
+    Streams items to CSV / NDJSON
     """
 
     def get(self, request, *args, **kwargs):
-        # Create CSV response
-        response = HttpResponse(content_type='text/csv')
-        response['Content-Disposition'] = 'attachment; filename="items_export.csv"'
-
-        writer = csv.writer(response)
-
-        # Write header
-        writer.writerow([
-            'g_code', 'item_name', 'description', 'category', 'subcategory',
-            'subcategory2', 'subcategory3', 'manufacturer', 'manufacturer_part_no',
-            'default_uom'
-        ])
-
-        # Write data rows
-        items = Item.objects.all().select_related('default_uom')
-        for item in items:
-            writer.writerow([
-                item.g_code,
-                item.item_name,
-                item.description or '',
-                item.category or '',
-                item.subcategory or '',
-                item.subcategory2 or '',
-                item.subcategory3 or '',
-                item.manufacturer or '',
-                item.manufacturer_part_no or '',
-                item.default_uom.uom_code if item.default_uom else '',
-            ])
-
-        return response
+        items = filter_items(Item.objects.order_by('g_code'), request.query_params)
+        return streaming_export(request, items, ITEM_EXPORT_COLUMNS, 'items_export')
 
 
 @extend_schema(
     tags=["Vendor CSV Export"],
-    summary="Export all vendor items to CSV",
-    description="Download all vendor item pricing from the database as a CSV file",
+    summary="Export vendor items to CSV or NDJSON",
+    description="""
+    Streams vendor pricing in the vendor_items import template layout.
+    Accepts the vendor item list filters (vendor, item, vendor_uom,
+    min_price, max_price, search, ordering).
+    """,
+    parameters=EXPORT_PARAMETERS,
 )
 class VendorItemExportView(APIView):
     """
-    GET /api/vendor-items/export/
-    Exports all vendor items to CSV format
+    GET /api/vendor-items-export/
+    Streams vendor items to CSV / NDJSON
     """
 
     def get(self, request, *args, **kwargs):
-        # Create CSV response
-        response = HttpResponse(content_type='text/csv')
-        response['Content-Disposition'] = 'attachment; filename="vendor_items_export.csv"'
-
-        writer = csv.writer(response)
-
-        # Write header
-        writer.writerow([
-            'vendor_name', 'item_sku', 'price', 'vendor_uom', 'lead_time_days'
-        ])
-
-        # Write data rows
-        vendor_items = VendorItem.objects.all().select_related('vendor', 'item', 'vendor_uom')
-        for vi in vendor_items:
-            writer.writerow([
-                vi.vendor.name,
-                vi.item.g_code,
-                vi.price,
-                vi.vendor_uom.uom_code if vi.vendor_uom else '',
-                vi.lead_time_days,
-            ])
-
-        return response
+        vendor_items = filter_vendor_items(VendorItem.objects.order_by('id'), request.query_params)
+        return streaming_export(
+            request, vendor_items, VENDOR_ITEM_EXPORT_COLUMNS, 'vendor_items_export'
+        )
+
+
+@extend_schema(
+    tags=["Import Jobs"],
+    summary="Queue a CSV import or list recent import jobs",
+    description="""
+    **POST** (multipart) stores the file and returns the queued job right away:
+    - **template_key** - CSV_TEMPLATES key the file follows
+    - **file** - CSV file
+    - **chunk_size** (optional) - Rows per committed chunk
+
+    The file is processed by the `process_import_jobs` worker. Poll
+    `/api/imports/<job_id>/` for progress.
+    """,
+)
+class ImportJobListCreateView(generics.ListCreateAPIView):
+    """
+    GET  /api/imports/ - Recent import jobs
+    POST /api/imports/ - Queue an import
+    """
+    queryset = ImportJob.objects.all()
+    serializer_class = ImportJobSerializer
+
+    def create(self, request, *args, **kwargs):
+        serializer = ImportJobCreateSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        user = request.user if request.user.is_authenticated else None
+        job = enqueue_import(
+            serializer.validated_data['template_key'],
+            serializer.validated_data['file'],
+            user=user,
+            chunk_size=serializer.validated_data.get('chunk_size', DEFAULT_CHUNK_SIZE),
+        )
+        return Response(ImportJobSerializer(job).data, status=status.HTTP_202_ACCEPTED)
+
+
+@extend_schema(
+    tags=["Import Jobs"],
+    summary="Import job progress",
+    description="Rows done, rate, ETA, counts and per-row errors for one import job",
+)
+class ImportJobDetailView(generics.RetrieveAPIView):
+    """GET /api/imports/<job_id>/"""
+    queryset = ImportJob.objects.all()
+    serializer_class = ImportJobSerializer
+    lookup_field = 'job_id'
@@ -0,0 +1,69 @@
+# vendoritems/filters.py
+"""
+Query-parameter filters shared by the vendor item list endpoint and exports
+"""
+from decimal import Decimal, InvalidOperation
+
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+
+
+def _parse_price(value):
+    """Decimal price from a query param, or None when missing or not a number"""
+    try:
+        price = Decimal(value)
+    except (InvalidOperation, TypeError, ValueError):
+        return None
+    return price if price.is_finite() else None
+
+
+def _parse_datetime(value):
+    """Datetime from a query param, or None when missing or invalid"""
+    try:
+        return parse_datetime(value or "")
+    except ValueError:
+        return None
+
+
+def filter_vendor_items(qs, params):
+    """
+    Apply the vendor item list filters to a queryset.
+
+    Supported params: vendor, item, vendor_uom, min_price, max_price,
+    updated_since (ISO datetime, matched against last_updated),
+    search (vendor SKU / item name / vendor name), ordering.
+    Unparseable prices and dates are ignored.
+    """
+    vendor_id = params.get("vendor")
+    item_id = params.get("item")
+    uom_code = params.get("vendor_uom")
+    min_price = _parse_price(params.get("min_price"))
+    max_price = _parse_price(params.get("max_price"))
+    updated_since = _parse_datetime(params.get("updated_since"))
+    search = params.get("search")
+    ordering = params.get("ordering")
+
+    if vendor_id:
+        qs = qs.filter(vendor_id=vendor_id)
+    if item_id:
+        qs = qs.filter(item_id=item_id)
+    if uom_code:
+        qs = qs.filter(vendor_uom__uom_code=uom_code)
+    if min_price is not None:
+        qs = qs.filter(unit_price__gte=min_price)
+    if max_price is not None:
+        qs = qs.filter(unit_price__lte=max_price)
+    if updated_since:
+        qs = qs.filter(last_updated__gte=updated_since)
+    if search:
+        qs = qs.filter(
+            Q(vendor_sku__icontains=search)
+            | Q(item__item_name__icontains=search)
+            | Q(vendor__name__icontains=search)
+        )
+    if ordering in ("price", "-price"):
+        qs = qs.order_by(ordering.replace("price", "unit_price"))
+    elif ordering in ("id", "-id"):
+        qs = qs.order_by(ordering)
+
+    return qs
@@ -4,10 +4,9 @@
 from rest_framework import generics
 from .models import VendorItem
 from .serializers import VendorItemSerializer
+from .filters import filter_vendor_items
 from rest_framework.request import Request
-from django.db.models import Q
-from django.http import HttpResponse
-import csv
+from vendor_imports.exports import ExportColumn, streaming_export
 
 
 
@@ -18,66 +17,29 @@ class VendorItemListCreateView(generics.ListCreateAPIView):
     def get_queryset(self):
         qs = VendorItem.objects.select_related("vendor", "item", "vendor_uom").all()
         req: Request = self.request
+        return filter_vendor_items(qs, req.query_params)
 
-        vendor_id = req.query_params.get("vendor")
-        item_id = req.query_params.get("item")
-        uom_code = req.query_params.get("vendor_uom")
-        min_price = req.query_params.get("min_price")
-        max_price = req.query_params.get("max_price")
-        search = req.query_params.get("search")
-        ordering = req.query_params.get("ordering")
 
-        if vendor_id:
-            qs = qs.filter(vendor_id=vendor_id)
-        if item_id:
-            qs = qs.filter(item_id=item_id)
-        if uom_code:
-            qs = qs.filter(vendor_uom__uom_code=uom_code)
-        if min_price:
-            qs = qs.filter(price__gte=min_price)
-        if max_price:
-            qs = qs.filter(price__lte=max_price)
-        if search:
-            qs = qs.filter(
-                Q(vendor_sku__icontains=search)
-                | Q(item__name__icontains=search)
-                | Q(vendor__name__icontains=search)
-            )
-        if ordering in ("price", "-price", "id", "-id"):
-            qs = qs.order_by(ordering)
-
-        return qs
+VENDOR_ITEM_EXPORT_COLUMNS = [
+    ExportColumn("Vendor", "vendor__name"),
+    ExportColumn("Item", "item__item_name"),
+    ExportColumn("Vendor SKU", "vendor_sku"),
+    ExportColumn("Vendor UoM", "vendor_uom_id"),
+    ExportColumn("Price", "unit_price"),
+    ExportColumn("Conversion Factor", "conversion_factor"),
+    ExportColumn("Lead Time (days)", "lead_time_days"),
+    ExportColumn("Last Updated", "last_updated", format=lambda value: value.strftime("%Y-%m-%d %H:%M:%S")),
+]
 
 
 class VendorItemExportView(generics.GenericAPIView):
-    queryset = VendorItem.objects.select_related("vendor", "item", "vendor_uom")
+    """
+    GET /api/vendoritems/export/
+    Streams the filtered vendor item list (same params as the list) as
+    CSV or NDJSON; see vendor_imports.exports for export_format / gzip.
+    """
+    queryset = VendorItem.objects.order_by("id")
 
     def get(self, request, *args, **kwargs):
-        response = HttpResponse(content_type="text/csv")
-        response["Content-Disposition"] = 'attachment; filename="vendor_items.csv"'
-
-        writer = csv.writer(response)
-        writer.writerow([
-            "Vendor",
-            "Item",
-            "Vendor SKU",
-            "Vendor UoM",
-            "Price",
-            "Conversion Factor",
-            "Lead Time (days)",
-            "Last Updated",
-        ])
-
-        for vi in self.get_queryset():
-            writer.writerow([
-                vi.vendor.name if vi.vendor else "",
-                vi.item.name if vi.item else "",
-                vi.vendor_sku or "",
-                vi.vendor_uom.uom_code if vi.vendor_uom else "",
-                vi.price,
-                vi.conversion_factor,
-                vi.lead_time_days or "",
-                vi.last_updated.strftime("%Y-%m-%d %H:%M:%S"),
-            ])
-
-        return response
\ No newline at end of file
+        qs = filter_vendor_items(self.get_queryset(), request.query_params)
+        return streaming_export(request, qs, VENDOR_ITEM_EXPORT_COLUMNS, "vendor_items")
@@ -26,14 +26,16 @@ export default function AdminDashboard() {
     try {
       setLoading(true);
 
-      const [usersRes, auditsRes] = await Promise.all([
-        axiosClient.get('/users/?page_size=1'),
+      const [summaryRes, auditsRes] = await Promise.all([
+        axiosClient.get('/dashboard/summary/'),
         axiosClient.get('/audit/?page_size=10'),
       ]);
 
+      const { counts = {}, users_by_status: usersByStatus = {} } = summaryRes.data;
+
       setStats({
-        totalUsers: usersRes.data.count || 0,
-        activeUsers: usersRes.data.count || 0,
+        totalUsers: counts.users || 0,
+        activeUsers: usersByStatus.ACTIVE || 0,
         totalAuditLogs: auditsRes.data.count || 0,
         recentLogins: 0,
       });
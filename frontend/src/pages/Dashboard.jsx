@@ -3,46 +3,21 @@ import { Link } from "react-router-dom";
 import axiosClient from "../api/axiosClient";
 
 export default function Dashboard() {
-  // Fetch summary stats from various endpoints
-  const { data: itemsCount } = useQuery({
-    queryKey: ["items-count"],
+  // Fetch all summary stats in one request
+  const { data: summary } = useQuery({
+    queryKey: ["dashboard-summary"],
     queryFn: async () => {
-      const response = await axiosClient.get("/items/?page_size=1");
-      return response.data.count;
+      const response = await axiosClient.get("/dashboard/summary/");
+      return response.data;
     },
   });
 
-  const { data: shipmentsCount } = useQuery({
-    queryKey: ["shipments-count"],
-    queryFn: async () => {
-      const response = await axiosClient.get("/shipments/?page_size=1");
-      return response.data.count;
-    },
-  });
-
-  const { data: equipmentCount } = useQuery({
-    queryKey: ["equipment-count"],
-    queryFn: async () => {
-      const response = await axiosClient.get("/equipment/?page_size=1");
-      return response.data.count;
-    },
-  });
-
-  const { data: vehiclesCount } = useQuery({
-    queryKey: ["vehicles-count"],
-    queryFn: async () => {
-      const response = await axiosClient.get("/vehicles/?page_size=1");
-      return response.data.count;
-    },
-  });
-
-  const { data: usersCount } = useQuery({
-    queryKey: ["users-count"],
-    queryFn: async () => {
-      const response = await axiosClient.get("/users/?page_size=1");
-      return response.data.count;
-    },
-  });
+  const counts = summary?.counts || {};
+  const itemsCount = counts.items;
+  const shipmentsCount = counts.shipments;
+  const equipmentCount = counts.equipment;
+  const vehiclesCount = counts.vehicles;
+  const usersCount = counts.users;
 
   const { data: recentShipments } = useQuery({
     queryKey: ["recent-shipments"],
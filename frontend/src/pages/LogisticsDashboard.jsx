@@ -27,25 +27,28 @@ export default function LogisticsDashboard() {
       setLoading(true);
 
       // Fetch all stats in parallel
-      const [itemsRes, vendorsRes, ordersRes, shipmentsRes, equipmentRes, vehiclesRes, locationsRes] = await Promise.all([
-        axiosClient.get('/items/?page_size=1'),
-        axiosClient.get('/vendors/?page_size=1'),
+      const [summaryRes, ordersRes, shipmentsRes] = await Promise.all([
+        axiosClient.get('/dashboard/summary/'),
         axiosClient.get('/orders/?page_size=5'),
         axiosClient.get('/shipments/?page_size=5'),
-        axiosClient.get('/equipment/?page_size=1'),
-        axiosClient.get('/vehicles/?page_size=1'),
-        axiosClient.get('/locations/?page_size=1'),
       ]);
 
+      const {
+        counts = {},
+        orders_by_status: ordersByStatus = {},
+        shipments_by_status: shipmentsByStatus = {},
+        rfqs_by_status: rfqsByStatus = {},
+      } = summaryRes.data;
+
       setStats({
-        totalItems: itemsRes.data.count || 0,
-        totalVendors: vendorsRes.data.count || 0,
-        activeOrders: ordersRes.data.count || 0,
-        pendingShipments: shipmentsRes.data.count || 0,
-        equipmentCount: equipmentRes.data.count || 0,
-        vehicleCount: vehiclesRes.data.count || 0,
-        openRFQs: 0, // Will be populated when RFQ backend is ready
-        locationCount: locationsRes.data.count || 0,
+        totalItems: counts.items || 0,
+        totalVendors: counts.vendors || 0,
+        activeOrders: (ordersByStatus.OPEN || 0) + (ordersByStatus.PARTIAL || 0),
+        pendingShipments: (shipmentsByStatus.PICKING || 0) + (shipmentsByStatus.STAGED || 0),
+        equipmentCount: counts.equipment || 0,
+        vehicleCount: counts.vehicles || 0,
+        openRFQs: (rfqsByStatus.DRAFT || 0) + (rfqsByStatus.SENT || 0) + (rfqsByStatus.QUOTED || 0),
+        locationCount: counts.locations || 0,
       });
 
       setRecentOrders(ordersRes.data.results || []);